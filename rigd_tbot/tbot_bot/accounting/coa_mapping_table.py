@@ -252,6 +252,10 @@ def save_mapping_table(
     with open(version_file, "w", encoding="utf-8") as f:
         json.dump(table, f, indent=2)
 
+    # Lookups re-read the saved table (and re-index it on the new version)
+    global _LOADED_TABLE
+    _LOADED_TABLE = (None, None, None)
+
     return version_id
 
 
@@ -465,19 +469,74 @@ def assign_mapping(mapping_rule, user, reason=None) -> str:
     table["change_reason"] = (reason or "manual assignment")
     return save_mapping_table(table, reason=table["change_reason"], actor=user)
 
-def get_mapping_for_transaction(txn, mapping_table=None):
+# ----------------------------------------------------------------------
+# Compiled mapping index (resolver fast path)
+# ----------------------------------------------------------------------
+# get_mapping_for_transaction() runs once per ledger entry during sync. Rather than re-reading the JSON and
+# scanning every rule per entry, the table is compiled into hash maps: legacy 'mappings' keyed by
+# (normalized type, broker, subtype, description) -> first position, where a None field is the rule's wildcard,
+# and programmatic 'rules' keyed by rule_key. The index is rebuilt when the table's version (bumped by
+# save_mapping_table) or its rule lists change; in-place edits to a rule's match fields need a save.
+_INDEX_CACHE: Tuple[Any, ...] = (None, None, None)          # (table, signature, index)
+_LOADED_TABLE: Tuple[Any, ...] = (None, None, None)         # (mapping path, file signature, table)
+
+def _table_signature(table: Dict[str, Any]) -> Tuple[Any, ...]:
+    mappings = table.get("mappings") or []
+    rules = table.get("rules") or []
+    return table.get("version"), id(mappings), len(mappings), id(rules), len(rules)
+
+def _compile_mapping_index(table: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
-    Look up the COA mapping for a transaction dict.
-    Supports both legacy field-based mappings and programmatic rules.
+    Build the lookup maps; the first rule for a key wins, as in the linear scan.
+    Returns None if a rule holds an unhashable match field (caller falls back to the scan).
     """
-    if mapping_table is None:
-        mapping_table = load_mapping_table()
-
-    # Normalize the txn "type"/action for matching
-    txn_type_raw = txn.get("type") or txn.get("txn_type") or txn.get("action")
-    txn_type = _normalize_type(txn_type_raw)
-    txn_broker = (txn.get("broker") or txn.get("broker_code") or "").strip() or None
+    legacy: Dict[Tuple[Any, ...], int] = {}
+    rule_keys: Dict[Any, Dict[str, Any]] = {}
+    try:
+        for pos, rule in enumerate(table.get("mappings", [])):
+            key = (_normalize_type(rule.get("type")), rule.get("broker"), rule.get("subtype"), rule.get("description"))
+            legacy.setdefault(key, pos)
+        for r in table.get("rules", []):
+            rule_keys.setdefault(r.get("rule_key"), r)
+    except TypeError:
+        return None
+    return {"legacy": legacy, "rules": rule_keys}
+
+def _mapping_index(table: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    global _INDEX_CACHE
+    cached_table, cached_sig, index = _INDEX_CACHE
+    sig = _table_signature(table)
+    if cached_table is table and cached_sig == sig:
+        return index
+    index = _compile_mapping_index(table)
+    _INDEX_CACHE = (table, sig, index)
+    return index
+
+def _current_mapping_table() -> Dict[str, Any]:
+    """
+    The on-disk mapping table for lookups that were not handed one; re-read only when the file changes
+    (save_mapping_table in this or another process). Not for callers that edit and save the table.
+    """
+    global _LOADED_TABLE
+    path = _get_mapping_path()
+    try:
+        st = path.stat()
+        file_sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_sig = None
+    cached_path, cached_sig, table = _LOADED_TABLE
+    if table is not None and file_sig is not None and cached_path == path and cached_sig == file_sig:
+        return table
+    table = load_mapping_table()
+    try:
+        st = path.stat()
+        _LOADED_TABLE = (path, (st.st_mtime_ns, st.st_size), table)
+    except OSError:
+        _LOADED_TABLE = (None, None, None)
+    return table
 
+def _scan_mapping_for_transaction(txn, mapping_table, txn_type, txn_broker):
+    """Linear resolver (reference order); used when the table cannot be indexed."""
     # 1) Legacy field-based mappings (with normalized type compare)
     for rule in mapping_table.get("mappings", []):
         rule_type = _normalize_type(rule.get("type"))
@@ -495,6 +554,49 @@ def get_mapping_for_transaction(txn, mapping_table=None):
             return {"broker": txn_broker, "type": txn_type, "coa_account": r.get("account_code"), "rule_key": key}
     return None
 
+def get_mapping_for_transaction(txn, mapping_table=None):
+    """
+    Look up the COA mapping for a transaction dict.
+    Supports both legacy field-based mappings and programmatic rules.
+    Resolution order: first matching legacy mapping (table order), then the first rule with the derived rule_key.
+    """
+    if mapping_table is None:
+        mapping_table = _current_mapping_table()
+
+    # Normalize the txn "type"/action for matching
+    txn_type_raw = txn.get("type") or txn.get("txn_type") or txn.get("action")
+    txn_type = _normalize_type(txn_type_raw)
+    txn_broker = (txn.get("broker") or txn.get("broker_code") or "").strip() or None
+
+    index = _mapping_index(mapping_table)
+    if index is None:
+        return _scan_mapping_for_transaction(txn, mapping_table, txn_type, txn_broker)
+
+    # 1) Legacy mappings: a rule matches on its exact field or on None (wildcard), so probe every
+    #    exact/wildcard combination and keep the earliest rule position
+    subtype = txn.get("subtype")
+    description = txn.get("description")
+    legacy = index["legacy"]
+    best = None
+    try:
+        for b in ((txn_broker, None) if txn_broker is not None else (None,)):
+            for st in ((subtype, None) if subtype is not None else (None,)):
+                for d in ((description, None) if description is not None else (None,)):
+                    pos = legacy.get((txn_type, b, st, d))
+                    if pos is not None and (best is None or pos < best):
+                        best = pos
+    except TypeError:
+        return _scan_mapping_for_transaction(txn, mapping_table, txn_type, txn_broker)
+    if best is not None:
+        return mapping_table["mappings"][best]
+
+    # 2) Programmatic single-account rules (optional): derive key and return a simplified view
+    key = _derive_rule_key_from_context(txn or {})
+    r = index["rules"].get(key)
+    if r is not None:
+        return {"broker": txn_broker, "type": txn_type, "coa_account": r.get("account_code"), "rule_key": key}
+    return None
+
 def flag_unmapped_transaction(txn, user="system") -> str:
     table = load_mapping_table()
     table.setdefault("unmapped", []).append({
@@ -542,7 +644,7 @@ def apply_mapping_rule(entry, mapping_table=None):
     - If no rule found, caller may fallback to Suspense/PNL.
     """
     if mapping_table is None:
-        mapping_table = load_mapping_table()
+        mapping_table = _current_mapping_table()
 
     mapping = get_mapping_for_transaction(entry, mapping_table)
 
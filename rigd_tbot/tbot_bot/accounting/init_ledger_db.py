@@ -12,6 +12,7 @@ import sqlite3
 import json
 from cryptography.fernet import Fernet
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
+from tbot_bot.accounting.ledger_modules.ledger_group_summary import ensure_group_summary
 
 def resolve_ledger_schema_path():
     """
@@ -47,6 +48,7 @@ def init_ledger_db(entity_code=None, jurisdiction_code=None, broker_code=None, b
     conn.executescript(schema_sql)
     conn.commit()
     conn.close()
+    ensure_group_summary(ledger_db_path)
     print(f"[init_ledger_db] Ledger DB created: {ledger_db_path}")
 
 # CLI direct execution
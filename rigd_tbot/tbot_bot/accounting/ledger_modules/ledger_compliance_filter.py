@@ -22,6 +22,15 @@ _OPS_ACTIONS = {
     "reserve_tax", "reserve_payroll", "float_allocation", "rebalance_buy", "rebalance_sell",
 }
 _ALLOWED_ACTIONS = set(_CANON_ACTIONS) | _OPS_ACTIONS
+ALLOWED_ACTIONS = frozenset(_ALLOWED_ACTIONS)
+
+# Raw broker state hints (activity_type/type/order_status) that mark non-economic status records
+NON_ECONOMIC_MARKERS = frozenset({
+    "NEW", "PENDING_NEW", "ACCEPTED", "CANCELED", "CANCELLED", "REPLACED", "REJECTED", "EXPIRED",
+    "PARTIAL_FILL", "PARTIALLY_FILLED", "PENDING_CANCEL",
+    # We will only drop "FILL" if economics are actually zero
+    "FILL",
+})
 
 
 def _is_blank_primary(entry: Dict[str, Any]) -> bool:
@@ -64,15 +73,8 @@ def _is_zero_value_spurious(entry: Dict[str, Any]) -> bool:
         (raw.get("activity_type") or raw.get("type") or raw.get("order_status") or "")
     ).upper()
 
-    non_economic_markers = {
-        "NEW", "PENDING_NEW", "ACCEPTED", "CANCELED", "CANCELLED", "REPLACED", "REJECTED", "EXPIRED",
-        "PARTIAL_FILL", "PARTIALLY_FILLED", "PENDING_CANCEL",
-        # We will only drop "FILL" if economics are actually zero
-        "FILL",
-    }
-
     # If there’s literally no economic effect and no fees, drop it when it looks like a status/partial record
-    if (qty == 0 or price == 0 or total_value == 0) and fees == 0 and raw_type in non_economic_markers:
+    if (qty == 0 or price == 0 or total_value == 0) and fees == 0 and raw_type in NON_ECONOMIC_MARKERS:
         return True
     return False
 
@@ -3,7 +3,8 @@
 import sqlite3
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
 from tbot_bot.accounting.ledger_modules.ledger_entry import get_identity_tuple
-from typing import List, Dict, Any
+from tbot_bot.support.utils_log import log_event
+from typing import List, Dict, Any, Sequence
 
 def trade_exists(trade_id, side=None):
     """
@@ -73,6 +74,8 @@ def remove_duplicate_trades():
             conn.executemany("DELETE FROM trades WHERE id = ?", [(i,) for i in ids_to_delete])
             deleted = len(ids_to_delete)
             conn.commit()
+    # Duplicates gone: let the next post retry the unique index
+    _UNKEYED_DBS.discard(db_path)
     return deleted
 
 def check_duplicates(trade_id, side=None):
@@ -96,6 +99,77 @@ def check_duplicates(trade_id, side=None):
             ).fetchone()
         return row[0] if row else 0
 
+# -------- Set-based de-dup for bulk posting (sync) --------
+
+# Natural key of a ledger leg: one broker trade produces at most one leg per side
+NATURAL_KEY = ("trade_id", "broker_code", "side")
+NATURAL_KEY_INDEX = "uq_trades_natural_key"
+_INCOMING = "_incoming_legs"
+_KEYED_DBS = set()
+_UNKEYED_DBS = set()  # blocked by existing duplicates: not retried (full index build) on every post
+
+def ensure_natural_key_index(conn: sqlite3.Connection, db_path=None) -> bool:
+    """
+    Unique index on (trade_id, broker_code, side): a second leg for the same broker trade and side is rejected
+    by SQLite instead of being cleaned up afterwards. Legs without a side (NULL) never collide.
+    Returns False when existing duplicates block the index (run remove_duplicate_trades to clear them).
+    """
+    if db_path is not None:
+        if db_path in _KEYED_DBS:
+            return True
+        if db_path in _UNKEYED_DBS:
+            return False
+    try:
+        conn.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {NATURAL_KEY_INDEX} ON trades ({', '.join(NATURAL_KEY)})"
+        )
+    except sqlite3.IntegrityError:
+        if db_path is not None:
+            _UNKEYED_DBS.add(db_path)
+        log_event(
+            "ledger_deduplication",
+            f"{NATURAL_KEY_INDEX} not created: ledger already holds duplicate {NATURAL_KEY} legs; "
+            "run remove_duplicate_trades() to clear them. Anti-join dedupe still applies.",
+            level="warning",
+            extra={"db_path": str(db_path) if db_path is not None else None},
+        )
+        return False
+    if db_path is not None:
+        _KEYED_DBS.add(db_path)
+    return True
+
+def insert_new_legs(conn: sqlite3.Connection, legs: Sequence[Dict[str, Any]], columns: Sequence[str]) -> int:
+    """
+    Insert only legs whose natural key is not in the ledger yet (first occurrence wins within the batch).
+    Legs are staged in a temp table and written with one INSERT ... SELECT anti-joined against trades on
+    (trade_id, broker_code, side) instead of one lookup query per leg. Runs inside the caller's transaction.
+    Returns the number of legs inserted.
+    """
+    if not legs:
+        return 0
+    cols = list(columns)
+    col_list = ", ".join(cols)
+    conn.execute(f"DROP TABLE IF EXISTS temp.{_INCOMING}")
+    conn.execute(f"CREATE TEMP TABLE {_INCOMING} (_seq INTEGER PRIMARY KEY, {col_list})")
+    conn.executemany(
+        f"INSERT INTO temp.{_INCOMING} ({col_list}) VALUES ({', '.join('?' * len(cols))})",
+        [tuple(l.get(c) for c in cols) for l in legs],
+    )
+    key_match = " AND ".join(f"t.{k} = i.{k}" for k in NATURAL_KEY)
+    cur = conn.execute(
+        f"""
+        INSERT INTO trades ({col_list})
+        SELECT {", ".join(f"i.{c}" for c in cols)}
+        FROM temp.{_INCOMING} i
+        WHERE i._seq IN (SELECT MIN(_seq) FROM temp.{_INCOMING} GROUP BY {", ".join(NATURAL_KEY)})
+          AND NOT EXISTS (SELECT 1 FROM trades t WHERE {key_match})
+        ORDER BY i._seq
+        """
+    )
+    inserted = cur.rowcount
+    conn.execute(f"DROP TABLE temp.{_INCOMING}")
+    return inserted
+
 # -------- In-memory de-dup for pre-posting (used by tests & sync) --------
 
 def deduplicate_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
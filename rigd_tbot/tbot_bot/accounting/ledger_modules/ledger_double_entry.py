@@ -7,6 +7,7 @@ from tbot_bot.accounting.coa_mapping_table import load_mapping_table, apply_mapp
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
 from tbot_bot.support.decrypt_secrets import load_bot_identity
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
+from tbot_bot.accounting.ledger_modules.ledger_deduplication import ensure_natural_key_index, insert_new_legs
 import sqlite3
 import json
 import hashlib
@@ -282,10 +283,11 @@ def post_double_entry(entries: List[dict], mapping_table=None):
     """
     Low-level poster: supports two modes per entry:
       1) Pre-split (OB or journal): entry already has 'side' ('debit'/'credit') and 'account'
-         -> grouped by group_id, atomic insert per group, enforce zero-sum.
+         -> grouped by group_id, zero-sum enforced per group; the whole batch is inserted atomically.
       2) Event form: single entry that needs mapping -> mapped to (debit, credit) legs, inserted.
 
-    Dedup priority: fitid (if present) else (trade_id, side).
+    Dedup: set-based on the natural key (trade_id, broker_code, side) — legs already in the ledger (or repeated
+    earlier in the batch) are skipped; see ledger_deduplication.insert_new_legs.
     """
     entity_code, jurisdiction_code, broker_code, bot_id = get_identity_tuple()
     db_path = resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
@@ -330,77 +332,52 @@ def post_double_entry(entries: List[dict], mapping_table=None):
             leg["group_id"] = gid
         grouped.setdefault(gid, []).append(leg)
 
-    # Insert by group atomically
+    # Normalize and validate every group first, then insert the whole batch in one transaction
+    all_legs: List[Dict[str, Any]] = []
+    for gid, legs in grouped.items():
+        # Normalize -> sanitize; assign sync_run_id; compute fitids
+        normed: List[Dict[str, Any]] = []
+        for leg in legs:
+            # Ensure amount sign matches side
+            val = _as_float(leg.get("total_value"), 0.0)
+            side = (leg.get("side") or "").strip().lower()
+            if side == "debit":
+                leg["total_value"] = abs(val)
+                leg["amount"] = abs(val)
+            elif side == "credit":
+                leg["total_value"] = -abs(val)
+                leg["amount"] = -abs(val)
+
+            # JSON containers safe for sqlite
+            _ensure_json_fields(leg)
+
+            # Assign fitid if missing (OB rules for OB groups)
+            _maybe_assign_fitid(leg, broker_code, gid)
+
+            # Normalize and fill required columns
+            leg_n = _add_required_fields(leg, entity_code, jurisdiction_code, broker_code, bot_id)
+            normed.append(leg_n)
+
+        # Enforce same sync_run_id across the group
+        _ensure_group_sync_id(normed, gid)
+
+        # Zero-sum check (strong invariant)
+        if not _group_zero_sum_ok(normed):
+            raise RuntimeError(f"Double-entry imbalance in group {gid}")
+        all_legs.extend(normed)
+
+    if not all_legs:
+        return inserted_ids
+
     with sqlite3.connect(db_path) as conn:
-        for gid, legs in grouped.items():
-            # Normalize -> sanitize; assign sync_run_id; compute fitids
-            normed: List[Dict[str, Any]] = []
-            for leg in legs:
-                # Ensure amount sign matches side
-                val = _as_float(leg.get("total_value"), 0.0)
-                side = (leg.get("side") or "").strip().lower()
-                if side == "debit":
-                    leg["total_value"] = abs(val)
-                    leg["amount"] = abs(val)
-                elif side == "credit":
-                    leg["total_value"] = -abs(val)
-                    leg["amount"] = -abs(val)
-
-                # JSON containers safe for sqlite
-                _ensure_json_fields(leg)
-
-                # Assign fitid if missing (OB rules for OB groups)
-                _maybe_assign_fitid(leg, broker_code, gid)
-
-                # Normalize and fill required columns
-                leg_n = _add_required_fields(leg, entity_code, jurisdiction_code, broker_code, bot_id)
-                normed.append(leg_n)
-
-            # Enforce same sync_run_id across the group
-            _ensure_group_sync_id(normed, gid)
-
-            # Zero-sum check (strong invariant)
-            if not _group_zero_sum_ok(normed):
-                raise RuntimeError(f"Double-entry imbalance in group {gid}")
-
-            # Atomic insert per group
-            try:
-                conn.execute("BEGIN")
-                for l in normed:
-                    # Dedup: fitid first (if column exists in schema), else (trade_id, side)
-                    # We defensively try fitid; if column is absent, SQLite will error on query —
-                    # so wrap that check.
-                    fitid = l.get("fitid")
-                    dedup_hit = False
-                    if fitid:
-                        try:
-                            c = conn.execute("SELECT 1 FROM trades WHERE fitid = ?", (fitid,))
-                            if c.fetchone():
-                                dedup_hit = True
-                        except Exception:
-                            # fitid column may not exist — fall back to (trade_id, side)
-                            dedup_hit = False
-                    if not dedup_hit:
-                        c = conn.execute(
-                            "SELECT 1 FROM trades WHERE trade_id = ? AND side = ?",
-                            (l.get("trade_id"), l.get("side")),
-                        )
-                        if c.fetchone():
-                            dedup_hit = True
-
-                    if dedup_hit:
-                        continue
-
-                    columns = TRADES_FIELDS
-                    placeholders = ", ".join(["?"] * len(columns))
-                    conn.execute(
-                        f"INSERT INTO trades ({', '.join(columns)}) VALUES ({placeholders})",
-                        tuple(l.get(col) for col in columns),
-                    )
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
+        ensure_natural_key_index(conn, db_path)
+        try:
+            conn.execute("BEGIN")
+            insert_new_legs(conn, all_legs, TRADES_FIELDS)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
     return inserted_ids
 
@@ -21,7 +21,6 @@ from tbot_bot.support.decrypt_secrets import load_bot_identity
 from tbot_bot.accounting.ledger_modules.ledger_audit import append as audit_append  # emits immutable JSONL
 
 # Existing utilities (kept as-is for legacy callers)
-from tbot_web.support.auth_web import get_current_user
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
 from tbot_bot.accounting.ledger_modules.ledger_compliance_filter import compliance_filter_entry
 
@@ -420,6 +419,8 @@ def edit_ledger_entry(entry_id, updated_data):
         return  # Filtered out, do not update
 
     db_path = resolve_ledger_db_path(*get_identity_tuple())
+    # Web-only dependency (pulls in Flask); imported here so headless workers don't pay for it
+    from tbot_web.support.auth_web import get_current_user
     current_user = get_current_user()
     updated_data["updated_by"] = (
         current_user.username if hasattr(current_user, "username")
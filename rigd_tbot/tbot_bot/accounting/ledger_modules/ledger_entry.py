@@ -9,7 +9,6 @@ import sqlite3
 import json
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
 from tbot_bot.support.decrypt_secrets import load_bot_identity
-from tbot_web.support.auth_web import get_current_user
 from tbot_bot.accounting.ledger_modules.ledger_account_map import load_broker_code, load_account_number
 from tbot_bot.accounting.ledger_modules.ledger_edit import edit_ledger_entry, delete_ledger_entry  # Use shared helpers
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
@@ -66,6 +65,8 @@ def load_internal_ledger():
 def mark_entry_resolved(entry_id):
     bot_identity = get_identity_tuple()
     db_path = resolve_ledger_db_path(*bot_identity)
+    # Web-only dependency (pulls in Flask); imported here so headless workers don't pay for it
+    from tbot_web.support.auth_web import get_current_user
     current_user = get_current_user()
     updater = (
         current_user.username if hasattr(current_user, "username")
@@ -0,0 +1,257 @@
+# tbot_bot/accounting/ledger_modules/ledger_group_summary.py
+# Persisted per-group summaries of the trades table (one row per group_id), kept current by SQLite triggers
+# so every write path (posting, sync, edits, dedupe, other processes) updates it in the same transaction.
+# Reports and the ledger UI read it instead of regrouping raw legs. Rebuild/verify: run this module.
+
+"""
+trade_group_summary row = the group's representative leg (first debit leg by datetime_utc, id, side compared
+case-insensitively; else the first leg — same choice as ledger_grouping._pick_representative_leg) plus aggregates over all legs carrying the
+group_id: leg_count, fee_total, first/last datetime_utc.
+
+Triggers recompute only the affected group(s) on INSERT/UPDATE/DELETE of trades. They are installed by
+ensure_group_summary(); a DB that did not have them yet (or had an older version) is rebuilt once at install
+time, since legs written before then were never (or differently) summarised.
+
+    python -m tbot_bot.accounting.ledger_modules.ledger_group_summary --verify [--db PATH]
+    python -m tbot_bot.accounting.ledger_modules.ledger_group_summary --rebuild [--db PATH]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+SUMMARY_TABLE = "trade_group_summary"
+
+# Representative-leg columns copied into the summary (sortable in the ledger UI), then aggregates
+REP_COLUMNS = ("trade_id", "datetime_utc", "symbol", "account", "action", "quantity", "price", "fee",
+               "total_value", "status", "strategy", "tags", "notes")
+AGG_COLUMNS = ("leg_count", "fee_total", "first_datetime_utc", "last_datetime_utc")
+SUMMARY_COLUMNS = ("group_id", "rep_id") + REP_COLUMNS + AGG_COLUMNS
+
+# Only columns that feed the summary fire the update trigger
+_WATCHED_COLUMNS = ("group_id", "side", "datetime_utc", "symbol", "account", "action", "quantity", "price", "fee",
+                    "total_value", "status", "trade_id", "strategy", "tags", "notes")
+
+_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {SUMMARY_TABLE} (
+    group_id TEXT PRIMARY KEY,
+    rep_id INTEGER NOT NULL,
+    trade_id TEXT,
+    datetime_utc TEXT,
+    symbol TEXT,
+    account TEXT,
+    action TEXT,
+    quantity REAL,
+    price REAL,
+    fee REAL,
+    total_value REAL,
+    status TEXT,
+    strategy TEXT,
+    tags TEXT,
+    notes TEXT,
+    leg_count INTEGER NOT NULL,
+    fee_total REAL NOT NULL DEFAULT 0.0,
+    first_datetime_utc TEXT,
+    last_datetime_utc TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_trade_group_summary_symbol ON {SUMMARY_TABLE} (symbol);
+"""
+
+_TRIGGER_NAMES = ("trg_trades_group_summary_ins", "trg_trades_group_summary_upd_new",
+                  "trg_trades_group_summary_upd_old", "trg_trades_group_summary_del")
+
+_ENSURED: set = set()
+
+
+def rep_order_sql(alias: str = "") -> str:
+    """ORDER BY terms picking a group's representative leg; the single definition every SQL path uses."""
+    p = f"{alias}." if alias else ""
+    return f"(IFNULL(LOWER({p}side), '') <> 'debit'), {p}datetime_utc, {p}id"
+
+
+def _refresh_sql(g: str) -> str:
+    """Statements recomputing the summary row of group `g` (a SQL expression, e.g. NEW.group_id)."""
+    rep_cols = ", ".join(f"r.{c}" for c in REP_COLUMNS)
+    return f"""
+    DELETE FROM {SUMMARY_TABLE} WHERE group_id = {g};
+    INSERT INTO {SUMMARY_TABLE} ({", ".join(SUMMARY_COLUMNS)})
+    SELECT r.group_id, r.id, {rep_cols}, a.n, a.fee_total, a.first_dt, a.last_dt
+    FROM (SELECT COUNT(*) AS n, ROUND(SUM(IFNULL(fee, 0)), 8) AS fee_total,
+                 MIN(datetime_utc) AS first_dt, MAX(datetime_utc) AS last_dt
+          FROM trades WHERE group_id = {g}) a
+    JOIN trades r ON r.id = (SELECT id FROM trades WHERE group_id = {g}
+                             ORDER BY {rep_order_sql()} LIMIT 1)
+    WHERE a.n > 0;"""
+
+
+def _trigger_sql() -> List[str]:
+    ins, upd_new, upd_old, dele = _TRIGGER_NAMES
+    watched = ", ".join(_WATCHED_COLUMNS)
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS {ins} AFTER INSERT ON trades
+        WHEN NEW.group_id IS NOT NULL AND NEW.group_id <> ''
+        BEGIN {_refresh_sql("NEW.group_id")}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {upd_new} AFTER UPDATE OF {watched} ON trades
+        WHEN NEW.group_id IS NOT NULL AND NEW.group_id <> ''
+        BEGIN {_refresh_sql("NEW.group_id")}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {upd_old} AFTER UPDATE OF group_id ON trades
+        WHEN OLD.group_id IS NOT NULL AND OLD.group_id <> '' AND OLD.group_id IS NOT NEW.group_id
+        BEGIN {_refresh_sql("OLD.group_id")}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {dele} AFTER DELETE ON trades
+        WHEN OLD.group_id IS NOT NULL AND OLD.group_id <> ''
+        BEGIN {_refresh_sql("OLD.group_id")}
+        END""",
+    ]
+
+
+def _computed_select() -> str:
+    """Every group's summary computed from raw legs (rebuild and verify): one pass over idx_trades_group_time,
+    representative picked per group by the same correlated lookup the triggers use."""
+    rep_cols = ", ".join(f"r.{c}" for c in REP_COLUMNS)
+    return f"""
+    SELECT a.group_id AS group_id, r.id AS rep_id, {rep_cols}, a.n AS leg_count, a.fee_total AS fee_total,
+           a.first_dt AS first_datetime_utc, a.last_dt AS last_datetime_utc
+    FROM (SELECT group_id, COUNT(*) AS n, ROUND(SUM(IFNULL(fee, 0)), 8) AS fee_total,
+                 MIN(datetime_utc) AS first_dt, MAX(datetime_utc) AS last_dt,
+                 (SELECT l.id FROM trades l WHERE l.group_id = g.group_id
+                  ORDER BY {rep_order_sql("l")} LIMIT 1) AS rep_id
+          FROM trades g WHERE group_id IS NOT NULL AND group_id <> '' GROUP BY group_id) a
+    JOIN trades r ON r.id = a.rep_id"""
+
+
+def _default_db_path() -> str:
+    from tbot_bot.support.path_resolver import resolve_ledger_db_path
+    from tbot_bot.accounting.ledger_modules.ledger_entry import get_identity_tuple
+    entity_code, jurisdiction_code, broker_code, bot_id = get_identity_tuple()
+    return resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
+
+
+def _rebuild(conn: sqlite3.Connection) -> int:
+    conn.execute(f"DELETE FROM {SUMMARY_TABLE}")
+    conn.execute(f"INSERT INTO {SUMMARY_TABLE} ({', '.join(SUMMARY_COLUMNS)}) {_computed_select()}")
+    return conn.execute(f"SELECT COUNT(*) FROM {SUMMARY_TABLE}").fetchone()[0]
+
+
+def ensure_group_summary(db_path: Optional[str] = None) -> None:
+    """
+    Idempotent: create the summary table and its triggers. When the triggers were missing (new install on an
+    existing ledger) or differ from the current definition, they are replaced and the table is rebuilt from
+    trades in the same transaction. Checked once per DB per process.
+    """
+    db_path = db_path or _default_db_path()
+    if db_path in _ENSURED:
+        return
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(_TABLE_SQL)
+        have = dict(conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({','.join('?' * len(_TRIGGER_NAMES))})",
+            _TRIGGER_NAMES,
+        ).fetchall())
+        wanted = _trigger_sql()
+        # sqlite_master keeps the statement text minus "IF NOT EXISTS"
+        current = [have.get(name) == stmt.replace(" IF NOT EXISTS", "", 1) for name, stmt in zip(_TRIGGER_NAMES, wanted)]
+        if not all(current):
+            conn.execute("BEGIN IMMEDIATE")
+            for name in have:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            for stmt in wanted:
+                conn.execute(stmt)
+            _rebuild(conn)
+            conn.commit()
+    _ENSURED.add(db_path)
+
+
+def rebuild_group_summaries(db_path: Optional[str] = None) -> int:
+    """Recompute every summary row from raw legs (set-based, single transaction). Returns the group count."""
+    db_path = db_path or _default_db_path()
+    ensure_group_summary(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        n = _rebuild(conn)
+        conn.commit()
+    return n
+
+
+def verify_group_summaries(db_path: Optional[str] = None, max_report: int = 50) -> Dict[str, Any]:
+    """
+    Compare the stored summaries with a fresh computation from raw legs.
+    Returns {"ok", "groups", "missing", "stale", "orphaned"}; the id lists are capped at max_report.
+    """
+    db_path = db_path or _default_db_path()
+    ensure_group_summary(db_path)
+    cols = ", ".join(SUMMARY_COLUMNS)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"CREATE TEMP TABLE _gs_expected AS SELECT {cols} FROM ({_computed_select()})")
+        missing = [r[0] for r in conn.execute(
+            f"SELECT group_id FROM _gs_expected WHERE group_id NOT IN (SELECT group_id FROM {SUMMARY_TABLE}) LIMIT ?",
+            (max_report,),
+        )]
+        orphaned = [r[0] for r in conn.execute(
+            f"SELECT group_id FROM {SUMMARY_TABLE} WHERE group_id NOT IN (SELECT group_id FROM _gs_expected) LIMIT ?",
+            (max_report,),
+        )]
+        stale = [r[0] for r in conn.execute(
+            f"""SELECT group_id FROM (SELECT {cols} FROM {SUMMARY_TABLE} EXCEPT SELECT {cols} FROM _gs_expected)
+                WHERE group_id IN (SELECT group_id FROM _gs_expected) LIMIT ?""",
+            (max_report,),
+        )]
+        groups = conn.execute("SELECT COUNT(*) FROM _gs_expected").fetchone()[0]
+        conn.execute("DROP TABLE _gs_expected")
+    return {"ok": not (missing or stale or orphaned), "groups": groups,
+            "missing": missing, "stale": stale, "orphaned": orphaned}
+
+
+def fetch_group_summaries(db_path: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                          symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Summary rows, newest activity first."""
+    db_path = db_path or _default_db_path()
+    ensure_group_summary(db_path)
+    sql = f"SELECT * FROM {SUMMARY_TABLE}"
+    params: list = []
+    if symbol:
+        sql += " WHERE symbol = ?"
+        params.append(symbol)
+    sql += " ORDER BY last_datetime_utc DESC, group_id DESC"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [int(limit), int(offset)]
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        return [dict(r) for r in conn.execute(sql, params)]
+
+
+def summary_totals_by_symbol(db_path: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """{symbol: {"quantity", "total_value", "fee", "groups"}} summed over representative legs."""
+    db_path = db_path or _default_db_path()
+    ensure_group_summary(db_path)
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            f"""SELECT symbol, SUM(IFNULL(quantity, 0)), SUM(IFNULL(total_value, 0)), SUM(IFNULL(fee, 0)), COUNT(*)
+                FROM {SUMMARY_TABLE} GROUP BY symbol"""
+        ).fetchall()
+    return {r[0]: {"quantity": r[1], "total_value": r[2], "fee": r[3], "groups": r[4]} for r in rows}
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    ap = argparse.ArgumentParser(description="Rebuild or verify the trade_group_summary table")
+    ap.add_argument("--db", default=None, help="ledger DB path (default: this bot's ledger)")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rebuild", action="store_true")
+    mode.add_argument("--verify", action="store_true")
+    args = ap.parse_args()
+    if args.rebuild:
+        print(f"[ledger_group_summary] rebuilt {rebuild_group_summaries(args.db)} group summaries")
+    else:
+        report = verify_group_summaries(args.db)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["ok"] else 1)
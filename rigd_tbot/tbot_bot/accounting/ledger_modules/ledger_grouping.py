@@ -1,9 +1,13 @@
 # tbot_bot/accounting/ledger_modules/ledger_grouping.py
 
 from typing import List, Dict, Any, Optional, Tuple
+import base64
+import json
+import os
 import sqlite3
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
 from tbot_bot.accounting.ledger_modules.ledger_entry import get_identity_tuple
+from tbot_bot.accounting.ledger_modules.ledger_group_summary import SUMMARY_TABLE, ensure_group_summary, rep_order_sql
 
 COLLAPSED_TABLE = "trade_group_collapsed"
 
@@ -448,3 +452,253 @@ def collapse_expand_group(group_id: str, by: str = "group_id", collapsed_state:
             cur.execute(f"INSERT INTO {COLLAPSED_TABLE} (group_id, collapsed) VALUES (?, ?)", (group_id, new_state))
         conn.commit()
     return True
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination: groups ordered in SQL by their representative leg (first debit leg by time, else first
+# leg — same choice as _pick_representative_leg), one page per query via an index on (sort expr, id).
+# Page cost is O(page size · log N) instead of materializing and sorting every group in Python.
+# by="group_id" walks trade_group_summary (one row per group, representative columns precomputed by
+# ledger_group_summary's triggers); by="trade_id" picks representative legs from trades on the fly.
+# ---------------------------------------------------------------------------
+
+# Canonical sort key -> SQL expression. Nullable columns are wrapped in IFNULL so NULLs sort like "" (as
+# _safe() does) and each expression has a matching expression index.
+PAGE_SORT_EXPRESSIONS = {
+    "datetime_utc": "datetime_utc",
+    "symbol": "symbol",
+    "account": "account",
+    "action": "action",
+    "quantity": "quantity",
+    "price": "price",
+    "fee": "IFNULL(fee, 0)",
+    "total_value": "total_value",
+    "status": "IFNULL(status, '')",
+    "trade_id": "trade_id",
+    "strategy": "IFNULL(strategy, '')",
+    "tags": "IFNULL(tags, '')",
+    "notes": "IFNULL(notes, '')",
+}
+_GROUP_KEYS = ("group_id", "trade_id")
+_COUNT_CACHE: Dict[Tuple[str, str], Tuple[Tuple, int]] = {}
+_INDEXED_DBS: set = set()
+
+
+def _page_index_statements() -> List[str]:
+    stmts = [
+        "CREATE INDEX IF NOT EXISTS idx_trades_group_time ON trades (group_id, datetime_utc)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_tradeid_time ON trades (trade_id, datetime_utc)",
+    ]
+    for name, expr in PAGE_SORT_EXPRESSIONS.items():
+        stmts.append(f"CREATE INDEX IF NOT EXISTS idx_trades_page_{name} ON trades ({expr}, id)")
+        stmts.append(f"CREATE INDEX IF NOT EXISTS idx_group_summary_page_{name} ON {SUMMARY_TABLE} ({expr}, rep_id)")
+    return stmts
+
+
+def ensure_page_indexes(db_path: str) -> None:
+    """Create the keyset-pagination indexes once per DB per process."""
+    if db_path in _INDEXED_DBS:
+        return
+    ensure_group_summary(db_path)
+    with sqlite3.connect(db_path) as conn:
+        for stmt in _page_index_statements():
+            conn.execute(stmt)
+        conn.commit()
+    _INDEXED_DBS.add(db_path)
+
+
+def _db_version_key(db_path: str) -> Tuple:
+    out = []
+    for p in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(p)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+def count_groups(db_path: str, by: str = "group_id") -> int:
+    """Distinct group count, cached until the ledger DB (or its WAL) changes."""
+    key_col = by if by in _GROUP_KEYS else "group_id"
+    version = _db_version_key(db_path)
+    hit = _COUNT_CACHE.get((db_path, key_col))
+    if hit and hit[0] == version:
+        return hit[1]
+    with sqlite3.connect(db_path) as conn:
+        if key_col == "group_id":
+            ensure_group_summary(db_path)
+            total = conn.execute(f"SELECT COUNT(*) FROM {SUMMARY_TABLE}").fetchone()[0]
+        else:
+            total = conn.execute(
+                f"SELECT COUNT(DISTINCT {key_col}) FROM trades WHERE {key_col} IS NOT NULL AND {key_col} <> ''"
+            ).fetchone()[0]
+    _COUNT_CACHE[(db_path, key_col)] = (version, int(total or 0))
+    return int(total or 0)
+
+
+def encode_cursor(sort_by: str, sort_desc: bool, value: Any, last_id: int) -> str:
+    raw = json.dumps({"s": sort_by, "d": int(bool(sort_desc)), "v": value, "i": int(last_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: Optional[str], sort_by: str, sort_desc: bool) -> Optional[Tuple[Any, int]]:
+    """(value, id) after which the next page starts; None for a missing/foreign/garbled token (= first page)."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        if data.get("s") != sort_by or bool(data.get("d")) != bool(sort_desc):
+            return None
+        return data["v"], int(data["i"])
+    except Exception:
+        return None
+
+
+def _page_seed_rows(conn: sqlite3.Connection, key_col: str, expr: str, sort_desc: bool,
+                    after: Optional[Tuple[Any, int]], limit: int) -> List[sqlite3.Row]:
+    """Representative legs of the next `limit` groups in (expr, id) order, walked along the page indexes."""
+    order = "DESC" if sort_desc else "ASC"
+    op = "<" if sort_desc else ">"
+    if key_col == "group_id":
+        # Summary rows: one per group, rep_id is the representative leg's trades.id
+        id_col, source = "rep_id", SUMMARY_TABLE
+        rep = "1"
+    else:
+        id_col, source = "id", "trades"
+        rep = (
+            f"{key_col} IS NOT NULL AND {key_col} <> '' AND id = (SELECT r.id FROM trades r "
+            f"WHERE r.{key_col} = trades.{key_col} ORDER BY {rep_order_sql('r')} LIMIT 1)"
+        )
+    select = f"SELECT {id_col} AS id, {key_col} AS gkey, {expr} AS sort_value FROM {source} WHERE "
+    if after is None:
+        return conn.execute(
+            f"{select}{rep} ORDER BY {expr} {order}, {id_col} {order} LIMIT ?", (limit,)
+        ).fetchall()
+    # (expr, id) > (v, i) split into two index seeks: the rest of the current value's run, then later values.
+    # A single row-value/OR predicate can't seek an expression index and degrades to a scan from the start.
+    value, last_id = after
+    rows = conn.execute(
+        f"{select}{expr} = ? AND {id_col} {op} ? AND {rep} ORDER BY {id_col} {order} LIMIT ?",
+        (value, last_id, limit),
+    ).fetchall()
+    if len(rows) < limit:
+        rows += conn.execute(
+            f"{select}{expr} {op} ? AND {rep} ORDER BY {expr} {order}, {id_col} {order} LIMIT ?",
+            (value, limit - len(rows)),
+        ).fetchall()
+    return rows
+
+
+def _rows_for_group_ids(conn: sqlite3.Connection, group_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Batched _rows_for_group_id: two queries for the whole page instead of two per group."""
+    out: Dict[str, List[Dict[str, Any]]] = {gid: [] for gid in group_ids}
+    if not group_ids:
+        return out
+    conn.row_factory = sqlite3.Row
+    ph = ",".join("?" * len(group_ids))
+    primary = conn.execute(
+        f"SELECT * FROM trades WHERE group_id IN ({ph}) ORDER BY datetime_utc ASC, id ASC", tuple(group_ids)
+    ).fetchall()
+    trade_to_group: Dict[str, str] = {}
+    for r in primary:
+        d = dict(r)
+        out[d["group_id"]].append(d)
+        if d.get("trade_id"):
+            trade_to_group.setdefault(d["trade_id"], d["group_id"])
+    extra: Dict[str, List[Dict[str, Any]]] = {}
+    if trade_to_group:
+        tids = sorted(trade_to_group)
+        rows = conn.execute(
+            f"""
+            SELECT * FROM trades
+            WHERE trade_id IN ({",".join("?" * len(tids))})
+              AND (group_id IS NULL OR group_id = '')
+            ORDER BY datetime_utc ASC, id ASC
+            """,
+            tuple(tids),
+        ).fetchall()
+        for r in rows:
+            d = dict(r)
+            gid = trade_to_group[d["trade_id"]]
+            d["group_id"] = gid  # patched for UI coherence; not persisted
+            extra.setdefault(gid, []).append(d)
+    return {gid: _merge_unique_by_id(legs, extra.get(gid, [])) for gid, legs in out.items()}
+
+
+def fetch_grouped_trades_page(
+    by: str = "group_id",
+    collapse: bool = True,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    show_expanded_groups: Optional[List[str]] = None,
+    *,
+    sort_by: Optional[str] = None,
+    sort_desc: bool = True,
+    db_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    One keyset page of grouped trades, sorted in SQL by the groups' representative legs.
+
+    Returns {"entries", "next_cursor", "total_groups", "sort_by", "sort_desc"}; entries have the same shape as
+    fetch_grouped_trades() (collapsed representatives with sub_entries, or expanded legs kept together in their
+    group's position). Pass next_cursor back as `cursor` for the following page; a cursor issued for a different
+    sort is ignored (first page). Sort keys outside PAGE_SORT_EXPRESSIONS fall back to datetime_utc.
+    """
+    if db_path is None:
+        entity_code, jurisdiction_code, broker_code, bot_id = get_identity_tuple()
+        db_path = resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
+    _ensure_collapsed_table(db_path)
+    ensure_page_indexes(db_path)
+
+    key_col = by if by in _GROUP_KEYS else "group_id"
+    sort_key = sort_by if sort_by in PAGE_SORT_EXPRESSIONS else "datetime_utc"
+    expr = PAGE_SORT_EXPRESSIONS[sort_key]
+    limit = max(1, int(limit))
+    after = decode_cursor(cursor, sort_key, sort_desc)
+    expanded = set(show_expanded_groups or [])
+
+    entries: List[Dict[str, Any]] = []
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        seeds = _page_seed_rows(conn, key_col, expr, sort_desc, after, limit + 1)
+        has_more = len(seeds) > limit
+        seeds = seeds[:limit]
+        keys = [s["gkey"] for s in seeds]
+        if key_col == "group_id":
+            groups = _rows_for_group_ids(conn, keys)
+        else:
+            groups = {tid: _rows_for_trade_id(conn, tid) for tid in keys}
+
+    group_ids = [(groups[k][0].get("group_id") or k) if groups.get(k) else k for k in keys]
+    collapsed_map = _get_collapsed_map(db_path, [g for g in group_ids if g])
+    for k, gid in zip(keys, group_ids):
+        group = groups.get(k) or []
+        if not group:
+            continue
+        group.sort(key=lambda row: _safe(row.get("datetime_utc")))
+        if collapse and collapsed_map.get(gid, 1) and gid not in expanded:
+            collapsed_row = collapse_group(group)
+            collapsed_row["collapsed"] = True
+            collapsed_row["group_id"] = gid
+            collapsed_row["sub_entries"] = group
+            entries.append(collapsed_row)
+        else:
+            for entry in group:
+                entry["collapsed"] = False
+                entry["group_id"] = gid
+                entry["sub_entries"] = []
+            entries.extend(group)
+
+    next_cursor = None
+    if has_more and seeds:
+        last = seeds[-1]
+        next_cursor = encode_cursor(sort_key, sort_desc, last["sort_value"], last["id"])
+    return {
+        "entries": entries,
+        "next_cursor": next_cursor,
+        "total_groups": count_groups(db_path, key_col),
+        "sort_by": sort_key,
+        "sort_desc": bool(sort_desc),
+    }
@@ -1,10 +1,15 @@
 # tbot_bot/accounting/ledger_modules/ledger_hooks.py
 
 from tbot_bot.accounting.ledger_modules.ledger_account_map import get_account_path, load_broker_code
-from tbot_web.support.auth_web import get_current_user
 from tbot_bot.accounting.ledger_modules.ledger_double_entry import post_ledger_entries_double_entry
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
 
+
+def get_current_user():
+    # Web-only dependency (pulls in Flask); resolved on call so headless workers don't import it
+    from tbot_web.support.auth_web import get_current_user as _web_current_user
+    return _web_current_user()
+
 # ---- Compliance filter (compat import) ----
 try:
     # Preferred boolean API
@@ -4,6 +4,7 @@ import sqlite3
 from tbot_bot.support.path_resolver import resolve_ledger_db_path
 from tbot_bot.accounting.ledger_modules.ledger_entry import get_identity_tuple
 from tbot_bot.accounting.ledger_modules.ledger_grouping import fetch_grouped_trades as grouping_fetch_grouped_trades, fetch_trade_group_by_id as grouping_fetch_trade_group_by_id
+from tbot_bot.accounting.ledger_modules.ledger_group_summary import fetch_group_summaries, summary_totals_by_symbol
 
 PRIMARY_FIELDS = ("symbol", "datetime_utc", "action", "price", "quantity", "total_value")
 
@@ -18,6 +19,34 @@ def fetch_grouped_trades(*args, **kwargs):
 def fetch_trade_group_by_id(group_id):
     return grouping_fetch_trade_group_by_id(group_id)
 
+def fetch_grouped_trades_summary(limit=None, offset=0, symbol=None):
+    """
+    One precomputed row per group (trade_group_summary), newest activity first.
+    """
+    return fetch_group_summaries(limit=limit, offset=offset, symbol=symbol)
+
+def fetch_trades_by_group(group_id):
+    """
+    All legs of a group (falls back to trade_id match, so a bare trade_id also works).
+    """
+    if not group_id:
+        return []
+    entity_code, jurisdiction_code, broker_code, bot_id = get_identity_tuple()
+    db_path = resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT * FROM trades WHERE group_id = ? ORDER BY datetime_utc ASC, id ASC", (group_id,)
+        ).fetchall()
+        if not rows:
+            rows = conn.execute(
+                "SELECT * FROM trades WHERE trade_id = ? ORDER BY datetime_utc ASC, id ASC", (group_id,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+def get_summary_totals_by_symbol():
+    return summary_totals_by_symbol()
+
 def search_trades(search_term=None, sort_by="datetime_utc", sort_desc=True, limit=1000):
     entity_code, jurisdiction_code, broker_code, bot_id = get_identity_tuple()
     db_path = resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
@@ -16,7 +16,7 @@ from tbot_bot.accounting.coa_mapping_table import (
     get_mapping_for_transaction,
     flag_unmapped_transaction,
 )
-from tbot_bot.accounting.reconciliation_log import log_reconciliation_entry
+from tbot_bot.accounting.reconciliation_log import log_reconciliation_entries
 from tbot_bot.accounting.ledger_modules.ledger_entry import get_identity_tuple
 from tbot_bot.broker.utils.ledger_normalizer import normalize_trade
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
@@ -585,10 +585,10 @@ def sync_broker_ledger():
     # Validate double-entry integrity
     validate_double_entry()
 
-    # Write reconciliation records
+    # Write reconciliation records (one transaction for the whole run)
     mapping_version = str((mapping_table or {}).get("version", ""))
+    recon_entries = []
     for entry in all_entries:
-        trade_id = entry.get("trade_id")
         api_hash = ""
         jm = entry.get("json_metadata")
         if isinstance(jm, dict):
@@ -599,18 +599,17 @@ def sync_broker_ledger():
                 api_hash = jm_obj.get("api_hash", "") or jm_obj.get("credential_hash", "")
             except Exception:
                 pass
-
-        log_reconciliation_entry(
-            trade_id=trade_id,
-            status="matched",
-            compare_fields={},
-            sync_run_id=sync_run_id,
-            api_hash=api_hash,
-            broker=broker_code,
-            raw_record=entry,
-            mapping_version=mapping_version,
-            notes="Imported by sync",
-            entity_code=entity_code,
-            jurisdiction_code=jurisdiction_code,
-            broker_code=broker_code,
-        )
+        recon_entries.append({"trade_id": entry.get("trade_id"), "api_hash": api_hash, "raw_record": entry})
+
+    log_reconciliation_entries(
+        recon_entries,
+        status="matched",
+        compare_fields={},
+        sync_run_id=sync_run_id,
+        broker=broker_code,
+        mapping_version=mapping_version,
+        notes="Imported by sync",
+        entity_code=entity_code,
+        jurisdiction_code=jurisdiction_code,
+        broker_code=broker_code,
+    )
@@ -53,6 +53,33 @@ CREATE TABLE IF NOT EXISTS reconciliation_log (
 );
 """
 
+# Lookup indexes for get_reconciliation_entries filters (also in tbot_ledger_schema.sql)
+RECON_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_recon_sync_run_id ON reconciliation_log (sync_run_id)",
+    "CREATE INDEX IF NOT EXISTS idx_recon_trade_id ON reconciliation_log (trade_id)",
+    "CREATE INDEX IF NOT EXISTS idx_recon_status ON reconciliation_log (status)",
+)
+
+INSERT_COLUMNS = (
+    "trade_id", "entity_code", "jurisdiction_code", "broker_code", "broker", "error_code",
+    "account_id", "statement_date", "ledger_balance", "ledger_entry_id", "broker_balance", "delta",
+    "status", "event_type", "resolution", "resolved_by", "resolved_at", "raw_record", "notes", "recon_type",
+    "raw_record_json", "compare_fields", "json_metadata", "timestamp_utc", "sync_run_id", "api_hash",
+    "imported_at", "updated_at", "user_action", "mapping_version",
+)
+_INSERT_SQL = (
+    f"INSERT INTO reconciliation_log ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(INSERT_COLUMNS))})"
+)
+
+_CODE_KEYS = ("entity_code", "jurisdiction_code", "broker_code")
+
+# Schema/migration/index checks run once per DB per process
+_SCHEMA_READY = set()
+
+# Reused C-accelerated encoder; tuples encode as lists natively, anything else unserializable falls back to str
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
 def _get_db_path():
     entity_code, jurisdiction_code, broker_code, bot_id = get_bot_identity().split("_")
     return resolve_ledger_db_path(entity_code, jurisdiction_code, broker_code, bot_id)
@@ -73,12 +100,25 @@ def _ensure_event_type_column(conn: sqlite3.Connection):
         conn.execute("ALTER TABLE reconciliation_log ADD COLUMN event_type TEXT")
         conn.execute("UPDATE reconciliation_log SET event_type = ? WHERE event_type IS NULL OR event_type = ''", (EVENT_UNKNOWN,))
 
+def _ensure_schema(conn: sqlite3.Connection):
+    conn.execute(RECON_TABLE_SCHEMA)
+    _ensure_event_type_column(conn)
+    for stmt in RECON_INDEX_SQL:
+        conn.execute(stmt)
+
+def _ensure_schema_once(conn: sqlite3.Connection, db_path):
+    if db_path in _SCHEMA_READY:
+        return
+    _ensure_schema(conn)
+    conn.commit()
+    _SCHEMA_READY.add(db_path)
+
 def init_reconciliation_log_table():
     db_path = _get_db_path()
     with sqlite3.connect(db_path) as conn:
-        conn.execute(RECON_TABLE_SCHEMA)
-        _ensure_event_type_column(conn)
+        _ensure_schema(conn)
         conn.commit()
+    _SCHEMA_READY.add(db_path)
 
 def log_reconciliation_entry(
     trade_id,
@@ -116,76 +156,56 @@ def log_reconciliation_entry(
     Append a reconciliation log entry. Autofill codes from bot_identity if not provided.
     Enforces non-null event_type (defaults to EVENT_UNKNOWN).
     """
-    if not (entity_code and jurisdiction_code and broker_code):
-        identity = get_bot_identity()
-        entity_code, jurisdiction_code, broker_code, _ = identity.split("_")
-    db_path = _get_db_path()
+    entry = dict(locals())
+    log_reconciliation_entries([entry])
+
+# INSERT_COLUMNS -> entry key; JSON columns are encoded, timestamp_utc is stamped per batch
+_ENTRY_KEYS = tuple({"raw_record": "raw_record_text", "raw_record_json": "raw_record"}.get(c, c) for c in INSERT_COLUMNS)
+_JSON_KEYS = ("raw_record", "compare_fields", "json_metadata")
+
+def _rows_for(entries, defaults, timestamp_utc):
+    """Insert tuples for entry dicts (log_reconciliation_entry keyword names); None/missing keys use defaults."""
+    encode = _JSON_ENCODER.encode
+    # Batch-wide defaults are encoded once, not once per row
+    fallback = dict(defaults, timestamp_utc=timestamp_utc)
+    fallback.update({k: encode(defaults.get(k) or {}) for k in _JSON_KEYS})
+    fallback["event_type"] = (defaults.get("event_type") or "").strip() or EVENT_UNKNOWN
+    rows = []
+    for e in entries:
+        row = []
+        for k in _ENTRY_KEYS:
+            v = e.get(k)
+            if v is None or k == "timestamp_utc":
+                row.append(fallback.get(k))
+            elif k in _JSON_KEYS:
+                row.append(encode(v))
+            elif k == "event_type":
+                row.append(v.strip() or fallback[k])  # enforce non-null/blank event_type
+            else:
+                row.append(v)
+        rows.append(tuple(row))
+    return rows
+
+def log_reconciliation_entries(entries, **defaults):
+    """
+    Append many reconciliation log entries in one transaction (executemany).
+    Each entry is a dict using log_reconciliation_entry's keyword names; `defaults` (e.g. sync_run_id,
+    broker, mapping_version, event_type) fill keys an entry leaves unset or None. Entity/jurisdiction/broker
+    codes autofill from bot_identity. Returns the number of rows written.
+    """
+    entries = list(entries or [])
+    if not entries:
+        return 0
+    if not all(defaults.get(k) for k in _CODE_KEYS) and any(not all(e.get(k) for k in _CODE_KEYS) for e in entries):
+        defaults.update(zip(_CODE_KEYS, get_bot_identity().split("_")[:3]))
     timestamp_utc = datetime.utcnow().isoformat()
-
-    # Enforce non-null/blank event_type
-    safe_event = (event_type or "").strip() or EVENT_UNKNOWN
-
-    def make_json_safe(obj):
-        if isinstance(obj, tuple):
-            return [make_json_safe(i) for i in obj]
-        elif isinstance(obj, dict):
-            return {k: make_json_safe(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [make_json_safe(i) for i in obj]
-        else:
-            return obj
-
-    compare_fields_json = json.dumps(make_json_safe(compare_fields or {}))
-    raw_record_json = json.dumps(make_json_safe(raw_record or {}))
-    json_metadata_json = json.dumps(json_metadata or {})
-
+    rows = _rows_for(entries, defaults, timestamp_utc)
+    db_path = _get_db_path()
     with sqlite3.connect(db_path) as conn:
-        conn.execute(RECON_TABLE_SCHEMA)  # ensure table exists on first call
-        _ensure_event_type_column(conn)
-        conn.execute(
-            """
-            INSERT INTO reconciliation_log (
-                trade_id, entity_code, jurisdiction_code, broker_code, broker, error_code,
-                account_id, statement_date, ledger_balance, ledger_entry_id, broker_balance, delta,
-                status, event_type, resolution, resolved_by, resolved_at, raw_record, notes, recon_type,
-                raw_record_json, compare_fields, json_metadata, timestamp_utc, sync_run_id, api_hash,
-                imported_at, updated_at, user_action, mapping_version
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                trade_id,
-                entity_code,
-                jurisdiction_code,
-                broker_code,
-                broker,
-                error_code,
-                account_id,
-                statement_date,
-                ledger_balance,
-                ledger_entry_id,
-                broker_balance,
-                delta,
-                status,
-                safe_event,
-                resolution,
-                resolved_by,
-                resolved_at,
-                raw_record_text,
-                notes,
-                recon_type,
-                raw_record_json,
-                compare_fields_json,
-                json_metadata_json,
-                timestamp_utc,
-                sync_run_id,
-                api_hash,
-                imported_at,
-                updated_at,
-                user_action,
-                mapping_version,
-            )
-        )
+        _ensure_schema_once(conn, db_path)
+        conn.executemany(_INSERT_SQL, rows)
         conn.commit()
+    return len(rows)
 
 def get_reconciliation_entries(sync_run_id=None, trade_id=None, status=None):
     db_path = _get_db_path()
@@ -213,11 +233,7 @@ def snapshot_reconciliation_log():
         return json.dumps([dict(row) for row in cursor.fetchall()], indent=2)
 
 def ensure_reconciliation_log_initialized():
-    db_path = _get_db_path()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(RECON_TABLE_SCHEMA)
-        _ensure_event_type_column(conn)
-        conn.commit()
+    init_reconciliation_log_table()
 
 # ---- Helper wrappers for common events ----
 def log_event_coa_leg_reassigned(**kwargs):
@@ -392,6 +392,31 @@ CREATE TABLE IF NOT EXISTS reconciliation_log (
     mapping_version TEXT
 );
 
+-- Per-group summaries of trades (representative leg + aggregates), one row per group_id.
+-- Kept current by AFTER INSERT/UPDATE/DELETE triggers on trades installed by
+-- ledger_modules/ledger_group_summary.ensure_group_summary (which also backfills on first install).
+CREATE TABLE IF NOT EXISTS trade_group_summary (
+    group_id TEXT PRIMARY KEY,
+    rep_id INTEGER NOT NULL,
+    trade_id TEXT,
+    datetime_utc TEXT,
+    symbol TEXT,
+    account TEXT,
+    action TEXT,
+    quantity REAL,
+    price REAL,
+    fee REAL,
+    total_value REAL,
+    status TEXT,
+    strategy TEXT,
+    tags TEXT,
+    notes TEXT,
+    leg_count INTEGER NOT NULL,
+    fee_total REAL NOT NULL DEFAULT 0.0,
+    first_datetime_utc TEXT,
+    last_datetime_utc TEXT
+);
+
 
 
 
@@ -400,6 +425,39 @@ CREATE TABLE IF NOT EXISTS reconciliation_log (
 CREATE INDEX IF NOT EXISTS idx_trades_symbol_time ON trades (symbol, datetime_utc);
 CREATE INDEX IF NOT EXISTS idx_trades_entity ON trades (entity_code);
 CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades (strategy);
+-- Natural key of a leg (ledger_deduplication.ensure_natural_key_index): one leg per broker trade and side
+CREATE UNIQUE INDEX IF NOT EXISTS uq_trades_natural_key ON trades (trade_id, broker_code, side);
+-- Ledger UI keyset pagination (ledger_grouping.fetch_grouped_trades_page): one (sort expression, id) index per
+-- sortable column, and the expressions must match ledger_grouping.PAGE_SORT_EXPRESSIONS exactly
+CREATE INDEX IF NOT EXISTS idx_trades_group_time ON trades (group_id, datetime_utc);
+CREATE INDEX IF NOT EXISTS idx_trades_tradeid_time ON trades (trade_id, datetime_utc);
+CREATE INDEX IF NOT EXISTS idx_trades_page_datetime_utc ON trades (datetime_utc, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_symbol ON trades (symbol, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_account ON trades (account, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_action ON trades (action, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_quantity ON trades (quantity, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_price ON trades (price, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_fee ON trades (IFNULL(fee, 0), id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_total_value ON trades (total_value, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_status ON trades (IFNULL(status, ''), id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_trade_id ON trades (trade_id, id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_strategy ON trades (IFNULL(strategy, ''), id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_tags ON trades (IFNULL(tags, ''), id);
+CREATE INDEX IF NOT EXISTS idx_trades_page_notes ON trades (IFNULL(notes, ''), id);
+CREATE INDEX IF NOT EXISTS idx_trade_group_summary_symbol ON trade_group_summary (symbol);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_datetime_utc ON trade_group_summary (datetime_utc, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_symbol ON trade_group_summary (symbol, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_account ON trade_group_summary (account, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_action ON trade_group_summary (action, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_quantity ON trade_group_summary (quantity, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_price ON trade_group_summary (price, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_fee ON trade_group_summary (IFNULL(fee, 0), rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_total_value ON trade_group_summary (total_value, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_status ON trade_group_summary (IFNULL(status, ''), rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_trade_id ON trade_group_summary (trade_id, rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_strategy ON trade_group_summary (IFNULL(strategy, ''), rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_tags ON trade_group_summary (IFNULL(tags, ''), rep_id);
+CREATE INDEX IF NOT EXISTS idx_group_summary_page_notes ON trade_group_summary (IFNULL(notes, ''), rep_id);
 CREATE INDEX IF NOT EXISTS idx_ledger_entries_datetime ON ledger_entries (datetime_utc, entry_type);
 CREATE INDEX IF NOT EXISTS idx_ledger_entries_entity ON ledger_entries (entity_code);
 CREATE INDEX IF NOT EXISTS idx_events_type_time ON events (type, event_time_utc);
@@ -407,6 +465,10 @@ CREATE INDEX IF NOT EXISTS idx_events_entity ON events (entity_code);
 CREATE INDEX IF NOT EXISTS idx_float_allocation_by_date ON float_allocation_history (date, entity_code);
 CREATE INDEX IF NOT EXISTS idx_audit_trail_event_type ON audit_trail (event_type);
 CREATE INDEX IF NOT EXISTS idx_audit_trail_timestamp ON audit_trail (timestamp);
+-- reconciliation_log.get_reconciliation_entries filters (also created by reconciliation_log._ensure_schema)
+CREATE INDEX IF NOT EXISTS idx_recon_sync_run_id ON reconciliation_log (sync_run_id);
+CREATE INDEX IF NOT EXISTS idx_recon_trade_id ON reconciliation_log (trade_id);
+CREATE INDEX IF NOT EXISTS idx_recon_status ON reconciliation_log (status);
 CREATE INDEX IF NOT EXISTS idx_extstat_broker_date ON external_statements (broker_code, statement_date);
 CREATE INDEX IF NOT EXISTS idx_exttrans_broker_tradeid ON external_transactions (broker_code, trade_id);
 CREATE INDEX IF NOT EXISTS idx_acct_balances_broker_entity ON account_balances (broker_code, entity_code, currency_code);
@@ -10,34 +10,31 @@ import os
 import json
 import argparse
 from datetime import datetime, timezone
+from functools import partial
 import pandas as pd
 
 from tbot_bot.backtest.load_historical_data import load_data
 from tbot_bot.backtest.performance_metrics import calculate_metrics
-from tbot_bot.backtest.plot_results import plot_equity_curve
-from tbot_bot.config.env_bot import get_bot_config
-
-from tbot_bot.strategy.strategy_open import simulate_open
-from tbot_bot.strategy.strategy_mid import simulate_mid
-from tbot_bot.strategy.strategy_close import simulate_close
+from tbot_bot.backtest.simulators import simulate
 
 # Output folder for backtest results
 BACKTEST_DIR = "tbot_bot/backtest/results"
 os.makedirs(BACKTEST_DIR, exist_ok=True)
 
-# Map strategies to their simulation entry points
+# Map strategies to their simulation entry points (same functions strategy_*.simulate_* delegate to;
+# bound here directly so the engine does not import the live strategy modules and their secrets)
 STRATEGY_SIMULATORS = {
-    "open": simulate_open,
-    "mid": simulate_mid,
-    "close": simulate_close
+    "open": partial(simulate, "open"),
+    "mid": partial(simulate, "mid"),
+    "close": partial(simulate, "close")
 }
 
-def backtest(strategy: str, data_path: str, start_date: str, end_date: str):
+def backtest(strategy: str, data_path: str, start_date: str, end_date: str, config: dict = None, plot: bool = True):
     if strategy not in STRATEGY_SIMULATORS:
         raise ValueError(f"[backtest_engine] Unknown strategy: {strategy}")
 
     # Load OHLCV historical data
-    df = load_data(data_path)
+    df = load_data(data_path, start=start_date, end=end_date)
     df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
     df = df[(df["timestamp"] >= start_date) & (df["timestamp"] <= end_date)].copy()
 
@@ -46,7 +43,9 @@ def backtest(strategy: str, data_path: str, start_date: str, end_date: str):
 
     print(f"[backtest_engine] Running backtest for {strategy} strategy...")
     simulate_func = STRATEGY_SIMULATORS[strategy]
-    config = get_bot_config()
+    if config is None:
+        from tbot_bot.config.env_bot import get_bot_config
+        config = get_bot_config()
     trades = simulate_func(df, config)
 
     # Output log file
@@ -57,27 +56,35 @@ def backtest(strategy: str, data_path: str, start_date: str, end_date: str):
     trades_csv = os.path.join(BACKTEST_DIR, f"trade_history_{base_name}.csv")
     summary_json = os.path.join(BACKTEST_DIR, f"daily_summary_{base_name}.json")
 
-    pd.DataFrame(trades).to_csv(trades_csv, index=False)
+    trades_df = pd.DataFrame(trades)
+    if not trades_df.empty:
+        trades_df["timestamp"] = pd.to_datetime(trades_df["timestamp"], utc=True)
+    trades_df.to_csv(trades_csv, index=False)
     with open(trades_json, "w") as f_json:
         json.dump(trades, f_json, indent=2)
 
-    summary = calculate_metrics(trades)
+    summary = calculate_metrics(trades_df)
     with open(summary_json, "w") as f_summary:
-        json.dump(summary, f_summary, indent=2)
+        json.dump(summary, f_summary, indent=2, default=float)
 
     print(f"[backtest_engine] Backtest complete. Logs saved to:")
     print(f"  - {trades_csv}")
     print(f"  - {trades_json}")
     print(f"  - {summary_json}")
 
-    plot_equity_curve(trades, title=f"{strategy.capitalize()} Strategy")
+    if plot:
+        from tbot_bot.backtest.plot_results import plot_equity_curve
+        plot_equity_curve(trades_df, title=f"{strategy.capitalize()} Strategy")
+    return trades
 
 # ---- surgical: provide the expected public API name used by tests ----
-def run_backtest(strategy: str, data_path: str, start_date: str, end_date: str):
+def run_backtest(strategy: str, data_path: str = None, start_date: str = None, end_date: str = None, *,
+                 data_source: str = None, config: dict = None, plot: bool = False):
     """
-    Thin wrapper kept for test compatibility.
+    Thin wrapper kept for test compatibility; positional order unchanged, data_source is a keyword alias of data_path.
     """
-    return backtest(strategy=strategy, data_path=data_path, start_date=start_date, end_date=end_date)
+    return backtest(strategy=strategy, data_path=data_path or data_source, start_date=start_date,
+                    end_date=end_date, config=config, plot=plot)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="TradeBot Backtest Engine")
@@ -0,0 +1,345 @@
+# tbot_bot/backtest/historical_store.py
+# Columnar cache for historical OHLCV bars: CSV is converted once into a partitioned Parquet/Feather
+# dataset with explicit dtypes, then read back with column/predicate pushdown.
+
+"""
+Layout
+------
+<cache_root>/<csv name>_<path digest>/
+    manifest.json                    source path/size/mtime + content hash, format, schema version
+    data/month=<YYYYMM>/part-0.parquet|.feather
+
+Conversion is two-pass: CSV blocks are streamed into month-partitioned staging files, then each month
+is sorted by (symbol, timestamp) and rewritten as one file with large row groups. Memory is bounded
+by one month of bars, not by the CSV size.
+
+Pushdown: start/end select month directories before any file is opened; within a file, row-group
+statistics on the sorted symbol column (Parquet) skip symbols outside the filter, and only the
+requested columns are decoded. Feather (Arrow IPC, uncompressed) files are memory-mapped on read;
+Parquet (zstd) is smaller on disk.
+
+Partitions are calendar months rather than symbol x date: per-symbol-per-day files would be 126,000
+files for one year of 500 symbols, and file/row-group overhead then dominates full reads.
+
+The manifest records a BLAKE2b hash of the CSV. A cache is reused when the source's size and mtime
+still match; if they changed, the file is re-hashed and only a different hash triggers reconversion.
+
+Cache root: TBOT_HISTORICAL_CACHE_DIR, default tbot_bot/backtest/data/cache.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+SCHEMA_VERSION = 1
+ROW_GROUP_ROWS = 128 * 1024
+DEFAULT_CACHE_ROOT = os.path.join("tbot_bot", "backtest", "data", "cache")
+MANIFEST_FILE = "manifest.json"
+FORMATS = ("parquet", "feather")
+REQUIRED_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+FLOAT_COLUMNS = ("open", "high", "low", "close", "volume", "vix")
+DEFAULT_SYMBOL = "SYMBOL"
+# Cells pd.to_numeric accepts (after trimming); anything else becomes null, as errors="coerce" does ("nan" too,
+# so NaN-valued required cells are dropped like dropna drops them)
+_NUMERIC_RE = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$|^[+-]?inf(inity)?$"
+_HASH_CHUNK = 8 * 1024 * 1024
+
+
+def cache_root() -> str:
+    return os.environ.get("TBOT_HISTORICAL_CACHE_DIR", "").strip() or DEFAULT_CACHE_ROOT
+
+
+def store_dir_for(csv_path: str, fmt: str = "parquet", root: Optional[str] = None) -> str:
+    digest = hashlib.sha1(f"{os.path.abspath(csv_path)}|{fmt}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(root or cache_root(), f"{os.path.splitext(os.path.basename(csv_path))[0]}_{digest}")
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Manifest
+# ----------------------------------------------------------------------
+def read_manifest(store_dir: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(store_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _write_manifest(store_dir: str, manifest: Dict) -> None:
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def is_fresh(csv_path: str, store_dir: str, fmt: str = "parquet") -> bool:
+    """
+    True when store_dir holds a complete conversion of csv_path's current content.
+    Re-hashes only when size/mtime moved; a touched-but-identical file refreshes the manifest stamp.
+    """
+    m = read_manifest(store_dir)
+    if not m or m.get("schema_version") != SCHEMA_VERSION or m.get("format") != fmt:
+        return False
+    if not os.path.isdir(os.path.join(store_dir, "data")):
+        return False
+    st = os.stat(csv_path)
+    if m.get("source_size") == st.st_size and m.get("source_mtime_ns") == st.st_mtime_ns:
+        return True
+    if m.get("source_size") != st.st_size or file_hash(csv_path) != m.get("source_hash"):
+        return False
+    m["source_mtime_ns"] = st.st_mtime_ns
+    _write_manifest(store_dir, m)
+    return True
+
+
+# ----------------------------------------------------------------------
+# Conversion
+# ----------------------------------------------------------------------
+def _head(csv_path: str):
+    """Header and first data row (quoted or not)."""
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = [c.strip() for c in next(reader, [])]
+        row = next(reader, [])
+    return header, row
+
+
+def _sniff_tz_aware(csv_path: str) -> bool:
+    """Whether the first data row's timestamp carries a zone (Z / +hh:mm); naive stamps are read as UTC."""
+    header, row = _head(csv_path)
+    try:
+        ts = row[header.index("timestamp")].strip()
+    except (ValueError, IndexError):
+        return False
+    tail = ts[10:]
+    return tail.endswith("Z") or "+" in tail or tail.count("-") > 0
+
+
+def _arrow_batches(csv_path: str, block_size: int) -> Iterator:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    header, _ = _head(csv_path)
+    missing = set(REQUIRED_COLUMNS) - set(header)
+    if missing:
+        raise ValueError(f"[historical_store] Missing required columns: {missing}")
+    ts_type = pa.timestamp("ns", tz="UTC") if _sniff_tz_aware(csv_path) else pa.timestamp("ns")
+    floats = [c for c in FLOAT_COLUMNS if c in header]
+    # Numeric columns are read as text and coerced per cell: a typed read would fail the whole file on one bad cell
+    types = {"timestamp": ts_type, "symbol": pa.string()}
+    types.update({c: pa.string() for c in floats})
+    keep = [c for c in ("timestamp", "symbol") + FLOAT_COLUMNS if c in header]
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=pacsv.ConvertOptions(column_types=types, include_columns=keep),
+    )
+    for batch in reader:
+        tbl = pa.Table.from_batches([batch])
+        ts = tbl.column("timestamp")
+        if ts.type.tz is None:
+            ts = ts.cast(pa.timestamp("ns", tz="UTC"))
+        tbl = tbl.set_column(tbl.schema.get_field_index("timestamp"), "timestamp", ts)
+        for c in floats:
+            text = pc.utf8_trim_whitespace(tbl.column(c))
+            ok = pc.match_substring_regex(text, _NUMERIC_RE, ignore_case=True)
+            num = pc.if_else(ok, text, pa.scalar(None, pa.string())).cast(pa.float64())
+            tbl = tbl.set_column(tbl.schema.get_field_index(c), c, num)
+        if "symbol" not in tbl.column_names:
+            tbl = tbl.append_column("symbol", pa.array([DEFAULT_SYMBOL] * tbl.num_rows, pa.string()))
+        # Like load_data: only rows missing a required value are dropped; optional columns (vix) may be null
+        valid = [pc.is_valid(tbl.column(c)) for c in REQUIRED_COLUMNS]
+        keep_rows = valid[0]
+        for v in valid[1:]:
+            keep_rows = pc.and_(keep_rows, v)
+        tbl = tbl.filter(keep_rows)
+        if not tbl.num_rows:
+            continue
+        ts = tbl.column("timestamp")
+        month = pc.add(pc.multiply(pc.year(ts), 100), pc.month(ts)).cast(pa.int32())  # yyyymm
+        tbl = tbl.append_column("month", month)
+        for b in tbl.to_batches():
+            yield b
+
+
+def convert_csv(csv_path: str, store_dir: Optional[str] = None, fmt: str = "parquet",
+                block_size: int = 64 << 20) -> str:
+    """
+    Convert csv_path into the month-partitioned store (built in a temp dir, then swapped in).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if fmt not in FORMATS:
+        raise ValueError(f"[historical_store] Unknown format: {fmt}")
+    store_dir = store_dir or store_dir_for(csv_path, fmt)
+    source_hash = file_hash(csv_path)
+    st = os.stat(csv_path)
+    tmp_dir = store_dir + ".building"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    batches = _arrow_batches(csv_path, block_size)
+    first = next(batches, None)
+    if first is None:
+        raise ValueError(f"[historical_store] No rows in {csv_path}")
+
+    def _all():
+        yield first
+        yield from batches
+
+    # Pass 1: stream into month staging files (uncompressed IPC, cheap to write and re-read)
+    staging = os.path.join(tmp_dir, "staging")
+    ds.write_dataset(
+        ds.Scanner.from_batches(_all(), schema=first.schema),
+        staging,
+        format="ipc",
+        partitioning=ds.partitioning(pa.schema([("month", pa.int32())]), flavor="hive"),
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+    # Pass 2: one sorted file per month with large row groups
+    columns = [f.name for f in first.schema if f.name != "month"]
+    for month_dir in sorted(os.listdir(staging)):
+        tbl = ds.dataset(os.path.join(staging, month_dir), format="ipc").to_table()
+        tbl = tbl.sort_by([("symbol", "ascending"), ("timestamp", "ascending")])
+        sym_idx = tbl.schema.get_field_index("symbol")
+        tbl = tbl.set_column(sym_idx, "symbol", pc.dictionary_encode(tbl.column("symbol")))
+        out_dir = os.path.join(tmp_dir, "data", month_dir)
+        os.makedirs(out_dir, exist_ok=True)
+        if fmt == "feather":
+            feather.write_feather(tbl, os.path.join(out_dir, "part-0.feather"),
+                                  compression="uncompressed", chunksize=ROW_GROUP_ROWS)
+        else:
+            pq.write_table(tbl, os.path.join(out_dir, "part-0.parquet"), compression="zstd",
+                           row_group_size=ROW_GROUP_ROWS)
+        shutil.rmtree(os.path.join(staging, month_dir), ignore_errors=True)
+    shutil.rmtree(staging, ignore_errors=True)
+
+    _write_manifest(tmp_dir, {
+        "schema_version": SCHEMA_VERSION,
+        "format": fmt,
+        "source_path": os.path.abspath(csv_path),
+        "source_size": st.st_size,
+        "source_mtime_ns": st.st_mtime_ns,
+        "source_hash": source_hash,
+        "columns": columns,
+        "converted_at": datetime.now(timezone.utc).isoformat(),
+    })
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.replace(tmp_dir, store_dir)
+    _log(f"converted {csv_path} -> {store_dir} ({fmt})")
+    return store_dir
+
+
+def ensure_store(csv_path: str, fmt: str = "parquet", store_dir: Optional[str] = None, rebuild: bool = False) -> str:
+    store_dir = store_dir or store_dir_for(csv_path, fmt)
+    if rebuild or not is_fresh(csv_path, store_dir, fmt):
+        convert_csv(csv_path, store_dir, fmt)
+    return store_dir
+
+
+# ----------------------------------------------------------------------
+# Reads
+# ----------------------------------------------------------------------
+def _months(start: pd.Timestamp, end: pd.Timestamp) -> List[int]:
+    return [p.year * 100 + p.month for p in pd.period_range(start.tz_convert(None).to_period("M"),
+                                                             end.tz_convert(None).to_period("M"), freq="M")]
+
+
+def _utc(ts) -> Optional[pd.Timestamp]:
+    if ts is None:
+        return None
+    t = pd.Timestamp(ts)
+    return t.tz_localize("UTC") if t.tzinfo is None else t.tz_convert("UTC")
+
+
+def open_dataset(store_dir: str):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+
+    m = read_manifest(store_dir) or {}
+    fmt = m.get("format", "parquet")
+    if fmt == "feather":
+        file_format = ds.IpcFileFormat()
+    else:
+        file_format = ds.ParquetFileFormat(read_options={"dictionary_columns": ["symbol"]})
+    return ds.dataset(
+        os.path.join(store_dir, "data"),
+        format=file_format,
+        partitioning=ds.partitioning(pa.schema([("month", pa.int32())]), flavor="hive"),
+        filesystem=pafs.LocalFileSystem(use_mmap=(fmt == "feather")),
+    )
+
+
+def read_store(store_dir: str, start=None, end=None, symbols: Optional[Iterable[str]] = None,
+               columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Filtered read; month partitions and symbol row-group statistics prune data before decoding."""
+    import pyarrow.dataset as ds
+
+    dataset = open_dataset(store_dir)
+    start, end = _utc(start), _utc(end)
+    expr = None
+
+    def _and(e):
+        nonlocal expr
+        expr = e if expr is None else (expr & e)
+
+    if symbols is not None:
+        _and(ds.field("symbol").isin([str(s) for s in symbols]))
+    if start is not None or end is not None:
+        lo = start or pd.Timestamp("1970-01-01", tz="UTC")
+        hi = end or pd.Timestamp.now(tz="UTC")
+        _and(ds.field("month").isin(_months(lo, hi)))
+    if start is not None:
+        _and(ds.field("timestamp") >= start.to_pydatetime())
+    if end is not None:
+        _and(ds.field("timestamp") <= end.to_pydatetime())
+
+    names = [n for n in dataset.schema.names if n != "month"]
+    cols = list(columns) if columns else names
+    if "timestamp" not in cols:
+        cols = ["timestamp"] + cols
+    table = dataset.to_table(columns=[c for c in cols if c in names], filter=expr)
+    # Files are month-ordered and symbol-sorted, so a stable timestamp sort leaves ties in symbol order
+    table = table.unify_dictionaries().sort_by([("timestamp", "ascending")])
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_bars(csv_path: str, start=None, end=None, symbols: Optional[Iterable[str]] = None,
+              columns: Optional[Sequence[str]] = None, fmt: str = "parquet", rebuild: bool = False) -> pd.DataFrame:
+    """Convert-once-then-read: the cached equivalent of load_historical_data.load_data plus filters."""
+    return read_store(ensure_store(csv_path, fmt=fmt, rebuild=rebuild), start=start, end=end,
+                      symbols=symbols, columns=columns)
+
+
+def _log(msg: str, level: str = "info") -> None:
+    try:
+        from tbot_bot.support.utils_log import log_event
+        log_event("historical_store", msg, level=level)
+    except Exception:
+        print(f"[historical_store] {msg}", flush=True)
@@ -2,10 +2,27 @@
 # Load from CSV, OHLCV, or tick sources
 # -----------------------------------------
 # Loads and normalizes OHLCV data for use in backtest simulations.
+# CSV sources are converted once into a columnar cache (historical_store.py) and read from there
+# when pyarrow is available; set TBOT_HISTORICAL_CACHE=0 to always parse the CSV.
+
+import os
+from typing import Iterable, Optional, Sequence
 
 import pandas as pd
 
-def load_data(filepath: str) -> pd.DataFrame:
+def _cache_enabled(use_cache: Optional[bool]) -> bool:
+    if use_cache is not None:
+        return bool(use_cache)
+    if os.environ.get("TBOT_HISTORICAL_CACHE", "1") == "0":
+        return False
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def load_data(filepath: str, start=None, end=None, symbols: Optional[Iterable[str]] = None,
+              columns: Optional[Sequence[str]] = None, use_cache: Optional[bool] = None) -> pd.DataFrame:
     """
     Loads OHLCV data from a CSV file and returns a normalized DataFrame.
 
@@ -13,11 +30,19 @@ def load_data(filepath: str) -> pd.DataFrame:
 
     Args:
         filepath (str): Path to the historical data CSV file.
+        start, end: Optional inclusive UTC bounds on timestamp.
+        symbols: Optional symbol filter (requires a symbol column).
+        columns: Optional subset of columns to return (timestamp is always included).
+        use_cache (bool): Force the columnar cache on/off (default: on when pyarrow is installed).
 
     Returns:
         pd.DataFrame: Parsed and normalized OHLCV data.
     """
     try:
+        if _cache_enabled(use_cache):
+            from tbot_bot.backtest.historical_store import load_bars
+            return load_bars(filepath, start=start, end=end, symbols=symbols, columns=columns)
+
         df = pd.read_csv(filepath)
 
         required_cols = {"timestamp", "open", "high", "low", "close", "volume"}
@@ -34,7 +59,15 @@ def load_data(filepath: str) -> pd.DataFrame:
         df["volume"] = pd.to_numeric(df["volume"], errors="coerce")
 
         df.dropna(subset=["timestamp", "open", "high", "low", "close", "volume"], inplace=True)
-        df.sort_values("timestamp", inplace=True)
+        if start is not None:
+            df = df[df["timestamp"] >= pd.Timestamp(start, tz="UTC")]
+        if end is not None:
+            df = df[df["timestamp"] <= pd.Timestamp(end, tz="UTC")]
+        if symbols is not None and "symbol" in df.columns:
+            df = df[df["symbol"].astype(str).isin([str(s) for s in symbols])]
+        if columns:
+            df = df[["timestamp"] + [c for c in columns if c != "timestamp" and c in df.columns]]
+        df = df.sort_values("timestamp")
         df.reset_index(drop=True, inplace=True)
 
         return df
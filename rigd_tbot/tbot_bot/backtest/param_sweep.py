@@ -0,0 +1,352 @@
+# tbot_bot/backtest/param_sweep.py
+# Parallel parameter sweeps over the vectorized backtest simulators.
+# Market data is loaded once into shared memory; workers attach to it instead of re-reading the CSV.
+
+"""
+Usage:
+  python -m tbot_bot.backtest.param_sweep --strategy mid --data bars.csv --start 2023-01-01 --end 2023-12-31 \\
+      --grid '{"STRAT_MID_VWAP_THRESHOLD": [0.01, 0.02, 0.03], "TRADING_TRAILING_STOP_PCT": [0.01, 0.02]}'
+  ... --space '{"STRAT_MID_VWAP_THRESHOLD": [0.005, 0.04]}' --sample lhs --n 64
+
+Each completed run is appended to <out_dir>/results.jsonl as soon as it finishes. Rerunning the same
+sweep (same strategy, data file and date range -> same out_dir) skips runs already recorded there,
+so an interrupted sweep resumes where it stopped. The ranked table is written to <out_dir>/ranked.csv.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from tbot_bot.backtest.performance_metrics import calculate_metrics
+from tbot_bot.backtest.simulators import bar_arrays, simulate_arrays
+
+SWEEP_ROOT = os.path.join("tbot_bot", "backtest", "results", "sweeps")
+RESULTS_FILE = "results.jsonl"
+RANKED_FILE = "ranked.csv"
+
+
+# ----------------------------------------------------------------------
+# Parameter sets
+# ----------------------------------------------------------------------
+def expand_grid(grid: Dict[str, Iterable]) -> List[Dict]:
+    """Cartesian product of {key: [values]}; keys in sorted order for stable run ids."""
+    keys = sorted(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(list(grid[k]) for k in keys))]
+
+
+def _is_range(spec) -> bool:
+    return isinstance(spec, tuple) and len(spec) == 2
+
+
+def _draw(spec, u: float):
+    """Map u in [0, 1) onto a choice list or a (lo, hi) range (ints stay ints)."""
+    if _is_range(spec):
+        lo, hi = spec
+        if isinstance(lo, int) and isinstance(hi, int):
+            return int(min(hi, lo + int(u * (hi - lo + 1))))
+        return round(lo + u * (hi - lo), 10)
+    spec = list(spec)
+    return spec[min(len(spec) - 1, int(u * len(spec)))]
+
+
+def random_sample(space: Dict[str, object], n: int, seed: int = 1) -> List[Dict]:
+    """n independent draws; space values are choice lists or (lo, hi) tuples."""
+    rng = random.Random(seed)
+    keys = sorted(space)
+    return [{k: _draw(space[k], rng.random()) for k in keys} for _ in range(int(n))]
+
+
+def latin_hypercube(space: Dict[str, object], n: int, seed: int = 1) -> List[Dict]:
+    """n Latin-hypercube draws: every dimension is split into n strata, each used exactly once."""
+    rng = random.Random(seed)
+    keys = sorted(space)
+    n = int(n)
+    cols = {}
+    for k in keys:
+        strata = [(i + rng.random()) / n for i in range(n)]
+        rng.shuffle(strata)
+        cols[k] = strata
+    return [{k: _draw(space[k], cols[k][i]) for k in keys} for i in range(n)]
+
+
+def _parse_space(raw: Dict[str, object]) -> Dict[str, object]:
+    """JSON has no tuples: a 2-element numeric list under --space means a (lo, hi) range."""
+    out = {}
+    for k, v in raw.items():
+        if isinstance(v, list) and len(v) == 2 and all(isinstance(x, (int, float)) for x in v):
+            out[k] = tuple(v)
+        else:
+            out[k] = v
+    return out
+
+
+# ----------------------------------------------------------------------
+# Shared-memory market data
+# ----------------------------------------------------------------------
+class SharedBars:
+    """
+    bar_arrays() placed in named shared-memory blocks. The parent create()s and unlink()s;
+    workers attach(descriptor) and get zero-copy NumPy views.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], blocks: List[shared_memory.SharedMemory], descriptor: dict):
+        self.arrays = arrays
+        self.descriptor = descriptor
+        self._blocks = blocks
+
+    @classmethod
+    def create(cls, arrs: Dict[str, np.ndarray]) -> "SharedBars":
+        blocks, views, desc = [], {}, {"names": list(arrs["names"]), "arrays": {}}
+        try:
+            for key, arr in arrs.items():
+                if key == "names" or arr is None:
+                    continue
+                arr = np.ascontiguousarray(arr)
+                shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+                blocks.append(shm)
+                view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+                view[...] = arr
+                views[key] = view
+                desc["arrays"][key] = (shm.name, arr.dtype.str, arr.shape)
+        except Exception:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+            raise
+        return cls(cls._with_names(views, desc), blocks, desc)
+
+    @classmethod
+    def attach(cls, descriptor: dict) -> "SharedBars":
+        blocks, views = [], {}
+        for key, (name, dtype, shape) in descriptor["arrays"].items():
+            shm = shared_memory.SharedMemory(name=name)
+            blocks.append(shm)
+            views[key] = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=shm.buf)
+        return cls(cls._with_names(views, descriptor), blocks, descriptor)
+
+    @staticmethod
+    def _with_names(views: Dict[str, np.ndarray], desc: dict) -> Dict[str, np.ndarray]:
+        views = dict(views)
+        views["names"] = np.asarray(desc["names"], dtype=object)
+        views.setdefault("vix", None)
+        return views
+
+    def close(self) -> None:
+        self.arrays = {}
+        for shm in self._blocks:
+            try:
+                shm.close()
+            except Exception:
+                pass
+
+    def unlink(self) -> None:
+        for shm in self._blocks:
+            try:
+                shm.unlink()
+            except Exception:
+                pass
+
+
+_WORKER_BARS: Optional[SharedBars] = None
+
+
+def _init_worker(descriptor: dict) -> None:
+    global _WORKER_BARS
+    _WORKER_BARS = SharedBars.attach(descriptor)
+
+
+def _evaluate(arrs: Dict[str, np.ndarray], strategy: str, run_id: str, params: Dict, base_config: Dict) -> Dict:
+    t0 = time.perf_counter()
+    config = dict(base_config or {})
+    config.update(params)
+    trades = simulate_arrays(strategy, arrs, config)
+    df = pd.DataFrame(trades)
+    if not df.empty:
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    metrics = {k: float(v) if isinstance(v, (float, np.floating)) else int(v)
+               for k, v in calculate_metrics(df).items()}
+    metrics["total_pnl"] = round(float(df["PnL"].sum()) if not df.empty else 0.0, 4)
+    return {"run_id": run_id, "params": params, "metrics": metrics,
+            "elapsed_s": round(time.perf_counter() - t0, 4)}
+
+
+def _worker_run(strategy: str, run_id: str, params: Dict, base_config: Dict) -> Dict:
+    return _evaluate(_WORKER_BARS.arrays, strategy, run_id, params, base_config)
+
+
+# ----------------------------------------------------------------------
+# Sweep
+# ----------------------------------------------------------------------
+def _digest(obj) -> str:
+    return hashlib.sha1(json.dumps(obj, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def run_id_for(strategy: str, params: Dict, base_config: Optional[Dict] = None) -> str:
+    return _digest({"strategy": strategy, "params": params, "base": base_config or {}})
+
+
+def _data_fingerprint(data_path: str, start_date, end_date) -> Dict:
+    st = os.stat(data_path)
+    return {"path": os.path.abspath(data_path), "size": st.st_size, "mtime": int(st.st_mtime),
+            "start": str(start_date), "end": str(end_date)}
+
+
+def load_completed(out_dir: str) -> Dict[str, Dict]:
+    """run_id -> result for every run already recorded in results.jsonl (torn last lines are ignored)."""
+    path = os.path.join(out_dir, RESULTS_FILE)
+    done: Dict[str, Dict] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+                done[rec["run_id"]] = rec
+            except Exception:
+                continue
+    return done
+
+
+def rank_results(results: Iterable[Dict], rank_by: str = "sharpe_ratio", ascending: bool = False) -> pd.DataFrame:
+    rows = []
+    for r in results:
+        row = {"run_id": r["run_id"]}
+        row.update({f"param.{k}": v for k, v in r["params"].items()})
+        row.update(r["metrics"])
+        rows.append(row)
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+    table = table.sort_values([rank_by, "run_id"], ascending=[ascending, True], kind="mergesort")
+    table.insert(0, "rank", range(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def _load_bars(data_path: str, start_date=None, end_date=None) -> pd.DataFrame:
+    from tbot_bot.backtest.load_historical_data import load_data
+    return load_data(data_path, start=start_date, end=end_date)
+
+
+def run_sweep(strategy: str, data_path: str, param_sets: List[Dict], start_date=None, end_date=None,
+              base_config: Optional[Dict] = None, workers: Optional[int] = None, out_dir: Optional[str] = None,
+              rank_by: str = "sharpe_ratio", ascending: bool = False, resume: bool = True) -> pd.DataFrame:
+    """
+    Run every parameter set (merged over base_config) and return the ranked table.
+    workers=None uses os.cpu_count(); workers<=1 runs in-process over the same arrays.
+    """
+    base_config = dict(base_config or {})
+    if out_dir is None:
+        out_dir = os.path.join(SWEEP_ROOT, f"{strategy}_{_digest(_data_fingerprint(data_path, start_date, end_date))}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    runs = {}
+    for params in param_sets:
+        runs.setdefault(run_id_for(strategy, params, base_config), params)
+    done = load_completed(out_dir) if resume else {}
+    if not resume:
+        open(os.path.join(out_dir, RESULTS_FILE), "w").close()
+    pending = [(rid, p) for rid, p in runs.items() if rid not in done]
+    _log(f"sweep {strategy}: {len(runs)} runs, {len(runs) - len(pending)} already done, {len(pending)} pending -> {out_dir}")
+
+    results = [done[rid] for rid in runs if rid in done]
+    if pending:
+        df = _load_bars(data_path, start_date, end_date)
+        if df.empty:
+            raise ValueError("[param_sweep] No data in selected range.")
+        workers = (os.cpu_count() or 1) if workers is None else int(workers)
+        results_path = os.path.join(out_dir, RESULTS_FILE)
+        with open(results_path, "a+", encoding="utf-8") as sink:
+            # Terminate a line torn by an interrupted write so the next record starts clean
+            if sink.tell() > 0:
+                sink.seek(sink.tell() - 1)
+                if sink.read(1) != "\n":
+                    sink.write("\n")
+
+            def _record(rec):
+                sink.write(json.dumps(rec, sort_keys=True) + "\n")
+                sink.flush()
+                results.append(rec)
+
+            if workers <= 1:
+                arrs = bar_arrays(df)
+                del df
+                for rid, params in pending:
+                    _record(_evaluate(arrs, strategy, rid, params, base_config))
+            else:
+                shared = SharedBars.create(bar_arrays(df))
+                del df
+                try:
+                    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                             initargs=(shared.descriptor,)) as pool:
+                        futures = [pool.submit(_worker_run, strategy, rid, params, base_config)
+                                   for rid, params in pending]
+                        for fut in as_completed(futures):
+                            _record(fut.result())
+                finally:
+                    shared.close()
+                    shared.unlink()
+
+    table = rank_results(results, rank_by=rank_by, ascending=ascending)
+    tmp = os.path.join(out_dir, RANKED_FILE + ".tmp")
+    table.to_csv(tmp, index=False)
+    os.replace(tmp, os.path.join(out_dir, RANKED_FILE))
+    return table
+
+
+def _log(msg: str, level: str = "info") -> None:
+    try:
+        from tbot_bot.support.utils_log import log_event
+        log_event("param_sweep", msg, level=level)
+    except Exception:
+        print(f"[param_sweep] {msg}", flush=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="TradeBot backtest parameter sweep")
+    ap.add_argument("--strategy", required=True, choices=["open", "mid", "close"])
+    ap.add_argument("--data", required=True, help="Path to historical OHLCV CSV file")
+    ap.add_argument("--start", default=None, help="Start date (YYYY-MM-DD)")
+    ap.add_argument("--end", default=None, help="End date (YYYY-MM-DD)")
+    ap.add_argument("--grid", default=None, help='JSON {"KEY": [v1, v2, ...]} (full Cartesian product)')
+    ap.add_argument("--space", default=None, help='JSON {"KEY": [lo, hi] or [choices...]} for --sample')
+    ap.add_argument("--sample", choices=["random", "lhs"], default="lhs")
+    ap.add_argument("--n", type=int, default=32, help="number of sampled parameter sets")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--base", default=None, help="JSON config applied under every parameter set")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--out", default=None)
+    ap.add_argument("--rank-by", default="sharpe_ratio")
+    ap.add_argument("--ascending", action="store_true")
+    ap.add_argument("--fresh", action="store_true", help="ignore previously recorded runs")
+    args = ap.parse_args()
+
+    if args.grid:
+        param_sets = expand_grid(json.loads(args.grid))
+    elif args.space:
+        space = _parse_space(json.loads(args.space))
+        sampler = latin_hypercube if args.sample == "lhs" else random_sample
+        param_sets = sampler(space, args.n, seed=args.seed)
+    else:
+        ap.error("one of --grid or --space is required")
+
+    table = run_sweep(args.strategy, args.data, param_sets, start_date=args.start, end_date=args.end,
+                      base_config=json.loads(args.base) if args.base else None, workers=args.workers,
+                      out_dir=args.out, rank_by=args.rank_by, ascending=args.ascending, resume=not args.fresh)
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(table.head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
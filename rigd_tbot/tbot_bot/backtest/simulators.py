@@ -0,0 +1,680 @@
+# tbot_bot/backtest/simulators.py
+# Vectorized backtest simulators for the open/mid/close strategies over minute bars.
+# strategy_open/mid/close.simulate_* delegate here; this module reads no config/secrets at import time.
+
+"""
+Input
+-----
+A minute-bar DataFrame (see load_historical_data.load_data) with columns:
+  timestamp (UTC), open, high, low, close, volume, and optionally symbol (default "SYMBOL") and vix.
+
+Model (mirrors the live strategies, one session per UTC day)
+------------------------------------------------------------
+Common:
+  * Window starts at START_TIME_{OPEN,MID,CLOSE} (UTC HH:MM) each day.
+  * Screener pool: symbols ranked per day by |price - day open| / day open at the first entry bar
+    (the screeners' momentum sort); only the top MAX_TRADES * CANDIDATE_MULTIPLIER are considered,
+    and at most MAX_TRADES signals per day are taken in rank order (as the live loops do).
+  * Entry at the signal bar's close; capital = ACCOUNT_BALANCE * WEIGHTS[slot] (else MAX_RISK_PER_TRADE).
+  * Trailing stop (get_strategy_trail_pct): from the bar after entry, stop = running peak (long) / trough
+    (short) through the previous bar x (1 -/+ pct); fills at the stop, or the open if the bar gapped through.
+  * Otherwise the position is closed at the last close at/before the hold deadline.
+  * Slippage BACKTEST_SLIPPAGE_BPS (adverse, both legs) and fees BACKTEST_FEE_PER_ORDER,
+    BACKTEST_FEE_PER_SHARE, BACKTEST_FEE_PCT (of notional, both legs).
+open:  range = high/low over OPEN_ANALYSIS_TIME; breakout bars in the next OPEN_BREAKOUT_TIME minutes
+       (close > high*(1+STRAT_OPEN_BUFFER) long, close < low*(1-buffer) short); hold until
+       analysis end + OPEN_MONITORING_TIME.
+mid:   session VWAP (typical price) from the day's first bar; first bar in MID_ANALYSIS_TIME with
+       |close - vwap| / vwap >= STRAT_MID_VWAP_THRESHOLD; buy below VWAP, short above; hold MID_MONITORING_TIME.
+close: gated per day by vix >= STRAT_CLOSE_VIX_THRESHOLD (vix column, else BACKTEST_VIX, else open);
+       first bar in CLOSE_ANALYSIS_TIME with close > day high*0.995 (long) or close < day mid-range*0.9
+       (short); hold CLOSE_MONITORING_TIME.
+Shorts are skipped when SHORT_TYPE_* is "disabled". Pre-close trail tightening is not modelled.
+
+simulate_reference(...) runs the same rules with plain Python loops; it exists for parity tests.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from tbot_bot.trading.trailing_stop import get_strategy_trail_pct
+
+STRATEGIES = ("open", "mid", "close")
+
+
+# ----------------------------------------------------------------------
+# Parameters
+# ----------------------------------------------------------------------
+def _hhmm_to_min(v, default: str) -> int:
+    s = str(v or default).strip()
+    parts = s.split(":")
+    return int(parts[0]) * 60 + (int(parts[1]) if len(parts) > 1 else 0)
+
+
+def _f(config: dict, key: str, default: float) -> float:
+    try:
+        v = config.get(key, default)
+        return float(default if v in (None, "") else v)
+    except Exception:
+        return float(default)
+
+
+@dataclass
+class SimParams:
+    strategy: str
+    start_min: int              # minute-of-day (UTC) the window starts
+    analysis: int               # minutes
+    entry_window: int           # minutes (open: breakout window)
+    hold: int                   # minutes (open: from analysis end; mid/close: from entry)
+    trail_pct: float
+    allow_short: bool
+    max_trades: int
+    pool_size: int
+    account_balance: float
+    weights: List[float] = field(default_factory=list)
+    max_risk_per_trade: float = 0.025
+    fractional: bool = True
+    slippage: float = 0.0005
+    fee_per_order: float = 0.0
+    fee_per_share: float = 0.0
+    fee_pct: float = 0.0
+    open_buffer: float = 0.02
+    vwap_threshold: float = 0.02
+    vix_threshold: float = 0.0
+    vix_default: Optional[float] = None
+
+    @property
+    def width(self) -> int:
+        if self.strategy == "open":
+            return self.analysis + max(self.entry_window, self.hold)
+        return self.analysis + self.hold
+
+    @property
+    def entry_cols(self):
+        if self.strategy == "open":
+            return self.analysis, self.analysis + self.entry_window
+        return 0, self.analysis
+
+    def capital_for_slot(self, slot: int) -> float:
+        w = self.weights[slot] if slot < len(self.weights) else self.max_risk_per_trade
+        return self.account_balance * w
+
+
+def params_from_config(strategy: str, config: dict) -> SimParams:
+    strategy = str(strategy).lower()
+    if strategy not in STRATEGIES:
+        raise ValueError(f"[simulators] Unknown strategy: {strategy}")
+    up = strategy.upper()
+    max_trades = int(_f(config, "MAX_TRADES", 4))
+    weights_raw = str(config.get("WEIGHTS", "") or "")
+    try:
+        weights = [float(w) for w in weights_raw.split(",") if w.strip()]
+    except Exception:
+        weights = []
+    start_defaults = {"open": "14:30", "mid": "15:30", "close": "19:30"}
+    analysis = int(_f(config, f"{up}_ANALYSIS_TIME", 10))
+    hold = int(_f(config, f"{up}_MONITORING_TIME", 30))
+    vix_default = config.get("BACKTEST_VIX")
+    return SimParams(
+        strategy=strategy,
+        start_min=_hhmm_to_min(config.get(f"START_TIME_{up}"), start_defaults[strategy]),
+        analysis=max(1, analysis),
+        entry_window=max(1, int(_f(config, "OPEN_BREAKOUT_TIME", 10))) if strategy == "open" else max(1, analysis),
+        hold=max(1, hold),
+        trail_pct=get_strategy_trail_pct(strategy, config, default_pct=_f(config, "TRADING_TRAILING_STOP_PCT", 0.02)),
+        allow_short=str(config.get(f"SHORT_TYPE_{up}", "disabled")).strip().lower() != "disabled",
+        max_trades=max_trades,
+        pool_size=max_trades * int(_f(config, "CANDIDATE_MULTIPLIER", 3)),
+        account_balance=_f(config, "ACCOUNT_BALANCE", 100000.0),
+        weights=weights,
+        max_risk_per_trade=_f(config, "MAX_RISK_PER_TRADE", 0.025),
+        fractional=str(config.get("FRACTIONAL", "true")).strip().lower() == "true",
+        slippage=_f(config, "BACKTEST_SLIPPAGE_BPS", 5.0) / 10000.0,
+        fee_per_order=_f(config, "BACKTEST_FEE_PER_ORDER", 0.0),
+        fee_per_share=_f(config, "BACKTEST_FEE_PER_SHARE", 0.0),
+        fee_pct=_f(config, "BACKTEST_FEE_PCT", 0.0),
+        open_buffer=_f(config, "STRAT_OPEN_BUFFER", 0.02),
+        vwap_threshold=_f(config, "STRAT_MID_VWAP_THRESHOLD", 0.02),
+        vix_threshold=_f(config, "STRAT_CLOSE_VIX_THRESHOLD", 0.0),
+        vix_default=float(vix_default) if vix_default not in (None, "") else None,
+    )
+
+
+# ----------------------------------------------------------------------
+# Panel construction: rows = (day, symbol) sessions, columns = window minutes
+# ----------------------------------------------------------------------
+@dataclass
+class Panel:
+    day: np.ndarray             # int64 UTC day number per row
+    symbols: np.ndarray         # object array of symbol per row
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+    vix: Optional[np.ndarray]
+    first_open: np.ndarray      # day open (earliest bar of the session, any minute)
+    pre_hi: np.ndarray          # max high before the window
+    pre_lo: np.ndarray          # min low before the window
+    pre_pv: np.ndarray          # sum typical*volume before the window
+    pre_v: np.ndarray           # sum volume before the window
+
+
+def _minutes_utc(ts: pd.Series) -> np.ndarray:
+    t = pd.to_datetime(ts, utc=True)
+    return t.dt.tz_localize(None).to_numpy().astype("datetime64[m]").astype(np.int64)
+
+
+def bar_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Column arrays used by the simulators: mins (UTC epoch minutes), sym codes + names, OHLCV, vix."""
+    if "symbol" in df.columns:
+        sym_codes, sym_names = pd.factorize(df["symbol"], sort=False)
+        sym_names = np.asarray(sym_names, dtype=str).astype(object)
+    else:
+        sym_codes, sym_names = np.zeros(len(df), dtype=np.int64), np.array(["SYMBOL"], dtype=object)
+    out = {"mins": _minutes_utc(df["timestamp"]), "sym": sym_codes.astype(np.int64), "names": sym_names}
+    for k in ("open", "high", "low", "close", "volume"):
+        out[k] = df[k].to_numpy(dtype=float)
+    out["vix"] = df["vix"].to_numpy(dtype=float) if "vix" in df.columns else None
+    return out
+
+
+def _take(arrs: Dict[str, np.ndarray], idx) -> Dict[str, np.ndarray]:
+    return {k: (v if k == "names" or v is None else v[idx]) for k, v in arrs.items()}
+
+
+def build_panel(df: pd.DataFrame, start_min: int, width: int) -> Panel:
+    return _panel_from_arrays(bar_arrays(df), start_min, width)
+
+
+def _panel_from_arrays(arrs: Dict[str, np.ndarray], start_min: int, width: int) -> Panel:
+    mins = arrs["mins"]
+    day = mins // 1440
+    mod = mins - day * 1440
+    sym_codes, sym_names = arrs["sym"], arrs["names"]
+    n_sym = max(1, len(sym_names))
+    day0 = int(day.min()) if len(day) else 0
+    key = (day - day0) * n_sym + sym_codes
+
+    o, h, lo, c, v, vix = (arrs[k] for k in ("open", "high", "low", "close", "volume", "vix"))
+
+    in_win = (mod >= start_min) & (mod < start_min + width)
+    rows, inv = np.unique(key[in_win], return_inverse=True)
+    R = len(rows)
+    col = (mod[in_win] - start_min).astype(np.int64)
+
+    def _scatter(src):
+        out = np.full((R, width), np.nan)
+        out[inv, col] = src[in_win]
+        return out
+
+    P_o, P_h, P_l, P_c, P_v = (_scatter(a) for a in (o, h, lo, c, v))
+    P_vix = _scatter(vix) if vix is not None else None
+
+    pre_hi = np.full(R, -np.inf)
+    pre_lo = np.full(R, np.inf)
+    pre_pv = np.zeros(R)
+    pre_v = np.zeros(R)
+    first_min = np.full(R, np.iinfo(np.int64).max)
+    first_open = np.full(R, np.nan)
+
+    pre = mod < start_min
+    if R and pre.any():
+        pk = key[pre]
+        idx = np.searchsorted(rows, pk)
+        idx_c = np.minimum(idx, R - 1)
+        ok = rows[idx_c] == pk
+        idx = idx_c[ok]
+        sel = np.flatnonzero(pre)[ok]
+        hv, lv, vv = h[sel], lo[sel], np.nan_to_num(v[sel])
+        np.maximum.at(pre_hi, idx, np.where(np.isnan(hv), -np.inf, hv))
+        np.minimum.at(pre_lo, idx, np.where(np.isnan(lv), np.inf, lv))
+        typ = np.nan_to_num((hv + lv + c[sel]) / 3.0)
+        pre_pv += np.bincount(idx, weights=typ * vv, minlength=R)
+        pre_v += np.bincount(idx, weights=vv, minlength=R)
+        m = mod[sel]
+        np.minimum.at(first_min, idx, m)
+        is_first = m == first_min[idx]
+        first_open[idx[is_first]] = o[sel][is_first]
+
+    # Sessions whose first bar is inside the window open at the first window bar
+    need = np.isnan(first_open)
+    if need.any():
+        valid = ~np.isnan(P_o)
+        first_col = np.argmax(valid, axis=1)
+        fo = P_o[np.arange(R), first_col]
+        first_open[need] = fo[need]
+
+    row_day = rows // n_sym + day0
+    row_sym = np.asarray(sym_names, dtype=object)[rows % n_sym]
+    return Panel(row_day, row_sym, P_o, P_h, P_l, P_c, P_v, P_vix,
+                 first_open, pre_hi, pre_lo, pre_pv, pre_v)
+
+
+# ----------------------------------------------------------------------
+# Signals
+# ----------------------------------------------------------------------
+def _first_true(mask: np.ndarray):
+    has = mask.any(axis=1)
+    return has, np.where(has, np.argmax(mask, axis=1), -1)
+
+
+def _signals(p: Panel, prm: SimParams):
+    """Returns (entry_col, direction[+1 long, -1 short], has_signal)."""
+    lo_c, hi_c = prm.entry_cols
+    R, W = p.c.shape
+    cols = np.arange(W)
+    in_entry = (cols >= lo_c) & (cols < hi_c)
+    with np.errstate(invalid="ignore"):
+        if prm.strategy == "open":
+            rh = np.nanmax(np.where(np.isnan(p.h[:, :prm.analysis]), -np.inf, p.h[:, :prm.analysis]), axis=1)
+            rl = np.nanmin(np.where(np.isnan(p.l[:, :prm.analysis]), np.inf, p.l[:, :prm.analysis]), axis=1)
+            ok = np.isfinite(rh) & np.isfinite(rl)
+            long_sig = (p.c > (rh * (1 + prm.open_buffer))[:, None]) & ok[:, None]
+            short_sig = (p.c < (rl * (1 - prm.open_buffer))[:, None]) & ok[:, None]
+        elif prm.strategy == "mid":
+            typ = np.nan_to_num((p.h + p.l + p.c) / 3.0)
+            vol = np.nan_to_num(p.v)
+            cum_pv = p.pre_pv[:, None] + np.cumsum(typ * vol, axis=1)
+            cum_v = p.pre_v[:, None] + np.cumsum(vol, axis=1)
+            vwap = np.where(cum_v > 0, cum_pv / np.where(cum_v > 0, cum_v, 1.0), np.nan)
+            dev = np.where(vwap > 0, (p.c - vwap) / vwap, 0.0)
+            big = np.abs(dev) >= prm.vwap_threshold
+            long_sig = big & (dev < 0)
+            short_sig = big & (dev > 0)
+        else:
+            hi = np.maximum(p.pre_hi[:, None], np.fmax.accumulate(np.where(np.isnan(p.h), -np.inf, p.h), axis=1))
+            lo = np.minimum(p.pre_lo[:, None], np.fmin.accumulate(np.where(np.isnan(p.l), np.inf, p.l), axis=1))
+            mid = (hi + lo) / 2.0
+            valid_rng = np.isfinite(hi) & np.isfinite(lo) & (hi > 0) & (lo > 0)
+            long_sig = (hi > 0) & np.isfinite(hi) & (p.c > hi * 0.995)
+            short_sig = valid_rng & ~long_sig & (mid > 0) & (p.c < mid * 0.9)
+            if p.vix is not None:
+                gate = ~(p.vix < prm.vix_threshold)      # NaN vix -> fail open (as vix_gatekeeper)
+            elif prm.vix_default is not None:
+                gate = np.full(p.c.shape, prm.vix_default >= prm.vix_threshold)
+            else:
+                gate = np.ones(p.c.shape, dtype=bool)
+            long_sig &= gate
+            short_sig &= gate
+
+    valid = ~np.isnan(p.c)
+    long_sig = long_sig & in_entry & valid
+    short_sig = short_sig & in_entry & valid & prm.allow_short
+    has_l, col_l = _first_true(long_sig)
+    has_s, col_s = _first_true(short_sig)
+    col_l = np.where(has_l, col_l, W)
+    col_s = np.where(has_s, col_s, W)
+    entry = np.minimum(col_l, col_s)
+    direction = np.where(col_l <= col_s, 1, -1)
+    has = has_l | has_s
+    return np.where(has, entry, -1), direction, has
+
+
+def _screen_rank(p: Panel, prm: SimParams) -> np.ndarray:
+    """Per-day rank (0 = best) by momentum at the first entry bar; NaN price ranks last."""
+    lo_c, _ = prm.entry_cols
+    R = len(p.day)
+    if R == 0:
+        return np.zeros(0, dtype=np.int64)
+    # price at the first entry bar (last close at/before it)
+    c = p.c[:, : lo_c + 1]
+    idx = np.where(~np.isnan(c), np.arange(c.shape[1]), -1)
+    last = np.maximum.accumulate(idx, axis=1)[:, -1]
+    price = np.where(last >= 0, c[np.arange(R), np.maximum(last, 0)], np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        score = np.abs(price - p.first_open) / p.first_open
+    score = np.where(np.isfinite(score), score, -np.inf)
+    order = np.lexsort((p.symbols.astype(str), -score, p.day))
+    day_sorted = p.day[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(day_sorted)) + 1]
+    counts = np.diff(np.r_[starts, len(order)])
+    rank_sorted = np.arange(len(order)) - np.repeat(starts, counts)
+    rank = np.empty(R, dtype=np.int64)
+    rank[order] = rank_sorted
+    return rank
+
+
+def _slots(day: np.ndarray, rank: np.ndarray, take: np.ndarray, max_trades: int) -> np.ndarray:
+    """Slot (0..) among taken rows per day in rank order; -1 for rows beyond max_trades or not taken."""
+    slot = np.full(len(day), -1, dtype=np.int64)
+    idx = np.flatnonzero(take)
+    if not len(idx):
+        return slot
+    order = idx[np.lexsort((rank[idx], day[idx]))]
+    d = day[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(d)) + 1]
+    counts = np.diff(np.r_[starts, len(order)])
+    s = np.arange(len(order)) - np.repeat(starts, counts)
+    keep = s < max_trades
+    slot[order[keep]] = s[keep]
+    return slot
+
+
+# ----------------------------------------------------------------------
+# Exits (trailing stop, else time)
+# ----------------------------------------------------------------------
+def _exits(o, h, lo, c, entry, deadline, direction, entry_px, pct):
+    n, W = c.shape
+    cols = np.arange(W)[None, :]
+    e = entry[:, None]
+    x = deadline[:, None]
+    live = (cols > e) & (cols <= x)
+    is_long = (direction > 0)[:, None]
+
+    seed = np.where(cols == e, entry_px[:, None], np.nan)
+    hh = np.where(live, h, np.nan)
+    ll = np.where(live, lo, np.nan)
+    peak = np.fmax.accumulate(np.where(np.isnan(seed), np.where(np.isnan(hh), -np.inf, hh), seed), axis=1)
+    trough = np.fmin.accumulate(np.where(np.isnan(seed), np.where(np.isnan(ll), np.inf, ll), seed), axis=1)
+    prev_peak = np.concatenate([np.full((n, 1), -np.inf), peak[:, :-1]], axis=1)
+    prev_trough = np.concatenate([np.full((n, 1), np.inf), trough[:, :-1]], axis=1)
+    stop = np.where(is_long, prev_peak * (1.0 - pct), prev_trough * (1.0 + pct))
+    with np.errstate(invalid="ignore"):
+        hit = live & np.where(is_long, ll <= stop, hh >= stop)
+    has_hit, hit_col = _first_true(hit)
+
+    rows = np.arange(n)
+    hc = np.maximum(hit_col, 0)
+    stop_at = stop[rows, hc]
+    open_at = o[rows, hc]
+    gap_px = np.where(direction > 0, np.fmin(open_at, stop_at), np.fmax(open_at, stop_at))
+    stop_px = np.where(np.isnan(open_at), stop_at, gap_px)
+
+    valid_idx = np.where(~np.isnan(c) & (cols <= x) & (cols >= e), cols, -1)
+    last_col = np.maximum.accumulate(valid_idx, axis=1)[:, -1]
+    time_px = c[rows, np.maximum(last_col, 0)]
+
+    exit_col = np.where(has_hit, hit_col, last_col)
+    exit_px = np.where(has_hit, stop_px, time_px)
+    reason = np.where(has_hit, "trailing_stop", "time")
+    return exit_col, exit_px, reason
+
+
+# ----------------------------------------------------------------------
+# Fills, fees, PnL
+# ----------------------------------------------------------------------
+def _pnl(prm: SimParams, direction, entry_px, exit_px, slot):
+    s = prm.slippage
+    is_long = direction > 0
+    entry_fill = np.where(is_long, entry_px * (1 + s), entry_px * (1 - s))
+    exit_fill = np.where(is_long, exit_px * (1 - s), exit_px * (1 + s))
+    w = np.asarray(prm.weights + [prm.max_risk_per_trade] * (prm.max_trades + 1), dtype=float)
+    capital = prm.account_balance * w[np.clip(slot, 0, len(w) - 1)]
+    qty = capital / entry_fill
+    if not prm.fractional:
+        qty = np.floor(qty)
+    fees = 2 * prm.fee_per_order + 2 * prm.fee_per_share * qty + prm.fee_pct * (entry_fill + exit_fill) * qty
+    gross = np.where(is_long, exit_fill - entry_fill, entry_fill - exit_fill) * qty
+    return entry_fill, exit_fill, qty, fees, gross - fees
+
+
+def _iso(day: int, start_min: int, col: int) -> str:
+    ts = pd.Timestamp(int(day) * 86400 + (start_min + int(col)) * 60, unit="s", tz="UTC")
+    return ts.isoformat()
+
+
+def _to_trades(prm, symbols, day, entry_col, exit_col, direction, entry_fill, exit_fill, qty, fees, pnl, reason):
+    base = pd.Timestamp(0, tz="UTC")
+    entry_ts = base + pd.to_timedelta(day * 1440 + prm.start_min + entry_col, unit="m")
+    exit_ts = base + pd.to_timedelta(day * 1440 + prm.start_min + exit_col, unit="m")
+    out = pd.DataFrame({
+        "symbol": symbols,
+        "side": np.where(direction > 0, "long", "short"),
+        "entry_time": entry_ts.map(lambda t: t.isoformat()),
+        "exit_time": exit_ts.map(lambda t: t.isoformat()),
+        "entry_price": np.round(entry_fill, 6),
+        "exit_price": np.round(exit_fill, 6),
+        "qty": np.round(qty, 6),
+        "fees": np.round(fees, 6),
+        "PnL": np.round(pnl, 6),
+        "exit_reason": reason,
+        "strategy_name": prm.strategy,
+    })
+    out["timestamp"] = out["exit_time"]
+    out = out.sort_values(["timestamp", "symbol"], kind="mergesort")
+    return out.to_dict("records")
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+def simulate(strategy: str, df: pd.DataFrame, config: Optional[dict] = None,
+             chunk_days: int = 21) -> List[Dict]:
+    """
+    Vectorized simulation of one strategy over a (symbol x day) minute-bar panel.
+    Sessions are independent, so days are processed in chunks of chunk_days to bound memory.
+    """
+    if df is None or len(df) == 0:
+        params_from_config(strategy, config or {})
+        return []
+    return simulate_arrays(strategy, bar_arrays(df), config, chunk_days=chunk_days)
+
+
+def simulate_arrays(strategy: str, arrs: Dict[str, np.ndarray], config: Optional[dict] = None,
+                    chunk_days: int = 21) -> List[Dict]:
+    """simulate() over pre-extracted bar_arrays() (e.g. views onto shared memory in sweep workers)."""
+    prm = params_from_config(strategy, config or {})
+    if not len(arrs["mins"]):
+        return []
+    day = arrs["mins"] // 1440
+    if not (np.diff(day) >= 0).all():
+        order = np.argsort(day, kind="stable")
+        arrs, day = _take(arrs, order), day[order]
+    days = np.unique(day)
+    step = max(1, int(chunk_days))
+    trades: List[Dict] = []
+    for i in range(0, len(days), step):
+        first, last = days[i], days[min(i + step, len(days)) - 1]
+        rows = slice(np.searchsorted(day, first, side="left"), np.searchsorted(day, last, side="right"))
+        panel = _panel_from_arrays(_take(arrs, rows), prm.start_min, prm.width)
+        trades.extend(_simulate_panel(prm, panel))
+    return trades
+
+
+def _simulate_panel(prm: SimParams, p: Panel) -> List[Dict]:
+    if not len(p.day):
+        return []
+    entry, direction, has = _signals(p, prm)
+    rank = _screen_rank(p, prm)
+    take = has & (rank < prm.pool_size)
+    slot = _slots(p.day, rank, take, prm.max_trades)
+    sel = np.flatnonzero(slot >= 0)
+    if not len(sel):
+        return []
+
+    W = prm.width
+    e = entry[sel]
+    if prm.strategy == "open":
+        deadline = np.maximum(np.full(len(sel), prm.analysis + prm.hold - 1), e)
+    else:
+        deadline = e + prm.hold
+    deadline = np.minimum(deadline, W - 1)
+    d = direction[sel]
+    entry_px = p.c[sel, e]
+    exit_col, exit_px, reason = _exits(p.o[sel], p.h[sel], p.l[sel], p.c[sel], e, deadline, d, entry_px, prm.trail_pct)
+    entry_fill, exit_fill, qty, fees, pnl = _pnl(prm, d, entry_px, exit_px, slot[sel])
+    keep = qty > 0
+    return _to_trades(prm, p.symbols[sel][keep], p.day[sel][keep], e[keep], exit_col[keep], d[keep],
+                      entry_fill[keep], exit_fill[keep], qty[keep], fees[keep], pnl[keep], reason[keep])
+
+
+def simulate_reference(strategy: str, df: pd.DataFrame, config: Optional[dict] = None) -> List[Dict]:
+    """
+    Slow, loop-based implementation of the same rules as simulate(); used for parity tests only.
+    """
+    prm = params_from_config(strategy, config or {})
+    if df is None or len(df) == 0:
+        return []
+    mins = _minutes_utc(df["timestamp"])
+    syms = df["symbol"].astype(str).to_numpy() if "symbol" in df.columns else np.array(["SYMBOL"] * len(df), dtype=object)
+    vix_col = df["vix"].to_numpy(dtype=float) if "vix" in df.columns else None
+    ohlcv = df[["open", "high", "low", "close", "volume"]].to_numpy(dtype=float).tolist()
+    sessions: Dict[tuple, Dict[int, tuple]] = {}
+    for i in range(len(df)):
+        day, mod = divmod(int(mins[i]), 1440)
+        bar = (*ohlcv[i], float(vix_col[i]) if vix_col is not None else math.nan)
+        sessions.setdefault((day, syms[i]), {})[mod] = bar
+
+    W = prm.width
+    lo_c, hi_c = prm.entry_cols
+    cands = []  # (day, score, symbol, entry_col, direction, bars)
+    for (day, sym), bars in sessions.items():
+        win = [bars.get(prm.start_min + j) for j in range(W)]
+        if not any(win):
+            continue
+        first_open = bars[min(bars)][0]
+        pre = [b for m, b in bars.items() if m < prm.start_min]
+        pre_hi = max((b[1] for b in pre), default=-math.inf)
+        pre_lo = min((b[2] for b in pre), default=math.inf)
+        pre_pv = sum(((b[1] + b[2] + b[3]) / 3.0) * b[4] for b in pre)
+        pre_v = sum(b[4] for b in pre)
+
+        price = math.nan
+        for j in range(lo_c + 1):
+            if win[j] is not None:
+                price = win[j][3]
+        score = abs(price - first_open) / first_open if (first_open and not math.isnan(price)) else -math.inf
+
+        entry, direction = -1, 0
+        if prm.strategy == "open":
+            hs = [b[1] for b in win[:prm.analysis] if b]
+            ls = [b[2] for b in win[:prm.analysis] if b]
+            if hs and ls:
+                rh, rl = max(hs), min(ls)
+                for j in range(lo_c, hi_c):
+                    b = win[j]
+                    if b is None:
+                        continue
+                    if b[3] > rh * (1 + prm.open_buffer):
+                        entry, direction = j, 1
+                        break
+                    if prm.allow_short and b[3] < rl * (1 - prm.open_buffer):
+                        entry, direction = j, -1
+                        break
+        elif prm.strategy == "mid":
+            cpv, cv = pre_pv, pre_v
+            for j in range(W):
+                b = win[j]
+                if b is not None:
+                    cpv += ((b[1] + b[2] + b[3]) / 3.0) * b[4]
+                    cv += b[4]
+                if j < lo_c or j >= hi_c or b is None or cv <= 0:
+                    continue
+                vwap = cpv / cv
+                dev = (b[3] - vwap) / vwap if vwap > 0 else 0.0
+                if abs(dev) >= prm.vwap_threshold:
+                    if dev < 0:
+                        entry, direction = j, 1
+                        break
+                    if prm.allow_short:
+                        entry, direction = j, -1
+                        break
+        else:
+            hi, lo = pre_hi, pre_lo
+            for j in range(W):
+                b = win[j]
+                if b is not None:
+                    hi, lo = max(hi, b[1]), min(lo, b[2])
+                if j < lo_c or j >= hi_c or b is None:
+                    continue
+                if not math.isnan(b[5]):
+                    gate = not (b[5] < prm.vix_threshold)
+                elif vix_col is None and prm.vix_default is not None:
+                    gate = prm.vix_default >= prm.vix_threshold
+                else:
+                    gate = True
+                if not gate:
+                    continue
+                if hi > 0 and math.isfinite(hi) and b[3] > hi * 0.995:
+                    entry, direction = j, 1
+                    break
+                mid = (hi + lo) / 2.0
+                if prm.allow_short and math.isfinite(hi) and math.isfinite(lo) and lo > 0 and mid > 0 and b[3] < mid * 0.9:
+                    entry, direction = j, -1
+                    break
+        cands.append((day, score, sym, entry, direction, win))
+
+    by_day: Dict[int, list] = {}
+    for cnd in cands:
+        by_day.setdefault(cnd[0], []).append(cnd)
+
+    rows = []
+    for day in sorted(by_day):
+        ranked = sorted(by_day[day], key=lambda r: (-r[1], r[2]))
+        slot = 0
+        for rank, (_, _, sym, entry, direction, win) in enumerate(ranked):
+            if slot >= prm.max_trades:
+                break
+            if rank >= prm.pool_size or entry < 0:
+                continue
+            entry_px = win[entry][3]
+            if prm.strategy == "open":
+                deadline = max(prm.analysis + prm.hold - 1, entry)
+            else:
+                deadline = entry + prm.hold
+            deadline = min(deadline, W - 1)
+            extreme = entry_px
+            exit_col, exit_px, reason = entry, entry_px, "time"
+            for j in range(entry + 1, deadline + 1):
+                b = win[j]
+                if b is None:
+                    continue
+                stop = extreme * (1 - prm.trail_pct) if direction > 0 else extreme * (1 + prm.trail_pct)
+                if (direction > 0 and b[2] <= stop) or (direction < 0 and b[1] >= stop):
+                    exit_col, reason = j, "trailing_stop"
+                    exit_px = min(b[0], stop) if direction > 0 else max(b[0], stop)
+                    break
+                extreme = max(extreme, b[1]) if direction > 0 else min(extreme, b[2])
+                exit_col, exit_px = j, b[3]
+            s = prm.slippage
+            ef = entry_px * (1 + s) if direction > 0 else entry_px * (1 - s)
+            xf = exit_px * (1 - s) if direction > 0 else exit_px * (1 + s)
+            qty = prm.capital_for_slot(slot) / ef
+            if not prm.fractional:
+                qty = float(math.floor(qty))
+            if qty > 0:
+                fees = 2 * prm.fee_per_order + 2 * prm.fee_per_share * qty + prm.fee_pct * (ef + xf) * qty
+                gross = (xf - ef) * qty if direction > 0 else (ef - xf) * qty
+                rows.append(dict(symbol=sym, side="long" if direction > 0 else "short",
+                                 entry_time=_iso(day, prm.start_min, entry), exit_time=_iso(day, prm.start_min, exit_col),
+                                 entry_price=round(ef, 6), exit_price=round(xf, 6), qty=round(qty, 6),
+                                 fees=round(fees, 6), PnL=round(gross - fees, 6), exit_reason=reason,
+                                 strategy_name=prm.strategy))
+            slot += 1
+    for r in rows:
+        r["timestamp"] = r["exit_time"]
+    rows.sort(key=lambda r: (r["timestamp"], r["symbol"]))
+    return rows
+
+
+def generate_synthetic_bars(symbols: List[str], days: int, start: str = "2023-01-02",
+                            session_start: str = "14:30", session_minutes: int = 390,
+                            seed: int = 1, vol: float = 0.002) -> pd.DataFrame:
+    """Random-walk minute bars per (weekday, symbol) session (for tests and benchmarks)."""
+    rng = np.random.default_rng(seed)
+    day_index = pd.bdate_range(start, periods=days, tz="UTC")
+    n_sym, n_min = len(symbols), int(session_minutes)
+    offs = pd.to_timedelta(_hhmm_to_min(session_start, "14:30") + np.arange(n_min), unit="m")
+    ts = (day_index.values[:, None, None] + offs.values[None, None, :]).repeat(n_sym, axis=1)
+    base = rng.uniform(10, 200, size=(1, n_sym, 1))
+    rets = rng.normal(0, vol, size=(days, n_sym, n_min))
+    close = base * np.exp(np.cumsum(rets, axis=2) + np.cumsum(rng.normal(0, 0.01, size=(days, n_sym, 1)), axis=0))
+    open_ = np.concatenate([close[:, :, :1] * (1 + rng.normal(0, vol, size=(days, n_sym, 1))), close[:, :, :-1]], axis=2)
+    spread = np.abs(rng.normal(0, vol, size=close.shape)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.integers(100, 10000, size=close.shape).astype(float)
+    sym = np.broadcast_to(np.arange(n_sym)[None, :, None], close.shape)
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(ts.ravel(), utc=True),
+        "symbol": pd.Categorical.from_codes(sym.ravel(), categories=list(symbols)),
+        "open": open_.ravel(), "high": high.ravel(), "low": low.ravel(),
+        "close": close.ravel(), "volume": volume.ravel(),
+    })
@@ -5,7 +5,7 @@ import requests
 import hashlib
 from datetime import datetime, timezone
 from tbot_bot.broker.utils.broker_request import safe_request
-from tbot_bot.broker.utils.ledger_normalizer import normalize_trade
+from tbot_bot.broker.utils.ledger_normalizer import normalize_trades
 
 
 class AlpacaBroker:
@@ -56,6 +56,20 @@ class AlpacaBroker:
     def get_positions(self):
         return self._request("GET", "/v2/positions")
 
+    def get_account_snapshot(self):
+        """Account value, cash and ETF holdings from one account + one positions request."""
+        info = self.get_account_info()
+        try:
+            cash = float(info.get("cash") or info.get("cash_balance") or 0.0)
+        except Exception:
+            cash = 0.0
+        return {
+            "account_value": float(info.get("equity", 0.0)),
+            "cash": cash,
+            "etf_holdings": self.get_etf_holdings(),
+            "requests": 2,
+        }
+
     def get_position(self, symbol):
         try:
             return self._request("GET", f"/v2/positions/{symbol}")
@@ -201,8 +215,7 @@ class AlpacaBroker:
             acts = self._fetch_cash_activity_internal(params)
             # Ensure group_id for all normalized items
             normed = []
-            for a in acts:
-                trade = normalize_trade(a, self.credential_hash)
+            for trade in normalize_trades(acts, self.credential_hash):
                 if not trade.get("group_id"):
                     trade["group_id"] = trade.get("trade_id")
                 normed.append(trade)
@@ -315,8 +328,7 @@ class AlpacaBroker:
                 break
         # Normalize
         normed_trades = []
-        for tf in order_fills.values():
-            trade = normalize_trade(tf, self.credential_hash)
+        for trade in normalize_trades(order_fills.values(), self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_trades.append(trade)
@@ -359,8 +371,7 @@ class AlpacaBroker:
                 break
         # Normalize
         normed_acts = []
-        for act in activities:
-            trade = normalize_trade(act, self.credential_hash)
+        for trade in normalize_trades(activities, self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_acts.append(trade)
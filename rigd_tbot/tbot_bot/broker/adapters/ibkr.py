@@ -3,7 +3,7 @@
 import hashlib
 from tbot_bot.broker.core.broker_interface import BrokerInterface
 from tbot_bot.broker.utils.broker_request import safe_request
-from tbot_bot.broker.utils.ledger_normalizer import normalize_trade
+from tbot_bot.broker.utils.ledger_normalizer import normalize_trades
 
 
 class IBKRBroker(BrokerInterface):
@@ -126,8 +126,7 @@ class IBKRBroker(BrokerInterface):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/trades", params=params)
         trades = resp.get("trades", resp)
         normed_trades = []
-        for t in trades:
-            trade = normalize_trade(t, self.credential_hash)
+        for trade in normalize_trades(trades, self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_trades.append(trade)
@@ -140,8 +139,7 @@ class IBKRBroker(BrokerInterface):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/transactions", params=params)
         acts = resp.get("transactions", resp)
         normed_acts = []
-        for a in acts:
-            trade = normalize_trade(a, self.credential_hash)
+        for trade in normalize_trades(acts, self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_acts.append(trade)
@@ -3,7 +3,7 @@
 import hashlib
 from tbot_bot.broker.core.broker_interface import BrokerInterface
 from tbot_bot.broker.utils.broker_request import safe_request
-from tbot_bot.broker.utils.ledger_normalizer import normalize_trade
+from tbot_bot.broker.utils.ledger_normalizer import normalize_trades
 
 class TradierBroker(BrokerInterface):
     def __init__(self, env):
@@ -33,6 +33,16 @@ class TradierBroker(BrokerInterface):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/balances")
         return float(resp.get("balances", {}).get("cash_balance", 0.0))
 
+    def get_account_snapshot(self):
+        """Account value, cash and ETF holdings from one balances + one positions request."""
+        balances = self._request("GET", f"/v1/accounts/{self.account_id}/balances").get("balances", {})
+        return {
+            "account_value": float(balances.get("total_equity", 0.0)),
+            "cash": float(balances.get("cash_balance", 0.0)),
+            "etf_holdings": self.get_etf_holdings(),
+            "requests": 2,
+        }
+
     def get_positions(self):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/positions")
         positions = resp.get("positions", {}).get("position", [])
@@ -148,8 +158,7 @@ class TradierBroker(BrokerInterface):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/history", params=params)
         trades = resp.get("history", {}).get("trade", [])
         normed_trades = []
-        for t in trades:
-            trade = normalize_trade(t, self.credential_hash)
+        for trade in normalize_trades(trades, self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_trades.append(trade)
@@ -162,8 +171,7 @@ class TradierBroker(BrokerInterface):
         resp = self._request("GET", f"/v1/accounts/{self.account_id}/history", params=params)
         activities = resp.get("history", {}).get("cash", [])
         normed_acts = []
-        for a in activities:
-            trade = normalize_trade(a, self.credential_hash)
+        for trade in normalize_trades(activities, self.credential_hash):
             if not trade.get("group_id"):
                 trade["group_id"] = trade.get("trade_id")
             normed_acts.append(trade)
@@ -10,13 +10,11 @@ from tbot_bot.support.decrypt_secrets import (
     load_broker_credential,
 )
 from tbot_bot.config.env_bot import get_bot_config
-from tbot_bot.broker.utils.ledger_normalizer import normalize_trade
+from tbot_bot.broker.utils.ledger_normalizer import normalize_trades
 
-# Prefer the central compliance filter; fall back to a local-lite filter if unavailable.
+# Prefer the central compliance filter (fused into normalize_trades); fall back to a local-lite filter if unavailable.
 try:
-    from tbot_bot.accounting.ledger_modules.ledger_compliance_filter import (
-        compliance_filter_entries as _compliance_filter_entries,
-    )
+    import tbot_bot.accounting.ledger_modules.ledger_compliance_filter  # noqa: F401  (availability probe)
     _HAS_COMPLIANCE = True
 except Exception:
     _HAS_COMPLIANCE = False
@@ -115,11 +113,11 @@ def get_active_broker():
 
 def _normalize_and_filter(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Normalize broker records and filter out blanks/unmapped/status-only noise."""
-    normalized = [normalize_trade(r) for r in records if isinstance(r, dict)]
     if _HAS_COMPLIANCE:
-        return _compliance_filter_entries(normalized)
+        # Single batch pass: schema-compiled normalization with the compliance rules fused in
+        return normalize_trades(records, compliance=True, skip_non_dict=True)
     # Fallback path if compliance module not importable
-    return _lite_filter(normalized)
+    return _lite_filter(normalize_trades(records, skip_non_dict=True))
 
 
 def place_order(order):
@@ -1,26 +1,46 @@
 # tbot_bot/broker/utils/ledger_normalizer.py
+# normalize_trade() maps one raw broker record to a TRADES_FIELDS dict. normalize_trades() / iter_trade_rows() do the
+# same for a whole batch: one specialised row builder is compiled per broker record schema (key set), actions go
+# through a lookup table, and the ledger compliance filter can be applied in the same pass. Output is identical to
+# [normalize_trade(r) for r in records] (+ compliance_filter_entries).
+
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import json
 
 from tbot_bot.support.utils_identity import get_bot_identity
 from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
 
-raw_id = get_bot_identity()
-if isinstance(raw_id, str):
-    parts = raw_id.split("_")
-    BOT_IDENTITY = {
-        "ENTITY_CODE": parts[0] if len(parts) > 0 else "UNKNOWN",
-        "JURISDICTION_CODE": parts[1] if len(parts) > 1 else "UNKNOWN",
-        "BROKER_CODE": parts[2] if len(parts) > 2 else "UNKNOWN",
-        "BOT_ID": parts[3] if len(parts) > 3 else "UNKNOWN"
-    }
-elif isinstance(raw_id, dict):
-    BOT_IDENTITY = raw_id
-else:
-    BOT_IDENTITY = {
-        "ENTITY_CODE": "UNKNOWN",
-        "JURISDICTION_CODE": "UNKNOWN",
-        "BROKER_CODE": "UNKNOWN",
-        "BOT_ID": "UNKNOWN"
-    }
+try:
+    from tbot_bot.accounting.ledger_modules import ledger_compliance_filter as _compliance
+except Exception:
+    _compliance = None
+from tbot_bot.support.lazy_settings import LazySettings
+
+# Identity resolves on first normalize_trade() call (see support/lazy_settings.py), not at import.
+def _load_settings():
+    raw_id = get_bot_identity()
+    if isinstance(raw_id, str):
+        parts = raw_id.split("_")
+        BOT_IDENTITY = {
+            "ENTITY_CODE": parts[0] if len(parts) > 0 else "UNKNOWN",
+            "JURISDICTION_CODE": parts[1] if len(parts) > 1 else "UNKNOWN",
+            "BROKER_CODE": parts[2] if len(parts) > 2 else "UNKNOWN",
+            "BOT_ID": parts[3] if len(parts) > 3 else "UNKNOWN"
+        }
+    elif isinstance(raw_id, dict):
+        BOT_IDENTITY = raw_id
+    else:
+        BOT_IDENTITY = {
+            "ENTITY_CODE": "UNKNOWN",
+            "JURISDICTION_CODE": "UNKNOWN",
+            "BROKER_CODE": "UNKNOWN",
+            "BOT_ID": "UNKNOWN"
+        }
+    return {"raw_id": raw_id, "BOT_IDENTITY": BOT_IDENTITY}
+
+_SETTINGS = LazySettings(globals(), _load_settings, ("raw_id", "BOT_IDENTITY"))
+__getattr__ = _SETTINGS.module_getattr
 
 # Map raw broker actions to canonical ledger actions
 ACTION_MAP = {
@@ -47,6 +67,7 @@ ALLOWED_ACTIONS = (
 )
 
 def normalize_trade(trade, credential_hash=None):
+    _SETTINGS.ensure()
     if not isinstance(trade, dict):
         return {k: None for k in TRADES_FIELDS}
 
@@ -140,3 +161,244 @@ def normalize_trade(trade, credential_hash=None):
     mapping["skip_insert"] = False
 
     return mapping
+
+
+# ---------------------------------------------------------------------------
+# Batch normalization
+# ---------------------------------------------------------------------------
+# Output fields of normalize_trade() in mapping order: (field, source expression spec). Specs:
+#   ("or", keys, tail)   t.get(k1) or t.get(k2) ... [or tail]; tail None = the last key's plain get()
+#   ("get", key, default)           t.get(key, default)
+#   ("get2", key, key2, default)    t.get(key, t.get(key2, default))
+#   ("float", spec)                 float(<spec>)
+_FIELD_SPECS = (
+    ("trade_id", ("or", ("id", "trade_id", "order_id"), None)),
+    ("symbol", ("or", ("symbol", "underlying"), None)),
+    ("side", "side"),
+    ("action", "action"),
+    ("quantity", ("float", ("or", ("qty", "quantity", "filled_qty"), ("const", 0)))),
+    ("quantity_type", ("get", "quantity_type", None)),
+    ("price", ("float", ("or", ("price", "filled_avg_price", "fill_price"), ("const", 0)))),
+    ("fee", ("float", ("get", "fee", 0))),
+    ("commission", ("float", ("get", "commission", 0))),
+    ("datetime_utc", ("or", ("transaction_time", "filled_at", "execution_time", "date", "datetime_utc"), None)),
+    ("status", ("get2", "status", "order_status", "")),
+    ("strategy", ("get", "strategy", "UNKNOWN")),
+    ("account", ("get", "account", "default")),
+    ("currency_code", ("or", ("currency_code",), ("get", "currency", "USD"))),
+    ("language_code", ("get", "language_code", "en")),
+    ("price_currency", ("get", "price_currency", None)),
+    ("fx_rate", ("get", "fx_rate", None)),
+    ("commission_currency", ("get", "commission_currency", None)),
+    ("fee_currency", ("get", "fee_currency", None)),
+    ("accrued_interest", ("float", ("get", "accrued_interest", 0.0))),
+    ("accrued_interest_currency", ("get", "accrued_interest_currency", None)),
+    ("tax", ("float", ("get", "tax", 0.0))),
+    ("tax_currency", ("get", "tax_currency", None)),
+    ("net_amount", ("get", "net_amount", None)),
+    ("settlement_date", ("get", "settlement_date", None)),
+    ("trade_date", ("get", "trade_date", None)),
+    ("description", ("get", "description", None)),
+    ("counterparty", ("get", "counterparty", None)),
+    ("sub_account", ("get", "sub_account", None)),
+    ("broker_code", ("or", ("broker_code",), ("get", "broker", "ALPACA"))),
+    ("entity_code", "entity_code"),
+    ("jurisdiction_code", "jurisdiction_code"),
+    ("bot_id", "bot_id"),
+    ("json_metadata", "json_metadata"),
+)
+
+
+def _spec_keys(spec) -> set:
+    if not isinstance(spec, tuple):
+        return set()
+    kind = spec[0]
+    if kind == "or":
+        return set(spec[1]) | _spec_keys(spec[2])
+    if kind == "get":
+        return {spec[1]}
+    if kind == "get2":
+        return {spec[1], spec[2]}
+    if kind == "float":
+        return _spec_keys(spec[1])
+    return set()
+
+
+_SOURCE_KEYS = frozenset().union(*(_spec_keys(spec) for _f, spec in _FIELD_SPECS))
+_PADDING_FIELDS = tuple(k for k in TRADES_FIELDS if k not in {f for f, _s in _FIELD_SPECS} and k != "total_value")
+_SKIP_TEMPLATE = dict.fromkeys(TRADES_FIELDS)
+_SKIP_TEMPLATE["skip_insert"] = True
+_SCHEMA_CACHE_MAX = 512
+_ACTION_CACHE_MAX = 4096
+
+_BUILDERS: Dict[frozenset, Any] = {}
+_SCHEMAS: Dict[tuple, Any] = {}
+_ACTIONS: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+
+
+def _expr(spec, present) -> str:
+    """Python expression for `spec`, specialised to the source keys present in the record schema."""
+    kind = spec[0]
+    if kind == "const":
+        return repr(spec[1])
+    if kind == "get":
+        return f"t[{spec[1]!r}]" if spec[1] in present else repr(spec[2])
+    if kind == "get2":
+        return f"t[{spec[1]!r}]" if spec[1] in present else _expr(("get", spec[2], spec[3]), present)
+    if kind == "float":
+        return f"float({_expr(spec[1], present)})"
+    keys, tail = spec[1], spec[2]
+    if tail is None:  # the chain's value is the last key's get() (None when missing)
+        keys, tail = keys[:-1], ("get", keys[-1], None)
+    terms = [f"t[{k!r}]" for k in keys if k in present] + [_expr(tail, present)]
+    return "(" + " or ".join(terms) + ")"
+
+
+def _compile_builder(present: frozenset):
+    """Row builder for records carrying exactly the source keys in `present` (None for every other field)."""
+    fixed = {"side": "side", "action": "action", "entity_code": "entity", "jurisdiction_code": "juris",
+             "bot_id": "bot", "json_metadata": '{"raw_broker": t, "api_hash": h, "unmapped_action": None}'}
+    items = []
+    for field, spec in _FIELD_SPECS:
+        if field in fixed:
+            value = fixed[field]
+        elif field == "quantity":
+            value = f"(q := {_expr(spec, present)})"
+        elif field == "price":
+            value = f"(p := {_expr(spec, present)})"
+        else:
+            value = _expr(spec, present)
+        items.append(f"        {field!r}: {value},")
+    items.append("        'total_value': round(q * p, 6),")
+    items.extend(f"        {k!r}: None," for k in _PADDING_FIELDS)
+    items.append("        'skip_insert': False,")
+    src = "def build(t, h, action, side, entity, juris, bot):\n    return {\n" + "\n".join(items) + "\n    }\n"
+    ns: Dict[str, Any] = {}
+    exec(compile(src, "<ledger_normalizer:trade_schema>", "exec"), ns)
+    build = ns["build"]
+    build.source = src
+    return build
+
+
+def _builder_for(trade: dict):
+    keys = tuple(trade)
+    build = _SCHEMAS.get(keys)
+    if build is None:
+        present = frozenset(k for k in keys if k in _SOURCE_KEYS)
+        build = _BUILDERS.get(present)
+        if build is None:
+            if len(_BUILDERS) >= _SCHEMA_CACHE_MAX:
+                _BUILDERS.clear()
+                _SCHEMAS.clear()
+            build = _BUILDERS[present] = _compile_builder(present)
+        if len(_SCHEMAS) >= _SCHEMA_CACHE_MAX * 4:
+            _SCHEMAS.clear()
+        _SCHEMAS[keys] = build
+    return build
+
+
+def _classify_action(raw_action) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(canonical action or None if invalid, side value, unmapped_action) exactly as normalize_trade() decides."""
+    raw_action_lower = str(raw_action).lower()
+    canonical_action = ACTION_MAP.get(raw_action_lower, raw_action_lower)
+    unmapped_action = None
+    if canonical_action is None or canonical_action not in ALLOWED_ACTIONS:
+        unmapped_action = canonical_action if canonical_action else raw_action_lower
+        canonical_action = None
+    side_value = raw_action_lower if raw_action_lower in ("debit", "credit") else None
+    return canonical_action, side_value, unmapped_action
+
+
+def _action_info(raw_action):
+    if raw_action.__class__ is str:
+        info = _ACTIONS.get(raw_action)
+        if info is None:
+            if len(_ACTIONS) >= _ACTION_CACHE_MAX:
+                _ACTIONS.clear()
+            info = _ACTIONS[raw_action] = _classify_action(raw_action)
+        return info
+    return _classify_action(raw_action)
+
+
+def _passes_compliance(entry: dict) -> bool:
+    """ledger_compliance_filter.compliance_filter_entry() for a mapped (non-skip) row from the builder."""
+    if entry["action"] not in _compliance.ALLOWED_ACTIONS:
+        return False
+    qty, price, total_value = entry["quantity"], entry["price"], entry["total_value"]
+    if (qty == 0 or price == 0 or total_value == 0) and entry["fee"] + entry["commission"] == 0:
+        raw = entry["json_metadata"]["raw_broker"]
+        raw_type = str(raw.get("activity_type") or raw.get("type") or raw.get("order_status") or "").upper()
+        if raw_type in _compliance.NON_ECONOMIC_MARKERS:
+            return False
+    return bool(entry["trade_id"])
+
+
+def iter_normalized_trades(records: Iterable[Any], credential_hash=None, compliance: bool = False,
+                           skip_non_dict: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily normalize `records`; same dicts as normalize_trade(r, credential_hash) per record. With
+    compliance=True only rows passing ledger_compliance_filter.compliance_filter_entries() are yielded (skip rows
+    and non-dict records never pass). skip_non_dict drops non-dict records instead of yielding all-None rows.
+    """
+    if compliance and _compliance is None:
+        raise RuntimeError("ledger_compliance_filter is unavailable; cannot apply compliance=True")
+    _SETTINGS.ensure()
+    ident = BOT_IDENTITY
+    entity = ident.get("ENTITY_CODE", "UNKNOWN")
+    juris = ident.get("JURISDICTION_CODE", "UNKNOWN")
+    bot = ident.get("BOT_ID", "UNKNOWN")
+    h = credential_hash or "n/a"
+    keys_cache = _SCHEMAS
+    for trade in records:
+        if not isinstance(trade, dict):
+            if not (skip_non_dict or compliance):
+                yield {k: None for k in TRADES_FIELDS}
+            continue
+        raw_action = trade.get("action") or trade.get("side") or None
+        if raw_action:
+            action, side, unmapped = _action_info(raw_action)
+        else:
+            action = side = unmapped = None
+        if action is None:
+            if compliance:
+                continue  # blank primary fields
+            mapping = dict(_SKIP_TEMPLATE)
+            mapping["json_metadata"] = {"raw_broker": trade, "api_hash": h,
+                                        "unmapped_action": unmapped or raw_action or "missing"}
+            mapping["trade_id"] = trade.get("id") or trade.get("trade_id") or trade.get("order_id")
+            yield mapping
+            continue
+        build = keys_cache.get(tuple(trade)) or _builder_for(trade)
+        row = build(trade, h, action, side, entity, juris, bot)
+        if compliance and not _passes_compliance(row):
+            continue
+        yield row
+
+
+def normalize_trades(records: Iterable[Any], credential_hash=None, compliance: bool = False,
+                     skip_non_dict: bool = False) -> List[Dict[str, Any]]:
+    """Batch normalize_trade(); see iter_normalized_trades()."""
+    return list(iter_normalized_trades(records, credential_hash, compliance, skip_non_dict))
+
+
+_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, default=str).encode
+_ROW_FIELDS = frozenset(TRADES_FIELDS) | {"skip_insert"}
+
+
+def iter_trade_rows(records: Iterable[Any], credential_hash=None, columns: Sequence[str] = TRADES_FIELDS,
+                    compliance: bool = True) -> Iterator[tuple]:
+    """
+    Compliant normalized trades as tuples in `columns` order (dict/list values JSON-encoded), ready for
+    conn.executemany("INSERT INTO trades (<columns>) VALUES (?, ...)", rows).
+    """
+    columns = tuple(columns)
+    if columns and _ROW_FIELDS.issuperset(columns):
+        pick = itemgetter(*columns)
+        if len(columns) == 1:
+            pick = lambda row, _get=pick: (_get(row),)
+    else:
+        pick = lambda row: tuple(row.get(c) for c in columns)
+    encode = _JSON_ENCODE
+    for row in iter_normalized_trades(records, credential_hash, compliance=compliance, skip_non_dict=True):
+        values = pick(row)
+        yield tuple(encode(v) if v.__class__ is dict or v.__class__ is list else v for v in values)
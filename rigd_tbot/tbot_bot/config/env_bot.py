@@ -241,12 +241,35 @@ def validate_bot_config(config: Dict[str, Any]) -> None:
     config["HOLDINGS_MID"]                = _normalize_hhmm_or_hhmmss(str(config.get("HOLDINGS_MID", "")).strip(),                "HOLDINGS_MID")
     config["UNIVERSE_REBUILD_START_TIME"] = _normalize_hhmm_or_hhmmss(str(config.get("UNIVERSE_REBUILD_START_TIME", "")).strip(), "UNIVERSE_REBUILD_START_TIME")
 
+# Decrypted+validated config, keyed by the stat of the .enc and key files so edits are picked up
+# on the next call (warm phase workers preload this before the market window opens).
+_CONFIG_MEMO: Dict[str, Any] = {"key": None, "config": None}
+
+def _config_memo_key():
+    enc_path, key_path, _, _ = _resolve_encrypted_paths()
+    if enc_path is None or key_path is None:
+        return None
+    try:
+        es, ks = enc_path.stat(), key_path.stat()
+    except OSError:
+        return None
+    return (str(enc_path), es.st_mtime_ns, es.st_size, str(key_path), ks.st_mtime_ns, ks.st_size)
+
+def get_bot_config_version():
+    """Hashable stat key of the encrypted config + key file (None if missing); changes whenever either is rewritten."""
+    return _config_memo_key()
+
 def get_bot_config() -> Dict[str, Any]:
+    memo_key = _config_memo_key()
+    if memo_key is not None and _CONFIG_MEMO["key"] == memo_key:
+        return dict(_CONFIG_MEMO["config"])
     logger.debug("Loading bot config from .env_bot.enc")
     config = load_env_bot()
     logger.debug("Validating bot config")
     validate_bot_config(config)
     logger.debug("Bot config loaded and validated successfully")
+    if memo_key is not None:
+        _CONFIG_MEMO["key"], _CONFIG_MEMO["config"] = memo_key, dict(config)
     return config
 
 def load_env_var(key: str, fallback: Any = None) -> Any:
@@ -9,16 +9,29 @@ from pathlib import Path
 from tbot_bot.trading.notifier_bot import notify_critical_error
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.path_resolver import get_output_path
+from tbot_bot.support.lazy_settings import LazySettings
 
 # Load configuration at runtime (never at module import for bootstrap safety)
-config = get_bot_config()
-LOG_FORMAT = config.get("LOG_FORMAT", "json")
+def _load_settings():
+    config = get_bot_config()
+    return {"config": config, "LOG_FORMAT": config.get("LOG_FORMAT", "json")}
 
-# Use new path_resolver logic, always require both category and filename
-LOG_FILE = get_output_path(category="logs", filename="unresolved_orders.log")
+_SETTINGS = LazySettings(globals(), _load_settings, ("config", "LOG_FORMAT"))
 
-# NEW: Dedicated consolidated error traceback log for all workers/supervisor
-ERROR_TRACEBACKS_FILE = get_output_path(category="logs", filename="error_tracebacks.log")
+def _load_paths():
+    return {
+        # Use new path_resolver logic, always require both category and filename
+        "LOG_FILE": get_output_path(category="logs", filename="unresolved_orders.log"),
+        # NEW: Dedicated consolidated error traceback log for all workers/supervisor
+        "ERROR_TRACEBACKS_FILE": get_output_path(category="logs", filename="error_tracebacks.log"),
+    }
+
+_PATHS = LazySettings(globals(), _load_paths, ("LOG_FILE", "ERROR_TRACEBACKS_FILE"))
+
+def __getattr__(name):
+    if name in _PATHS.names:
+        return _PATHS.module_getattr(name)
+    return _SETTINGS.module_getattr(name)
 
 ERROR_CATEGORIES = ["NetworkError", "BrokerError", "LogicError", "ConfigError"]
 
@@ -29,6 +42,13 @@ def log_error(error_type, strategy_name, broker, exception, error_code=None):
     """
     timestamp = datetime.now(timezone.utc).isoformat()
     trace = traceback.format_exc(limit=5)
+    # Error reporting must not depend on config being loadable
+    try:
+        _SETTINGS.ensure()
+        log_format = LOG_FORMAT
+    except Exception:
+        log_format = "json"
+    _PATHS.ensure()
 
     log_data = {
         "timestamp": timestamp,
@@ -49,7 +69,7 @@ def log_error(error_type, strategy_name, broker, exception, error_code=None):
     try:
         Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
         with open(LOG_FILE, "a", encoding="utf-8") as f:
-            if LOG_FORMAT == "json":
+            if log_format == "json":
                 import json
                 f.write(json.dumps(log_data) + "\n")
             else:
@@ -69,10 +89,13 @@ def log_error(error_type, strategy_name, broker, exception, error_code=None):
         print("[error_handler_bot] Failed to write to error_tracebacks.log:", et_exc, file=sys.stderr)
 
     if error_type in ["BrokerError", "NetworkError", "ConfigError"]:
-        notify_critical_error(
-            summary=f"Critical {error_type} in {strategy_name}",
-            detail=f"{timestamp}\n\nError: {exception}\n\nTrace:\n{trace}"
-        )
+        try:
+            notify_critical_error(
+                summary=f"Critical {error_type} in {strategy_name}",
+                detail=f"{timestamp}\n\nError: {exception}\n\nTrace:\n{trace}"
+            )
+        except Exception as n_exc:
+            print("[error_handler_bot] Failed to send critical error notification:", n_exc, file=sys.stderr)
 
 def handle(exception, strategy_name="unknown", broker="unknown", category="LogicError", error_code=None):
     """
@@ -5,18 +5,16 @@
 from __future__ import annotations
 import math
 from datetime import datetime
+import importlib.util
 from tbot_bot.support.utils_log import log_event  # UPDATED
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.path_resolver import get_bot_identity
-from scipy.stats import norm
+from tbot_bot.support.lazy_settings import LazySettings
 
-config = get_bot_config()
-identity = get_bot_identity()
-
-JURISDICTION_CODE = identity.get("JURISDICTION_CODE", "USA")
-
-ENABLE_BSM_FILTER = config.get("ENABLE_BSM_FILTER", "true").lower() == "true"
-MAX_BSM_DEVIATION = float(config.get("MAX_BSM_DEVIATION", 0.15))
+# scipy is imported on first pricing call (it dominates import time); fail at import only if it is absent,
+# so risk_module's `except ImportError` fallback still applies.
+if importlib.util.find_spec("scipy") is None:
+    raise ImportError("black_scholes_filter requires scipy")
 
 # Jurisdiction-specific risk-free rates
 RISK_FREE_RATES = {
@@ -32,7 +30,29 @@ RISK_FREE_RATES = {
     "BRA": 0.092    # Brazil (high-rate economy)
 }
 
-RISK_FREE_RATE = RISK_FREE_RATES.get(JURISDICTION_CODE, 0.045)
+
+def _jurisdiction_code(identity) -> str:
+    # BOT_IDENTITY_STRING is {ENTITY}_{JURISDICTION}_{BROKER}_{BOT_ID}
+    if isinstance(identity, dict):
+        return identity.get("JURISDICTION_CODE", "USA")
+    if isinstance(identity, str) and identity.count("_") >= 1:
+        return identity.split("_")[1] or "USA"
+    return "USA"
+
+def _load_settings():
+    config = get_bot_config()
+    identity = get_bot_identity()
+    JURISDICTION_CODE = _jurisdiction_code(identity)
+    ENABLE_BSM_FILTER = str(config.get("ENABLE_BSM_FILTER", "true")).lower() == "true"
+    MAX_BSM_DEVIATION = float(config.get("MAX_BSM_DEVIATION", 0.15))
+    RISK_FREE_RATE = RISK_FREE_RATES.get(JURISDICTION_CODE, 0.045)
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "identity", "JURISDICTION_CODE", "ENABLE_BSM_FILTER", "MAX_BSM_DEVIATION", "RISK_FREE_RATE",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 def calculate_bsm_price(option_type, S, K, T, r, sigma):
     """
@@ -48,6 +68,7 @@ def calculate_bsm_price(option_type, S, K, T, r, sigma):
     """
     if T <= 0 or sigma <= 0 or S <= 0 or K <= 0:
         return 0.0
+    from scipy.stats import norm
 
     d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
     d2 = d1 - sigma * math.sqrt(T)
@@ -72,6 +93,7 @@ def passes_bsm_filter(option_type, S, K, T_days, sigma, market_price, context=No
     :param context: optional dict for logging context
     :return: True if within range, else False
     """
+    _SETTINGS.ensure()
     if not ENABLE_BSM_FILTER:
         return True
 
@@ -94,6 +116,7 @@ def is_trade_blocked_by_bsm(option_type, S, K, T_days, sigma, market_price, cont
     Richer interface: Returns (blocked:bool, reason:str|None)
     Use in risk modules that want full diagnostics.
     """
+    _SETTINGS.ensure()
     if not ENABLE_BSM_FILTER:
         return (False, None)
 
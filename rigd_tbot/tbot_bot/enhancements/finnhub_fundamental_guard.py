@@ -11,9 +11,8 @@ from tbot_bot.support.utils_log import log_event  # UPDATED
 from tbot_bot.support.secrets_manager import load_screener_credentials
 from tbot_bot.support.path_resolver import get_cache_path  # <- Surgical update: path resolver used
 from tbot_bot.config.env_bot import get_bot_config
+from tbot_bot.support.lazy_settings import LazySettings
 
-# Load config
-config = get_bot_config()
 # Credential loader (never hardcode, always use secrets manager)
 def get_finnhub_api_params():
     all_creds = load_screener_credentials()
@@ -35,11 +34,21 @@ def get_finnhub_api_params():
 
 FUNDAMENTAL_CACHE = get_cache_path(f"fundamentals_{datetime.date.today()}.json")  # <- Surgical update: path resolver used
 
-# Runtime filter toggles
-ENABLE_FUNDAMENTAL_GUARD = config.get("ENABLE_FUNDAMENTAL_GUARD", "true").lower() == "true"
-MAX_DEBT_EQUITY = float(config.get("MAX_DEBT_EQUITY", 2.5))
-MAX_PE_RATIO = float(config.get("MAX_PE_RATIO", 50.0))
-MIN_MARKET_CAP = int(config.get("MIN_MARKET_CAP_FUNDAMENTAL", 2000000000))
+# Runtime filter toggles (read from config on first use, not at import)
+def _load_settings():
+    config = get_bot_config()
+    return {
+        "config": config,
+        "ENABLE_FUNDAMENTAL_GUARD": config.get("ENABLE_FUNDAMENTAL_GUARD", "true").lower() == "true",
+        "MAX_DEBT_EQUITY": float(config.get("MAX_DEBT_EQUITY", 2.5)),
+        "MAX_PE_RATIO": float(config.get("MAX_PE_RATIO", 50.0)),
+        "MIN_MARKET_CAP": int(config.get("MIN_MARKET_CAP_FUNDAMENTAL", 2000000000)),
+    }
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "ENABLE_FUNDAMENTAL_GUARD", "MAX_DEBT_EQUITY", "MAX_PE_RATIO", "MIN_MARKET_CAP",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 
 def load_cache():
@@ -76,6 +85,7 @@ def passes_fundamental_guard(symbol: str, context: dict = None) -> bool:
     Validates symbol against PE ratio, D/E ratio, and market cap requirements.
     Rejects if any metric fails. Logs rejections.
     """
+    _SETTINGS.ensure()
     api_key, _, _, _ = get_finnhub_api_params()
     if not ENABLE_FUNDAMENTAL_GUARD or not api_key:
         return True
@@ -11,22 +11,34 @@ from tbot_bot.support.path_resolver import get_output_path
 # Resolve blocklist file within output/enhancements
 BLOCKLIST_FILE = os.path.join(get_output_path("enhancements", "ticker_blocklist.json"))
 
-def load_blocklist():
-    """
-    Loads the current blocklist of traded tickers from disk.
-    Returns a set of tickers traded during the current UTC date.
-    """
-    if not os.path.exists(BLOCKLIST_FILE):
-        return set()
+# Today's set, keyed by (file mtime_ns, size, UTC date): re-parsed only when the file changes or the day rolls
+_CACHE = {"key": None, "tickers": frozenset()}
 
+def _today_tickers():
+    today = datetime.utcnow().date().isoformat()
+    try:
+        st = os.stat(BLOCKLIST_FILE)
+    except OSError:
+        return frozenset()
+    key = (BLOCKLIST_FILE, st.st_mtime_ns, st.st_size, today)
+    if _CACHE["key"] == key:
+        return _CACHE["tickers"]
     try:
         with open(BLOCKLIST_FILE, "r") as f:
             data = json.load(f)
-            today = datetime.utcnow().date().isoformat()
-            return set(ticker.upper() for ticker in data.get(today, []))
+        tickers = frozenset(ticker.upper() for ticker in data.get(today, []))
     except Exception as e:
         log_error(f"[ticker_blocklist] Failed to load blocklist: {e}", module="ticker_blocklist")
-        return set()
+        return frozenset()
+    _CACHE["key"], _CACHE["tickers"] = key, tickers
+    return tickers
+
+def load_blocklist():
+    """
+    Loads the current blocklist of traded tickers from disk.
+    Returns a set of tickers traded during the current UTC date.
+    """
+    return set(_today_tickers())
 
 def save_blocklist(ticker):
     """
@@ -45,8 +57,11 @@ def save_blocklist(ticker):
         data[today] = list(tickers_today)
 
         os.makedirs(os.path.dirname(BLOCKLIST_FILE), exist_ok=True)
-        with open(BLOCKLIST_FILE, "w") as f:
+        tmp = f"{BLOCKLIST_FILE}.tmp"
+        with open(tmp, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp, BLOCKLIST_FILE)
+        _CACHE["key"] = None
 
         log_debug(f"[ticker_blocklist] Added {ticker.upper()} to blocklist.", module="ticker_blocklist")
     except Exception as e:
@@ -57,5 +72,11 @@ def is_ticker_blocked(ticker):
     Checks if the given ticker has already been traded today.
     Returns True if it is on the blocklist.
     """
-    blocklist = load_blocklist()
-    return ticker.upper() in blocklist
+    return ticker.upper() in _today_tickers()
+
+def blocked_tickers(tickers):
+    """
+    Subset of tickers (as given) already traded today; one freshness check for the whole batch.
+    """
+    traded = _today_tickers()
+    return {t for t in tickers if t and t.upper() in traded}
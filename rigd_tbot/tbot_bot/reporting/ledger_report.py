@@ -1,7 +1,11 @@
 # tbot_bot/reporting/ledger_report.py
 # Grouped row reporting, summary/expand logic for double-entry trades.
 
-from tbot_bot.accounting.ledger_modules.ledger_query import fetch_trades_by_group, fetch_grouped_trades_summary
+from tbot_bot.accounting.ledger_modules.ledger_query import (
+    fetch_trades_by_group,
+    fetch_grouped_trades_summary,
+    get_summary_totals_by_symbol,
+)
 
 def get_grouped_ledger_report(expand_group_ids=None):
     """
@@ -40,18 +44,13 @@ def get_grouped_ledger_report(expand_group_ids=None):
 
 def get_ledger_summary_totals():
     """
-    Returns aggregate totals for reporting: sums of quantity, total_value, fees, by action, symbol, etc.
+    Returns aggregate totals for reporting: sums of quantity, total_value, fees per symbol.
+    Aggregated in SQL over trade_group_summary (one representative row per group).
     """
-    grouped = fetch_grouped_trades_summary()
-    summary = {}
-    for group in grouped:
-        symbol = group["symbol"]
-        if symbol not in summary:
-            summary[symbol] = {"quantity": 0, "total_value": 0, "fee": 0}
-        summary[symbol]["quantity"] += group.get("quantity", 0) or 0
-        summary[symbol]["total_value"] += group.get("total_value", 0) or 0
-        summary[symbol]["fee"] += group.get("fee", 0) or 0
-    return summary
+    return {
+        symbol: {"quantity": t["quantity"] or 0, "total_value": t["total_value"] or 0, "fee": t["fee"] or 0}
+        for symbol, t in get_summary_totals_by_symbol().items()
+    }
 
 def get_trade_details(trade_id):
     """
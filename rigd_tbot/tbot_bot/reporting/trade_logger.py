@@ -17,18 +17,27 @@ from datetime import datetime, timezone
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.utils_log import log_event
 from tbot_bot.support.path_resolver import get_output_path
+from tbot_bot.support.lazy_settings import LazySettings
 
-# Load config
-config = get_bot_config()
-BOT_IDENTITY = config.get("BOT_IDENTITY_STRING") or "UNKNOWN_IDENTITY"
-LOG_FORMAT = str(config.get("LOG_FORMAT", "json")).lower()
-ENABLE_LOGGING = bool(config.get("ENABLE_LOGGING", True))
+# Load config on first use (see support/lazy_settings.py); importing this module stays side-effect free
+def _load_settings():
+    config = get_bot_config()
+    return {
+        "config": config,
+        "BOT_IDENTITY": config.get("BOT_IDENTITY_STRING") or "UNKNOWN_IDENTITY",
+        "LOG_FORMAT": str(config.get("LOG_FORMAT", "json")).lower(),
+        "ENABLE_LOGGING": bool(config.get("ENABLE_LOGGING", True)),
+    }
+
+_SETTINGS = LazySettings(globals(), _load_settings, ("config", "BOT_IDENTITY", "LOG_FORMAT", "ENABLE_LOGGING"))
+__getattr__ = _SETTINGS.module_getattr
 
 def append_trade(trade: dict):
     """
     Writes trade entry to identity-scoped /output/trades/ directory
     as JSON or CSV, with compliant naming.
     """
+    _SETTINGS.ensure()
     if not ENABLE_LOGGING or not isinstance(trade, dict):
         return
 
@@ -64,6 +73,7 @@ def append_trade(trade: dict):
 # When launched by the supervisor, run as a lightweight persistent service to avoid restart thrash.
 if __name__ == "__main__":
     print(f"[LAUNCH] trade_logger.py launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+    _SETTINGS.ensure()
     log_event("trade_logger", "Trade logger service started (idle; writes occur via append_trade calls).")
     # Idle loop with a very light heartbeat; adjust via LOG_HEARTBEAT_SEC if desired.
     heartbeat = int(config.get("LOG_HEARTBEAT_SEC", 3600))
@@ -0,0 +1,67 @@
+# tbot_bot/runtime/phase_latency.py
+# Phase start latency probe: scheduled phase time -> first quote request, one JSONL record per phase run.
+# schedule_dispatcher exports TBOT_PHASE_NAME / TBOT_PHASE_SCHEDULED_TS / TBOT_PHASE_MODE (cold|warm) to the
+# phase process; get_realtime_price() calls mark_first_quote() so the first quote request stamps the record.
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+_LOCK = threading.Lock()
+_MARKED = False
+
+
+def _latency_path() -> str:
+    override = os.environ.get("TBOT_PHASE_LATENCY_PATH")
+    if override:
+        return override
+    from tbot_bot.support.path_resolver import get_output_path
+    return get_output_path("logs", "phase_latency.jsonl")
+
+
+def _parse_ts(s: str) -> Optional[datetime.datetime]:
+    try:
+        dt = datetime.datetime.fromisoformat(str(s).strip().replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.astimezone(datetime.timezone.utc)
+
+
+def mark_first_quote() -> Optional[Dict]:
+    """
+    Record scheduled->first-quote latency once per process. No-op outside dispatcher-launched phases.
+    Never raises: a failed write must not block the quote request that triggered it.
+    """
+    global _MARKED
+    if _MARKED:
+        return None
+    scheduled = os.environ.get("TBOT_PHASE_SCHEDULED_TS")
+    if not scheduled:
+        return None
+    with _LOCK:
+        if _MARKED:
+            return None
+        _MARKED = True
+    now = datetime.datetime.now(datetime.timezone.utc)
+    sched_dt = _parse_ts(scheduled)
+    rec = {
+        "phase": os.environ.get("TBOT_PHASE_NAME", ""),
+        "mode": os.environ.get("TBOT_PHASE_MODE", "cold"),
+        "scheduled_ts": scheduled,
+        "first_quote_ts": now.isoformat().replace("+00:00", "Z"),
+        "latency_s": round((now - sched_dt).total_seconds(), 4) if sched_dt else None,
+    }
+    try:
+        path = _latency_path()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec) + "\n")
+    except Exception:
+        pass
+    return rec
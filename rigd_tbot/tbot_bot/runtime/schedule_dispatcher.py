@@ -1,6 +1,8 @@
 # tbot_bot/runtime/schedule_dispatcher.py
 # Single source of truth for executing the daily schedule produced by tbot_supervisor.
 # Follows times in logs/schedule.json with grace windows; honors control flags; updates bot_state; writes per-phase logs.
+# Optional warm workers (TBOT_WARM_WORKERS=1): each phase's process is spawned TBOT_WARM_LEAD_S seconds early,
+# preloads imports/config/universe and is released at the scheduled time (see warm_worker.py).
 
 # --- PATH BOOTSTRAP ---
 import sys as _sys, pathlib as _pathlib
@@ -18,10 +20,11 @@ import time
 import datetime
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 # (surgical) centralized bot-state management
 from tbot_bot.support.bot_state_manager import set_state
+from tbot_bot.support.status_publisher import write_json_atomic
 
 def _iso() -> str:
     return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -52,8 +55,7 @@ def _write_status(extra: Dict):
         payload = {}
     payload.update(extra or {})
     payload["dispatcher_updated_at"] = _iso()
-    with open(STATUS_PATH, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    write_json_atomic(STATUS_PATH, payload, indent=2, sort_keys=True)
 
 def _phase_log(name: str) -> Path:
     return _out_path("logs", f"{name}.log")
@@ -88,12 +90,28 @@ def _grace_min() -> int:
     except Exception:
         return 2
 
-def _should_run_or_skip(target_dt: Optional[datetime.datetime], phase: str) -> bool:
+def _warm_enabled() -> bool:
+    return os.environ.get("TBOT_WARM_WORKERS", "0") == "1"
+
+def _warm_lead_s() -> int:
+    try:
+        return max(0, int(os.environ.get("TBOT_WARM_LEAD_S", "180")))
+    except Exception:
+        return 180
+
+def _should_run_or_skip(target_dt: Optional[datetime.datetime], phase: str,
+                        prewarm: Optional[Callable[[], None]] = None) -> bool:
     if not target_dt:
         _log(f"{phase}: no scheduled time → run now.")
         return True
     now = datetime.datetime.now(datetime.timezone.utc)
     if now < target_dt:
+        if prewarm is not None:
+            warm_at = target_dt - datetime.timedelta(seconds=_warm_lead_s())
+            if now < warm_at:
+                _log(f"{phase}: sleeping until {warm_at.isoformat()}Z (warm-up)")
+                _sleep_until(warm_at)
+            prewarm()
         _log(f"{phase}: sleeping until {target_dt.isoformat()}Z")
         _sleep_until(target_dt)
         return True
@@ -114,6 +132,8 @@ def _flag() -> Optional[str]:
 
 def _boundary_check() -> Optional[str]:
     fl = _flag()
+    if fl:
+        _discard_warm()
     if fl == "kill":
         set_state("shutdown_triggered", reason="dispatcher:kill")
         _log("Kill flag detected. Aborting.")
@@ -129,13 +149,26 @@ def _boundary_check() -> Optional[str]:
 def _py() -> str:
     return os.environ.get("TBOT_PY", sys.executable)
 
-def _run(cmd: str, phase: str) -> int:
+def _base_env() -> Dict[str, str]:
     env = os.environ.copy()
     # ensure repo on path
     repo = str(_ROOT)
     cur = env.get("PYTHONPATH", "")
     if repo not in cur.split(os.pathsep):
         env["PYTHONPATH"] = f"{repo}{os.pathsep}{cur}" if cur else repo
+    return env
+
+def _phase_env(phase: str, target_dt: Optional[datetime.datetime], mode: str) -> Dict[str, str]:
+    """Env for a phase process; TBOT_PHASE_* feed the scheduled→first-quote probe (phase_latency.py)."""
+    env = _base_env()
+    ts = target_dt or datetime.datetime.now(datetime.timezone.utc)
+    env["TBOT_PHASE_NAME"] = phase
+    env["TBOT_PHASE_SCHEDULED_TS"] = ts.isoformat().replace("+00:00", "Z")
+    env["TBOT_PHASE_MODE"] = mode
+    return env
+
+def _run(cmd: str, phase: str, env: Optional[Dict[str, str]] = None) -> int:
+    env = env if env is not None else _base_env()
 
     logp = _phase_log(phase)
     with open(logp, "ab", buffering=0) as lf:
@@ -154,6 +187,51 @@ def _run(cmd: str, phase: str) -> int:
                 pass
             return 1
 
+# phase log name -> WarmWorker spawned ahead of that phase
+_WARM: Dict[str, object] = {}
+
+def _prewarmer(module: str, args: List[str], phase: str,
+               target_dt: Optional[datetime.datetime]) -> Optional[Callable[[], None]]:
+    if not _warm_enabled():
+        return None
+
+    def _spawn():
+        try:
+            from tbot_bot.runtime.warm_worker import WarmWorker
+            w = WarmWorker.spawn(module, args, log_path=str(_phase_log(phase)),
+                                 env=_phase_env(phase, target_dt, "warm"), cwd=str(_ROOT), python=_py())
+            _WARM[phase] = w
+            _log(f"Warm[{phase}]: spawned pid={w.proc.pid} for {module} {' '.join(args)}")
+        except Exception as e:
+            _log(f"WARN warm spawn failed for {phase}: {e}")
+    return _spawn
+
+def _discard_warm():
+    while _WARM:
+        phase, w = _WARM.popitem()
+        try:
+            w.discard()
+            _log(f"Warm[{phase}]: discarded unused worker")
+        except Exception as e:
+            _log(f"WARN discarding warm worker {phase}: {e}")
+
+def _run_module(module: str, args: List[str], phase: str, target_dt: Optional[datetime.datetime]) -> int:
+    """Release the pre-warmed worker for this phase if one is alive; otherwise spawn cold via _run."""
+    w = _WARM.pop(phase, None)
+    if w is not None:
+        _log(f"Exec[{phase}]: warm worker pid={w.proc.pid} ready={w.ready()}")
+        rc = w.go()
+        if rc is not None:
+            _log(f"Exit[{phase}]: {rc} (warm)")
+            return rc
+        _log(f"WARN warm worker for {phase} exited before go; falling back to cold start.")
+    cmd = " ".join([shlex.quote(_py()), "-m", module] + [shlex.quote(a) for a in args])
+    return _run(cmd, phase, env=_phase_env(phase, target_dt, "cold"))
+
+ROUTER = "tbot_bot.strategy.strategy_router"
+HOLDINGS = "tbot_bot.runtime.holdings_maintenance"
+UNIVERSE = "tbot_bot.screeners.universe_orchestrator"
+
 def _lock_path(trading_date: str) -> Path:
     return _out_path("locks", f"dispatcher_{trading_date}.lock")
 
@@ -199,12 +277,13 @@ def main() -> int:
 
     # ========================= OPEN =========================
     if _boundary_check(): return 0
-    if _should_run_or_skip(_dt(sched["open_utc"]), "OPEN"):
+    open_dt = _dt(sched["open_utc"])
+    if _should_run_or_skip(open_dt, "OPEN", _prewarmer(ROUTER, ["--session=open"], "open", open_dt)):
         # Enter OPEN analysis
         set_state("analyzing", reason="open:analyze")
         # Orders placing begins with strategy launch
         set_state("trading", reason="open:placing")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.strategy.strategy_router --session=open", "open")
+        rc = _run_module(ROUTER, ["--session=open"], "open", open_dt)
         rc_nonzero |= (rc != 0)
         # Monitoring phase starts after router returns; do not spam
         set_state("monitoring", reason="open:monitoring")
@@ -213,24 +292,26 @@ def main() -> int:
     if _boundary_check(): return 0
     hold_open_str = sched.get("holdings_open_utc") or sched.get("holdings_utc")
     hold_open_dt = _dt(hold_open_str) if hold_open_str else None
-    if _should_run_or_skip(hold_open_dt, "HOLDINGS(open)"):
+    if _should_run_or_skip(hold_open_dt, "HOLDINGS(open)",
+                           _prewarmer(HOLDINGS, ["--session=open"], "holdings_open", hold_open_dt)):
         # OPEN close-out window
         set_state("trading", reason="open:closing")
         # Analyze + place for holdings
         set_state("analyzing", reason="holdings:analyze")
         set_state("trading", reason="holdings:placing")
         _stamp_holdings_launch("open")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.runtime.holdings_maintenance --session=open", "holdings_open")
+        rc = _run_module(HOLDINGS, ["--session=open"], "holdings_open", hold_open_dt)
         rc_nonzero |= (rc != 0)
         # Waiting for MID
         set_state("running", reason="waiting:mid")
 
     # ========================= MID =========================
     if _boundary_check(): return 0
-    if _should_run_or_skip(_dt(sched["mid_utc"]), "MID"):
+    mid_dt = _dt(sched["mid_utc"])
+    if _should_run_or_skip(mid_dt, "MID", _prewarmer(ROUTER, ["--session=mid"], "mid", mid_dt)):
         set_state("analyzing", reason="mid:analyze")
         set_state("trading", reason="mid:placing")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.strategy.strategy_router --session=mid", "mid")
+        rc = _run_module(ROUTER, ["--session=mid"], "mid", mid_dt)
         rc_nonzero |= (rc != 0)
         set_state("monitoring", reason="mid:monitoring")
 
@@ -238,37 +319,40 @@ def main() -> int:
     if _boundary_check(): return 0
     hold_mid_str = sched.get("holdings_mid_utc")
     hold_mid_dt = _dt(hold_mid_str) if hold_mid_str else None
-    if _should_run_or_skip(hold_mid_dt, "HOLDINGS(mid)"):
+    if _should_run_or_skip(hold_mid_dt, "HOLDINGS(mid)",
+                           _prewarmer(HOLDINGS, ["--session=mid"], "holdings_mid", hold_mid_dt)):
         set_state("trading", reason="mid:closing")
         set_state("analyzing", reason="holdings:analyze")
         set_state("trading", reason="holdings:placing")
         _stamp_holdings_launch("mid")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.runtime.holdings_maintenance --session=mid", "holdings_mid")
+        rc = _run_module(HOLDINGS, ["--session=mid"], "holdings_mid", hold_mid_dt)
         rc_nonzero |= (rc != 0)
         set_state("running", reason="waiting:close")
 
     # ========================= CLOSE =========================
     if _boundary_check(): return 0
-    if _should_run_or_skip(_dt(sched["close_utc"]), "CLOSE"):
+    close_dt = _dt(sched["close_utc"])
+    if _should_run_or_skip(close_dt, "CLOSE", _prewarmer(ROUTER, ["--session=close"], "close", close_dt)):
         set_state("analyzing", reason="close:analyze")
         set_state("trading", reason="close:placing")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.strategy.strategy_router --session=close", "close")
+        rc = _run_module(ROUTER, ["--session=close"], "close", close_dt)
         rc_nonzero |= (rc != 0)
         set_state("monitoring", reason="close:monitoring")
 
     # ========================= UNIVERSE (post-close) =========================
     if _boundary_check(): return 0
     uni_dt = _dt(sched["universe_utc"]) if sched.get("universe_utc") else None
-    if _should_run_or_skip(uni_dt, "UNIVERSE"):
+    if _should_run_or_skip(uni_dt, "UNIVERSE", _prewarmer(UNIVERSE, [], "universe", uni_dt)):
         # close-out window for CLOSE strategy ends before universe; mark closing just prior
         set_state("trading", reason="close:closing")
         # Universe rebuild
         set_state("analyzing", reason="universe:rebuild")
-        rc = _run(f"{shlex.quote(_py())} -m tbot_bot.screeners.universe_orchestrator", "universe")
+        rc = _run_module(UNIVERSE, [], "universe", uni_dt)
         rc_nonzero |= (rc != 0)
         # Day complete; waiting for nightly trigger
         set_state("running", reason="waiting:nightly")
 
+    _discard_warm()
     _write_status({"dispatcher_status": "complete", "rc_nonzero": int(rc_nonzero)})
     _log(f"Dispatcher complete. rc_nonzero={int(rc_nonzero)}")
     return 0 if not rc_nonzero else 1
@@ -6,12 +6,14 @@ status_bot.py – Tracks and exposes the current state of the bot for UI or exte
 Used by status_web.py and internal logging for diagnostics and dashboard reporting.
 Implements exhaustive status tracking and win_rate calculation per RIGD_TradingBot spec.
 Writes live status only to tbot_bot/output/logs/status.json (no identity subdir, never writes to /output/{BOT_IDENTITY}/logs/).
+Writes go through a StatusPublisher: coalesced to at most one per TBOT_STATUS_WRITE_INTERVAL, skipped when nothing
+but the timestamp changed (rewritten every TBOT_STATUS_HEARTBEAT for liveness), atomic temp-file + rename, and
+mirrored into status.json.view for readers that skip JSON parsing (see support/status_publisher.py).
 Can be run directly for diagnostics (CLI/testing). Normally launched as a subprocess by tbot_supervisor.py.
 """
 
 import sys
 import time
-import json
 from threading import Lock, Thread
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.utils_time import utc_now
@@ -21,6 +23,7 @@ from pathlib import Path
 from datetime import datetime, timezone
 # SURGICAL: centralize state reads via manager
 from tbot_bot.support.bot_state_manager import get_state
+from tbot_bot.support.status_publisher import StatusPublisher
 
 print(f"[LAUNCH] status_bot.py launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
 
@@ -32,6 +35,11 @@ def ensure_status_dir():
 class BotStatus:
     def __init__(self):
         self.lock = Lock()
+        self._config_applied = False
+        self.publisher = StatusPublisher(
+            STATUS_FILE_PATH, self.to_dict,
+            on_error=lambda e: print(f"[status_bot] ERROR: Failed to write status.json: {e}"),
+        )
         self.reset()
 
     def reset(self):
@@ -167,43 +175,42 @@ class BotStatus:
                 "supervisor_failed": self.supervisor_failed,
             }
 
-    def save_status(self):
-        status_dict = self.to_dict()
-        ensure_status_dir()
+    def _apply_config_once(self):
+        # Config is folded in on the first save instead of at import (importing status_bot writes nothing)
+        if self._config_applied:
+            return
+        self._config_applied = True
         try:
-            with open(STATUS_FILE_PATH, "w", encoding="utf-8") as f:
-                json.dump(status_dict, f, indent=2)
-        except Exception as e:
-            print(f"[status_bot] ERROR: Failed to write status.json: {e}")
+            self.update_config(get_bot_config())
+        except Exception:
+            pass
+
+    def save_status(self):
+        # Coalesced: bursts of updates within one write interval become a single write of the latest status
+        self._apply_config_once()
+        self.publisher.request()
+
+    def publish_status(self, force: bool = False) -> bool:
+        """Loop tick: like save_status, but reports whether status.json was written by this call."""
+        self._apply_config_once()
+        return self.publisher.publish(force=True) if force else self.publisher.request()
 
 bot_status = BotStatus()
 
 def update_live_status_loop(interval=2):
     print("[status_bot] Live status update loop started (CTRL+C to quit).")
     while True:
-        bot_status.save_status()
-        print(f"[status_bot] Updated {STATUS_FILE_PATH} at {utc_now().isoformat()}")
+        if bot_status.publish_status():
+            print(f"[status_bot] Updated {STATUS_FILE_PATH} at {utc_now().isoformat()}")
         time.sleep(interval)
 
 def run_status_bot():
-    try:
-        config = get_bot_config()
-        bot_status.update_config(config)
-    except Exception:
-        pass
+    bot_status._apply_config_once()
     update_live_status_loop()
 
 if __name__ == "__main__":
     run_status_bot()
 
-# Defensive: always save a status on import, even if not running as live service
-try:
-    config = get_bot_config()
-    bot_status.update_config(config)
-    bot_status.save_status()
-except Exception:
-    bot_status.save_status()
-
 def update_bot_state(
     state: str = None,
     strategy: str = None,
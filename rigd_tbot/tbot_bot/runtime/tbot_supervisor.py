@@ -27,6 +27,7 @@ from tbot_bot.support.utils_time import (
 
 # (surgical) centralized state manager
 from tbot_bot.support.bot_state_manager import get_state, set_state  # UPDATED: add get_state
+from tbot_bot.support.status_publisher import write_json_atomic
 
 # --- Paths & constants ---
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -61,8 +62,7 @@ def _write_status(extra: Dict) -> None:
     payload.update(extra or {})
     payload["supervisor_updated_at"] = _iso_utc_now()
     try:
-        with open(STATUS_PATH, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, sort_keys=True)
+        write_json_atomic(STATUS_PATH, payload, indent=2, sort_keys=True)
     except Exception as e:
         _write_log(f"[status] write error: {e}")
 
@@ -0,0 +1,223 @@
+# tbot_bot/runtime/warm_worker.py
+# Pre-forked warm worker for schedule_dispatcher phases.
+# The dispatcher spawns one worker a few minutes before a phase; the worker imports the phase module and
+# its strategy stack, preloads config/screener secrets/universe, writes a ready file and blocks on stdin.
+# On "go" it runs the phase module's main() exactly as `python -m <module> <args>` would and exits.
+# Workers are never reused: one process per phase keeps the crash isolation of the cold path.
+
+from __future__ import annotations
+
+# --- PATH BOOTSTRAP ---
+import sys as _sys, pathlib as _pathlib
+_THIS = _pathlib.Path(__file__).resolve()
+_ROOT = _THIS.parents[2]
+if str(_ROOT) not in _sys.path:
+    _sys.path.insert(0, str(_ROOT))
+# --- END BOOTSTRAP ---
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence
+
+GO = b"go\n"
+
+
+def _extra_modules(module: str, args: Sequence[str]) -> List[str]:
+    """Modules the phase imports lazily after start; importing them here moves that cost before the window."""
+    extras: List[str] = []
+    if module == "tbot_bot.strategy.strategy_router":
+        for a in args:
+            if a.startswith("--session="):
+                extras.append(f"tbot_bot.strategy.strategy_{a.split('=', 1)[1]}")
+    elif module == "tbot_bot.runtime.holdings_maintenance":
+        extras.append("tbot_bot.trading.holdings_manager")
+    extras.append("tbot_bot.screeners.screener_utils")
+    return extras
+
+
+def _warm_config() -> None:
+    from tbot_bot.config.env_bot import get_bot_config
+    get_bot_config()
+
+
+def _warm_screener_secrets() -> None:
+    from tbot_bot.screeners.screener_utils import get_universe_screener_secrets
+    get_universe_screener_secrets()
+
+
+def _warm_universe() -> None:
+    from tbot_bot.screeners.screener_utils import load_universe_cache
+    load_universe_cache()
+
+
+_WARMERS = (
+    ("config", _warm_config),
+    ("screener_secrets", _warm_screener_secrets),
+    ("universe", _warm_universe),
+)
+
+
+def preload(module: str, args: Sequence[str]) -> Dict[str, object]:
+    """Import the phase module + extras and run the warmers. Failures are recorded, not raised."""
+    timings: Dict[str, object] = {}
+    errors: Dict[str, str] = {}
+    for name in [module] + _extra_modules(module, args):
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+        timings[name] = round(time.perf_counter() - t0, 4)
+    for label, fn in _WARMERS:
+        t0 = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            errors[label] = f"{type(e).__name__}: {e}"
+        timings[label] = round(time.perf_counter() - t0, 4)
+    return {"timings_s": timings, "errors": errors}
+
+
+def _write_ready(path: str, payload: Dict) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _run_phase(module: str, args: Sequence[str]) -> int:
+    mod = sys.modules.get(module) or importlib.import_module(module)
+    sys.argv = [module] + list(args)
+    entry = getattr(mod, "main", None)
+    if not callable(entry):
+        import runpy
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+        return 0
+    rc = entry()
+    return int(rc) if isinstance(rc, int) else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm phase worker (spawned by schedule_dispatcher)")
+    parser.add_argument("--module", required=True)
+    parser.add_argument("--ready-file", required=True)
+    parser.add_argument("phase_args", nargs=argparse.REMAINDER)
+    ns = parser.parse_args(argv)
+    phase_args = ns.phase_args[1:] if ns.phase_args[:1] == ["--"] else list(ns.phase_args)
+
+    t0 = time.perf_counter()
+    info = preload(ns.module, phase_args)
+    info.update({"pid": os.getpid(), "module": ns.module, "preload_s": round(time.perf_counter() - t0, 4)})
+    print(f"[warm_worker] preloaded {ns.module} in {info['preload_s']}s errors={list(info['errors'])}", flush=True)
+    _write_ready(ns.ready_file, info)
+
+    line = sys.stdin.buffer.readline()
+    if line != GO:
+        print("[warm_worker] discarded before go", flush=True)
+        return 0
+    os.environ["TBOT_PHASE_MODE"] = "warm"
+    return _run_phase(ns.module, phase_args)
+
+
+class WarmWorker:
+    """Parent-side handle: spawn ahead of the phase, go() at the scheduled time, discard() if unused."""
+
+    def __init__(self, module: str, args: Sequence[str], proc: subprocess.Popen, ready_file: str, log_fh):
+        self.module = module
+        self.args = list(args)
+        self.proc = proc
+        self.ready_file = ready_file
+        self._log_fh = log_fh
+
+    @classmethod
+    def spawn(cls, module: str, args: Sequence[str] = (), log_path: Optional[str] = None,
+              env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None,
+              python: Optional[str] = None) -> "WarmWorker":
+        fd, ready_file = tempfile.mkstemp(prefix="tbot_warm_", suffix=".json")
+        os.close(fd)
+        os.unlink(ready_file)
+        log_fh = open(log_path, "ab", buffering=0) if log_path else subprocess.DEVNULL
+        cmd = [python or sys.executable, "-m", "tbot_bot.runtime.warm_worker",
+               "--module", module, "--ready-file", ready_file, "--", *args]
+        try:
+            proc = subprocess.Popen(cmd, cwd=cwd or str(_ROOT), stdin=subprocess.PIPE,
+                                    stdout=log_fh, stderr=log_fh, env=env)
+        except Exception:
+            if log_path:
+                log_fh.close()
+            raise
+        return cls(module, args, proc, ready_file, log_fh)
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def ready(self) -> bool:
+        return os.path.exists(self.ready_file)
+
+    def ready_info(self) -> Dict:
+        try:
+            with open(self.ready_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def wait_ready(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while not self.ready():
+            if not self.alive() or time.monotonic() >= deadline:
+                return self.ready()
+            time.sleep(0.05)
+        return True
+
+    def go(self) -> Optional[int]:
+        """Release the worker and wait for the phase to finish. None means the worker died before go."""
+        if not self.alive():
+            self._cleanup()
+            return None
+        try:
+            self.proc.stdin.write(GO)
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            self.proc.wait()
+            self._cleanup()
+            return None
+        rc = self.proc.wait()
+        # No ready file means the worker died during preload and never reached the phase.
+        started = self.ready()
+        self._cleanup()
+        return int(rc) if started else None
+
+    def discard(self, timeout: float = 10.0) -> None:
+        if self.alive():
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=timeout)
+            except Exception:
+                self.proc.kill()
+                self.proc.wait()
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        for p in (self.ready_file, f"{self.ready_file}.tmp"):
+            try:
+                os.unlink(p)
+            except OSError:
+                pass
+        if self._log_fh not in (None, subprocess.DEVNULL):
+            try:
+                self._log_fh.close()
+            except Exception:
+                pass
+            self._log_fh = None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
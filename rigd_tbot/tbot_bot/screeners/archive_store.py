@@ -0,0 +1,435 @@
+# tbot_bot/screeners/archive_store.py
+# Content-addressed, compressed archive store for universe/blocklist versions (used by universe_archiver).
+# Files are cut into record-aligned, content-defined chunks; identical chunks are stored once, new chunks are
+# compressed (zstd when the zstandard package is installed, zlib otherwise) as a delta against the chunk of the
+# previous version that starts at the same record. One index file gives O(1) version lookup.
+
+"""
+Layout under the store root:
+
+    index.json              {"format": 1, "versions": {vid: {...}}, "chunks": {cid: [...]}}  (temp + fsync + replace)
+    packs/<name>.pack       concatenated chunk blobs of one put(); one file + one fsync per archived version
+
+versions[vid] = {"basename", "ts", "label", "size", "sha1", "created_utc", "chunks": [cid, ...]}
+chunks[cid]   = [pack, offset, length, raw_size, base_cid | None, depth, anchor]
+
+cid is the sha1 of the chunk's raw bytes. A blob starts with one codec byte ("z" zstd, "d" zlib) followed by the
+compressed chunk; when base_cid is set the base chunk's raw bytes are the compression dictionary (delta). Delta
+chains are capped at MAX_DELTA_DEPTH so restoring any version decodes a bounded number of blobs per chunk.
+
+Chunk boundaries sit at record ends (newline, or "}," in compact JSON) and are chosen from a hash of the next
+record's leading bytes, which hold the symbol and stay the same when only prices change. So unchanged stretches
+dedupe and changed chunks line up with their predecessor for the delta.
+
+prune() drops versions by basename/time range, then garbage-collects chunks no remaining version uses (surviving
+deltas against a dropped chunk are re-encoded standalone first) and rewrites packs that are mostly dead. Writers are serialised per process. Chunks are written before
+the index, so a crash leaves at most an unreferenced pack that the next prune() removes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+INDEX_NAME = "index.json"
+PACK_DIR = "packs"
+
+CHUNK_MIN = 4 * 1024
+CHUNK_MAX = 64 * 1024
+CHUNK_MASK = 0x3F  # ~1 in 64 record starts past CHUNK_MIN is a boundary (~14 KB chunks for universe rows)
+ANCHOR_BYTES = 24
+MAX_DELTA_DEPTH = int(os.environ.get("TBOT_ARCHIVE_MAX_DELTA_DEPTH", "4"))
+ZSTD_LEVEL = int(os.environ.get("TBOT_ARCHIVE_ZSTD_LEVEL", "10"))
+ZLIB_LEVEL = 6
+REPACK_DEAD_RATIO = 0.5
+
+_RECORD_END = re.compile(rb"\n|\},\s*")
+
+
+def utc_now():
+    return datetime.utcnow().replace(tzinfo=timezone.utc)
+
+
+def _anchor(segment: bytes) -> int:
+    return zlib.crc32(segment[:ANCHOR_BYTES])
+
+
+def split_chunks(data: bytes) -> List[bytes]:
+    """Record-aligned content-defined chunks of `data` (concatenation == data)."""
+    chunks: List[bytes] = []
+    start = 0
+    n = len(data)
+    for m in _RECORD_END.finditer(data):
+        end = m.end()
+        if end - start >= CHUNK_MIN and end < n:
+            if (_anchor(data[end:end + ANCHOR_BYTES]) & CHUNK_MASK) == 0 or end - start >= CHUNK_MAX:
+                chunks.append(data[start:end])
+                start = end
+    while n - start > CHUNK_MAX:  # trailing stretch without record ends (binary / one huge record)
+        chunks.append(data[start:start + CHUNK_MAX])
+        start += CHUNK_MAX
+    if start < n:
+        chunks.append(data[start:])
+    return chunks
+
+
+def _compress(raw: bytes, base: Optional[bytes]) -> bytes:
+    if _zstd is not None:
+        kw = {"level": ZSTD_LEVEL}
+        if base:
+            kw["dict_data"] = _zstd.ZstdCompressionDict(base, dict_type=_zstd.DICT_TYPE_RAWCONTENT)
+        return b"z" + _zstd.ZstdCompressor(**kw).compress(raw)
+    c = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, 15, 9, zlib.Z_DEFAULT_STRATEGY, base[-32768:]) if base \
+        else zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, 15, 9)
+    return b"d" + c.compress(raw) + c.flush()
+
+
+def _decompress(blob: bytes, base: Optional[bytes]) -> bytes:
+    codec, payload = blob[:1], blob[1:]
+    if codec == b"z":
+        if _zstd is None:
+            raise RuntimeError("Archive chunk is zstd-compressed but the zstandard package is not installed")
+        kw = {}
+        if base:
+            kw["dict_data"] = _zstd.ZstdCompressionDict(base, dict_type=_zstd.DICT_TYPE_RAWCONTENT)
+        return _zstd.ZstdDecompressor(**kw).decompress(payload)
+    if codec == b"d":
+        d = zlib.decompressobj(15, base[-32768:]) if base else zlib.decompressobj(15)
+        return d.decompress(payload) + d.flush()
+    raise RuntimeError(f"Unknown archive chunk codec: {codec!r}")
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_durable(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+class ArchiveStore:
+    def __init__(self, root):
+        self.root = str(root)
+        self.index_path = os.path.join(self.root, INDEX_NAME)
+        self.pack_dir = os.path.join(self.root, PACK_DIR)
+        self._lock = threading.RLock()
+        self._key = None
+        self._versions: Dict[str, dict] = {}
+        self._chunks: Dict[str, list] = {}
+        self._history: Dict[str, List[str]] = {}
+
+    # ---------------- index ----------------
+    def _load(self) -> None:
+        try:
+            st = os.stat(self.index_path)
+            key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            key = None
+        if key == self._key:
+            return
+        versions, chunks = {}, {}
+        if key is not None:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            versions, chunks = data.get("versions") or {}, data.get("chunks") or {}
+        history: Dict[str, List[str]] = {}
+        for vid, v in sorted(versions.items(), key=lambda kv: (kv[1]["ts"], kv[0])):
+            history.setdefault(v["basename"], []).append(vid)
+        self._versions, self._chunks, self._history, self._key = versions, chunks, history, key
+
+    def _save(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        payload = json.dumps({"format": 1, "versions": self._versions, "chunks": self._chunks},
+                             separators=(",", ":")).encode("utf-8")
+        _write_durable(self.index_path, payload)
+        st = os.stat(self.index_path)
+        self._key = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    # ---------------- queries ----------------
+    def get(self, vid: str) -> Optional[dict]:
+        with self._lock:
+            self._load()
+            v = self._versions.get(vid)
+            return dict(v, id=vid) if v else None
+
+    def versions(self, basename: Optional[str] = None) -> List[str]:
+        """Version ids, newest first (optionally for one basename)."""
+        with self._lock:
+            self._load()
+            if basename:
+                return list(reversed(self._history.get(basename, [])))
+            return [vid for vid, _v in sorted(self._versions.items(), key=lambda kv: (kv[1]["ts"], kv[0]),
+                                              reverse=True)]
+
+    def latest(self, basename: str) -> Optional[str]:
+        with self._lock:
+            self._load()
+            hist = self._history.get(basename)
+            return hist[-1] if hist else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._load()
+            logical = sum(v["size"] for v in self._versions.values())
+            stored = sum(c[2] for c in self._chunks.values())
+            packs = 0
+            if os.path.isdir(self.pack_dir):
+                packs = sum(os.path.getsize(os.path.join(self.pack_dir, p)) for p in os.listdir(self.pack_dir))
+            return {"versions": len(self._versions), "chunks": len(self._chunks), "logical_bytes": logical,
+                    "stored_bytes": stored, "pack_bytes": packs, "index_bytes": self._key[1] if self._key else 0}
+
+    # ---------------- chunk io ----------------
+    def _read_blob(self, cid: str, files: Dict[str, object]) -> bytes:
+        pack, offset, length = self._chunks[cid][:3]
+        f = files.get(pack)
+        if f is None:
+            f = files[pack] = open(os.path.join(self.pack_dir, pack), "rb")
+        f.seek(offset)
+        return f.read(length)
+
+    def _raw(self, cid: str, memo: Dict[str, bytes], files: Dict[str, object]) -> bytes:
+        raw = memo.get(cid)
+        if raw is None:
+            chain = []
+            c = cid
+            while c is not None and c not in memo:
+                chain.append(c)
+                c = self._chunks[c][4]
+            for c in reversed(chain):
+                base = self._chunks[c][4]
+                memo[c] = _decompress(self._read_blob(c, files), memo[base] if base else None)
+            raw = memo[cid]
+        return raw
+
+    # ---------------- put / restore ----------------
+    def put(self, src_path, label: Optional[str] = None, ts: Optional[str] = None) -> Optional[str]:
+        """Archive `src_path` as a new version; returns its id ("<basename>.<ts>[_label]") or None if missing."""
+        try:
+            with open(src_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        basename = os.path.basename(str(src_path))
+        ts = ts or utc_now().strftime("%Y%m%dT%H%M%SZ")
+        with self._lock:
+            self._load()
+            vid = base_vid = f"{basename}.{ts}" + (f"_{label}" if label else "")
+            n = 1
+            while vid in self._versions:
+                vid, n = f"{base_vid}-{n}", n + 1
+            prev = self.latest(basename)
+            prev_by_anchor = {}
+            if prev:
+                for cid in self._versions[prev]["chunks"]:
+                    prev_by_anchor.setdefault(self._chunks[cid][6], cid)
+            pack = hashlib.sha1(vid.encode("utf-8")).hexdigest()[:16] + ".pack"
+            blobs, offset, new = [], 0, {}
+            memo: Dict[str, bytes] = {}
+            files: Dict[str, object] = {}
+            ids = []
+            try:
+                for raw in split_chunks(data):
+                    cid = hashlib.sha1(raw).hexdigest()
+                    ids.append(cid)
+                    if cid in self._chunks or cid in new:
+                        continue
+                    anchor = _anchor(raw)
+                    base = prev_by_anchor.get(anchor)
+                    depth = 0
+                    if base is not None and self._chunks[base][5] < MAX_DELTA_DEPTH:
+                        depth = self._chunks[base][5] + 1
+                        blob = _compress(raw, self._raw(base, memo, files))
+                    else:
+                        base = None
+                        blob = _compress(raw, None)
+                    new[cid] = [pack, offset, len(blob), len(raw), base, depth, anchor]
+                    blobs.append(blob)
+                    offset += len(blob)
+            finally:
+                for f in files.values():
+                    f.close()
+            if blobs:
+                os.makedirs(self.pack_dir, exist_ok=True)
+                _write_durable(os.path.join(self.pack_dir, pack), b"".join(blobs))
+            self._chunks.update(new)
+            self._versions[vid] = {"basename": basename, "ts": ts, "label": label or "", "size": len(data),
+                                   "sha1": hashlib.sha1(data).hexdigest(), "chunks": ids,
+                                   "created_utc": utc_now().isoformat()}
+            self._history.setdefault(basename, []).append(vid)
+            self._history[basename].sort(key=lambda v: (self._versions[v]["ts"], v))
+            self._save()
+            return vid
+
+    def read(self, vid: str) -> bytes:
+        with self._lock:
+            self._load()
+            v = self._versions.get(vid)
+            if v is None:
+                raise KeyError(vid)
+            memo: Dict[str, bytes] = {}
+            files: Dict[str, object] = {}
+            try:
+                data = b"".join(self._raw(cid, memo, files) for cid in v["chunks"])
+            finally:
+                for f in files.values():
+                    f.close()
+        if hashlib.sha1(data).hexdigest() != v["sha1"]:
+            raise RuntimeError(f"Archive version {vid} failed checksum verification")
+        return data
+
+    def restore(self, vid: str, target_path) -> str:
+        """Write version `vid` to `target_path` atomically (checksum-verified)."""
+        data = self.read(vid)
+        target_path = str(target_path)
+        os.makedirs(os.path.dirname(target_path) or ".", exist_ok=True)
+        _write_durable(target_path, data)
+        return target_path
+
+    # ---------------- pruning ----------------
+    def prune(self, basename: Optional[str] = None, before: Optional[str] = None, after: Optional[str] = None,
+              keep_last: int = 0) -> List[str]:
+        """
+        Remove versions whose ts satisfies after <= ts < before (either bound optional; ts strings compare in
+        time order), optionally only for one basename and never the newest `keep_last` of each basename.
+        Returns removed version ids.
+        """
+        with self._lock:
+            self._load()
+            removed = []
+            for name, hist in self._history.items():
+                if basename and name != basename:
+                    continue
+                candidates = hist[:-keep_last] if keep_last > 0 else hist
+                for vid in candidates:
+                    ts = self._versions[vid]["ts"]
+                    if (before is None or ts < before) and (after is None or ts >= after):
+                        removed.append(vid)
+            for vid in removed:
+                v = self._versions.pop(vid)
+                self._history[v["basename"]].remove(vid)
+            self._history = {k: h for k, h in self._history.items() if h}
+            dead_packs = self._gc()
+            self._save()
+            for p in dead_packs:  # only once the saved index no longer points into them
+                try:
+                    os.unlink(os.path.join(self.pack_dir, p))
+                except OSError:
+                    pass
+            return removed
+
+    def _gc(self) -> List[str]:
+        """
+        Drop chunks no remaining version uses, re-encoding survivors whose delta base is among them as standalone
+        chunks (so pruned history is actually freed), then repack sparse packs. Returns pack files no longer used.
+        """
+        live = {cid for v in self._versions.values() for cid in v["chunks"]}
+        self._rebase([cid for cid in live if self._chunks[cid][4] is not None and self._chunks[cid][4] not in live])
+        self._chunks = {cid: c for cid, c in self._chunks.items() if cid in live}
+        self._renumber_depths()
+        live_bytes: Dict[str, int] = {}
+        for c in self._chunks.values():
+            live_bytes[c[0]] = live_bytes.get(c[0], 0) + c[2]
+        if not os.path.isdir(self.pack_dir):
+            return []
+        sizes = {p: os.path.getsize(os.path.join(self.pack_dir, p)) for p in os.listdir(self.pack_dir)
+                 if p.endswith(".pack")}
+        sparse = [p for p, used in live_bytes.items() if p in sizes and used < sizes[p] * (1 - REPACK_DEAD_RATIO)]
+        if sparse:
+            self._repack(sparse)
+        return [p for p in sizes if p not in live_bytes or p in sparse]
+
+    def _rebase(self, cids: List[str]) -> None:
+        if not cids:
+            return
+        name = hashlib.sha1(("rebase:" + utc_now().isoformat() + ":".join(cids[:4])).encode("utf-8")).hexdigest()[:16] \
+            + ".pack"
+        memo: Dict[str, bytes] = {}
+        files: Dict[str, object] = {}
+        blobs, offset, updates = [], 0, {}
+        try:
+            for cid in cids:
+                blob = _compress(self._raw(cid, memo, files), None)
+                c = self._chunks[cid]
+                updates[cid] = [name, offset, len(blob), c[3], None, 0, c[6]]
+                blobs.append(blob)
+                offset += len(blob)
+        finally:
+            for f in files.values():
+                f.close()
+        os.makedirs(self.pack_dir, exist_ok=True)
+        _write_durable(os.path.join(self.pack_dir, name), b"".join(blobs))
+        self._chunks.update(updates)
+
+    def _renumber_depths(self) -> None:
+        depth: Dict[str, int] = {}
+
+        def walk(cid):
+            chain = []
+            while cid is not None and cid not in depth:
+                chain.append(cid)
+                cid = self._chunks[cid][4]
+            d = depth[cid] if cid is not None else -1
+            for c in reversed(chain):
+                d += 1
+                depth[c] = d
+
+        for cid in self._chunks:
+            walk(cid)
+            self._chunks[cid][5] = depth[cid]
+
+    def _repack(self, packs: List[str]) -> None:
+        """Copy the live blobs of mostly-dead packs verbatim into one new pack."""
+        moving = sorted((cid for cid, c in self._chunks.items() if c[0] in packs),
+                        key=lambda cid: (self._chunks[cid][0], self._chunks[cid][1]))
+        name = hashlib.sha1(("repack:" + utc_now().isoformat() + ":".join(packs)).encode("utf-8")).hexdigest()[:16] \
+            + ".pack"
+        blobs, offset, files = [], 0, {}
+        try:
+            for cid in moving:
+                blob = self._read_blob(cid, files)
+                blobs.append(blob)
+                self._chunks[cid] = [name, offset] + self._chunks[cid][2:]
+                offset += len(blob)
+        finally:
+            for f in files.values():
+                f.close()
+        _write_durable(os.path.join(self.pack_dir, name), b"".join(blobs))
+
+
+_STORES: Dict[str, ArchiveStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_archive_store(root) -> ArchiveStore:
+    root = os.path.abspath(str(root))
+    with _STORES_LOCK:
+        store = _STORES.get(root)
+        if store is None:
+            store = _STORES[root] = ArchiveStore(root)
+        return store
@@ -1,17 +1,35 @@
 # tbot_bot/screeners/blocklist_manager.py
 # Centralized blocklist management for atomic symbol universe builds and daily maintenance.
 # Handles dynamic append of blocklisted symbols (per enrichment/filter step) with reason, timestamp, and provider.
+# The file is an append-only log: additions append "SYMBOL|reason|timestamp|provider", removals append a tombstone
+# ("-SYMBOL|reason|timestamp|"). BlocklistStore keeps the live set in memory per process, reads only the appended
+# tail when the file grows, and rewrites the file atomically (compaction) once dead lines pile up.
+# Appends and rewrites from all processes (web app, orchestrator, enrichment) serialize on an flock over
+# "<blocklist>.lock", so a compaction never drops lines another process appended meanwhile.
 
 from __future__ import annotations
 import os
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from tbot_bot.support.path_resolver import resolve_screener_blocklist_path
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX: in-process locking only
+    fcntl = None
+
 BLOCKLIST_PATH = resolve_screener_blocklist_path()
 BLOCKLIST_LOG_PATH = "tbot_bot/output/screeners/blocklist_ops.log"
 
+TOMBSTONE_PREFIX = "-"
+# Compact once superseded/tombstone lines exceed both the floor and this share of live entries
+COMPACT_MIN_DEAD = int(os.environ.get("TBOT_BLOCKLIST_COMPACT_MIN_DEAD", "256"))
+COMPACT_DEAD_RATIO = float(os.environ.get("TBOT_BLOCKLIST_COMPACT_RATIO", "0.5"))
+
 def utc_now():
     return datetime.utcnow().replace(tzinfo=timezone.utc)
 
@@ -32,66 +50,278 @@ def atomic_append_text(path: str, line: str):
     with open(path, "a", encoding="utf-8") as f:
         f.write(line if line.endswith("\n") else line + "\n")
 
-def load_blocklist(path: str = BLOCKLIST_PATH):
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive cross-process lock on "<path>.lock" (not re-entrant: never nest for the same path)."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "a") as lf:
+        fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+def _format_entry(e: Dict[str, str]) -> str:
+    return f"{e['symbol']}|{e.get('reason', '')}|{e.get('timestamp', '')}|{e.get('provider', '')}"
+
+def _as_symbols(symbols: Union[str, Iterable[str]]) -> List[str]:
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    return [s.strip().upper() for s in symbols if s and s.strip()]
+
+# --------------------------------------------------------------------
+# In-memory store (one per blocklist path per process)
+# --------------------------------------------------------------------
+class BlocklistStore:
+    """
+    Live view of one blocklist file. Membership checks cost one os.stat(): an unchanged file is not read,
+    a grown file (same inode) is read from the last offset only, anything else (compaction by another
+    process, truncation, restore) triggers a full reload.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._lines = 0
+        self._ino = None
+        self._size = -1
+        self._mtime_ns = None
+        self._offset = 0
+        self._tail = b""  # last bytes before _offset: detects a rewrite that reused the inode number
+        # Entry from a trailing line without newline (mid-append or hand-edited): visible until the next refresh,
+        # never merged into _entries, so a half-written "MSF" or "-GO" cannot stick
+        self._provisional: Dict[str, Dict[str, str]] = {}
+
+    @staticmethod
+    def _parse(line: str):
+        """(SYMBOL, entry) for an entry line, (SYMBOL, None) for a tombstone, None for blanks/comments."""
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return None
+        parts = line.split("|")
+        symbol = parts[0].upper()
+        if symbol.startswith(TOMBSTONE_PREFIX):
+            return symbol[len(TOMBSTONE_PREFIX):], None
+        return symbol, {
+            "symbol": parts[0],
+            "reason": parts[1] if len(parts) > 1 else "",
+            "timestamp": parts[2] if len(parts) > 2 else "",
+            "provider": parts[3] if len(parts) > 3 else "",
+        }
+
+    def _apply(self, line: str) -> bool:
+        parsed = self._parse(line)
+        if parsed is None:
+            return False
+        symbol, entry = parsed
+        if entry is None:
+            self._entries.pop(symbol, None)
+        else:
+            self._entries[symbol] = entry
+        return True
+
+    def _live(self) -> Dict[str, Dict[str, str]]:
+        if not self._provisional:
+            return self._entries
+        return {**self._entries, **self._provisional}
+
+    def refresh(self) -> "BlocklistStore":
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                if self._ino is not None or self._entries:
+                    self._reset()
+                return self
+            if st.st_ino == self._ino and st.st_size == self._size and st.st_mtime_ns == self._mtime_ns:
+                return self
+            if st.st_ino != self._ino or st.st_size < self._offset:
+                self._reset()
+            with open(self.path, "rb") as f:
+                f.seek(self._offset - len(self._tail))
+                data = f.read()
+                if not data.startswith(self._tail):
+                    # Replaced by a rewrite that happens to reuse the inode and is at least as long: reload
+                    self._reset()
+                    f.seek(0)
+                    data = f.read()
+                else:
+                    data = data[len(self._tail):]
+            complete = data.rfind(b"\n") + 1
+            for raw in data[:complete].decode("utf-8", errors="replace").splitlines():
+                self._lines += self._apply(raw)
+            # Only newline-terminated lines are applied; the unterminated tail is re-read from _offset next time.
+            # A partial addition is shown provisionally, a partial tombstone is ignored until it is complete.
+            self._provisional = {}
+            if complete < len(data):
+                parsed = self._parse(data[complete:].decode("utf-8", errors="replace"))
+                if parsed is not None and parsed[1] is not None:
+                    self._provisional[parsed[0]] = parsed[1]
+            self._offset += complete
+            if complete:
+                self._tail = (self._tail + data[:complete])[-64:]
+            self._ino, self._size, self._mtime_ns = st.st_ino, st.st_size, st.st_mtime_ns
+            return self
+
+    # ---- reads ----
+    def __contains__(self, symbol: str) -> bool:
+        return (symbol or "").strip().upper() in self.refresh()._live()
+
+    def blocked_many(self, symbols: Iterable[str]) -> Set[str]:
+        live = self.refresh()._live()
+        return {s for s in symbols if s and s.strip().upper() in live}
+
+    def symbols(self) -> Set[str]:
+        return set(self.refresh()._live())
+
+    def entries(self) -> List[Dict[str, str]]:
+        return [dict(e) for e in self.refresh()._live().values()]
+
+    def __len__(self) -> int:
+        return len(self.refresh()._live())
+
+    @property
+    def dead_lines(self) -> int:
+        return self._lines - len(self._entries)
+
+    # ---- writes ----
+    def _append(self, lines: List[str]):
+        if not lines:
+            return
+        with _file_lock(self.path):
+            self._write_lines(lines)
+        self.refresh()
+        self.maybe_compact()
+
+    def _write_lines(self, lines: List[str]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def add(self, symbols: Union[str, Iterable[str]], reason: str = "", provider: str = "") -> List[str]:
+        now = utc_now().isoformat() + "Z"
+        syms = _as_symbols(symbols)
+        with self._lock:
+            self._append([_format_entry({"symbol": s, "reason": reason, "timestamp": now, "provider": provider})
+                          for s in syms])
+        return syms
+
+    def remove(self, symbols: Union[str, Iterable[str]], reason: str = "") -> List[str]:
+        now = utc_now().isoformat() + "Z"
+        with self._lock:
+            with _file_lock(self.path):
+                # Liveness check and tombstone append in one critical section across processes
+                live = self.refresh()._entries
+                syms = [s for s in dict.fromkeys(_as_symbols(symbols)) if s in live]
+                if syms:
+                    self._write_lines([f"{TOMBSTONE_PREFIX}{s}|{reason}|{now}|" for s in syms])
+            if syms:
+                self.refresh()
+                self.maybe_compact()
+        return syms
+
+    def maybe_compact(self) -> bool:
+        with self._lock:
+            dead = self.dead_lines
+            if dead >= COMPACT_MIN_DEAD and dead > COMPACT_DEAD_RATIO * len(self._entries):
+                self.compact()
+                return True
+        return False
+
+    def compact(self):
+        """Rewrite the file with live entries only (temp file + fsync + os.replace)."""
+        with self._lock, _file_lock(self.path):
+            # Under the file lock no other process can append between this refresh and the replace; an
+            # unterminated last line is then a hand edit, kept (terminated) rather than dropped
+            self.refresh()
+            self._write_atomic([_format_entry(e) for e in self._live().values()])
+
+    def clear(self):
+        with self._lock, _file_lock(self.path):
+            self._write_atomic([])
+
+    def _write_atomic(self, lines: List[str]):
+        # Caller holds _file_lock; the temp name is still unique so a stray writer cannot clobber it
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                if lines:
+                    f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._reset()
+        self.refresh()
+
+_STORES: Dict[str, BlocklistStore] = {}
+_STORES_LOCK = threading.Lock()
+
+def get_blocklist_store(path: Optional[str] = None) -> BlocklistStore:
+    path = os.path.abspath(path or BLOCKLIST_PATH)
+    store = _STORES.get(path)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(path, BlocklistStore(path))
+    return store
+
+# --------------------------------------------------------------------
+# Module API
+# --------------------------------------------------------------------
+def load_blocklist(path: Optional[str] = None):
     """
     Returns blocklist as set of symbols.
-    Each line: symbol|reason|timestamp|provider (pipe-delimited).
+    Each line: symbol|reason|timestamp|provider (pipe-delimited); tombstoned symbols are excluded.
     """
-    blockset = set()
-    if not os.path.isfile(path):
-        return blockset
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("|", 1)
-            if parts:
-                blockset.add(parts[0].upper())
-    return blockset
-
-def get_blocklist_entries(path: str = BLOCKLIST_PATH):
+    return get_blocklist_store(path).symbols()
+
+def get_blocklist_entries(path: Optional[str] = None):
     """
-    Returns list of blocklist dicts: [{"symbol": ..., "reason": ..., "timestamp": ..., "provider": ...}]
+    Returns list of live blocklist dicts: [{"symbol": ..., "reason": ..., "timestamp": ..., "provider": ...}]
+    (latest entry per symbol, in first-added order).
     """
-    entries = []
-    if not os.path.isfile(path):
-        return entries
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("|")
-            # symbol|reason|timestamp|provider (at least symbol and reason present)
-            symbol = parts[0] if len(parts) > 0 else ""
-            reason = parts[1] if len(parts) > 1 else ""
-            timestamp = parts[2] if len(parts) > 2 else ""
-            provider = parts[3] if len(parts) > 3 else ""
-            entries.append({"symbol": symbol, "reason": reason, "timestamp": timestamp, "provider": provider})
-    return entries
-
-def add_to_blocklist(symbol: str, reason: str = "", provider: str = ""):
-    now = utc_now().isoformat() + "Z"
-    entry = f"{symbol.upper()}|{reason}|{now}|{provider}"
-    atomic_append_text(BLOCKLIST_PATH, entry)
-    log_blocklist_event("Added to blocklist", {"symbol": symbol.upper(), "reason": reason, "timestamp": now, "provider": provider})
-
-def remove_from_blocklist(symbol: str):
-    symbol = symbol.upper()
-    entries = get_blocklist_entries()
-    updated = [e for e in entries if e["symbol"].upper() != symbol]
-    with open(BLOCKLIST_PATH, "w", encoding="utf-8") as f:
-        for e in updated:
-            f.write(f"{e['symbol']}|{e['reason']}|{e['timestamp']}|{e.get('provider','')}\n")
-    log_blocklist_event("Removed from blocklist", {"symbol": symbol})
+    return get_blocklist_store(path).entries()
+
+def get_blocklist_lines(path: Optional[str] = None) -> List[str]:
+    """Live entries as pipe-delimited lines (for display/export)."""
+    return [_format_entry(e) for e in get_blocklist_entries(path)]
+
+def add_to_blocklist(symbol: Union[str, Iterable[str]], reason: str = "", provider: str = ""):
+    syms = get_blocklist_store().add(symbol, reason=reason, provider=provider)
+    if syms:
+        log_blocklist_event("Added to blocklist", {"symbols": syms, "reason": reason, "provider": provider})
+
+def remove_from_blocklist(symbol: Union[str, Iterable[str]], reason: str = ""):
+    syms = get_blocklist_store().remove(symbol, reason=reason)
+    log_blocklist_event("Removed from blocklist", {"symbols": syms or _as_symbols(symbol), "reason": reason})
 
 def is_blocked(symbol: str) -> bool:
-    return symbol.upper() in load_blocklist()
+    return symbol in get_blocklist_store()
+
+def is_blocked_many(symbols: Iterable[str]) -> Set[str]:
+    """Subset of symbols (as given) that are blocklisted; one freshness check for the whole batch."""
+    return get_blocklist_store().blocked_many(symbols)
 
 def get_blocklist_count() -> int:
-    return len(load_blocklist())
+    return len(get_blocklist_store())
+
+def compact_blocklist():
+    get_blocklist_store().compact()
+    log_blocklist_event("Blocklist compacted")
 
 def clear_blocklist():
-    open(BLOCKLIST_PATH, "w", encoding="utf-8").close()
+    get_blocklist_store().clear()
     log_blocklist_event("Blocklist cleared")
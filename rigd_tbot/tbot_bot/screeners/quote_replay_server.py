@@ -0,0 +1,202 @@
+# tbot_bot/screeners/quote_replay_server.py
+# Local WebSocket server that replays recorded ticks using the Finnhub trade-stream protocol.
+# Offline testing/benchmarking of quote_stream.QuoteStream without touching a live provider.
+
+"""
+Recorded ticks are NDJSON, one trade per line: {"s": "AAPL", "p": 187.12, "t": 1700000000000, "v": 100}
+(sorted by "t", milliseconds). Each connected client gets its own replay filtered to the symbols it
+subscribed to; consecutive ticks are grouped into one {"type":"trade","data":[...]} message per
+timestamp (or up to batch_size ticks when replaying with speed <= 0, i.e. as fast as possible).
+
+Usage:
+  python -m tbot_bot.screeners.quote_replay_server --ticks ticks.ndjson --port 8765 --speed 1.0
+  TBOT_QUOTE_STREAM_URL=ws://127.0.0.1:8765 python -m tbot_bot.runtime.main
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def load_ticks(path: str) -> List[dict]:
+    ticks = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                t = json.loads(line)
+            except Exception:
+                continue
+            if "s" in t and "p" in t:
+                ticks.append(t)
+    ticks.sort(key=lambda r: r.get("t", 0))
+    return ticks
+
+
+def write_ticks(path: str, ticks: Iterable[dict]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for t in ticks:
+            f.write(json.dumps(t, separators=(",", ":")) + "\n")
+
+
+def generate_synthetic_ticks(symbols: List[str], n_ticks: int, start_ms: int = 1_700_000_000_000,
+                             step_ms: int = 1, seed: int = 1) -> Iterator[dict]:
+    """Random-walk prints round-robin over symbols (for tests and benchmarks)."""
+    rng = random.Random(seed)
+    prices: Dict[str, float] = {s: rng.uniform(10, 200) for s in symbols}
+    for i in range(n_ticks):
+        sym = symbols[i % len(symbols)]
+        prices[sym] = round(prices[sym] * (1.0 + rng.gauss(0, 0.0005)), 4)
+        yield {"s": sym, "p": prices[sym], "t": start_ms + i * step_ms, "v": rng.randint(1, 500)}
+
+
+class ReplayServer:
+    """
+    Threaded wrapper around a websockets server. start() returns once the socket is bound;
+    `port=0` picks a free port (see .port after start()).
+    """
+
+    def __init__(self, ticks: List[dict], host: str = "127.0.0.1", port: int = 0,
+                 speed: float = 1.0, batch_size: int = 500, loop_forever: bool = False,
+                 subscribe_settle_s: float = 0.1):
+        self.ticks = ticks
+        self.host = host
+        self.port = port
+        self.speed = float(speed)
+        self.batch_size = max(1, int(batch_size))
+        self.loop_forever = bool(loop_forever)
+        self.subscribe_settle_s = float(subscribe_settle_s)
+        self.sent_ticks = 0
+        self.clients = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def _handler(self, ws, path=None):
+        self.clients += 1
+        subs = set()
+        sub_event = asyncio.Event()
+
+        async def reader():
+            async for raw in ws:
+                try:
+                    msg = json.loads(raw)
+                except Exception:
+                    continue
+                sym = str(msg.get("symbol", "")).upper()
+                if msg.get("type") == "subscribe" and sym:
+                    subs.add(sym)
+                    sub_event.set()
+                elif msg.get("type") == "unsubscribe":
+                    subs.discard(sym)
+
+        read_task = asyncio.ensure_future(reader())
+        try:
+            await sub_event.wait()
+            # Clients send one subscribe per symbol; let the burst land before replaying
+            await asyncio.sleep(self.subscribe_settle_s)
+            while True:
+                await self._replay_once(ws, subs)
+                if not self.loop_forever:
+                    break
+            # Like a live feed, keep the connection open (idle) until the client leaves
+            await read_task
+        except Exception:
+            pass
+        finally:
+            read_task.cancel()
+
+    async def _replay_once(self, ws, subs) -> None:
+        batch: List[dict] = []
+        prev_t = None
+        for tick in self.ticks:
+            if tick["s"] not in subs:
+                continue
+            t = tick.get("t", 0)
+            flush = len(batch) >= self.batch_size if self.speed <= 0 else (prev_t is not None and t != prev_t)
+            if flush and batch:
+                await self._send_batch(ws, batch)
+                batch = []
+                if self.speed > 0 and prev_t is not None:
+                    await asyncio.sleep(max(0.0, (t - prev_t) / 1000.0 / self.speed))
+            batch.append(tick)
+            prev_t = t
+        if batch:
+            await self._send_batch(ws, batch)
+
+    async def _send_batch(self, ws, batch: List[dict]) -> None:
+        await ws.send(json.dumps({"type": "trade", "data": batch}, separators=(",", ":")))
+        self.sent_ticks += len(batch)
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._run, name="quote_replay_server", daemon=True)
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def _run(self) -> None:
+        import websockets
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        async def _serve():
+            self._server = await websockets.serve(self._handler, self.host, self.port, max_size=None)
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._ready.set()
+
+        self._loop.run_until_complete(_serve())
+        self._loop.run_forever()
+
+    def stop(self) -> None:
+        if not self._loop:
+            return
+
+        async def _close():
+            self._server.close()
+            await self._server.wait_closed()
+
+        fut = asyncio.run_coroutine_threadsafe(_close(), self._loop)
+        try:
+            fut.result(timeout=5)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay recorded ticks over a local WebSocket (Finnhub protocol).")
+    ap.add_argument("--ticks", required=True, help="NDJSON file of {s,p,t,v} trades")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--speed", type=float, default=1.0, help="1.0 = real time; <=0 = as fast as possible")
+    ap.add_argument("--loop", action="store_true", help="restart the recording when it ends")
+    args = ap.parse_args()
+
+    srv = ReplayServer(load_ticks(args.ticks), host=args.host, port=args.port,
+                       speed=args.speed, loop_forever=args.loop).start()
+    print(f"[quote_replay_server] serving {len(srv.ticks)} ticks on {srv.url}", flush=True)
+    try:
+        srv._thread.join()
+    except KeyboardInterrupt:
+        srv.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# tbot_bot/screeners/quote_stream.py
+# Streaming quote ingestion: WebSocket subscription set + in-memory last-quote table.
+# Serves get_realtime_price() from memory when a fresh streamed quote exists; REST remains the fallback.
+
+"""
+Protocol
+--------
+Finnhub trade stream (also spoken by quote_replay_server.py):
+  client -> {"type": "subscribe", "symbol": "AAPL"} / {"type": "unsubscribe", "symbol": "AAPL"}
+  server -> {"type": "trade", "data": [{"s": "AAPL", "p": 187.1, "t": 1700000000000, "v": 100}, ...]}
+  server -> {"type": "ping"}
+
+Activation
+----------
+The stream is opt-in per process:
+  - TBOT_QUOTE_STREAM_URL=ws://127.0.0.1:8765   explicit endpoint (e.g. the local replay server)
+  - TBOT_QUOTE_STREAM=1                         Finnhub endpoint built from Screener Credentials
+get_quote_stream(autostart=True) starts it on first use; otherwise callers keep the REST path.
+
+Staleness
+---------
+Every update gets a process-wide sequence number. Lookups take max_age_s and return None for
+quotes older than that, so callers fall back to REST instead of trading on a frozen price.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+DEFAULT_MAX_AGE_S = 5.0
+FINNHUB_WS_URL = "wss://ws.finnhub.io"
+
+
+@dataclass
+class Quote:
+    symbol: str
+    price: float
+    seq: int
+    received_at: float        # time.monotonic() at ingest
+    provider_ts: Optional[int] = None  # provider timestamp (ms since epoch) if sent
+    volume: Optional[float] = None
+
+
+class QuoteTable:
+    """
+    Thread-safe last-quote table keyed by upper-case symbol.
+    Reads are plain dict lookups; writers take a lock only to bump the sequence counter.
+    """
+
+    def __init__(self):
+        self._quotes: Dict[str, Quote] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.updates = 0
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def update(self, symbol: str, price: float, provider_ts: Optional[int] = None,
+               volume: Optional[float] = None, received_at: Optional[float] = None) -> int:
+        sym = str(symbol).upper()
+        now = received_at if received_at is not None else time.monotonic()
+        with self._lock:
+            prev = self._quotes.get(sym)
+            # Drop out-of-order prints (provider timestamps going backwards)
+            if prev is not None and provider_ts is not None and prev.provider_ts is not None \
+                    and provider_ts < prev.provider_ts:
+                return prev.seq
+            self._seq += 1
+            self.updates += 1
+            self._quotes[sym] = Quote(sym, float(price), self._seq, now, provider_ts, volume)
+            return self._seq
+
+    def update_many(self, rows: Iterable[dict]) -> int:
+        """Apply a provider 'data' array ({"s","p","t","v"}). Returns the number applied."""
+        now = time.monotonic()
+        n = 0
+        with self._lock:
+            quotes = self._quotes
+            for r in rows:
+                try:
+                    sym = str(r["s"]).upper()
+                    px = float(r["p"])
+                except Exception:
+                    continue
+                ts = r.get("t")
+                prev = quotes.get(sym)
+                if prev is not None and ts is not None and prev.provider_ts is not None and ts < prev.provider_ts:
+                    continue
+                self._seq += 1
+                quotes[sym] = Quote(sym, px, self._seq, now, ts, r.get("v"))
+                n += 1
+            self.updates += n
+        return n
+
+    def get(self, symbol: str, max_age_s: Optional[float] = DEFAULT_MAX_AGE_S) -> Optional[Quote]:
+        q = self._quotes.get(str(symbol).upper())
+        if q is None:
+            return None
+        if max_age_s is not None and (time.monotonic() - q.received_at) > max_age_s:
+            return None
+        return q
+
+    def get_price(self, symbol: str, max_age_s: Optional[float] = DEFAULT_MAX_AGE_S) -> Optional[float]:
+        q = self.get(symbol, max_age_s)
+        return q.price if q is not None else None
+
+    def age(self, symbol: str) -> Optional[float]:
+        q = self._quotes.get(str(symbol).upper())
+        return (time.monotonic() - q.received_at) if q is not None else None
+
+    def stale_symbols(self, symbols: Iterable[str], max_age_s: float = DEFAULT_MAX_AGE_S) -> List[str]:
+        return [s for s in symbols if self.get(s, max_age_s) is None]
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+
+class QuoteStream:
+    """
+    Maintains one WebSocket connection, the subscription set and a QuoteTable.
+    Reconnects with exponential backoff and resubscribes the full set after every connect.
+    """
+
+    def __init__(self, url: str, table: Optional[QuoteTable] = None,
+                 recv_timeout_s: float = 1.0, idle_reconnect_s: float = 30.0,
+                 backoff_initial_s: float = 0.5, backoff_max_s: float = 30.0):
+        self.url = url
+        self.table = table or QuoteTable()
+        self.recv_timeout_s = float(recv_timeout_s)
+        self.idle_reconnect_s = float(idle_reconnect_s)
+        self.backoff_initial_s = float(backoff_initial_s)
+        self.backoff_max_s = float(backoff_max_s)
+
+        self._subs: FrozenSet[str] = frozenset()  # replaced, never mutated: _run iterates a stable snapshot
+        self._subs_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._ws = None
+        self._stop = threading.Event()
+        self._connected = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.connects = 0
+        self.messages = 0
+        self.last_error: Optional[str] = None
+
+    # --- subscription set ---------------------------------------------
+    @property
+    def subscriptions(self) -> Set[str]:
+        return set(self._subs)
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        with self._subs_lock:
+            new = {str(s).upper() for s in symbols if s} - self._subs
+            if not new:
+                return
+            self._subs = self._subs | new
+        for sym in sorted(new):
+            self._send({"type": "subscribe", "symbol": sym})
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        with self._subs_lock:
+            gone = {str(s).upper() for s in symbols if s} & self._subs
+            self._subs = self._subs - gone
+        for sym in sorted(gone):
+            self._send({"type": "unsubscribe", "symbol": sym})
+
+    def _send(self, msg: dict) -> bool:
+        ws = self._ws
+        if ws is None:
+            return False  # resubscribed on next connect
+        try:
+            with self._send_lock:
+                ws.send(json.dumps(msg))
+            return True
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+
+    # --- lifecycle ----------------------------------------------------
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: float = 5.0) -> bool:
+        return self._connected.wait(timeout)
+
+    def start(self) -> "QuoteStream":
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quote_stream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def reconnect(self) -> None:
+        """Drop the current connection; the worker reconnects and resubscribes."""
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        import websocket  # websocket-client
+
+        backoff = self.backoff_initial_s
+        while not self._stop.is_set():
+            ws = None
+            try:
+                ws = websocket.create_connection(self.url, timeout=10)
+                ws.settimeout(self.recv_timeout_s)
+                self._ws = ws
+                self.connects += 1
+                subs = self._subs
+                for sym in sorted(subs):
+                    with self._send_lock:
+                        ws.send(json.dumps({"type": "subscribe", "symbol": sym}))
+                self._connected.set()
+                _log(f"connected to {self._redacted_url()} ({len(subs)} subscriptions)")
+                backoff = self.backoff_initial_s
+                last_msg = time.monotonic()
+                while not self._stop.is_set():
+                    try:
+                        raw = ws.recv()
+                    except websocket.WebSocketTimeoutException:
+                        if time.monotonic() - last_msg > self.idle_reconnect_s:
+                            raise ConnectionError(f"no messages for {self.idle_reconnect_s:.0f}s")
+                        continue
+                    if not raw:
+                        raise ConnectionError("connection closed by server")
+                    last_msg = time.monotonic()
+                    self._handle(raw)
+            except Exception as e:
+                if not self._stop.is_set():
+                    self.last_error = str(e)
+                    _log(f"stream error: {e}; reconnecting in {backoff:.1f}s", level="warning")
+            finally:
+                self._connected.clear()
+                self._ws = None
+                if ws is not None:
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+            if self._stop.wait(backoff):
+                break
+            backoff = min(backoff * 2.0, self.backoff_max_s)
+
+    def _handle(self, raw) -> None:
+        self.messages += 1
+        try:
+            msg = json.loads(raw)
+        except Exception:
+            return
+        if msg.get("type") == "trade":
+            self.table.update_many(msg.get("data") or ())
+
+    def _redacted_url(self) -> str:
+        return self.url.split("?", 1)[0]
+
+
+# ----------------------------------------------------------------------
+# Process-wide stream (opt-in)
+# ----------------------------------------------------------------------
+_STREAM: Optional[QuoteStream] = None
+_STREAM_LOCK = threading.Lock()
+_AUTOSTART_CHECKED = False
+
+
+def _resolve_stream_url() -> Optional[str]:
+    url = os.environ.get("TBOT_QUOTE_STREAM_URL", "").strip()
+    if url:
+        return url
+    if os.environ.get("TBOT_QUOTE_STREAM", "0") != "1":
+        return None
+    from tbot_bot.screeners.screener_utils import get_universe_screener_secrets
+    cfg = get_universe_screener_secrets()
+    if (cfg.get("SCREENER_NAME") or "").upper() != "FINNHUB" or not cfg.get("SCREENER_API_KEY"):
+        return None
+    return f"{FINNHUB_WS_URL}?token={cfg['SCREENER_API_KEY']}"
+
+
+def start_quote_stream(url: str, symbols: Iterable[str] = ()) -> QuoteStream:
+    """Start (or replace) the process-wide stream."""
+    global _STREAM
+    with _STREAM_LOCK:
+        if _STREAM is not None:
+            _STREAM.stop()
+        _STREAM = QuoteStream(url)
+        _STREAM.subscribe(symbols)
+        return _STREAM.start()
+
+
+def stop_quote_stream() -> None:
+    global _STREAM
+    with _STREAM_LOCK:
+        if _STREAM is not None:
+            _STREAM.stop()
+            _STREAM = None
+
+
+def get_quote_stream(autostart: bool = False) -> Optional[QuoteStream]:
+    """
+    Return the running stream. With autostart=True, the env-configured stream is started
+    on first call (checked once per process).
+    """
+    global _AUTOSTART_CHECKED
+    if _STREAM is not None or not autostart or _AUTOSTART_CHECKED:
+        return _STREAM
+    with _STREAM_LOCK:
+        if _AUTOSTART_CHECKED:
+            return _STREAM
+        _AUTOSTART_CHECKED = True
+        try:
+            url = _resolve_stream_url()
+        except Exception as e:
+            _log(f"stream autostart skipped: {e}", level="warning")
+            url = None
+    if url:
+        start_quote_stream(url)
+    return _STREAM
+
+
+def get_streamed_price(symbol: str, max_age_s: float = DEFAULT_MAX_AGE_S) -> Optional[float]:
+    """
+    Fresh streamed price or None. Unknown symbols are added to the subscription set so the
+    next lookup can be served from memory.
+    """
+    stream = get_quote_stream(autostart=True)
+    if stream is None:
+        return None
+    px = stream.table.get_price(symbol, max_age_s)
+    if px is None and str(symbol).upper() not in stream.subscriptions:
+        stream.subscribe([symbol])
+    return px
+
+
+def _log(msg: str, level: str = "info") -> None:
+    try:
+        from tbot_bot.support.utils_log import log_event
+        log_event("quote_stream", msg, level=level)
+    except Exception:
+        print(f"[quote_stream] {msg}", flush=True)
@@ -2,7 +2,8 @@
 # Core screener interface: symbol selection, enhancement/risk enforcement
 
 from tbot_bot.screeners.symbol_universe_refresh import load_symbol_universe
-from tbot_bot.enhancements.ticker_blocklist import is_ticker_blocked
+from tbot_bot.enhancements.ticker_blocklist import blocked_tickers
+from tbot_bot.screeners.blocklist_manager import is_blocked_many
 from tbot_bot.trading.risk_module import validate_trade
 
 def get_eligible_symbols(
@@ -23,9 +24,11 @@ def get_eligible_symbols(
         List[str]: List of eligible symbols
     """
     universe = load_symbol_universe()
+    # Traded-today and screener blocklists checked for the whole universe at once
+    blocked = blocked_tickers(universe) | is_blocked_many(universe)
     eligible = []
     for idx, symbol in enumerate(universe):
-        if is_ticker_blocked(symbol):
+        if symbol in blocked:
             continue
         valid, _ = validate_trade(
             symbol=symbol,
@@ -34,6 +34,9 @@ BLOCKLIST_PATH = resolve_screener_blocklist_path()
 class UniverseCacheError(Exception):
     pass
 
+# Parsed universe cache keyed by (path, mtime_ns, size); lets a warm phase worker preload it.
+_UNIVERSE_MEMO: Dict[str, Any] = {}
+
 # --------------------------------------------------------------------
 # Centralized atomic fsync/replace & JSON helpers (single source of truth)
 # --------------------------------------------------------------------
@@ -249,8 +252,16 @@ def get_universe_screener_secrets() -> dict:
 def get_realtime_price(symbol: str, timeout: int = 4) -> float:
     """
     Single source of truth for market prices.
-    Uses the currently enabled Screener Credentials (prefers FINNHUB).
+    Served from the in-memory quote table when a streamed quote is fresh (see quote_stream.py);
+    otherwise uses the currently enabled Screener Credentials (prefers FINNHUB) over REST.
     """
+    from tbot_bot.runtime.phase_latency import mark_first_quote
+    mark_first_quote()
+    from tbot_bot.screeners.quote_stream import get_streamed_price
+    px = get_streamed_price(symbol)
+    if px is not None:
+        return px
+
     cfg = get_universe_screener_secrets()
     provider = (cfg.get("SCREENER_NAME") or "").upper()
 
@@ -307,6 +318,13 @@ def load_universe_cache(bot_identity: Optional[str] = None) -> List[Dict]:
     if not os.path.exists(path):
         LOG.error(f"[screener_utils] Universe cache missing at path: {path}")
         raise UniverseCacheError(f"Universe cache file not found: {path}")
+    try:
+        st = os.stat(path)
+        memo_key = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        memo_key = None
+    if memo_key is not None and _UNIVERSE_MEMO.get("key") == memo_key:
+        return [dict(r) for r in _UNIVERSE_MEMO["records"]]
 
     # --- NEW: accept either NDJSON or JSON array ---
     with open(path, "r", encoding="utf-8") as f:
@@ -347,6 +365,8 @@ def load_universe_cache(bot_identity: Optional[str] = None) -> List[Dict]:
         raise UniverseCacheError("Universe cache is a placeholder/too small; trigger rebuild.")
 
     LOG.info(f"[screener_utils] Loaded universe cache with {len(cleaned)} symbols from {path}")
+    if memo_key is not None:
+        _UNIVERSE_MEMO["key"], _UNIVERSE_MEMO["records"] = memo_key, [dict(r) for r in cleaned]
     return cleaned
 
 def load_partial_cache() -> List[Dict]:
@@ -429,15 +449,9 @@ def load_blocklist(path: Optional[str] = None) -> List[str]:
     if not os.path.isfile(path):
         LOG.warning(f"[screener_utils] Blocklist file not found or not provided: {path}")
         return []
-    blocklist = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                sym = line.split("|", 1)[0].upper()
-                blocklist.append(sym)
+        # Shared per-process store: honours tombstones, re-reads only when the file changes
+        blocklist = list(load_blocklist_full(path))
     except Exception as e:
         LOG.error(f"[screener_utils] Failed to load blocklist file '{path}': {e}")
         return []
@@ -0,0 +1,103 @@
+# tbot_bot/screeners/stage_cache.py
+# Content-hash manifest for the universe build stages: a stage is skipped when its input key (hash of upstream
+# output hashes + settings) matches the last successful run and its outputs are still on disk unchanged.
+
+"""
+Manifest (one JSON file, written temp + fsync + os.replace):
+
+    {"raw":     {"key": "<sha1>", "outputs": {"<path>": "<sha1 of file>"}, "finished_utc": "...", "seconds": 1.2},
+     "enrich":  {...},
+     "publish": {...}}
+
+A stage's key is fingerprint(...) over everything it reads: upstream output hashes (output_hash()), settings,
+provider names and credential fingerprints, the UTC build date. Outputs are re-hashed before a skip, so a
+deleted, truncated or hand-edited checkpoint file makes the stage run again. Stages are recorded only after their
+outputs are published, so a crash mid-stage leaves the previous entry (and its still-valid outputs) in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+_HASH_MEMO: Dict[str, tuple] = {}
+_HASH_LOCK = threading.Lock()
+
+
+def file_sha1(path) -> Optional[str]:
+    """sha1 of a file's bytes (memoised per (mtime_ns, size, inode)); None if missing."""
+    path = str(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    memo = _HASH_MEMO.get(path)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    with _HASH_LOCK:
+        _HASH_MEMO[path] = (key, digest)
+    return digest
+
+
+def fingerprint(*parts: Any) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class StageManifest:
+    def __init__(self, path):
+        self.path = str(path)
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._stages = {k: v for k, v in data.items() if isinstance(v, dict)}
+        except (OSError, ValueError):
+            pass
+
+    def is_fresh(self, stage: str, key: str) -> bool:
+        """True when `stage` last succeeded with this key and every recorded output is unchanged on disk."""
+        entry = self._stages.get(stage)
+        if not entry or entry.get("key") != key or not entry.get("outputs"):
+            return False
+        return all(file_sha1(p) == digest for p, digest in entry["outputs"].items())
+
+    def output_hash(self, stage: str, path) -> Optional[str]:
+        """Recorded hash of one of a stage's outputs, falling back to hashing the file."""
+        entry = self._stages.get(stage) or {}
+        return (entry.get("outputs") or {}).get(str(path)) or file_sha1(path)
+
+    def record(self, stage: str, key: str, outputs: Iterable, started: Optional[float] = None) -> None:
+        entry = {
+            "key": key,
+            "outputs": {str(p): file_sha1(p) for p in outputs},
+            "finished_utc": datetime.now(timezone.utc).isoformat(),
+        }
+        if started is not None:
+            entry["seconds"] = round(time.monotonic() - started, 3)
+        self._stages[stage] = entry
+        self._save()
+
+    def invalidate(self, stage: str) -> None:
+        if self._stages.pop(stage, None) is not None:
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._stages, f, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
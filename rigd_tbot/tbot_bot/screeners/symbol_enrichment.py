@@ -116,46 +116,67 @@ def _is_fatal_provider_error(err: Exception) -> bool:
     )
     return any(m in msg for m in fatal_markers)
 
-def main():
+class EnrichmentAbort(Exception):
+    """Enrichment stopped early; `code` is the exit code the stage reports (2 = not configured, 1 = failed)."""
+
+    def __init__(self, code: int, message: str = ""):
+        super().__init__(message or f"enrichment aborted ({code})")
+        self.code = code
+
+def prepare_enrichment():
+    """
+    Resolve the enrichment provider: returns (env, screener_secrets, provider name).
+    Raises EnrichmentAbort(2) when no usable API provider is enabled for enrichment.
+    """
     env = load_env_bot_config()
     try:
         screener_secrets = get_enrichment_provider_creds()
     except Exception as e:
         log_progress("No valid enrichment provider enabled. Aborting enrichment.", {"error": str(e)})
-        sys.exit(2)
+        raise EnrichmentAbort(2, str(e))
     name = (screener_secrets.get("SCREENER_NAME") or "").strip().upper()
     if name.endswith("_TXT"):
         log_progress("TXT provider selected as enrichment provider, aborting enrichment.", {"provider": name})
-        sys.exit(2)
-    ProviderClass = get_provider_class(name)
-    if ProviderClass is None:
+        raise EnrichmentAbort(2, f"TXT provider {name}")
+    if get_provider_class(name) is None:
         log_progress("Provider class not found for enrichment.", {"provider": name})
-        sys.exit(2)
+        raise EnrichmentAbort(2, f"no provider class for {name}")
+    return env, screener_secrets, name
+
+def filter_params(env) -> dict:
+    """Universe filter settings from env (also part of the stage cache key)."""
+    # Parse and normalize allowed exchanges from env (optional; MIC/alias-aware)
+    exchanges_env = (env.get("SCREENER_UNIVERSE_EXCHANGES", "") or "").strip()
+    allowed_exchanges_raw = [e.strip() for e in exchanges_env.split(",") if e.strip()]
+    return {
+        "min_price": float(env.get("SCREENER_UNIVERSE_MIN_PRICE", 1)),
+        "max_price": float(env.get("SCREENER_UNIVERSE_MAX_PRICE", 10000)),
+        "min_cap": float(env.get("SCREENER_UNIVERSE_MIN_MARKET_CAP", 300_000_000)),
+        "max_cap": float(env.get("SCREENER_UNIVERSE_MAX_MARKET_CAP", 10_000_000_000)),
+        "max_size": int(env.get("SCREENER_UNIVERSE_MAX_SIZE", 2000)),
+        "allowed_exchanges": normalize_exchange_list(allowed_exchanges_raw) if allowed_exchanges_raw else None,
+    }
+
+def enrich_symbols(raw_symbols, env, screener_secrets, name):
+    """
+    Enrich raw symbol records with quotes and apply the universe filters.
+    Returns (unfiltered_records, partial_records, stats); raises EnrichmentAbort(1) on fatal provider errors.
+    """
     merged_config = env.copy()
     merged_config.update(screener_secrets)
 
     # Provider may raise on bad/missing credentials — allow to bubble up and abort
-    provider = ProviderClass(merged_config)
+    provider = get_provider_class(name)(merged_config)
 
-    try:
-        raw_symbols = load_raw_symbols()
-    except Exception as e:
-        log_progress("Failed to load raw symbols.", {"error": str(e)})
-        sys.exit(2)
     if not raw_symbols:
         log_progress("No raw symbols found.")
-        sys.exit(1)
+        raise EnrichmentAbort(1, "no raw symbols")
 
-    min_price = float(env.get("SCREENER_UNIVERSE_MIN_PRICE", 1))
-    max_price = float(env.get("SCREENER_UNIVERSE_MAX_PRICE", 10000))
-    min_cap = float(env.get("SCREENER_UNIVERSE_MIN_MARKET_CAP", 300_000_000))
-    max_cap = float(env.get("SCREENER_UNIVERSE_MAX_MARKET_CAP", 10_000_000_000))
-    max_size = int(env.get("SCREENER_UNIVERSE_MAX_SIZE", 2000))
-
-    # Parse and normalize allowed exchanges from env (optional; MIC/alias-aware)
-    exchanges_env = (env.get("SCREENER_UNIVERSE_EXCHANGES", "") or "").strip()
-    allowed_exchanges_raw = [e.strip() for e in exchanges_env.split(",") if e.strip()]
-    allowed_exchanges = normalize_exchange_list(allowed_exchanges_raw) if allowed_exchanges_raw else None
+    params = filter_params(env)
+    min_price, max_price = params["min_price"], params["max_price"]
+    min_cap, max_cap = params["min_cap"], params["max_cap"]
+    max_size = params["max_size"]
+    allowed_exchanges = params["allowed_exchanges"]
 
     blocklist = set(load_blocklist(BLOCKLIST_PATH))
     all_symbols = normalize_symbols(raw_symbols)  # includes exchange normalization
@@ -197,7 +218,7 @@ def main():
         except Exception as e:
             if _is_fatal_provider_error(e):
                 log_progress("Provider error during enrichment — aborting", {"provider": name, "error": str(e)})
-                sys.exit(1)
+                raise EnrichmentAbort(1, str(e))
             # Non-fatal data miss: log and continue
             missed_api_count += 1
             log_progress("Non-fatal provider data miss", {"symbol": sym, "provider": name, "error": str(e)})
@@ -262,13 +283,7 @@ def main():
     )
     enriched_count = len(partial_records)
 
-    # Write a SINGLE JSON array per file (compatible with orchestrator reader)
-    _atomic_write_json(UNFILTERED_PATH, unfiltered_records)
-    _atomic_write_json(PARTIAL_PATH, partial_records)
-
-    # Do not touch/copy partial to final here: that must be orchestrated externally.
-
-    log_progress("Enrichment complete", {
+    stats = {
         "enriched_count": enriched_count,
         "blocklisted": blocklisted_count,
         "missed_api": missed_api_count,
@@ -277,9 +292,29 @@ def main():
         "pre_skipped_suffix": preskipped_suffix,
         "unfiltered_count": len(unfiltered_records),
         "partial_count": len(partial_records),
-        "partial_path": PARTIAL_PATH,
-        "unfiltered_path": UNFILTERED_PATH
-    })
+    }
+    return unfiltered_records, partial_records, stats
+
+def write_enrichment_outputs(unfiltered_records, partial_records):
+    # Write a SINGLE JSON array per file (compatible with orchestrator reader)
+    _atomic_write_json(UNFILTERED_PATH, unfiltered_records)
+    _atomic_write_json(PARTIAL_PATH, partial_records)
+    # Do not touch/copy partial to final here: that must be orchestrated externally.
+
+def main():
+    try:
+        env, screener_secrets, name = prepare_enrichment()
+        try:
+            raw_symbols = load_raw_symbols()
+        except Exception as e:
+            log_progress("Failed to load raw symbols.", {"error": str(e)})
+            raise EnrichmentAbort(2, str(e))
+        unfiltered_records, partial_records, stats = enrich_symbols(raw_symbols, env, screener_secrets, name)
+    except EnrichmentAbort as e:
+        sys.exit(e.code)
+
+    write_enrichment_outputs(unfiltered_records, partial_records)
+    log_progress("Enrichment complete", dict(stats, partial_path=PARTIAL_PATH, unfiltered_path=UNFILTERED_PATH))
 
 if __name__ == "__main__":
     try:
@@ -1,12 +1,16 @@
 # tbot_bot/screeners/symbol_universe_raw_builder.py
-# Stage 1: Downloads the full raw symbol universe via a single provider API call.
-# Writes the complete raw symbol payload to symbol_universe.symbols_raw.json (newline-delimited JSON).
+# Stage 1: Downloads the full raw symbol universe from every enabled API provider, one worker thread each.
+# Records are merged per normalized symbol (credential index order = field priority) and streamed to
+# symbol_universe.symbols_raw.json (newline-delimited JSON) through a temp file published atomically.
 # All operations are atomic, crash-resumable, and audit-logged.
 # No filtering, no enrichment, no blocklist applied here.
 
 import os
 import sys
 import json
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 from tbot_bot.support.secrets_manager import load_screener_credentials
 from tbot_bot.support.path_resolver import resolve_universe_raw_path, resolve_universe_log_path
@@ -21,6 +25,10 @@ MISCONFIG_EXIT   = 3       # provider name present but no class mapping
 FETCH_FAIL_EXIT  = 4       # provider.fetch_symbols() raised
 EMPTY_EXIT       = 5       # provider returned 0 symbols
 
+# Records per worker -> merger hand-off, and how many batches may queue before workers block
+RAW_BATCH_SIZE = int(os.environ.get("TBOT_RAW_BATCH_SIZE", "1000"))
+RAW_QUEUE_BATCHES = int(os.environ.get("TBOT_RAW_QUEUE_BATCHES", "64"))
+
 print(f"[LAUNCH] symbol_universe_raw_builder.py @ {datetime.now(timezone.utc).isoformat()}", flush=True)
 
 def log_progress(msg, details=None):
@@ -42,6 +50,18 @@ def log_progress(msg, details=None):
         # never crash on logging
         pass
 
+def _fsync_publish(tmp_path: str, out_path: str) -> None:
+    """os.replace a fully written (already fsynced) temp file over out_path, then fsync the directory entry."""
+    os.replace(tmp_path, out_path)
+    try:
+        dir_fd = os.open(os.path.dirname(out_path), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except Exception:
+        pass
+
 def _atomic_write_ndjson(lines, out_path: str) -> None:
     """
     Atomically write NDJSON:
@@ -51,8 +71,7 @@ def _atomic_write_ndjson(lines, out_path: str) -> None:
       - fsync directory entry
     """
     tmp_path = out_path + ".tmp"
-    dest_dir = os.path.dirname(out_path)
-    os.makedirs(dest_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(tmp_path, "w", encoding="utf-8") as f:
         for line in lines:
             f.write(line)
@@ -60,20 +79,19 @@ def _atomic_write_ndjson(lines, out_path: str) -> None:
                 f.write("\n")
         f.flush()
         os.fsync(f.fileno())
-    os.replace(tmp_path, out_path)
-    try:
-        dir_fd = os.open(dest_dir, os.O_DIRECTORY)
-        try:
-            os.fsync(dir_fd)
-        finally:
-            os.close(dir_fd)
-    except Exception:
-        pass
+    _fsync_publish(tmp_path, out_path)
 
-def get_raw_provider_creds():
+def get_raw_provider_configs():
+    """
+    All enabled API (non-*_TXT) universe providers as (SCREENER_NAME, creds) in credential index order,
+    which is also their merge priority (first = wins conflicting fields). Creds use unsuffixed keys.
+    """
     def _truthy(v) -> bool:
         return str(v).strip().lower() in ("1", "true", "yes", "y", "on")
 
+    def _order(idx):
+        return (0, int(idx), "") if str(idx).isdigit() else (1, 0, str(idx))
+
     all_creds = load_screener_credentials() or {}
     provider_indices = []
     for k, v in all_creds.items():
@@ -89,74 +107,230 @@ def get_raw_provider_creds():
             "in the credential admin with UNIVERSE_ENABLED checked."
         )
 
-    idx = provider_indices[0]
-    # Normalize to unsuffixed keys for downstream use
-    return {
-        key.replace(f"_{idx}", ""): v
-        for key, v in all_creds.items()
-        if key.endswith(f"_{idx}") and not key.startswith("PROVIDER_")
-    }
+    configs = []
+    for idx in sorted(dict.fromkeys(provider_indices), key=_order):
+        # Normalize to unsuffixed keys for downstream use
+        creds = {
+            key[: -len(f"_{idx}")]: v
+            for key, v in all_creds.items()
+            if key.endswith(f"_{idx}") and not key.startswith("PROVIDER_")
+        }
+        configs.append((str(creds.get("SCREENER_NAME") or "").strip().upper(), creds))
+    return configs
 
-def main():
-    log_progress("symbol_universe_raw_builder.py started")
+def get_raw_provider_creds():
+    """Creds of the first (highest priority) enabled API provider."""
+    return get_raw_provider_configs()[0][1]
+
+# --------------------------------------------------------------------
+# Concurrent fetch + merging deduplicator
+# --------------------------------------------------------------------
+def normalize_symbol(symbol) -> str:
+    return str(symbol or "").strip().upper()
+
+class RawSymbolMerger:
+    """
+    Merges per-provider symbol records keyed on normalized symbol. For each field the value from the
+    highest-priority provider (lowest number) that has a non-empty value wins; other providers only fill gaps.
+    A symbol is emitted as soon as no still-running provider could contribute to it any more: every running
+    provider has already reported it, or has finished. Emitted records are final and never re-emitted.
+    """
+
+    def __init__(self, priorities):
+        self.priorities = dict(priorities)        # provider key (name or list position) -> priority
+        self.running = set(self.priorities)
+        self._pending = {}                        # sym -> (record, {field: priority}, providers seen)
+        self._emitted = set()
+        self.duplicates = 0
+
+    def add(self, provider: str, rec: dict):
+        """Merge one record; returns the merged record if it is now final, else None."""
+        if not isinstance(rec, dict):
+            return None
+        sym = normalize_symbol(rec.get("symbol"))
+        if not sym:
+            return None
+        if sym in self._emitted:
+            self.duplicates += 1
+            return None
+        prio = self.priorities[provider]
+        entry = self._pending.get(sym)
+        if entry is None:
+            entry = self._pending[sym] = ({}, {}, set())
+        else:
+            self.duplicates += 1
+        merged, field_prio, seen = entry
+        for k, v in rec.items():
+            if v is None or v == "":
+                continue
+            if k not in field_prio or prio < field_prio[k]:
+                merged[k] = v
+                field_prio[k] = prio
+        merged["symbol"] = sym
+        seen.add(provider)
+        if self.running <= seen:
+            return self._emit(sym)
+        return None
+
+    def finish(self, provider: str):
+        """Mark a provider done; returns the records that became final."""
+        self.running.discard(provider)
+        ready = [sym for sym, (_m, _p, seen) in self._pending.items() if self.running <= seen]
+        return [self._emit(sym) for sym in ready]
+
+    def _emit(self, sym):
+        merged = self._pending.pop(sym)[0]
+        self._emitted.add(sym)
+        return merged
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+def _provider_worker(key, name, provider, out_q, batch_size):
+    # Messages carry `key` (list position), not the name: two enabled credentials may share a SCREENER_NAME
+    t0 = time.monotonic()
+    count, error = 0, None
     try:
-        screener_secrets = get_raw_provider_creds()
-    except RuntimeError as e:
-        # This is the ONLY path that should return NO_PROVIDER_EXIT (2)
-        log_progress("No valid universe provider enabled. Aborting raw build.", {"error": str(e)})
-        print(f"ERROR: {e}", flush=True)
-        sys.exit(NO_PROVIDER_EXIT)
+        result = provider.fetch_symbols()
+        batch = []
+        for rec in result or ():
+            batch.append(rec)
+            if len(batch) >= batch_size:
+                out_q.put(("records", key, batch))
+                count += len(batch)
+                batch = []
+        if batch:
+            out_q.put(("records", key, batch))
+            count += len(batch)
     except Exception as e:
-        log_progress("Failed to read screener credentials.", {"error": str(e)})
-        print(f"ERROR: failed to read screener credentials: {e}", flush=True)
-        sys.exit(MISCONFIG_EXIT)
-
-    name = (screener_secrets.get("SCREENER_NAME") or "").strip().upper()
-    if name.endswith("_TXT"):
-        # TXT providers are not valid sources for a raw universe build
-        log_progress("TXT provider configured; aborting raw build.", {"provider": name})
-        print(f"ERROR: TXT providers (like {name}) cannot be used for universe build. Enable a data API provider.", flush=True)
-        sys.exit(NO_PROVIDER_EXIT)
-
-    ProviderClass = get_provider_class(name)
-    if ProviderClass is None:
-        log_progress("No provider class mapping found.", {"provider": name})
-        print(f"ERROR: No provider class mapping found for SCREENER_NAME '{name}'", flush=True)
-        sys.exit(MISCONFIG_EXIT)
-
-    provider = ProviderClass(screener_secrets)
+        error = str(e)
+    out_q.put(("done", key, {"provider": name, "records": count, "seconds": round(time.monotonic() - t0, 3),
+                              "error": error}))
+
+def build_raw_universe(providers, out_path: str, batch_size: int = None, sink: list = None):
+    """
+    Fetch symbols from all providers concurrently (one worker thread each) and stream the deduplicated,
+    priority-merged records to out_path as NDJSON. `providers` is [(name, provider_instance)] in priority
+    order. Records are written to a temp file as they become final; it is fsynced and atomically published
+    only if at least one record was written, otherwise removed. Written records are also appended to `sink`
+    when given (in-process callers keep them instead of re-reading the file).
+    Returns {"count", "duplicates", "providers": [per-provider stats], "seconds"}.
+    """
+    batch_size = batch_size or RAW_BATCH_SIZE
+    t0 = time.monotonic()
+    # Workers, stats and merge priority are keyed on list position (priority order), never on the name
+    merger = RawSymbolMerger({i: i for i in range(len(providers))})
+    out_q = queue.Queue(maxsize=RAW_QUEUE_BATCHES)
+    workers = [threading.Thread(target=_provider_worker, args=(i, name, p, out_q, batch_size),
+                                name=f"raw-{i}-{name.lower()}", daemon=True) for i, (name, p) in enumerate(providers)]
+    for w in workers:
+        w.start()
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    stats, count, skipped = {}, 0, 0
     try:
-        raw_symbols = provider.fetch_symbols()
-    except Exception as e:
-        log_progress("Provider fetch_symbols() failed, aborting.", {"error": str(e)})
-        print(f"ERROR: fetch_symbols failed: {e}", flush=True)
-        sys.exit(FETCH_FAIL_EXIT)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            def write(rec):
+                nonlocal count, skipped
+                try:
+                    line = json.dumps(rec, ensure_ascii=False)
+                except Exception as e:
+                    skipped += 1
+                    log_progress("Skipping non-serializable symbol entry.", {"error": str(e)})
+                    return
+                f.write(line + "\n")
+                count += 1
+                if sink is not None:
+                    sink.append(rec)
 
-    if not raw_symbols:
-        log_progress("Provider returned no symbols.")
-        print("ERROR: provider returned no symbols.", flush=True)
-        sys.exit(EMPTY_EXIT)
+            while len(stats) < len(workers):
+                kind, key, payload = out_q.get()
+                if kind == "records":
+                    for rec in payload:
+                        merged = merger.add(key, rec)
+                        if merged is not None:
+                            write(merged)
+                else:
+                    stats[key] = payload
+                    for merged in merger.finish(key):
+                        write(merged)
+            f.flush()
+            os.fsync(f.fileno())
+        if count:
+            _fsync_publish(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {
+        "count": count,
+        "duplicates": merger.duplicates,
+        "skipped": skipped,
+        "providers": [stats[i] for i in range(len(providers))],
+        "seconds": round(time.monotonic() - t0, 3),
+    }
 
-    # Ensure symbols are serializable lines before any write
-    lines = []
-    count = 0
-    for s in raw_symbols:
+def run_raw_build(configs=None, out_path: str = None, sink: list = None, report: dict = None) -> int:
+    """
+    Stage 1 body. Returns 0 on success or one of the *_EXIT codes (nothing is published on failure).
+    `configs` defaults to get_raw_provider_configs(); `sink` receives the written records (see build_raw_universe).
+    `report`, when given, receives "providers": the per-provider stats (including "error") of the fetch.
+    """
+    out_path = out_path or RAW_PATH
+    log_progress("symbol_universe_raw_builder.py started")
+    if configs is None:
         try:
-            lines.append(json.dumps(s, ensure_ascii=False))
-            count += 1
+            configs = get_raw_provider_configs()
+        except RuntimeError as e:
+            # This is the ONLY path that should return NO_PROVIDER_EXIT (2)
+            log_progress("No valid universe provider enabled. Aborting raw build.", {"error": str(e)})
+            print(f"ERROR: {e}", flush=True)
+            return NO_PROVIDER_EXIT
         except Exception as e:
-            # skip un-serializable entries (do not write partial files)
-            log_progress("Skipping non-serializable symbol entry.", {"error": str(e)})
+            log_progress("Failed to read screener credentials.", {"error": str(e)})
+            print(f"ERROR: failed to read screener credentials: {e}", flush=True)
+            return MISCONFIG_EXIT
+
+    providers = []
+    for name, screener_secrets in configs:
+        ProviderClass = get_provider_class(name)
+        if ProviderClass is None:
+            log_progress("No provider class mapping found.", {"provider": name})
+            print(f"ERROR: No provider class mapping found for SCREENER_NAME '{name}'", flush=True)
+            continue
+        providers.append((name, ProviderClass(screener_secrets)))
+    if not providers:
+        return MISCONFIG_EXIT
 
-    if count == 0:
-        log_progress("All entries were non-serializable; nothing to write.", {"provider": name})
-        print("ERROR: no serializable symbols to write.", flush=True)
-        sys.exit(EMPTY_EXIT)
+    result = build_raw_universe(providers, out_path, sink=sink)
+    if report is not None:
+        report["providers"] = result["providers"]
+    for st in result["providers"]:
+        log_progress("Provider fetch finished", st)
+        print(f"  provider {st['provider']}: {st['records']} records in {st['seconds']:.2f}s"
+              + (f" (error: {st['error']})" if st["error"] else ""), flush=True)
 
-    _atomic_write_ndjson(lines, RAW_PATH)
+    if result["count"] == 0:
+        if all(st["error"] for st in result["providers"]):
+            log_progress("Provider fetch_symbols() failed, aborting.", {"providers": result["providers"]})
+            print("ERROR: fetch_symbols failed for every provider.", flush=True)
+            return FETCH_FAIL_EXIT
+        log_progress("Providers returned no symbols.", {"providers": result["providers"]})
+        print("ERROR: provider returned no symbols.", flush=True)
+        return EMPTY_EXIT
+
+    log_progress("Raw symbol universe written", {
+        "raw_path": out_path, "count": result["count"], "duplicates": result["duplicates"],
+        "providers": [st["provider"] for st in result["providers"]], "seconds": result["seconds"],
+    })
+    print(f"Raw symbol universe build complete: {result['count']} symbols written to {out_path}", flush=True)
+    return 0
 
-    log_progress("Raw symbol universe written", {"raw_path": RAW_PATH, "count": count, "provider": name})
-    print(f"Raw symbol universe build complete: {count} symbols written to {RAW_PATH}", flush=True)
+def main():
+    rc = run_raw_build()
+    if rc:
+        sys.exit(rc)
 
 if __name__ == "__main__":
     try:
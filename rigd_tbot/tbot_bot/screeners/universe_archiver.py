@@ -1,12 +1,16 @@
 # tbot_bot/screeners/universe_archiver.py
 # Automated archival, rotation, and restore utilities for symbol universe and blocklist files.
 # 100% spec-compliant with archival, retention policy, and rollback/restore logic.
+# Archives go into a compressed, deduplicated version store (archive_store.py) under ARCHIVE_DIR/store; version ids
+# keep the old "<basename>.<ts>[_label]" naming. Plain ".bak" copies from before the store are still listed,
+# restored and expired.
 
 import os
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from tbot_bot.screeners.archive_store import get_archive_store
 from tbot_bot.support.path_resolver import (
     resolve_universe_cache_path,
     resolve_universe_partial_path,
@@ -22,17 +26,15 @@ def utc_now():
 def ensure_archive_dir():
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
 
+def archive_store():
+    return get_archive_store(ARCHIVE_DIR / "store")
+
 def archive_file(src_path, label=None):
+    """Archive src_path as a new store version; returns the version id (None if src_path is missing)."""
     ensure_archive_dir()
     if not os.path.exists(src_path):
         return None
-    ts = utc_now().strftime("%Y%m%dT%H%M%SZ")
-    basename = os.path.basename(src_path)
-    label_str = f"_{label}" if label else ""
-    archive_name = f"{basename}.{ts}{label_str}.bak"
-    archive_path = ARCHIVE_DIR / archive_name
-    shutil.copy2(src_path, archive_path)
-    return str(archive_path)
+    return archive_store().put(src_path, label=label)
 
 def archive_all(label=None):
     paths = [
@@ -48,18 +50,26 @@ def archive_all(label=None):
                 archived.append(arch)
     return archived
 
+def _legacy_archives(basename=None):
+    return [str(f) for f in ARCHIVE_DIR.iterdir()
+            if f.is_file() and f.name.endswith(".bak") and (not basename or f.name.startswith(basename))]
+
 def list_archives(basename=None):
+    """Store version ids then legacy .bak paths, each newest first."""
     ensure_archive_dir()
-    files = []
-    for f in ARCHIVE_DIR.iterdir():
-        if f.is_file() and (not basename or f.name.startswith(basename)):
-            files.append(str(f))
-    files.sort(reverse=True)
-    return files
+    versions = [v for v in archive_store().versions() if not basename or v.startswith(basename)]
+    return versions + sorted(_legacy_archives(basename), reverse=True)
+
+def prune_archives(basename=None, before=None, after=None, keep_last=0):
+    """Drop store versions with after <= ts < before (datetimes or "%Y%m%dT%H%M%SZ" strings)."""
+    ensure_archive_dir()
+    fmt = lambda t: t.strftime("%Y%m%dT%H%M%SZ") if isinstance(t, datetime) else t
+    return archive_store().prune(basename=basename, before=fmt(before), after=fmt(after), keep_last=keep_last)
 
 def cleanup_archives(retention_days=RETENTION_DAYS):
     now = utc_now()
-    deleted = []
+    ensure_archive_dir()
+    deleted = prune_archives(before=now - timedelta(days=retention_days))
     for f in ARCHIVE_DIR.iterdir():
         if not f.is_file():
             continue
@@ -73,9 +83,14 @@ def cleanup_archives(retention_days=RETENTION_DAYS):
     return deleted
 
 def restore_archive(archive_path, target_path):
-    if not os.path.isfile(archive_path):
+    """Restore a store version id (or a legacy .bak path) to target_path."""
+    if os.path.isfile(archive_path):
+        shutil.copy2(archive_path, target_path)
+        return
+    store = archive_store()
+    if store.get(archive_path) is None:
         raise RuntimeError(f"Archive file does not exist: {archive_path}")
-    shutil.copy2(archive_path, target_path)
+    store.restore(archive_path, target_path)
 
 def latest_archive_for(basename):
     archives = list_archives(basename)
@@ -103,6 +118,8 @@ if __name__ == "__main__":
     parser.add_argument("--list", action="store_true", help="List all archive files")
     parser.add_argument("--restore-universe", action="store_true", help="Restore latest universe cache from archive")
     parser.add_argument("--restore-blocklist", action="store_true", help="Restore latest blocklist from archive")
+    parser.add_argument("--restore", nargs=2, metavar=("VERSION", "TARGET"), help="Restore one archive version")
+    parser.add_argument("--stats", action="store_true", help="Show archive store size/dedup statistics")
     args = parser.parse_args()
 
     if args.archive:
@@ -125,3 +142,8 @@ if __name__ == "__main__":
             print("Restored latest blocklist.")
         else:
             print("No blocklist archive found.")
+    if args.restore:
+        restore_archive(args.restore[0], args.restore[1])
+        print(f"Restored {args.restore[0]} -> {args.restore[1]}")
+    if args.stats:
+        print(archive_store().stats())
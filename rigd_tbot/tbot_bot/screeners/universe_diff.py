@@ -1,11 +1,14 @@
 # tbot_bot/screeners/universe_diff.py
 # Utility for diffing/comparing any two universe or blocklist files (audit/archival/drift detection)
 # 100% spec-compliant. Supports JSON and TXT blocklist diff, field-by-field diff, and reporting.
-# Usage: python universe_diff.py <file1> <file2> [--blocklist]
+# Universe diffs load both files column-wise (symbol / row fingerprint / row text), match rows by fingerprint
+# first and only decode and compare fields of rows whose fingerprints differ, with optional per-field numeric
+# tolerances. --json emits a machine-readable change set instead of the text report.
+# Usage: python universe_diff.py <file1> <file2> [--blocklist] [--json] [--tol FIELD=ABS|FIELD=PCT%]...
 
 import sys
 import json
-from typing import List, Set, Dict
+from typing import Any, List, Optional, Set, Dict, Tuple
 
 def load_json_symbols(path: str) -> List[Dict]:
     # Handles both newline-delimited JSON (preferred) and JSON array/object legacy
@@ -39,7 +42,12 @@ def load_blocklist(path: str) -> Set[str]:
         for line in f:
             line = line.strip().upper()
             if line and not line.startswith("#"):
-                syms.add(line.split("|", 1)[0])
+                sym = line.split("|", 1)[0]
+                # "-SYMBOL|..." is a removal tombstone (blocklist_manager append log)
+                if sym.startswith("-"):
+                    syms.discard(sym[1:])
+                else:
+                    syms.add(sym)
     return syms
 
 def diff_blocklists(bl1: Set[str], bl2: Set[str]):
@@ -47,27 +55,160 @@ def diff_blocklists(bl1: Set[str], bl2: Set[str]):
     only_in_2 = sorted(list(bl2 - bl1))
     return only_in_1, only_in_2
 
-def diff_universes(u1: List[Dict], u2: List[Dict]):
-    symset1 = set([s.get("symbol", "").upper() for s in u1 if "symbol" in s])
-    symset2 = set([s.get("symbol", "").upper() for s in u2 if "symbol" in s])
-    only_in_1 = sorted(list(symset1 - symset2))
-    only_in_2 = sorted(list(symset2 - symset1))
+# --------------------------------------------------------------------
+# Columnar load + fingerprint-first diff engine
+# --------------------------------------------------------------------
+_SYMBOL_PREFIX = '{"symbol": "'
+
+class UniverseColumns:
+    """
+    One universe as parallel columns: upper-cased symbol, row fingerprint and row source (NDJSON line text,
+    or the decoded record for JSON array/object files). Rows are decoded lazily by record(i); `index` maps
+    symbol -> row (last occurrence wins, as a dict built from the file would).
+    """
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self.fingerprints: List[int] = []
+        self.rows: List[Any] = []
+        self.index: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _append(self, sym: str, fp: int, row: Any):
+        self.index[sym] = len(self.symbols)
+        self.symbols.append(sym)
+        self.fingerprints.append(fp)
+        self.rows.append(row)
+
+    def add_line(self, line: str) -> bool:
+        """Add one NDJSON line; the symbol is sliced from json.dumps-style lines without decoding the row."""
+        sym = None
+        if line.startswith(_SYMBOL_PREFIX) and line.endswith("}"):
+            end = line.find('"', len(_SYMBOL_PREFIX))
+            if end > 0 and "\\" not in line[len(_SYMBOL_PREFIX):end]:
+                sym = line[len(_SYMBOL_PREFIX):end]
+        if sym is None:
+            try:
+                rec = json.loads(line)
+            except Exception:
+                return False
+            if not isinstance(rec, dict) or "symbol" not in rec:
+                return False
+            sym = rec.get("symbol") or ""
+        self._append(str(sym).upper(), hash(line), line)
+        return True
+
+    def add_record(self, rec: Dict):
+        if isinstance(rec, dict) and "symbol" in rec:
+            text = json.dumps(rec, sort_keys=True, default=str)
+            self._append(str(rec.get("symbol") or "").upper(), hash(text), rec)
+
+    def record(self, i: int) -> Dict:
+        row = self.rows[i]
+        return json.loads(row) if isinstance(row, str) else row
+
+def load_columns(path: str) -> UniverseColumns:
+    """Load a universe file (NDJSON preferred; JSON array / {"symbols": [...]} legacy) into columns."""
+    cols = UniverseColumns()
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(4096).lstrip()
+        f.seek(0)
+        if not head.startswith("["):  # a JSON array is never read as NDJSON, even if some lines parse alone
+            for line in f:
+                line = line.strip()
+                if line:
+                    cols.add_line(line)
+    if len(cols):
+        return cols
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("symbols") or []
+    for rec in data if isinstance(data, list) else []:
+        cols.add_record(rec)
+    return cols
+
+def columns_from_records(records: List[Dict]) -> UniverseColumns:
+    cols = UniverseColumns()
+    for rec in records:
+        cols.add_record(rec)
+    return cols
+
+def parse_tolerances(specs: List[str]) -> Dict[str, Tuple[float, float]]:
+    """["lastClose=0.01", "marketCap=0.5%", "*=1e-9"] -> {field: (abs_tol, rel_tol)}; "*" applies to every field."""
+    tols: Dict[str, Tuple[float, float]] = {}
+    for spec in specs or []:
+        field, _, value = spec.partition("=")
+        value = value.strip()
+        if not field.strip() or not value:
+            raise ValueError(f"Bad tolerance '{spec}' (expected FIELD=ABS or FIELD=PCT%)")
+        if value.endswith("%"):
+            tols[field.strip()] = (0.0, float(value[:-1]) / 100.0)
+        else:
+            tols[field.strip()] = (float(value), 0.0)
+    return tols
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+def field_deltas(r1: Dict, r2: Dict, tolerances: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, list]:
+    """
+    Fields whose values differ beyond tolerance: {field: [old, new]} plus the numeric delta as a third element
+    when both values are numbers ([old, new, new - old]).
+    """
+    out: Dict[str, list] = {}
+    tolerances = tolerances or {}
+    default = tolerances.get("*")
+    for k in r1.keys() | r2.keys():
+        v1, v2 = r1.get(k), r2.get(k)
+        if v1 == v2:
+            continue
+        if _is_number(v1) and _is_number(v2):
+            tol = tolerances.get(k, default)
+            delta = v2 - v1
+            if tol is not None and abs(delta) <= max(tol[0], tol[1] * max(abs(v1), abs(v2))):
+                continue
+            out[k] = [v1, v2, delta]
+        else:
+            out[k] = [v1, v2]
+    return out
+
+def diff_columns(c1: UniverseColumns, c2: UniverseColumns,
+                 tolerances: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+    """
+    Change set from c1 (old) to c2 (new):
+        {"added": [sym...], "removed": [sym...], "changed": [{"symbol": sym, "fields": {field: [old, new(, delta)]}}],
+         "counts": {"old", "new", "added", "removed", "changed", "compared", "unchanged"}}
+    Rows with equal fingerprints are unchanged without being decoded; only rows whose fingerprints differ are
+    compared field by field (so a reordered or within-tolerance row is not reported).
+    """
+    i1, i2 = c1.index, c2.index
+    removed = sorted(i1.keys() - i2.keys())
+    added = sorted(i2.keys() - i1.keys())
+    fp1, fp2 = c1.fingerprints, c2.fingerprints
+    suspects = [sym for sym, a in i1.items() if sym in i2 and fp1[a] != fp2[i2[sym]]]
     changed = []
-    u1_map = {s.get("symbol", "").upper(): s for s in u1}
-    u2_map = {s.get("symbol", "").upper(): s for s in u2}
-    common = symset1 & symset2
-    for sym in common:
-        s1 = u1_map[sym]
-        s2 = u2_map[sym]
-        diffs = {}
-        for k in set(s1.keys()) | set(s2.keys()):
-            v1 = s1.get(k)
-            v2 = s2.get(k)
-            if v1 != v2:
-                diffs[k] = (v1, v2)
-        if diffs:
-            changed.append({"symbol": sym, "diffs": diffs})
-    return only_in_1, only_in_2, changed
+    for sym in sorted(suspects):
+        deltas = field_deltas(c1.record(i1[sym]), c2.record(i2[sym]), tolerances)
+        if deltas:
+            changed.append({"symbol": sym, "fields": deltas})
+    common = len(i1) - len(removed)
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "counts": {"old": len(i1), "new": len(i2), "added": len(added), "removed": len(removed),
+                   "changed": len(changed), "compared": len(suspects), "unchanged": common - len(changed)},
+    }
+
+def diff_universes(u1: List[Dict], u2: List[Dict], tolerances: Optional[Dict[str, Tuple[float, float]]] = None):
+    """Record-list API: (only_in_1, only_in_2, [{"symbol", "diffs": {field: (old, new)}}])."""
+    result = diff_columns(columns_from_records(u1), columns_from_records(u2), tolerances)
+    changed = [{"symbol": ch["symbol"], "diffs": {k: (d[0], d[1]) for k, d in ch["fields"].items()}}
+               for ch in result["changed"]]
+    return result["removed"], result["added"], changed
 
 def print_diff_result(only_in_1, only_in_2, changed=None, name1="File1", name2="File2"):
     print(f"Symbols only in {name1}: {len(only_in_1)}")
@@ -84,21 +225,41 @@ def print_diff_result(only_in_1, only_in_2, changed=None, name1="File1", name2="
                 print(f"    {k}: {v1}  ==>  {v2}")
 
 def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Diff two universe (NDJSON/JSON) or blocklist files")
+    ap.add_argument("file1")
+    ap.add_argument("file2")
+    ap.add_argument("--blocklist", action="store_true", help="compare as blocklist files")
+    ap.add_argument("--json", action="store_true", help="print the change set as JSON")
+    ap.add_argument("--tol", action="append", default=[], metavar="FIELD=ABS|FIELD=PCT%",
+                    help="numeric tolerance per field ('*' = every field); repeatable")
     if len(sys.argv) < 3:
-        print("Usage: python universe_diff.py <file1> <file2> [--blocklist]")
+        print("Usage: python universe_diff.py <file1> <file2> [--blocklist] [--json] [--tol FIELD=ABS|FIELD=PCT%]...")
         sys.exit(1)
-    file1, file2 = sys.argv[1], sys.argv[2]
-    is_blocklist = "--blocklist" in sys.argv
-    if is_blocklist:
+    args = ap.parse_args()
+    file1, file2 = args.file1, args.file2
+    if args.blocklist:
         bl1 = load_blocklist(file1)
         bl2 = load_blocklist(file2)
         only_in_1, only_in_2 = diff_blocklists(bl1, bl2)
-        print_diff_result(only_in_1, only_in_2, name1=file1, name2=file2)
+        if args.json:
+            print(json.dumps({"added": only_in_2, "removed": only_in_1}))
+        else:
+            print_diff_result(only_in_1, only_in_2, name1=file1, name2=file2)
     else:
-        u1 = load_json_symbols(file1)
-        u2 = load_json_symbols(file2)
-        only_in_1, only_in_2, changed = diff_universes(u1, u2)
-        print_diff_result(only_in_1, only_in_2, changed, name1=file1, name2=file2)
+        try:
+            tolerances = parse_tolerances(args.tol)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        result = diff_columns(load_columns(file1), load_columns(file2), tolerances)
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False, default=str))
+        else:
+            changed = [{"symbol": ch["symbol"], "diffs": {k: (d[0], d[1]) for k, d in ch["fields"].items()}}
+                       for ch in result["changed"]]
+            print_diff_result(result["removed"], result["added"], changed, name1=file1, name2=file2)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,267 @@
+# tbot_bot/screeners/universe_index.py
+# Per-file SQLite index over universe files (unfiltered/partial NDJSON, final JSON array/object) for the web UI.
+# Serves counts in O(1), pages in file order by offset or keyset cursor, and prefix/substring symbol search
+# without re-reading or re-parsing the universe file on every request.
+
+"""
+Index
+-----
+One SQLite sidecar per universe file, at <file dir>/.index/<file name>.sqlite:
+
+    rows(pos INTEGER PRIMARY KEY, sym TEXT, doc TEXT)    -- pos = record order in the file, sym = upper symbol
+    meta(key, value)                                     -- source signature, count, status, schema version
+
+The sidecar is rebuilt (temp file + os.replace) when the source file's (inode, size, mtime_ns) signature
+changes, so a process that finds a sidecar already built by another process for the same file just uses it.
+Records are kept as their JSON text and only the rows of the requested page are decoded.
+
+Search
+------
+Symbols are matched upper-cased, like the previous in-Python filter. Prefix search is a range scan on the
+(sym, pos) index; substring search (the default, same results as before) scans that covering index with
+instr() instead of decoding every record.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+INDEX_DIRNAME = ".index"
+_SCHEMA_VERSION = 1
+_LIST_KEYS = ("symbols", "items", "universe")
+_INSERT_BATCH = 5000
+
+_MEMO: Dict[str, "UniverseIndex"] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def index_path_for(path) -> Path:
+    p = Path(path)
+    return p.parent / INDEX_DIRNAME / f"{p.name}.sqlite"
+
+
+def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _symbol_of(item: Any) -> str:
+    if isinstance(item, str):
+        return item.upper()
+    if isinstance(item, dict):
+        return str(item.get("symbol") or "").upper()
+    return ""
+
+
+def iter_universe_records(path: str) -> Tuple[Iterator[Tuple[str, str]], Dict[str, Any]]:
+    """
+    (sym, json_text) per record in file order, plus file-level info ({"status": ...} for final-cache objects).
+    NDJSON is streamed line by line; a JSON array, or an object holding symbols/items/universe, is loaded whole.
+    Undecodable NDJSON lines are skipped, as in the web loaders.
+    """
+    info: Dict[str, Any] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        first_line = f.readline()
+        second_line = f.readline() if head == "{" else ""
+    whole_doc = head == "["
+    if head == "{":
+        try:
+            json.loads(first_line)
+            whole_doc = not second_line.strip()  # a one-line object: may still be a wrapper
+        except ValueError:
+            whole_doc = True  # pretty-printed object
+
+    if whole_doc:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError:
+            data = None
+        items: List[Any] = []
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            info["status"] = data.get("status")
+            for key in _LIST_KEYS:
+                if isinstance(data.get(key), list):
+                    items = data[key]
+                    break
+            else:
+                if "symbol" in data:
+                    items = [data]  # single-record NDJSON file
+        if data is not None:
+            return ((_symbol_of(it), json.dumps(it, ensure_ascii=False)) for it in items), info
+
+    def ndjson():
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                yield _symbol_of(item), line
+
+    return ndjson(), info
+
+
+class UniverseIndex:
+    def __init__(self, path, index_path=None):
+        self.path = str(path)
+        self.index_path = Path(index_path) if index_path else index_path_for(path)
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[int, int, int]] = None
+        self._count = 0
+        self._status: Optional[str] = None
+
+    # ---- build ----
+    def ensure(self) -> "UniverseIndex":
+        sig = _signature(self.path)
+        if sig is not None and sig == self._sig:
+            return self
+        with self._lock:
+            sig = _signature(self.path)
+            if sig is None:
+                self._sig, self._count, self._status = None, 0, None
+                return self
+            if sig == self._sig:
+                return self
+            if not self._load_meta(sig):
+                self._rebuild(sig)
+        return self
+
+    def _load_meta(self, sig) -> bool:
+        """Adopt an existing sidecar built for this exact file version."""
+        if not self.index_path.exists():
+            return False
+        try:
+            with sqlite3.connect(str(self.index_path)) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return False
+        if meta.get("schema") != str(_SCHEMA_VERSION) or meta.get("source_sig") != json.dumps(sig):
+            return False
+        self._sig, self._count = sig, int(meta.get("count") or 0)
+        self._status = meta.get("status") or None
+        return True
+
+    def _rebuild(self, sig):
+        records, info = iter_universe_records(self.path)
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            writable = os.access(self.index_path.parent, os.W_OK)
+        except OSError:
+            writable = False
+        if not writable:
+            # Read-only output dir: keep the sidecar in the temp dir instead
+            tag = hashlib.sha1(self.path.encode("utf-8")).hexdigest()[:12]
+            self.index_path = Path(tempfile.gettempdir()) / "tbot_universe_index" / f"{tag}_{Path(self.path).name}.sqlite"
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{self.index_path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        conn = sqlite3.connect(tmp)
+        ok = False
+        try:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("CREATE TABLE rows (pos INTEGER PRIMARY KEY, sym TEXT NOT NULL, doc TEXT NOT NULL)")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            count = 0
+            batch: List[Tuple[int, str, str]] = []
+            for sym, doc in records:
+                batch.append((count, sym, doc))
+                count += 1
+                if len(batch) >= _INSERT_BATCH:
+                    conn.executemany("INSERT INTO rows VALUES (?, ?, ?)", batch)
+                    batch.clear()
+            conn.executemany("INSERT INTO rows VALUES (?, ?, ?)", batch)
+            conn.execute("CREATE INDEX idx_rows_sym ON rows (sym, pos)")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("schema", str(_SCHEMA_VERSION)), ("source_sig", json.dumps(sig)), ("count", str(count)),
+                ("status", info.get("status") or ""),
+            ])
+            conn.commit()
+            ok = True
+        finally:
+            conn.close()
+            if not ok:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        os.replace(tmp, self.index_path)
+        self._sig, self._count, self._status = sig, count, info.get("status")
+
+    # ---- reads ----
+    def count(self) -> int:
+        return self.ensure()._count
+
+    def status(self) -> Optional[str]:
+        return self.ensure()._status
+
+    def page(self, search: str = "", offset: int = 0, limit: int = 100, after: Optional[int] = None,
+             prefix: bool = False) -> Tuple[List[Any], Optional[int]]:
+        """
+        Records in file order matching `search` (upper-cased symbol substring, or prefix when prefix=True).
+        `after` (a position cursor from a previous page) takes precedence over `offset`.
+        Returns (records, next cursor or None when this was the last page).
+        """
+        self.ensure()
+        if self._sig is None or limit <= 0:
+            return [], None
+        where, args = [], []
+        search = (search or "").upper()
+        if search and prefix:
+            where.append("sym >= ? AND sym < ?")
+            args += [search, search + "\U0010ffff"]
+        elif search:
+            where.append("instr(sym, ?) > 0")
+            args.append(search)
+        if after is not None:
+            where.append("pos > ?")
+            args.append(int(after))
+        sql = "SELECT pos, doc FROM rows"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY pos LIMIT ?"
+        args.append(int(limit) + 1)
+        if after is None and offset:
+            sql += " OFFSET ?"
+            args.append(max(0, int(offset)))
+        with sqlite3.connect(str(self.index_path)) as conn:
+            rows = conn.execute(sql, args).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [json.loads(doc) for _pos, doc in rows], (rows[-1][0] if more and rows else None)
+
+
+def get_universe_index(path) -> UniverseIndex:
+    key = os.path.abspath(str(path))
+    idx = _MEMO.get(key)
+    if idx is None:
+        with _MEMO_LOCK:
+            idx = _MEMO.setdefault(key, UniverseIndex(key))
+    return idx
+
+
+def universe_count(path) -> int:
+    """Number of records in a universe file (0 if missing/unreadable)."""
+    try:
+        return get_universe_index(path).count()
+    except Exception:
+        return 0
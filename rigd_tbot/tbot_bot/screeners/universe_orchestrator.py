@@ -1,15 +1,19 @@
 # tbot_bot/screeners/universe_orchestrator.py
 # Orchestrates the full nightly universe build process:
-# 1) Runs symbol_universe_raw_builder.py to create symbol_universe.symbols_raw.json (single API call)
-# 2) Runs symbol_enrichment.py to enrich, filter, blocklist, and build universe files from API adapters
-# 3) Atomically writes FINAL (symbol_universe.json): write .partial → fsync → os.replace (atomic publish)
+# 1) raw: symbol_universe_raw_builder builds symbol_universe.symbols_raw.json (all enabled API providers, merged)
+# 2) enrich: symbol_enrichment enriches, filters, blocklists and writes the unfiltered/partial files
+# 3) publish: atomically writes FINAL (symbol_universe.json): write staged → fsync → os.replace (atomic publish)
 # 4) Optionally polls for blocklist/manual recovery and logs if triggered
+# Stages run in-process by default: records pass between stages in memory, every stage still checkpoints its
+# output file, and a stage whose inputs hash the same as its last successful run is skipped (stage_cache).
+# TBOT_UNIVERSE_ISOLATION=subprocess (or --subprocess) runs each stage as `python -m` instead, uncached.
 # Logs progress and errors to screen and to universe_ops.log via path_resolver. No daemon behavior.
 
 import subprocess
 import sys
 import os
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -22,6 +26,7 @@ from tbot_bot.support.path_resolver import (
 )
 
 from tbot_bot.screeners.screener_utils import get_universe_screener_secrets
+from tbot_bot.screeners.stage_cache import StageManifest, fingerprint
 # SURGICAL: centralized bot-state writes
 from tbot_bot.support.bot_state_manager import set_state
 
@@ -40,6 +45,11 @@ BLOCKLIST_PATH = os.path.join(os.path.dirname(UNFILTERED_PATH), "screener_blockl
 # Special meaning: raw-builder uses 2 to indicate "no provider enabled"
 NO_PROVIDER_EXIT = 2
 
+# Stage execution: "inprocess" (default, cached) or "subprocess" (one interpreter per stage, no cache)
+UNIVERSE_ISOLATION = os.environ.get("TBOT_UNIVERSE_ISOLATION", "inprocess").strip().lower()
+# Stage manifest (input keys + output hashes of the last successful run of each stage)
+MANIFEST_PATH = os.path.join(os.path.dirname(PARTIAL_PATH), ".pipeline", "universe_stages.json")
+
 
 # --- (surgical) Back-compat shim for tests: allow monkeypatching universe_orchestrator.get_output_path ---
 def get_output_path(*args, **kwargs) -> str:
@@ -106,7 +116,7 @@ def poll_blocklist_recovery():
     return False
 
 
-def _atomic_publish_json(data: dict, final_path: str) -> None:
+def _atomic_publish_json(data: dict, final_path: str, indent: Optional[int] = 2) -> None:
     """
     Atomically write JSON to final_path:
       - write to temp file in same dir
@@ -120,7 +130,7 @@ def _atomic_publish_json(data: dict, final_path: str) -> None:
 
     # Write staged content
     with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(data, f, ensure_ascii=False, indent=indent)
         f.flush()
         os.fsync(f.fileno())
 
@@ -363,90 +373,220 @@ def append_to_blocklist(symbol: str, path: Optional[str] = None, reason: Optiona
 # =========================
 # Orchestration entrypoint
 # =========================
-def main():
-    # Mark rebuild start
+def _set_state_quiet(state: str, reason: str) -> None:
     try:
-        set_state("analyzing", reason="universe:rebuild")
+        set_state(state, reason=reason)
     except Exception:
         pass
 
-    # Step 1: Build raw symbols file from provider API (single API call)
+
+def _exit_no_provider():
+    log("No universe provider enabled; deferring until credentials are added.")
+    # Emit waiting state ONLY if final is missing; otherwise preserve last-good.
+    if not os.path.exists(FINAL_PATH):
+        _write_waiting_status(FINAL_PATH)
+    _set_state_quiet("running", "universe:done")
+    sys.exit(0)
+
+
+def _exit_raw_failed(rc: int):
+    # Preserve last-good by exiting without touching FINAL_PATH
+    log("Raw builder failed; preserving last known good universe.")
+    _set_state_quiet("error", "universe:error")
+    sys.exit(rc)
+
+
+def _exit_enrichment_failed(rc: int):
+    # ---- Failure marker + preserve last good (do NOT publish) ----
+    try:
+        uni_dir = Path(FINAL_PATH).parent
+        uni_dir.mkdir(parents=True, exist_ok=True)
+        (uni_dir / "universe_build.failed").write_text(
+            f"{datetime.utcnow().isoformat()}Z\n", encoding="utf-8"
+        )
+        log("CRITICAL: Universe build enrichment failed; keeping last known good.")
+    finally:
+        _set_state_quiet("error", "universe:error")
+    sys.exit(rc)
+
+
+def _publish_final(data: dict, indent: Optional[int] = 2) -> None:
+    """Validate and atomically publish the final payload (exit 4 invalid, 3 write failure)."""
+    try:
+        if not _final_payload_is_valid(data):
+            log("ERROR: Final payload validation failed; refusing to publish.")
+            _set_state_quiet("error", "universe:error")
+            sys.exit(4)
+        _atomic_publish_json(data, FINAL_PATH, indent=indent)
+        log(f"Universe orchestration completed successfully. Published {FINAL_PATH}")
+    except SystemExit:
+        raise
+    except Exception as e:
+        log(f"ERROR: Failed to publish universe: {e}")
+        _set_state_quiet("error", "universe:error")
+        sys.exit(3)
+
+
+def _require_partial() -> None:
+    if not os.path.exists(PARTIAL_PATH):
+        log(f"ERROR: Missing partial universe: {PARTIAL_PATH}")
+        _set_state_quiet("error", "universe:error")
+        sys.exit(1)
+
+
+def _run_subprocess_stages() -> None:
+    """Each stage in its own interpreter (`python -m`), exchanging data only through the checkpoint files."""
+    # Step 1: Build raw symbols file from provider APIs
     rc = run_module("tbot_bot.screeners.symbol_universe_raw_builder", tolerate_rcs=(NO_PROVIDER_EXIT,))
     if rc == NO_PROVIDER_EXIT:
-        log("No universe provider enabled; deferring until credentials are added.")
-        # Emit waiting state ONLY if final is missing; otherwise preserve last-good.
-        if not os.path.exists(FINAL_PATH):
-            _write_waiting_status(FINAL_PATH)
-        try:
-            set_state("running", reason="universe:done")
-        except Exception:
-            pass
-        sys.exit(0)
+        _exit_no_provider()
     if rc != 0:
-        # Preserve last-good by exiting without touching FINAL_PATH
-        log("Raw builder failed; preserving last known good universe.")
-        try:
-            set_state("error", reason="universe:error")
-        except Exception:
-            pass
-        sys.exit(rc)
+        _exit_raw_failed(rc)
 
     # Step 2: Enrich, filter, blocklist, and build universe files from API adapters
     rc = run_module("tbot_bot.screeners.symbol_enrichment")
     if rc != 0:
-        # ---- Failure marker + preserve last good (do NOT publish) ----
-        try:
-            uni_dir = Path(FINAL_PATH).parent
-            uni_dir.mkdir(parents=True, exist_ok=True)
-            (uni_dir / "universe_build.failed").write_text(
-                f"{datetime.utcnow().isoformat()}Z\n", encoding="utf-8"
-            )
-            log("CRITICAL: Universe build enrichment failed; keeping last known good.")
-        finally:
-            try:
-                set_state("error", reason="universe:error")
-            except Exception:
-                pass
-        sys.exit(rc)
+        _exit_enrichment_failed(rc)
 
     # Step 3: Finalize — inject timestamp and atomically publish staged -> final
-    if not os.path.exists(PARTIAL_PATH):
-        log(f"ERROR: Missing partial universe: {PARTIAL_PATH}")
-        try:
-            set_state("error", reason="universe:error")
-        except Exception:
-            pass
-        sys.exit(1)
-
+    _require_partial()
     try:
         data = _stage_with_timestamp(PARTIAL_PATH)
-        if not _final_payload_is_valid(data):
-            log("ERROR: Final payload validation failed; refusing to publish.")
-            try:
-                set_state("error", reason="universe:error")
-            except Exception:
-                pass
-            sys.exit(4)
-        _atomic_publish_json(data, FINAL_PATH)
-        log(f"Universe orchestration completed successfully. Published {FINAL_PATH}")
     except Exception as e:
         log(f"ERROR: Failed to publish universe: {e}")
-        try:
-            set_state("error", reason="universe:error")
-        except Exception:
-            pass
+        _set_state_quiet("error", "universe:error")
         sys.exit(3)
+    _publish_final(data)
+
+
+def _run_in_process(force: bool = False) -> None:
+    """
+    raw -> enrich -> publish in this process. Each stage's key covers everything it reads; a stage with an
+    unchanged key and intact outputs is skipped (so an unchanged re-fetch still skips what follows), and a
+    downstream stage that does run reads a skipped stage's checkpoint file instead of its in-memory result.
+    """
+    from tbot_bot.screeners import symbol_universe_raw_builder as raw_builder
+    from tbot_bot.screeners import symbol_enrichment as enrichment
+    from tbot_bot.screeners.screener_utils import load_blocklist
+
+    manifest = StageManifest(MANIFEST_PATH)
+    build_date = datetime.now(timezone.utc).date().isoformat()
+
+    # Step 1: raw — keyed on the enabled providers (name + credential fingerprint, in priority order) and the
+    # UTC build date; a fetch where any provider errored is published but never recorded as fresh
+    log("Stage raw: resolving providers...")
+    try:
+        configs = raw_builder.get_raw_provider_configs()
+    except RuntimeError as e:
+        raw_builder.log_progress("No valid universe provider enabled. Aborting raw build.", {"error": str(e)})
+        _exit_no_provider()
+    except Exception as e:
+        log(f"Stage raw: failed to read screener credentials: {e}")
+        _exit_raw_failed(raw_builder.MISCONFIG_EXIT)
+    raw_key = fingerprint("raw", [(name, fingerprint(creds)) for name, creds in configs], build_date)
+    raw_records = None
+    if not force and manifest.is_fresh("raw", raw_key):
+        log("Stage raw: inputs unchanged; reusing checkpoint.")
+    else:
+        started = time.monotonic()
+        raw_records, raw_report = [], {}
+        try:
+            rc = raw_builder.run_raw_build(configs, raw_builder.RAW_PATH, sink=raw_records, report=raw_report)
+        except Exception as e:
+            log(f"Stage raw: failed: {e}")
+            rc = 1
+        if rc == NO_PROVIDER_EXIT:
+            _exit_no_provider()
+        if rc != 0:
+            _exit_raw_failed(rc)
+        failed = [st["provider"] for st in raw_report.get("providers", ()) if st.get("error")]
+        if failed:
+            # Degraded (partial) fetch: usable for this build, but the next rebuild must fetch again
+            manifest.invalidate("raw")
+            log(f"Stage raw: provider errors ({', '.join(failed)}); checkpoint not cached.")
+        else:
+            manifest.record("raw", raw_key, [raw_builder.RAW_PATH], started)
+        log(f"Stage raw: {len(raw_records)} symbols in {time.monotonic() - started:.2f}s.")
+
+    # Step 2: enrich — keyed on raw content, live blocklist, filter settings, provider and UTC date
+    partial_records = None
+    try:
+        env, screener_secrets, name = enrichment.prepare_enrichment()
+        blocklist = sorted(load_blocklist(enrichment.BLOCKLIST_PATH))
+        enrich_key = fingerprint("enrich", manifest.output_hash("raw", raw_builder.RAW_PATH),
+                                 fingerprint(blocklist), enrichment.filter_params(env), name, build_date)
+        if not force and manifest.is_fresh("enrich", enrich_key):
+            log("Stage enrich: inputs unchanged; reusing checkpoint.")
+        else:
+            started = time.monotonic()
+            if raw_records is None:
+                raw_records = enrichment.load_raw_symbols()
+            unfiltered, partial_records, stats = enrichment.enrich_symbols(raw_records, env, screener_secrets, name)
+            enrichment.write_enrichment_outputs(unfiltered, partial_records)
+            enrichment.log_progress("Enrichment complete", dict(stats, partial_path=enrichment.PARTIAL_PATH,
+                                                                unfiltered_path=enrichment.UNFILTERED_PATH))
+            if stats.get("missed_api"):
+                # Timeouts/5xx dropped symbols: publish this build, but the next rebuild must enrich again
+                manifest.invalidate("enrich")
+                log(f"Stage enrich: {stats['missed_api']} provider misses; checkpoint not cached.")
+            else:
+                manifest.record("enrich", enrich_key, [enrichment.UNFILTERED_PATH, enrichment.PARTIAL_PATH], started)
+            log(f"Stage enrich: {stats['partial_count']} of {stats['unfiltered_count']} enriched symbols kept "
+                f"in {time.monotonic() - started:.2f}s.")
+    except enrichment.EnrichmentAbort as e:
+        log(f"Stage enrich: aborted ({e})")
+        _exit_enrichment_failed(e.code)
+    except Exception as e:
+        enrichment.log_progress("Enrichment failed and raised exception", {"error": str(e)})
+        log(f"Stage enrich: failed: {e}")
+        _exit_enrichment_failed(1)
+
+    # Step 3: publish — keyed on the partial file's content
+    _require_partial()
+    publish_key = fingerprint("publish", manifest.output_hash("enrich", PARTIAL_PATH))
+    if not force and manifest.is_fresh("publish", publish_key):
+        log("Stage publish: partial unchanged; final universe already published.")
+        return
+    started = time.monotonic()
+    if partial_records is not None:
+        data = {"symbols": partial_records, "build_timestamp_utc": datetime.utcnow().isoformat() + "Z"}
+    else:
+        try:
+            data = _stage_with_timestamp(PARTIAL_PATH)
+        except Exception as e:
+            log(f"ERROR: Failed to publish universe: {e}")
+            _set_state_quiet("error", "universe:error")
+            sys.exit(3)
+    _publish_final(data, indent=None)
+    manifest.record("publish", publish_key, [FINAL_PATH], started)
+
+
+def main(isolation: Optional[str] = None, force: Optional[bool] = None):
+    isolation = (isolation or UNIVERSE_ISOLATION).strip().lower()
+    if force is None:
+        force = os.environ.get("TBOT_UNIVERSE_FORCE", "").strip().lower() in ("1", "true", "yes", "on")
+
+    # Mark rebuild start
+    _set_state_quiet("analyzing", "universe:rebuild")
+
+    if isolation == "subprocess":
+        _run_subprocess_stages()
+    else:
+        _run_in_process(force=force)
 
     # Step 4: Poll for blocklist/manual recovery flag
     if poll_blocklist_recovery():
         log("Blocklist/manual recovery event logged during universe orchestration.")
 
     # Success terminal state
-    try:
-        set_state("running", reason="universe:done")
-    except Exception:
-        pass
+    _set_state_quiet("running", "universe:done")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Universe build orchestrator")
+    ap.add_argument("--subprocess", action="store_true", help="run each stage in its own interpreter (no stage cache)")
+    ap.add_argument("--force", action="store_true", help="re-run every stage even if its inputs are unchanged")
+    cli = ap.parse_args()
+    main(isolation="subprocess" if cli.subprocess else None, force=cli.force or None)
@@ -0,0 +1,140 @@
+# tbot_bot/screeners/universe_stream.py
+# Incremental reader for universe files: yields records one at a time from NDJSON, a JSON array, or a
+# {"status": ..., "symbols"/"items"/"universe": [...]} object without loading the whole file.
+
+"""
+NDJSON (what save_universe_cache writes) is read line by line; undecodable lines are skipped, as in the web
+loaders. Arrays and wrapper objects, pretty-printed or not, are decoded item by item from a sliding buffer
+with json.JSONDecoder.raw_decode, so memory stays at one read chunk plus one record. Non-list members of a
+wrapper object (e.g. "status") are decoded and dropped; an object with no list member is itself a record.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterator, TextIO
+
+LIST_KEYS = ("symbols", "items", "universe")
+CHUNK_SIZE = 1 << 16
+# Longest first line probed when telling NDJSON from a one-line wrapper object
+HEAD_LIMIT = 1 << 20
+_WS = " \t\r\n"
+_DECODER = json.JSONDecoder()
+
+
+class _JsonReader:
+    """Pull-style reader over a text file: skip whitespace, check punctuation, decode one value."""
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"expected {ch!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer end may be a truncated number/literal
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except ValueError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                self.eof = True
+
+    def array_items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            ch = self.peek()
+            self.pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise ValueError(f"expected ',' or ']' at offset {self.pos - 1}")
+
+
+def _iter_wrapper(reader: _JsonReader) -> Iterator[Any]:
+    reader.expect("{")
+    record: Dict[str, Any] = {}
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key in LIST_KEYS and reader.peek() == "[":
+            yield from reader.array_items()
+            return
+        record[key] = reader.value()
+        ch = reader.peek()
+        reader.pos += 1
+        if ch == "}":
+            break
+        if ch != ",":
+            raise ValueError(f"expected ',' or '}}' at offset {reader.pos - 1}")
+    if "symbol" in record:
+        yield record
+
+
+def _is_ndjson_record(line: str) -> bool:
+    try:
+        first = json.loads(line)
+    except ValueError:
+        return False
+    return isinstance(first, dict) and "symbol" in first and not any(isinstance(first.get(k), list) for k in LIST_KEYS)
+
+
+def iter_universe_items(path, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Records of a universe file in file order (dicts, or bare symbol strings for plain lists)."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.readline(HEAD_LIMIT)
+        while head and not head.strip():
+            head = f.readline(HEAD_LIMIT)
+        f.seek(0)
+        first = head.lstrip(_WS)[:1]
+        if first == "[":
+            yield from _JsonReader(f, chunk_size).array_items()
+        elif first == "{" and not _is_ndjson_record(head):
+            yield from _iter_wrapper(_JsonReader(f, chunk_size))
+        elif first:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -71,7 +71,12 @@ def load_blocklist(path: str) -> Set[str]:
             line = line.strip().upper()
             if line and not line.startswith("#"):
                 # Only add symbol (first comma, CSV format)
-                syms.add(line.split(",", 1)[0])
+                sym = line.split(",", 1)[0]
+                # "-SYMBOL|..." is a removal tombstone (blocklist_manager append log)
+                if sym.startswith("-"):
+                    syms.discard(sym[1:].split("|", 1)[0])
+                else:
+                    syms.add(sym)
     return syms
 
 def _dedupe_and_find_dups(symbols: List[Dict]) -> Tuple[List[Dict], Set[str]]:
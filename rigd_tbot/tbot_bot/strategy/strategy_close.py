@@ -21,6 +21,7 @@ from tbot_bot.trading.risk_module import validate_trade
 from tbot_bot.config.error_handler_bot import handle as handle_error
 from tbot_bot.support.decrypt_secrets import decrypt_json
 from tbot_bot.support import path_resolver  # ensure control path consistency
+from tbot_bot.support.lazy_settings import LazySettings
 # --- NEW (surgical): centralized trailing-stop helper ---
 from tbot_bot.trading.trailing_stop import (
     compute_trailing_exit_threshold,  # noqa: F401
@@ -34,26 +35,38 @@ from tbot_bot.support.bot_state_manager import set_state
 
 print("[strategy_close] module loaded", flush=True)
 
-config = get_bot_config()
-broker_creds = decrypt_json("broker_credentials")
-BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
-
-STRAT_CLOSE_ENABLED   = config["STRAT_CLOSE_ENABLED"]
-CLOSE_ANALYSIS_TIME   = int(config["CLOSE_ANALYSIS_TIME"])
-CLOSE_MONITORING_TIME = int(config["CLOSE_MONITORING_TIME"])
-VIX_THRESHOLD         = float(config["STRAT_CLOSE_VIX_THRESHOLD"])
-SHORT_TYPE_CLOSE      = config["SHORT_TYPE_CLOSE"]
-ACCOUNT_BALANCE       = float(config["ACCOUNT_BALANCE"])
-MAX_RISK_PER_TRADE    = float(config["MAX_RISK_PER_TRADE"])
-DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
-MAX_TRADES            = int(config["MAX_TRADES"])
-CANDIDATE_MULTIPLIER  = int(config["CANDIDATE_MULTIPLIER"])
-FRACTIONAL            = str(config.get("FRACTIONAL", "false")).lower() == "true"
-WEIGHTS               = [float(w) for w in config["WEIGHTS"].split(",")]
-# SURGICAL: read trading trailing stop from env (defaults to 2%)
-TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
-# SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
-HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+# Config/broker settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+    broker_creds = decrypt_json("broker_credentials")
+    BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
+
+    STRAT_CLOSE_ENABLED   = config["STRAT_CLOSE_ENABLED"]
+    CLOSE_ANALYSIS_TIME   = int(config["CLOSE_ANALYSIS_TIME"])
+    CLOSE_MONITORING_TIME = int(config["CLOSE_MONITORING_TIME"])
+    VIX_THRESHOLD         = float(config["STRAT_CLOSE_VIX_THRESHOLD"])
+    SHORT_TYPE_CLOSE      = config["SHORT_TYPE_CLOSE"]
+    ACCOUNT_BALANCE       = float(config["ACCOUNT_BALANCE"])
+    MAX_RISK_PER_TRADE    = float(config["MAX_RISK_PER_TRADE"])
+    DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
+    MAX_TRADES            = int(config["MAX_TRADES"])
+    CANDIDATE_MULTIPLIER  = int(config["CANDIDATE_MULTIPLIER"])
+    FRACTIONAL            = str(config.get("FRACTIONAL", "false")).lower() == "true"
+    WEIGHTS               = [float(w) for w in config["WEIGHTS"].split(",")]
+    # SURGICAL: read trading trailing stop from env (defaults to 2%)
+    TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
+    # SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
+    HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "broker_creds", "BROKER_CODE", "STRAT_CLOSE_ENABLED", "CLOSE_ANALYSIS_TIME",
+    "CLOSE_MONITORING_TIME", "VIX_THRESHOLD", "SHORT_TYPE_CLOSE", "ACCOUNT_BALANCE",
+    "MAX_RISK_PER_TRADE", "DEFAULT_CAPITAL_PER_TRADE", "MAX_TRADES", "CANDIDATE_MULTIPLIER",
+    "FRACTIONAL", "WEIGHTS", "TRADING_TRAILING_STOP_PCT", "HARD_CLOSE_BUFFER_SEC",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- Control/stamps (use tbot_bot/control via resolver) ---
 CONTROL_DIR        = path_resolver.get_project_root() / "tbot_bot" / "control"
@@ -67,6 +80,7 @@ def is_test_mode_active():
     return TEST_MODE_FLAG.exists()
 
 def self_check():
+    _SETTINGS.ensure()
     return STRAT_CLOSE_ENABLED and VIX_THRESHOLD >= 0
 
 def get_broker_api():
@@ -98,6 +112,7 @@ def _has_close_run_today(now_dt: datetime) -> bool:
 # ------------------------
 
 def analyze_closing_signals(start_time, screener_class):
+    _SETTINGS.ensure()
     log_event("strategy_close", "Starting EOD momentum/fade analysis...")
     # --- SURGICAL: set explicit state on entry to analyze phase ---
     set_state("analyzing", reason="close:analyze")
@@ -204,6 +219,7 @@ def analyze_closing_signals(start_time, screener_class):
     return []
 
 def monitor_closing_trades(signals, start_time):
+    _SETTINGS.ensure()
     log_event("strategy_close", "Monitoring EOD trades...")
     # --- SURGICAL: set explicit state right before placing orders ---
     set_state("trading", reason="close:placing")
@@ -357,8 +373,10 @@ def run_close_strategy(screener_class):
     print(f"[strategy_close] completed with {len(trades)} trades", flush=True)
     return StrategyResult(trades=trades, skipped=False)
 
-def simulate_close(*args, **kwargs):
+def simulate_close(df, config=None):
     """
-    Stub for backtest/CI/test: returns empty list.
+    Backtest entry point: vectorized simulation of the close strategy over a minute-bar DataFrame.
+    See tbot_bot/backtest/simulators.py for the modelled rules.
     """
-    return []
+    from tbot_bot.backtest.simulators import simulate
+    return simulate("close", df, config)
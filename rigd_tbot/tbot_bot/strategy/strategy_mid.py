@@ -20,6 +20,7 @@ from tbot_bot.trading.risk_module import validate_trade
 from tbot_bot.config.error_handler_bot import handle as handle_error
 from tbot_bot.support.decrypt_secrets import decrypt_json
 from tbot_bot.support import path_resolver  # ensure control path consistency
+from tbot_bot.support.lazy_settings import LazySettings
 # --- NEW (surgical): central trailing stop helpers (align with strategy_open usage) ---
 from tbot_bot.trading.trailing_stop import (
     compute_trailing_exit_threshold,  # noqa: F401
@@ -33,26 +34,38 @@ from tbot_bot.support.bot_state_manager import set_state
 
 print("[strategy_mid] module loaded", flush=True)
 
-config = get_bot_config()
-broker_creds = decrypt_json("broker_credentials")
-BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
-
-STRAT_MID_ENABLED = config["STRAT_MID_ENABLED"]
-MID_ANALYSIS_TIME = int(config["MID_ANALYSIS_TIME"])
-MID_MONITORING_TIME = int(config["MID_MONITORING_TIME"])
-VWAP_THRESHOLD = float(config["STRAT_MID_VWAP_THRESHOLD"])
-SHORT_TYPE_MID = config["SHORT_TYPE_MID"]
-ACCOUNT_BALANCE = float(config["ACCOUNT_BALANCE"])
-MAX_RISK_PER_TRADE = float(config["MAX_RISK_PER_TRADE"])
-DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
-MAX_TRADES = int(config["MAX_TRADES"])
-CANDIDATE_MULTIPLIER = int(config["CANDIDATE_MULTIPLIER"])
-FRACTIONAL = str(config.get("FRACTIONAL", "false")).lower() == "true"
-WEIGHTS = [float(w) for w in config["WEIGHTS"].split(",")]
-# SURGICAL: read trading trailing stop from env (defaults to 2%)
-TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
-# SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
-HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+# Config/broker settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+    broker_creds = decrypt_json("broker_credentials")
+    BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
+
+    STRAT_MID_ENABLED = config["STRAT_MID_ENABLED"]
+    MID_ANALYSIS_TIME = int(config["MID_ANALYSIS_TIME"])
+    MID_MONITORING_TIME = int(config["MID_MONITORING_TIME"])
+    VWAP_THRESHOLD = float(config["STRAT_MID_VWAP_THRESHOLD"])
+    SHORT_TYPE_MID = config["SHORT_TYPE_MID"]
+    ACCOUNT_BALANCE = float(config["ACCOUNT_BALANCE"])
+    MAX_RISK_PER_TRADE = float(config["MAX_RISK_PER_TRADE"])
+    DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
+    MAX_TRADES = int(config["MAX_TRADES"])
+    CANDIDATE_MULTIPLIER = int(config["CANDIDATE_MULTIPLIER"])
+    FRACTIONAL = str(config.get("FRACTIONAL", "false")).lower() == "true"
+    WEIGHTS = [float(w) for w in config["WEIGHTS"].split(",")]
+    # SURGICAL: read trading trailing stop from env (defaults to 2%)
+    TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
+    # SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
+    HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "broker_creds", "BROKER_CODE", "STRAT_MID_ENABLED", "MID_ANALYSIS_TIME",
+    "MID_MONITORING_TIME", "VWAP_THRESHOLD", "SHORT_TYPE_MID", "ACCOUNT_BALANCE",
+    "MAX_RISK_PER_TRADE", "DEFAULT_CAPITAL_PER_TRADE", "MAX_TRADES", "CANDIDATE_MULTIPLIER",
+    "FRACTIONAL", "WEIGHTS", "TRADING_TRAILING_STOP_PCT", "HARD_CLOSE_BUFFER_SEC",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- Control/stamps (use tbot_bot/control via resolver) ---
 CONTROL_DIR        = path_resolver.get_project_root() / "tbot_bot" / "control"
@@ -66,6 +79,7 @@ def is_test_mode_active():
     return TEST_MODE_FLAG.exists()
 
 def self_check():
+    _SETTINGS.ensure()
     return STRAT_MID_ENABLED and VWAP_THRESHOLD > 0
 
 def get_broker_api():
@@ -97,6 +111,7 @@ def _has_mid_run_today(now_dt: datetime) -> bool:
 # ------------------------
 
 def analyze_vwap_signals(start_time, screener_class):
+    _SETTINGS.ensure()
     log_event("strategy_mid", "Starting VWAP deviation analysis...")
     # --- SURGICAL: set explicit state on entry to analyze phase ---
     set_state("analyzing", reason="mid:analyze")
@@ -190,6 +205,7 @@ def analyze_vwap_signals(start_time, screener_class):
     return []
 
 def execute_mid_trades(signals, start_time):
+    _SETTINGS.ensure()
     log_event("strategy_mid", "Executing trades...")
     # --- SURGICAL: set explicit state right before placing orders ---
     set_state("trading", reason="mid:placing")
@@ -339,6 +355,10 @@ def run_mid_strategy(screener_class):
     print(f"[strategy_mid] completed with {len(trades)} trades", flush=True)
     return StrategyResult(trades=trades, skipped=False)
 
-def simulate_mid(*args, **kwargs):
-    """Stub for backtest/CI/test: returns empty list (no simulated trades)."""
-    return []
+def simulate_mid(df, config=None):
+    """
+    Backtest entry point: vectorized simulation of the mid strategy over a minute-bar DataFrame.
+    See tbot_bot/backtest/simulators.py for the modelled rules.
+    """
+    from tbot_bot.backtest.simulators import simulate
+    return simulate("mid", df, config)
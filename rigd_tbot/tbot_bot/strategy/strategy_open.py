@@ -21,6 +21,7 @@ from tbot_bot.trading.risk_module import validate_trade
 from tbot_bot.config.error_handler_bot import handle as handle_error
 from tbot_bot.support.decrypt_secrets import decrypt_json
 from tbot_bot.support import path_resolver  # ensure control path consistency
+from tbot_bot.support.lazy_settings import LazySettings
 # (surgical) centralized bot-state writes
 from tbot_bot.support.bot_state_manager import set_state
 
@@ -35,27 +36,40 @@ from tbot_bot.trading.trailing_stop import (
 
 print("[strategy_open] module loaded", flush=True)
 
-config = get_bot_config()
-broker_creds = decrypt_json("broker_credentials")
-BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
-
-STRAT_OPEN_ENABLED     = config["STRAT_OPEN_ENABLED"]
-STRAT_OPEN_BUFFER      = float(config["STRAT_OPEN_BUFFER"])
-OPEN_ANALYSIS_TIME     = int(config["OPEN_ANALYSIS_TIME"])
-OPEN_BREAKOUT_TIME     = int(config["OPEN_BREAKOUT_TIME"])
-OPEN_MONITORING_TIME   = int(config["OPEN_MONITORING_TIME"])
-SHORT_TYPE_OPEN        = config["SHORT_TYPE_OPEN"]
-ACCOUNT_BALANCE        = float(config["ACCOUNT_BALANCE"])
-MAX_RISK_PER_TRADE     = float(config["MAX_RISK_PER_TRADE"])
-DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
-MAX_TRADES             = int(config["MAX_TRADES"])
-CANDIDATE_MULTIPLIER   = int(config["CANDIDATE_MULTIPLIER"])
-FRACTIONAL             = str(config.get("FRACTIONAL", "false")).lower() == "true"
-WEIGHTS                = [float(w) for w in config["WEIGHTS"].split(",")]
-# SURGICAL: read trading trailing stop from env (defaults to 2%)
-TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
-# SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
-HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+# Config/broker settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+    broker_creds = decrypt_json("broker_credentials")
+    BROKER_CODE = broker_creds.get("BROKER_CODE", "").lower()
+
+    STRAT_OPEN_ENABLED     = config["STRAT_OPEN_ENABLED"]
+    STRAT_OPEN_BUFFER      = float(config["STRAT_OPEN_BUFFER"])
+    OPEN_ANALYSIS_TIME     = int(config["OPEN_ANALYSIS_TIME"])
+    OPEN_BREAKOUT_TIME     = int(config["OPEN_BREAKOUT_TIME"])
+    OPEN_MONITORING_TIME   = int(config["OPEN_MONITORING_TIME"])
+    SHORT_TYPE_OPEN        = config["SHORT_TYPE_OPEN"]
+    ACCOUNT_BALANCE        = float(config["ACCOUNT_BALANCE"])
+    MAX_RISK_PER_TRADE     = float(config["MAX_RISK_PER_TRADE"])
+    DEFAULT_CAPITAL_PER_TRADE = ACCOUNT_BALANCE * MAX_RISK_PER_TRADE
+    MAX_TRADES             = int(config["MAX_TRADES"])
+    CANDIDATE_MULTIPLIER   = int(config["CANDIDATE_MULTIPLIER"])
+    FRACTIONAL             = str(config.get("FRACTIONAL", "false")).lower() == "true"
+    WEIGHTS                = [float(w) for w in config["WEIGHTS"].split(",")]
+    # SURGICAL: read trading trailing stop from env (defaults to 2%)
+    TRADING_TRAILING_STOP_PCT = float(config.get("TRADING_TRAILING_STOP_PCT", 0.02))
+    # SURGICAL: hard-close buffer (seconds) used by tightening helper (default ~2.5 min)
+    HARD_CLOSE_BUFFER_SEC = int(float(config.get("HARD_CLOSE_BUFFER_SEC", 150)))
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "broker_creds", "BROKER_CODE", "STRAT_OPEN_ENABLED", "STRAT_OPEN_BUFFER",
+    "OPEN_ANALYSIS_TIME", "OPEN_BREAKOUT_TIME", "OPEN_MONITORING_TIME", "SHORT_TYPE_OPEN",
+    "ACCOUNT_BALANCE", "MAX_RISK_PER_TRADE", "DEFAULT_CAPITAL_PER_TRADE", "MAX_TRADES",
+    "CANDIDATE_MULTIPLIER", "FRACTIONAL", "WEIGHTS", "TRADING_TRAILING_STOP_PCT",
+    "HARD_CLOSE_BUFFER_SEC",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- Control/stamps (ensure we use tbot_bot/control, not project root/control) ---
 CONTROL_DIR     = path_resolver.get_project_root() / "tbot_bot" / "control"
@@ -70,6 +84,7 @@ def is_test_mode_active():
     return TEST_MODE_FLAG.exists()
 
 def self_check():
+    _SETTINGS.ensure()
     return STRAT_OPEN_ENABLED and STRAT_OPEN_BUFFER > 0
 
 def get_broker_api():
@@ -102,6 +117,7 @@ def _has_open_run_today(now_dt: datetime) -> bool:
 # ------------------------
 
 def analyze_opening_range(start_time, screener_class):
+    _SETTINGS.ensure()
     log_event("strategy_open", "Starting opening range analysis...")
     # (surgical) state: entering analyze phase
     try:
@@ -139,6 +155,7 @@ def analyze_opening_range(start_time, screener_class):
     return range_data
 
 def detect_breakouts(start_time, screener_class):
+    _SETTINGS.ensure()
     log_event("strategy_open", "Monitoring for breakouts...")
     trades = []
     breakout_minutes = 1 if is_test_mode_active() else OPEN_BREAKOUT_TIME
@@ -358,6 +375,10 @@ def run_open_strategy(screener_class):
     log_event("strategy_open", f"Open strategy completed: {len(trades)} trades placed")
     return StrategyResult(trades=trades, skipped=False)
 
-def simulate_open(*args, **kwargs):
-    """Stub for backtest/CI/test: returns empty list (no simulated trades)."""
-    return []
+def simulate_open(df, config=None):
+    """
+    Backtest entry point: vectorized simulation of the open strategy over a minute-bar DataFrame.
+    See tbot_bot/backtest/simulators.py for the modelled rules.
+    """
+    from tbot_bot.backtest.simulators import simulate
+    return simulate("open", df, config)
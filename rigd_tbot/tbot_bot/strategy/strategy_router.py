@@ -18,23 +18,34 @@ from tbot_bot.support.utils_time import utc_now  # removed parse_time_utc (not p
 from tbot_bot.support.utils_log import log_event
 # --- SURGICAL: use path_resolver for consistent control path resolution ---
 from tbot_bot.support import path_resolver
+from tbot_bot.support.lazy_settings import LazySettings
 # --- SURGICAL: add state manager import (no writes here, but kept for consistency with spec) ---
 from tbot_bot.support.bot_state_manager import set_state  # noqa: F401
 
-config = get_bot_config()
+# Config-derived routing settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
 
-# Router respects enable/disable flags and declared order but does not self-schedule.
-STRATEGY_SEQUENCE = [s.strip().lower() for s in config.get("STRATEGY_SEQUENCE", "open,mid,close").split(",")]
+    # Router respects enable/disable flags and declared order but does not self-schedule.
+    STRATEGY_SEQUENCE = [s.strip().lower() for s in config.get("STRATEGY_SEQUENCE", "open,mid,close").split(",")]
 
-STRAT_OPEN_ENABLED = bool(config.get("STRAT_OPEN_ENABLED", True))
-STRAT_MID_ENABLED = bool(config.get("STRAT_MID_ENABLED", True))
-STRAT_CLOSE_ENABLED = bool(config.get("STRAT_CLOSE_ENABLED", True))
+    STRAT_OPEN_ENABLED = bool(config.get("STRAT_OPEN_ENABLED", True))
+    STRAT_MID_ENABLED = bool(config.get("STRAT_MID_ENABLED", True))
+    STRAT_CLOSE_ENABLED = bool(config.get("STRAT_CLOSE_ENABLED", True))
 
-# Screener selection from .env_bot (upper-cased names resolve to concrete classes below)
-SCREENER_SOURCE = str(config.get("SCREENER_SOURCE", "FINNHUB")).strip().upper()
-OPEN_SCREENER = str(config.get("OPEN_SCREENER", SCREENER_SOURCE)).strip().upper()
-MID_SCREENER = str(config.get("MID_SCREENER", SCREENER_SOURCE)).strip().upper()
-CLOSE_SCREENER = str(config.get("CLOSE_SCREENER", SCREENER_SOURCE)).strip().upper()
+    # Screener selection from .env_bot (upper-cased names resolve to concrete classes below)
+    SCREENER_SOURCE = str(config.get("SCREENER_SOURCE", "FINNHUB")).strip().upper()
+    OPEN_SCREENER = str(config.get("OPEN_SCREENER", SCREENER_SOURCE)).strip().upper()
+    MID_SCREENER = str(config.get("MID_SCREENER", SCREENER_SOURCE)).strip().upper()
+    CLOSE_SCREENER = str(config.get("CLOSE_SCREENER", SCREENER_SOURCE)).strip().upper()
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "STRATEGY_SEQUENCE", "STRAT_OPEN_ENABLED", "STRAT_MID_ENABLED", "STRAT_CLOSE_ENABLED",
+    "SCREENER_SOURCE", "OPEN_SCREENER", "MID_SCREENER", "CLOSE_SCREENER",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- SURGICAL: resolve control dir via path_resolver to avoid double 'tbot_bot' ---
 CONTROL_DIR = path_resolver.get_project_root() / "tbot_bot" / "control"
@@ -158,6 +169,7 @@ def route_strategy(current_utc_time=None, override: str = None) -> StrategyResul
     - Otherwise: uses UTC now vs START_TIME_* (UTC) to pick the first eligible in STRATEGY_SEQUENCE.
     The router does NOT launch processes and does NOT stamp per-day guards; supervisor owns scheduling.
     """
+    _SETTINGS.ensure()
     state = _bot_state()
     print(f"[strategy_router] route_strategy called (override={override!r}, state={state})", flush=True)
 
@@ -223,6 +235,7 @@ def execute_strategy(name: str, screener_override: str = None) -> StrategyResult
     Dispatch to concrete strategy module, injecting screener class.
     Lazy-import strategies to avoid import-time crashes from unrelated modules.
     """
+    _SETTINGS.ensure()
     n = (name or "").strip().lower()
     screener_class = get_screener_class(screener_override or SCREENER_SOURCE)
 
@@ -288,14 +301,20 @@ def _self_check(session: str) -> None:
     # Strategy importability
     try:
         if session == "open":
-            from tbot_bot.strategy.strategy_open import run_open_strategy  # noqa: F401
+            from tbot_bot.strategy.strategy_open import run_open_strategy, self_check as _strategy_check  # noqa: F401
         elif session == "mid":
-            from tbot_bot.strategy.strategy_mid import run_mid_strategy  # noqa: F401
+            from tbot_bot.strategy.strategy_mid import run_mid_strategy, self_check as _strategy_check  # noqa: F401
         else:
-            from tbot_bot.strategy.strategy_close import run_close_strategy  # noqa: F401
+            from tbot_bot.strategy.strategy_close import run_close_strategy, self_check as _strategy_check  # noqa: F401
     except Exception as e:
         raise RuntimeError(f"strategy import failed for session={session}: {e}") from e
 
+    # Strategy settings load lazily; resolve them here so bad config/broker secrets still fail fast
+    try:
+        _strategy_check()
+    except Exception as e:
+        raise RuntimeError(f"strategy settings failed for session={session}: {e}") from e
+
     # Env/config minimal sanity
     try:
         from tbot_bot.config.env_bot import get_bot_config as _get_cfg
@@ -0,0 +1,217 @@
+# tbot_bot/support/import_profiler.py
+# Startup profiling for `python -m` entry points: cold import wall time, per-module cost (-X importtime)
+# and optional cProfile of the import, each measured in a fresh interpreter.
+# Usage: python -m tbot_bot.support.import_profiler [module ...] [--top 15] [--cprofile] [--json out.json] [--check]
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Entry points launched as `python -m` by the supervisor/dispatcher, with cold-import budgets (ms).
+# Budgets cover importing the module only (no main()); scale them with TBOT_IMPORT_BUDGET_SCALE on slow hosts.
+IMPORT_BUDGETS_MS: Dict[str, int] = {
+    "tbot_bot.runtime.main": 1500,
+    "tbot_bot.runtime.tbot_supervisor": 1500,
+    "tbot_bot.runtime.schedule_dispatcher": 1000,
+    "tbot_bot.strategy.strategy_router": 1500,
+    "tbot_bot.strategy.strategy_open": 2000,
+    "tbot_bot.strategy.strategy_mid": 2000,
+    "tbot_bot.strategy.strategy_close": 2000,
+    "tbot_bot.runtime.holdings_maintenance": 1500,
+    "tbot_bot.screeners.universe_orchestrator": 1500,
+    "tbot_bot.runtime.status_bot": 1000,
+    "tbot_bot.runtime.watchdog_bot": 1500,
+    "tbot_bot.runtime.sync_broker_ledger": 1500,
+    "tbot_bot.runtime.ledger_snapshot": 1500,
+    "tbot_bot.trading.risk_module": 2000,
+    "tbot_bot.reporting.trade_logger": 1000,
+}
+
+_MARKER = "__TBOT_IMPORT_PROFILE__"
+
+_PROBE = """
+import json, sys, time
+module, prof_path = sys.argv[1], sys.argv[2]
+prof = None
+if prof_path:
+    import cProfile
+    prof = cProfile.Profile()
+t0 = time.perf_counter()
+err = None
+try:
+    if prof:
+        prof.enable()
+    __import__(module)
+except BaseException as e:
+    err = f"{type(e).__name__}: {e}"
+finally:
+    if prof:
+        prof.disable()
+secs = time.perf_counter() - t0
+if prof:
+    prof.dump_stats(prof_path)
+print(%r + json.dumps({"seconds": secs, "error": err}), flush=True)
+""" % _MARKER
+
+
+@dataclass
+class ModuleCost:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    seconds: Optional[float]
+    error: Optional[str]
+    modules: List[ModuleCost] = field(default_factory=list)
+    cprofile: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.seconds is not None
+
+    def top_self(self, n: int = 15, prefix: str = "") -> List[ModuleCost]:
+        rows = [m for m in self.modules if m.name.startswith(prefix)]
+        return sorted(rows, key=lambda m: m.self_us, reverse=True)[:n]
+
+    def to_dict(self, top: int = 15) -> Dict:
+        d = asdict(self)
+        d["modules"] = [asdict(m) for m in self.top_self(top)]
+        d["tbot_modules"] = [asdict(m) for m in self.top_self(top, "tbot_bot")]
+        return d
+
+
+def parse_importtime(stderr: str) -> List[ModuleCost]:
+    """Parse `-X importtime` lines: 'import time: <self us> | <cumulative us> | <indent><name>'."""
+    out: List[ModuleCost] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cum_us, name = rest.split("|", 2)
+            stripped = name.lstrip(" ")
+            out.append(ModuleCost(stripped.strip(), int(self_us), int(cum_us), (len(name) - len(stripped) - 1) // 2))
+        except ValueError:
+            continue
+    return out
+
+
+def _env() -> Dict[str, str]:
+    env = os.environ.copy()
+    cur = env.get("PYTHONPATH", "")
+    if str(ROOT) not in cur.split(os.pathsep):
+        env["PYTHONPATH"] = f"{ROOT}{os.pathsep}{cur}" if cur else str(ROOT)
+    return env
+
+
+def profile_import(module: str, python: Optional[str] = None, cprofile: bool = False,
+                   cprofile_top: int = 25, timeout: float = 120.0) -> ImportProfile:
+    """Import `module` once in a fresh interpreter and collect wall time, importtime rows and optional cProfile."""
+    prof_path = ""
+    if cprofile:
+        fd, prof_path = tempfile.mkstemp(prefix="tbot_import_", suffix=".prof")
+        os.close(fd)
+    try:
+        proc = subprocess.run(
+            [python or sys.executable, "-X", "importtime", "-c", _PROBE, module, prof_path],
+            cwd=str(ROOT), env=_env(), capture_output=True, text=True, timeout=timeout,
+        )
+        result = None
+        for line in proc.stdout.splitlines():
+            if line.startswith(_MARKER):
+                result = json.loads(line[len(_MARKER):])
+        if result is None:
+            tail = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+            return ImportProfile(module, None, f"probe failed (rc={proc.returncode}): {tail}",
+                                 parse_importtime(proc.stderr))
+        prof_text = None
+        if cprofile and os.path.getsize(prof_path) > 0:
+            buf = io.StringIO()
+            pstats.Stats(prof_path, stream=buf).sort_stats("cumulative").print_stats(cprofile_top)
+            prof_text = buf.getvalue()
+        return ImportProfile(module, result["seconds"], result["error"], parse_importtime(proc.stderr), prof_text)
+    finally:
+        if prof_path:
+            try:
+                os.unlink(prof_path)
+            except OSError:
+                pass
+
+
+def budget_ms(module: str) -> Optional[float]:
+    base = IMPORT_BUDGETS_MS.get(module)
+    if base is None:
+        return None
+    try:
+        scale = float(os.environ.get("TBOT_IMPORT_BUDGET_SCALE", "1"))
+    except ValueError:
+        scale = 1.0
+    return base * scale
+
+
+def format_report(profiles: Sequence[ImportProfile], top: int = 15) -> str:
+    lines: List[str] = []
+    for p in profiles:
+        budget = budget_ms(p.module)
+        took = f"{p.seconds * 1000:8.1f} ms" if p.seconds is not None else "     n/a   "
+        status = "OK" if p.ok else f"ERROR {p.error}"
+        if p.ok and budget is not None and p.seconds * 1000 > budget:
+            status = f"OVER BUDGET ({budget:.0f} ms)"
+        lines.append(f"== {p.module}: {took}  {status}")
+        lines.append(f"   {'self ms':>9} {'cum ms':>9}  module (top {top} by self time)")
+        for m in p.top_self(top):
+            lines.append(f"   {m.self_us / 1000:9.1f} {m.cumulative_us / 1000:9.1f}  {m.name}")
+        tbot = p.top_self(top, "tbot_bot")
+        if tbot:
+            lines.append(f"   {'self ms':>9} {'cum ms':>9}  tbot_bot module")
+            for m in tbot:
+                lines.append(f"   {m.self_us / 1000:9.1f} {m.cumulative_us / 1000:9.1f}  {m.name}")
+        if p.cprofile:
+            lines.append(p.cprofile.rstrip())
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-module import cost report for bot entry points")
+    ap.add_argument("modules", nargs="*", help="modules to profile (default: every budgeted entry point)")
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--cprofile", action="store_true", help="also cProfile the import (sorted by cumulative)")
+    ap.add_argument("--json", dest="json_path", help="write the report as JSON")
+    ap.add_argument("--check", action="store_true", help="exit 1 if an entry point fails or exceeds its budget")
+    args = ap.parse_args(argv)
+
+    profiles = [profile_import(m, cprofile=args.cprofile) for m in (args.modules or list(IMPORT_BUDGETS_MS))]
+    print(format_report(profiles, args.top))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump([p.to_dict(args.top) for p in profiles], f, indent=2)
+
+    if args.check:
+        bad = [p.module for p in profiles
+               if not p.ok or (budget_ms(p.module) is not None and p.seconds * 1000 > budget_ms(p.module))]
+        if bad:
+            print(f"FAILED: {', '.join(bad)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# tbot_bot/support/lazy_settings.py
+# Deferred module-level settings: config/secrets-derived values are resolved on first use, not at import.
+# Importing a strategy/trading module must stay cheap and side-effect free (no decryption, no key
+# generation, no file writes); the values are loaded the first time a function actually needs them.
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, MutableMapping
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping that calls loader() on first access and keeps the result for the process,
+    matching the old `config = get_bot_config()` module-global semantics:
+        config = LazyMapping(get_bot_config)
+    """
+
+    def __init__(self, loader: Callable[[], Mapping]):
+        self._loader = loader
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Mapping:
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._loader() or {}
+                data = self._data
+        return data
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        return f"LazyMapping(loaded={self.loaded})"
+
+
+class LazySettings:
+    """
+    Module globals computed by loader() -> dict on first use.
+
+        def _load_settings():
+            config = get_bot_config()
+            return {"MAX_TRADES": int(config["MAX_TRADES"]), ...}
+
+        _SETTINGS = LazySettings(globals(), _load_settings, ("MAX_TRADES", ...))
+        __getattr__ = _SETTINGS.module_getattr      # module.MAX_TRADES still works from outside
+
+    Functions that read the globals directly call _SETTINGS.ensure() first. A failed load is not
+    cached, so the next call retries (e.g. once the bot is configured).
+    """
+
+    def __init__(self, namespace: MutableMapping[str, Any], loader: Callable[[], Dict[str, Any]],
+                 names: Iterable[str]):
+        self._ns = namespace
+        self._loader = loader
+        self.names = frozenset(names)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def ensure(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            values = self._loader()
+            missing = self.names.difference(values)
+            if missing:
+                raise KeyError(f"lazy settings loader did not provide: {sorted(missing)}")
+            self._ns.update(values)
+            self._loaded = True
+
+    def module_getattr(self, name: str) -> Any:
+        if name in self.names:
+            self.ensure()
+            return self._ns[name]
+        raise AttributeError(f"module {self._ns.get('__name__')!r} has no attribute {name!r}")
@@ -0,0 +1,266 @@
+# tbot_bot/support/log_index.py
+# Sparse time index for append-only log files plus a tail-first, size-capped window reader.
+# Lets the log viewer seek straight to "last N hours" instead of reading and parsing the whole file.
+
+"""
+Index
+-----
+Every `stride` bytes (default 64 KiB) the indexer seeks to the next line start and records the first
+timestamp it finds there, keeping one entry per minute bucket:
+
+    [["2026-01-02T14:30", 0], ["2026-01-02T14:31", 65602], ...]
+
+The index is extended incrementally from `indexed_to` on each refresh (only newly appended bytes are
+sampled) and rebuilt from scratch when the log is rotated or truncated (inode change or shrink).
+It is persisted as JSON under <log dir>/.index/<log name>.json (atomic replace) and memoised per process;
+an unwritable log directory just means the index lives in memory only.
+
+Window reads
+------------
+read_window(path, since=...) walks backwards from the end of the file (or from a `before` cursor) in
+blocks, stopping at the indexed start of the window or at `max_bytes`, whichever comes first. The page
+carries a `next_before` cursor when older lines in the window were cut off by the cap.
+
+Timestamps are compared as ISO strings ("YYYY-MM-DDTHH:MM:SS", wall time as written, offset ignored —
+the same semantics as logs_web.parse_timestamp). A line without a timestamp is kept with the entry
+above it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_STRIDE = int(os.environ.get("TBOT_LOG_INDEX_STRIDE", str(64 * 1024)))
+MAX_RESPONSE_BYTES = int(os.environ.get("TBOT_LOG_VIEW_MAX_BYTES", str(2 * 1024 * 1024)))
+_INDEX_VERSION = 1
+_BLOCK = 64 * 1024
+# Bytes read at each sample point while looking for a timestamped line
+_PROBE = 4096
+
+_TS_RE = re.compile(rb"(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2})(:\d{2})?")
+
+_MEMO: Dict[str, "LogIndex"] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def line_ts(line: bytes) -> Optional[str]:
+    """'YYYY-MM-DDTHH:MM[:SS]' of the first ISO timestamp in `line`, or None."""
+    m = _TS_RE.search(line)
+    if not m:
+        return None
+    return (m.group(1) + b"T" + m.group(2) + (m.group(3) or b"")).decode("ascii")
+
+
+def _ts_key(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def index_path_for(log_path) -> Path:
+    p = Path(log_path)
+    return p.parent / ".index" / f"{p.name}.json"
+
+
+class LogIndex:
+    def __init__(self, log_path, stride: int = DEFAULT_STRIDE, index_path=None, persist: bool = True):
+        self.log_path = str(log_path)
+        self.stride = stride
+        self.index_path = Path(index_path) if index_path else index_path_for(log_path)
+        self.persist = persist
+        self.ino: Optional[int] = None
+        self.size = 0
+        self.indexed_to = 0  # next sample position
+        self.keys: List[str] = []
+        self.offsets: List[int] = []
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    # ---- persistence ----
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.persist:
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _INDEX_VERSION or data.get("stride") != self.stride:
+            return
+        self.ino = data.get("ino")
+        self.size = int(data.get("size", 0))
+        self.indexed_to = int(data.get("indexed_to", 0))
+        entries = data.get("buckets") or []
+        self.keys = [k for k, _ in entries]
+        self.offsets = [int(o) for _, o in entries]
+
+    def _save(self) -> None:
+        if not self.persist:
+            return
+        payload = {
+            "version": _INDEX_VERSION,
+            "stride": self.stride,
+            "ino": self.ino,
+            "size": self.size,
+            "indexed_to": self.indexed_to,
+            "buckets": [[k, o] for k, o in zip(self.keys, self.offsets)],
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f".{self.index_path.name}.tmp.{os.getpid()}")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+
+    # ---- indexing ----
+
+    def refresh(self) -> "LogIndex":
+        """Sample bytes appended since the last refresh; rebuild after rotation/truncation."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            try:
+                st = os.stat(self.log_path)
+            except OSError:
+                return self
+            if st.st_ino != self.ino or st.st_size < self.size:
+                self.ino, self.indexed_to, self.keys, self.offsets = st.st_ino, 0, [], []
+            self.size = st.st_size
+            if self.indexed_to >= st.st_size:
+                return self
+            with open(self.log_path, "rb") as f:
+                pos = self.indexed_to
+                while pos < st.st_size:
+                    self._sample(f, pos, st.st_size)
+                    pos += self.stride
+            self.indexed_to = pos
+            self._save()
+        return self
+
+    def _sample(self, f, pos: int, size: int) -> None:
+        f.seek(pos)
+        probe = f.read(min(_PROBE, size - pos))
+        start = pos
+        if pos:
+            nl = probe.find(b"\n")
+            if nl < 0:
+                return
+            start, probe = pos + nl + 1, probe[nl + 1:]
+        for line in probe.split(b"\n"):
+            ts = line_ts(line)
+            if ts:
+                minute = ts[:16]
+                if not self.keys or minute != self.keys[-1]:
+                    self.keys.append(minute)
+                    self.offsets.append(start)
+                return
+            start += len(line) + 1
+
+    def offset_for(self, since: Optional[datetime]) -> int:
+        """Line-start offset at or before the first line with timestamp >= since (0 when unknown)."""
+        if since is None or not self.keys:
+            return 0
+        i = bisect.bisect_left(self.keys, since.strftime("%Y-%m-%dT%H:%M"))
+        # Start at the last sample before the window: unsampled lines of the window's first minute
+        # may precede that minute's own sample
+        return self.offsets[i - 1] if i >= 1 else 0
+
+
+def get_index(log_path, stride: int = DEFAULT_STRIDE) -> LogIndex:
+    key = os.path.abspath(str(log_path))
+    with _MEMO_LOCK:
+        idx = _MEMO.get(key)
+        if idx is None or idx.stride != stride:
+            idx = _MEMO[key] = LogIndex(key, stride=stride)
+    return idx.refresh()
+
+
+@dataclass
+class LogPage:
+    lines: List[str] = field(default_factory=list)
+    start_offset: int = 0
+    end_offset: int = 0
+    next_before: Optional[int] = None  # cursor for the next (older) page within the window
+    truncated: bool = False            # the size cap cut the window short
+
+
+def _complete_end(f, start: int, end: int) -> int:
+    """Largest line boundary <= end (drops a trailing line that is still being written)."""
+    if end <= start:
+        return end
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return end
+    lo = max(start, end - _BLOCK)
+    f.seek(lo)
+    nl = f.read(end - lo).rfind(b"\n")
+    return lo + nl + 1 if nl >= 0 else start
+
+
+def _read_backwards(f, start: int, end: int, max_bytes: int) -> Tuple[List[bytes], int]:
+    """
+    Lines of [start, end) (both line boundaries) read newest-first in blocks until ~max_bytes are collected.
+    Returns the lines in file order and the offset of the first one.
+    """
+    lines: List[bytes] = []
+    pos = first = end
+    carry = b""
+    while pos > start and end - first < max_bytes:
+        step = min(_BLOCK, pos - start)
+        pos -= step
+        f.seek(pos)
+        parts = (f.read(step) + carry).split(b"\n")
+        if pos + step == end:
+            parts.pop()  # empty element after the final newline
+        carry = parts.pop(0) if pos > start else b""
+        for line in reversed(parts):
+            lines.append(line)
+            first -= len(line) + 1
+            if end - first >= max_bytes:
+                break
+    lines.reverse()
+    return lines, first
+
+
+def read_window(log_path, since: Optional[datetime] = None, before: Optional[int] = None,
+                max_bytes: int = MAX_RESPONSE_BYTES, index: Optional[LogIndex] = None) -> LogPage:
+    """
+    Newest lines of `log_path` with timestamp >= since (all lines when since is None), ending at the
+    `before` cursor (default: end of file) and holding at most ~max_bytes of log text.
+    """
+    try:
+        size = os.path.getsize(log_path)
+    except OSError:
+        return LogPage()
+    idx = index or get_index(log_path)
+    start = idx.offset_for(since)
+    end = size if before is None else max(0, min(int(before), size))
+    with open(log_path, "rb") as f:
+        end = _complete_end(f, start, end)
+        if start >= end:
+            return LogPage(start_offset=end, end_offset=end)
+        raw, first = _read_backwards(f, start, end, max_bytes)
+    truncated = first > start
+    cutoff = _ts_key(since) if since is not None else None
+    # Lines without a timestamp (tracebacks, wrapped output) follow the entry above them; a page that
+    # starts mid-window, or a log with no timestamps at all, keeps its leading ones
+    keep = truncated or not idx.keys
+    out: List[str] = []
+    for line in raw:
+        if cutoff is not None:
+            ts = line_ts(line)
+            if ts is not None:
+                keep = ts >= cutoff[:len(ts)]
+            if not keep:
+                continue
+        out.append(line.decode("utf-8", errors="replace").rstrip("\r"))
+    return LogPage(lines=out, start_offset=first, end_offset=end,
+                   next_before=first if truncated else None, truncated=truncated)
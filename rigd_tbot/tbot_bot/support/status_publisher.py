@@ -0,0 +1,278 @@
+# tbot_bot/support/status_publisher.py
+# Write-coalescing publisher for status.json plus an optional mmap view for readers.
+# Updates mark the status dirty; at most one write happens per interval, only when the content (ignoring volatile
+# fields such as "timestamp") changed, and always via temp file + os.replace so readers never see a torn file.
+
+"""
+Writer side
+-----------
+    publisher = StatusPublisher(path, snapshot=bot_status.to_dict)
+    publisher.request()    # "status may have changed": publish now if the last write is older than `interval`,
+                           # otherwise a background flusher publishes once when the interval is up
+    publisher.publish()    # snapshot -> compare -> write if changed (or missing, or heartbeat due)
+
+A burst of request() calls within one interval becomes a single write of the latest snapshot. `version` counts
+published content changes. With `heartbeat` > 0 an unchanged status is still rewritten that often so the
+"timestamp" field keeps showing liveness (default 60 s instead of every 2 s).
+
+mmap view
+---------
+Next to the JSON file the publisher keeps `<path>.view`: a fixed-size file holding a 52-byte header and the
+status dict in marshal format. Header (little endian):
+
+    magic "TBSV" | seq u64 | version u64 | length u32 | crc32 u32 | json mtime_ns i64 | json size i64 | json inode u64
+
+The writer bumps seq to odd, writes payload and fields, then bumps seq to even (seqlock); readers retry while seq
+is odd or changed under them and check the crc. The header also carries the stat key of the JSON file it
+mirrors: StatusView.read(json_key=file_key(path)) returns the dict only while status.json is still exactly the
+file this publisher wrote (another process rewriting status.json makes readers fall back to parsing it).
+A payload larger than VIEW_CAPACITY is published with length 0 (readers fall back to JSON).
+Set TBOT_STATUS_VIEW=0 to disable the view.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+STATUS_WRITE_INTERVAL = float(os.environ.get("TBOT_STATUS_WRITE_INTERVAL", "2"))
+STATUS_HEARTBEAT = float(os.environ.get("TBOT_STATUS_HEARTBEAT", "60"))
+STATUS_VIEW_ENABLED = os.environ.get("TBOT_STATUS_VIEW", "1").strip().lower() not in ("0", "false", "no", "off")
+
+VIEW_SUFFIX = ".view"
+VIEW_MAGIC = b"TBSV"
+VIEW_CAPACITY = 64 * 1024
+_HEADER = struct.Struct("<4sQQIIqqQ")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = 4
+
+
+def _file_key(path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def write_json_atomic(path, payload: Any, indent: Optional[int] = 2, sort_keys: bool = False) -> None:
+    """json.dump to a temp file in the same directory, then os.replace (readers see old or new, never partial)."""
+    path = str(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=indent, sort_keys=sort_keys)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _ViewWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self._mm = None
+
+    def _open(self):
+        if self._mm is None:
+            size = _HEADER.size + VIEW_CAPACITY
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size < size:
+                    os.ftruncate(fd, size)
+                self._mm = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            if self._mm[:4] != VIEW_MAGIC:
+                _HEADER.pack_into(self._mm, 0, VIEW_MAGIC, 0, 0, 0, 0, 0, 0, 0)
+        return self._mm
+
+    def write(self, payload: bytes, version: int, json_key: Optional[Tuple[int, int, int]]) -> None:
+        mm = self._open()
+        if len(payload) > VIEW_CAPACITY:
+            payload = b""
+        seq = _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+        seq += 1 if seq % 2 == 0 else 0  # odd: write in progress
+        _SEQ.pack_into(mm, _SEQ_OFFSET, seq)
+        mm[_HEADER.size:_HEADER.size + len(payload)] = payload
+        mtime_ns, size, ino = json_key or (0, 0, 0)
+        _HEADER.pack_into(mm, 0, VIEW_MAGIC, seq, version, len(payload), zlib.crc32(payload), mtime_ns, size, ino)
+        _SEQ.pack_into(mm, _SEQ_OFFSET, seq + 1)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+class StatusView:
+    """Reader for a publisher's mmap view; read() is a header check when nothing changed since the last call."""
+
+    def __init__(self, json_path):
+        self.path = str(json_path) + VIEW_SUFFIX
+        self._mm = None
+        self._seq = None
+        self._version = None
+        self._data: Optional[Dict[str, Any]] = None
+        self._key = None
+
+    def _open(self):
+        if self._mm is None:
+            try:
+                with open(self.path, "rb") as f:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+        return self._mm
+
+    def read(self, json_key=None) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        (version, status dict) from the view, or None when there is no usable view. With json_key (file_key of
+        status.json) the view is used only if it mirrors exactly that file. The dict is shared; treat as read-only.
+        """
+        mm = self._open()
+        if mm is None or len(mm) < _HEADER.size:
+            return None
+        for _ in range(8):
+            magic, seq, version, length, crc, mtime_ns, size, ino = _HEADER.unpack_from(mm, 0)
+            if magic != VIEW_MAGIC:
+                return None
+            if seq % 2:
+                time.sleep(0)
+                continue
+            key = (mtime_ns, size, ino)
+            if seq == self._seq and self._data is not None:
+                data = self._data
+            else:
+                if not length or length > len(mm) - _HEADER.size:
+                    return None
+                payload = mm[_HEADER.size:_HEADER.size + length]
+                if _SEQ.unpack_from(mm, _SEQ_OFFSET)[0] != seq or zlib.crc32(payload) != crc:
+                    continue
+                try:
+                    data = marshal.loads(payload)
+                except (EOFError, ValueError, TypeError):
+                    continue
+                if not isinstance(data, dict):
+                    return None
+                self._seq, self._version, self._data, self._key = seq, version, data, key
+            if json_key is not None and tuple(json_key) != key:
+                return None
+            return version, data
+        return None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+class StatusPublisher:
+    def __init__(self, path, snapshot: Callable[[], Dict[str, Any]], interval: Optional[float] = None,
+                 heartbeat: Optional[float] = None, volatile: Iterable[str] = ("timestamp",), indent: Optional[int] = 2,
+                 view: Optional[bool] = None, on_error: Optional[Callable[[Exception], None]] = None):
+        self.path = str(path)
+        self.snapshot = snapshot
+        self.interval = STATUS_WRITE_INTERVAL if interval is None else float(interval)
+        self.heartbeat = STATUS_HEARTBEAT if heartbeat is None else float(heartbeat)
+        self.volatile = frozenset(volatile)
+        self.indent = indent
+        self.on_error = on_error
+        self._view = _ViewWriter(self.path + VIEW_SUFFIX) if (STATUS_VIEW_ENABLED if view is None else view) else None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = False
+        self._flusher: Optional[threading.Thread] = None
+        self._atexit_registered = False
+        self._last_write = 0.0
+        self._digest: Optional[str] = None
+        self.version = 0
+        self.stats = {"requests": 0, "publishes": 0, "writes": 0, "unchanged": 0, "errors": 0}
+
+    # ---------------- requests / coalescing ----------------
+    def request(self) -> bool:
+        """
+        Status may have changed: publish now if allowed by the interval, else once when the interval is up.
+        True only if this call wrote the file.
+        """
+        with self._cond:
+            self.stats["requests"] += 1
+            due = time.monotonic() - self._last_write >= self.interval
+            if not due or self._pending:
+                self._pending = True
+                self._ensure_flusher()
+                self._cond.notify()
+                return False
+        return self.publish()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._flush_loop, name="status-publisher", daemon=True)
+            self._flusher.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                wait = self._last_write + self.interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            with self._cond:
+                self._pending = False
+            self.publish()
+
+    def flush(self) -> bool:
+        """Publish a pending update immediately (shutdown)."""
+        with self._cond:
+            pending, self._pending = self._pending, False
+        return self.publish() if pending else False
+
+    # ---------------- publishing ----------------
+    def publish(self, force: bool = False) -> bool:
+        """Write the current snapshot if its content changed (or the file is missing / heartbeat due). True if written."""
+        with self._write_lock:
+            self.stats["publishes"] += 1
+            try:
+                status = self.snapshot()
+                stable = {k: v for k, v in status.items() if k not in self.volatile}
+                digest = hashlib.sha1(json.dumps(stable, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+                now = time.monotonic()
+                changed = digest != self._digest
+                if not (force or changed or not os.path.exists(self.path)
+                        or (self.heartbeat > 0 and now - self._last_write >= self.heartbeat)):
+                    self.stats["unchanged"] += 1
+                    return False
+                write_json_atomic(self.path, status, indent=self.indent)
+                if changed:
+                    self.version += 1
+                self._digest = digest
+                self._last_write = now
+                self.stats["writes"] += 1
+                if self._view is not None:
+                    try:
+                        self._view.write(marshal.dumps(status), self.version, _file_key(self.path))
+                    except (OSError, ValueError):
+                        self._view = None
+                return True
+            except Exception as e:
+                self.stats["errors"] += 1
+                if self.on_error:
+                    self.on_error(e)
+                return False
@@ -0,0 +1,99 @@
+# tbot_bot/test/test_archive_store.py
+# Universe archive store: byte-exact restore of every version, chunk dedup + delta storage across near-identical
+# versions, O(1) lookup by version id, range pruning with chunk GC/repack, and the universe_archiver wrappers.
+
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_archive_store launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import archive_store as store_mod
+from tbot_bot.screeners import universe_archiver as ua
+
+
+def _universe(day, n=3000):
+    rows = [{"symbol": f"S{i:05d}", "exchange": "NYSE", "companyName": f"COMPANY {i} INC",
+             "lastClose": 10 + (i * 7 + day * (i % 5 == 0)) % 300, "marketCap": 1e6 + i} for i in range(n)]
+    return json.dumps({"build_timestamp_utc": f"2025-01-{day + 1:02d}T00:00:00Z", "symbols": rows})
+
+
+def test_versions_roundtrip_and_dedupe(tmp_path):
+    store = store_mod.ArchiveStore(tmp_path / "store")
+    src = tmp_path / "symbol_universe.json"
+    ids, bodies = [], []
+    for day in range(6):
+        bodies.append(_universe(day))
+        src.write_text(bodies[-1], encoding="utf-8")
+        ids.append(store.put(src, ts=f"202501{day + 1:02d}T000000Z"))
+    src.write_text(bodies[-1], encoding="utf-8")
+    ids.append(store.put(src, ts="20250106T000000Z", label="manual"))
+
+    assert ids[0] == "symbol_universe.json.20250101T000000Z" and ids[-1].endswith("_manual")
+    assert store.versions("symbol_universe.json") == list(reversed(ids))
+    for vid, body in zip(ids, bodies + [bodies[-1]]):
+        store.restore(vid, tmp_path / "out.json")
+        assert (tmp_path / "out.json").read_text(encoding="utf-8") == body
+
+    stats = store.stats()
+    assert stats["versions"] == 7 and stats["logical_bytes"] == sum(map(len, bodies + [bodies[-1]]))
+    assert stats["pack_bytes"] < len(bodies[0]) // 2  # 7 versions cost well under half of one raw copy
+    assert store.get(ids[3])["size"] == len(bodies[3]) and store.get("nope") is None
+
+    # A fresh instance (another process) sees the same index
+    assert store_mod.ArchiveStore(tmp_path / "store").read(ids[2]) == bodies[2].encode("utf-8")
+
+
+def test_chunks_are_record_aligned_and_complete():
+    data = _universe(0, n=5000).encode("utf-8")
+    chunks = store_mod.split_chunks(data)
+    assert b"".join(chunks) == data and len(chunks) > 5
+    assert all(c.endswith(b", ") for c in chunks[:-1])
+    assert all(len(c) <= store_mod.CHUNK_MAX + 200 for c in chunks)
+    blob = os.urandom(200000)
+    assert b"".join(store_mod.split_chunks(blob)) == blob
+
+
+def test_prune_range_gc_and_repack(tmp_path):
+    store = store_mod.ArchiveStore(tmp_path / "store")
+    src = tmp_path / "symbol_universe.json"
+    ids = []
+    for day in range(8):
+        src.write_text(_universe(day * 3), encoding="utf-8")
+        ids.append(store.put(src, ts=f"202501{day + 1:02d}T000000Z"))
+    before = store.stats()
+
+    removed = store.prune(before="20250105T000000Z", after="20250102T000000Z")
+    assert removed == ids[1:4] and store.versions() == list(reversed([ids[0]] + ids[4:]))
+    removed = store.prune(before="20250201T000000Z", keep_last=2)
+    assert removed == [ids[0]] + ids[4:6]
+    after = store.stats()
+    assert after["chunks"] < before["chunks"] and after["pack_bytes"] < before["pack_bytes"]
+    for day, vid in ((6, ids[6]), (7, ids[7])):
+        assert store.read(vid) == _universe(day * 3).encode("utf-8")
+    packs = os.listdir(tmp_path / "store" / "packs")
+    referenced = {c[0] for c in json.loads((tmp_path / "store" / "index.json").read_text())["chunks"].values()}
+    assert set(packs) == referenced
+
+
+def test_archiver_wrappers(tmp_path, monkeypatch):
+    monkeypatch.setattr(ua, "ARCHIVE_DIR", tmp_path / "archive")
+    legacy = tmp_path / "archive" / "screener_blocklist.txt.20240101T000000Z.bak"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text("OLD|x||\n", encoding="utf-8")
+    src = tmp_path / "screener_blocklist.txt"
+    src.write_text("AAA|manual||\n", encoding="utf-8")
+
+    vid = ua.archive_file(str(src), label="pre")
+    assert ua.list_archives("screener_blocklist.txt") == [vid, str(legacy)]
+    assert ua.latest_archive_for("screener_blocklist.txt") == vid
+    ua.restore_archive(vid, str(tmp_path / "restored.txt"))
+    assert (tmp_path / "restored.txt").read_text(encoding="utf-8") == "AAA|manual||\n"
+    ua.restore_archive(str(legacy), str(tmp_path / "restored.txt"))
+    assert (tmp_path / "restored.txt").read_text(encoding="utf-8") == "OLD|x||\n"
+    with pytest.raises(RuntimeError):
+        ua.restore_archive("missing.20240101T000000Z", str(tmp_path / "x"))
+    assert ua.prune_archives(before=datetime(2100, 1, 1, tzinfo=timezone.utc)) == [vid]
+    assert ua.archive_file(str(tmp_path / "missing.txt")) is None
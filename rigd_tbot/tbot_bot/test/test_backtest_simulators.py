@@ -0,0 +1,82 @@
+# tbot_bot/test/test_backtest_simulators.py
+# Parity of the vectorized open/mid/close simulators against the slow reference loop.
+
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_backtest_simulators launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+import numpy as np
+import pytest
+
+from tbot_bot.backtest.simulators import (
+    STRATEGIES,
+    generate_synthetic_bars,
+    simulate,
+    simulate_reference,
+)
+
+BASE_CONFIG = {
+    "MAX_TRADES": 3,
+    "CANDIDATE_MULTIPLIER": 2,
+    "WEIGHTS": "0.4,0.2,0.2",
+    "STRAT_OPEN_BUFFER": 0.001,
+    "STRAT_MID_VWAP_THRESHOLD": 0.004,
+    "STRAT_CLOSE_VIX_THRESHOLD": 20,
+    "SHORT_TYPE_OPEN": "InverseETF",
+    "SHORT_TYPE_MID": "InverseETF",
+    "SHORT_TYPE_CLOSE": "InverseETF",
+    "BACKTEST_SLIPPAGE_BPS": 5,
+    "BACKTEST_FEE_PER_ORDER": 1.0,
+}
+
+
+def _bars(drop_frac=0.1, with_vix=True):
+    df = generate_synthetic_bars([f"S{i:02d}" for i in range(12)], days=8, seed=3, vol=0.004)
+    if drop_frac:
+        df = df.sample(frac=1 - drop_frac, random_state=1).sort_values("timestamp").reset_index(drop=True)
+    if with_vix:
+        df["vix"] = np.where(df["timestamp"].dt.day % 2 == 0, 25.0, 12.0)
+    return df
+
+
+def _assert_same(fast, slow):
+    assert len(fast) == len(slow)
+    for a, b in zip(fast, slow):
+        assert {k: a[k] for k in a if not isinstance(a[k], float)} == {k: b[k] for k in b if not isinstance(b[k], float)}
+        for k in ("entry_price", "exit_price", "qty", "fees", "PnL"):
+            assert a[k] == pytest.approx(b[k], rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+@pytest.mark.parametrize("trail", [0.005, 0.05])
+def test_vectorized_matches_reference(strategy, trail):
+    df = _bars()
+    cfg = dict(BASE_CONFIG, TRADING_TRAILING_STOP_PCT=trail, FRACTIONAL="false")
+    fast = simulate(strategy, df, cfg)
+    _assert_same(fast, simulate_reference(strategy, df, cfg))
+    assert fast, f"no trades simulated for {strategy}"
+    # Day chunking must not change results
+    assert simulate(strategy, df, cfg, chunk_days=3) == fast
+    # Never more than MAX_TRADES per day
+    days = [t["entry_time"][:10] for t in fast]
+    assert max(days.count(d) for d in set(days)) <= cfg["MAX_TRADES"]
+
+
+def test_shorts_disabled_and_vix_gate():
+    df = _bars(drop_frac=0)
+    cfg = dict(BASE_CONFIG, SHORT_TYPE_OPEN="disabled", SHORT_TYPE_CLOSE="disabled")
+    assert all(t["side"] == "long" for t in simulate("open", df, cfg))
+    gated = simulate("close", df, dict(cfg, STRAT_CLOSE_VIX_THRESHOLD=99))
+    assert gated == []
+    no_vix = df.drop(columns=["vix"])
+    assert simulate("close", no_vix, dict(cfg, STRAT_CLOSE_VIX_THRESHOLD=99, BACKTEST_VIX=10)) == []
+    _assert_same(simulate("close", no_vix, dict(cfg, BACKTEST_VIX=30)),
+                 simulate_reference("close", no_vix, dict(cfg, BACKTEST_VIX=30)))
+
+
+def test_fees_and_slippage_reduce_pnl():
+    df = _bars(drop_frac=0, with_vix=False)
+    free = simulate("mid", df, dict(BASE_CONFIG, BACKTEST_SLIPPAGE_BPS=0, BACKTEST_FEE_PER_ORDER=0))
+    costly = simulate("mid", df, dict(BASE_CONFIG, BACKTEST_SLIPPAGE_BPS=10, BACKTEST_FEE_PER_ORDER=1))
+    assert len(free) == len(costly) > 0
+    assert sum(t["PnL"] for t in costly) < sum(t["PnL"] for t in free)
@@ -0,0 +1,130 @@
+# tbot_bot/test/test_blocklist_store.py
+# Blocklist store: in-memory membership with bulk checks, tail reads of appends from other writers, tombstoned
+# removals, threshold compaction (atomic rewrite picked up by other processes), same-day traded-ticker cache.
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_blocklist_store launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import blocklist_manager as bm
+from tbot_bot.enhancements import ticker_blocklist as tb
+
+
+@pytest.fixture
+def blocklist(tmp_path, monkeypatch):
+    path = str(tmp_path / "screener_blocklist.txt")
+    monkeypatch.setattr(bm, "BLOCKLIST_PATH", path)
+    monkeypatch.setattr(bm, "BLOCKLIST_LOG_PATH", str(tmp_path / "blocklist_ops.log"))
+    monkeypatch.setattr(bm, "_STORES", {})
+    return path
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [l.rstrip("\n") for l in f]
+
+
+def test_add_remove_and_bulk_membership(blocklist):
+    with open(blocklist, "w", encoding="utf-8") as f:
+        f.write("# header\nmsft|manual|2025-01-01T00:00:00Z|ui\n")
+    bm.add_to_blocklist(["aapl", " tsla "], reason="PRICE_BELOW_MIN", provider="finnhub")
+    bm.add_to_blocklist("NVDA")
+    assert bm.is_blocked("aapl") and bm.is_blocked("MSFT") and not bm.is_blocked("GOOG")
+    assert bm.is_blocked_many(["AAPL", "goog", "tsla", "", "NVDA"]) == {"AAPL", "tsla", "NVDA"}
+    assert bm.get_blocklist_count() == 4
+
+    bm.remove_from_blocklist(["AAPL", "GOOG"], reason="manual")
+    assert not bm.is_blocked("AAPL") and bm.get_blocklist_count() == 3
+    assert _lines(blocklist)[-1].startswith("-AAPL|manual|")  # tombstone, no rewrite; GOOG was not live
+    assert [e["symbol"] for e in bm.get_blocklist_entries()] == ["msft", "TSLA", "NVDA"]
+    assert bm.load_blocklist() == {"MSFT", "TSLA", "NVDA"}
+
+    bm.add_to_blocklist("AAPL", reason="again")
+    assert bm.is_blocked("AAPL")
+
+
+def test_other_writers_seen_via_tail_and_reload(blocklist):
+    store = bm.get_blocklist_store()
+    store.add(["AAA", "BBB"])
+    other = bm.BlocklistStore(blocklist)  # stands in for another process
+    assert "AAA" in other
+
+    # Plain appends (including a line still being written) are read from the previous offset
+    with open(blocklist, "a", encoding="utf-8") as f:
+        f.write("CCC|x|t|p\n-AAA|r|t|\nDDD|partial")
+    assert other.symbols() == {"BBB", "CCC", "DDD"}
+    with open(blocklist, "a", encoding="utf-8") as f:
+        f.write("|t|p\n")
+    assert other.symbols() == {"BBB", "CCC", "DDD"} and other.dead_lines == 2
+
+    # Compaction replaces the file (new inode): the other store reloads in full
+    store.compact()
+    assert not any(l.startswith("-") for l in _lines(blocklist))
+    assert len(_lines(blocklist)) == 3 and other.symbols() == {"BBB", "CCC", "DDD"} and other.dead_lines == 0
+
+
+def test_partial_trailing_line_is_never_committed(blocklist):
+    with open(blocklist, "w", encoding="utf-8") as f:
+        f.write("AAPL|r|t|p\nGO|r|t|p\nMSF")
+    store = bm.BlocklistStore(blocklist)
+    assert store.symbols() == {"AAPL", "GO", "MSF"}  # partial addition shown provisionally
+    with open(blocklist, "a", encoding="utf-8") as f:
+        f.write("T|r|t|p\n-GO")
+    assert store.symbols() == {"AAPL", "GO", "MSFT"}  # half-written tombstone does not pop GO
+    with open(blocklist, "a", encoding="utf-8") as f:
+        f.write("OG|r|t|\n")
+    assert store.symbols() == {"AAPL", "GO", "MSFT"} and store.dead_lines == 1
+
+
+def test_compaction_threshold(blocklist, monkeypatch):
+    monkeypatch.setattr(bm, "COMPACT_MIN_DEAD", 10)
+    monkeypatch.setattr(bm, "COMPACT_DEAD_RATIO", 0.5)
+    syms = [f"S{i:03d}" for i in range(30)]
+    bm.add_to_blocklist(syms)
+    bm.remove_from_blocklist(syms[:4])
+    assert len(_lines(blocklist)) == 34  # 8 dead lines (4 entries + 4 tombstones): below the floor
+    bm.remove_from_blocklist(syms[4:7])
+    assert len(_lines(blocklist)) == 23 and not any(l.startswith("-") for l in _lines(blocklist))
+    assert bm.load_blocklist() == set(syms[7:])
+    bm.clear_blocklist()
+    assert bm.get_blocklist_count() == 0 and os.path.getsize(blocklist) == 0
+
+
+def _churn(path, worker, n):
+    # Each add is followed by a remove of the previous symbol: constant compaction pressure
+    bm.COMPACT_MIN_DEAD, bm.COMPACT_DEAD_RATIO = 4, 0.0
+    store = bm.BlocklistStore(path)
+    for i in range(n):
+        store.add(f"W{worker}S{i:03d}")
+        if i:
+            store.remove(f"W{worker}S{i - 1:03d}")
+        store.add(f"W{worker}K{i:03d}")
+
+
+def test_concurrent_compaction_keeps_other_process_appends(blocklist):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_churn, args=(blocklist, w, 40)) for w in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+    expected = {f"W{w}K{i:03d}" for w in range(3) for i in range(40)} | {f"W{w}S039" for w in range(3)}
+    assert bm.BlocklistStore(blocklist).symbols() == expected
+    assert not [f for f in os.listdir(os.path.dirname(blocklist)) if ".tmp" in f]
+
+
+def test_traded_today_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(tb, "BLOCKLIST_FILE", str(tmp_path / "ticker_blocklist.json"))
+    monkeypatch.setattr(tb, "_CACHE", {"key": None, "tickers": frozenset()})
+    assert not tb.is_ticker_blocked("AAPL")
+    tb.save_blocklist("aapl")
+    tb.save_blocklist("MSFT")
+    assert tb.is_ticker_blocked("AAPL") and tb.blocked_tickers(["aapl", "SPY", "MSFT"]) == {"aapl", "MSFT"}
+    cached = tb._CACHE["tickers"]
+    assert tb.load_blocklist() == {"AAPL", "MSFT"} and tb._CACHE["tickers"] is cached
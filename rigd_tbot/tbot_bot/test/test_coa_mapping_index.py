@@ -0,0 +1,89 @@
+# tbot_bot/test/test_coa_mapping_index.py
+# Compiled COA mapping index: same rule as the linear resolver for random tables/transactions (wildcards, first
+# match wins, legacy before rule_key), re-indexed after save_mapping_table, on-disk table re-read only on change.
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_coa_mapping_index launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.accounting import coa_mapping_table as cm
+
+TYPES = ["dividend", "DIV", "interest", "fee", "commission", "deposit", "transfer_out", "buy", "SPLIT"]
+BROKERS = [None, "ALPACA", "IBKR"]
+SUBTYPES = [None, "cash", "stock"]
+DESCS = [None, "Q1", "Q2"]
+
+
+def _table(rng, n_mappings, n_rules):
+    mappings = [{"broker": rng.choice(BROKERS), "type": rng.choice(TYPES), "subtype": rng.choice(SUBTYPES),
+                 "description": rng.choice(DESCS), "debit_account": f"D{i}", "credit_account": f"C{i}"}
+                for i in range(n_mappings)]
+    rules = [{"rule_key": cm._derive_rule_key_from_context({"broker": rng.choice(BROKERS[1:]), "type": "other",
+                                                             "symbol": f"S{rng.randint(0, 9)}"}),
+              "account_code": f"R{i}"} for i in range(n_rules)]
+    return {"mappings": mappings, "rules": rules, "version": 3, "entity_code": "E", "jurisdiction_code": "US",
+            "broker_code": "ALPACA"}
+
+
+def _txn(rng):
+    return {"action": rng.choice(TYPES + ["other"]), "broker": rng.choice(BROKERS), "subtype": rng.choice(SUBTYPES),
+            "description": rng.choice(DESCS), "symbol": f"S{rng.randint(0, 9)}"}
+
+
+def _scan(txn, table):
+    txn_type = cm._normalize_type(txn.get("type") or txn.get("txn_type") or txn.get("action"))
+    txn_broker = (txn.get("broker") or txn.get("broker_code") or "").strip() or None
+    return cm._scan_mapping_for_transaction(txn, table, txn_type, txn_broker)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_index_matches_linear_resolver(seed):
+    rng = random.Random(seed)
+    table = _table(rng, 60, 30)
+    hits = 0
+    for _ in range(2000):
+        txn = _txn(rng)
+        got = cm.get_mapping_for_transaction(txn, table)
+        assert got == _scan(txn, table)
+        hits += got is not None
+    assert hits
+
+
+def test_reindexed_when_table_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cm, "_get_mapping_path", lambda *a: tmp_path / "coa_mapping_table.json")
+    table = _table(random.Random(0), 0, 0)
+    table["mappings"] = [{"broker": None, "type": "FEE", "subtype": None, "description": None,
+                          "debit_account": "Expenses:Old", "credit_account": "Assets:Brokerage:Cash"}]
+    txn = {"action": "fee", "broker": "ALPACA"}
+    assert cm.get_mapping_for_transaction(txn, table)["debit_account"] == "Expenses:Old"
+
+    # A more specific rule ahead of the wildcard one takes over once saved
+    table["mappings"].insert(0, {"broker": "ALPACA", "type": "fee", "subtype": None, "description": None,
+                                 "debit_account": "Expenses:Alpaca", "credit_account": "Assets:Brokerage:Cash"})
+    cm.save_mapping_table(table)
+    assert cm.get_mapping_for_transaction(txn, table)["debit_account"] == "Expenses:Alpaca"
+    # Unhashable match fields fall back to the scan
+    table["mappings"].append({"broker": None, "type": "FEE", "subtype": ["x"], "description": None})
+    assert cm.get_mapping_for_transaction(txn, table)["debit_account"] == "Expenses:Alpaca"
+
+
+def test_on_disk_table_read_once_until_saved(tmp_path, monkeypatch):
+    monkeypatch.setattr(cm, "_get_mapping_path", lambda *a: tmp_path / "coa_mapping_table.json")
+    monkeypatch.setattr(cm, "_LOADED_TABLE", (None, None, None))
+    cm.save_mapping_table(dict(_table(random.Random(0), 0, 0), mappings=[
+        {"broker": None, "type": "DIVIDEND", "debit_account": "Assets:Brokerage:Cash", "credit_account": "Income:A"}]))
+    loads = []
+    real = cm.load_mapping_table
+    monkeypatch.setattr(cm, "load_mapping_table", lambda *a: (loads.append(1), real(*a))[1])
+    for _ in range(50):
+        debit, credit = cm.apply_mapping_rule({"action": "div", "total_value": 5, "symbol": "SPY"})
+    assert credit["account"] == "Income:A" and len(loads) == 1
+
+    table = real()
+    table["mappings"][0]["credit_account"] = "Income:B"
+    cm.save_mapping_table(table)
+    assert cm.apply_mapping_rule({"action": "div", "total_value": 5})[1]["account"] == "Income:B"
+    assert len(loads) == 2
@@ -0,0 +1,130 @@
+# tbot_bot/test/test_event_stream.py
+# SSE hub: incremental log tailing, state/status/log fan-out, per-client backpressure and connection cap.
+
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+print(f"[LAUNCH] test_event_stream launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_web.py import status_web as sw
+from tbot_web.support.event_stream import EventHub, LogTail, Subscriber, status_delta
+
+
+def test_log_tail_reads_only_complete_new_lines(tmp_path):
+    log = tmp_path / "open.log"
+    log.write_text("old 1\nold 2\n")
+    tail = LogTail(str(log))
+    assert tail.read_new() == []
+    with open(log, "a") as f:
+        f.write("new 1\nnew ")
+    assert tail.read_new() == ["new 1"]
+    with open(log, "a") as f:
+        f.write("2\n")
+    assert tail.read_new() == ["new 2"]
+    log.write_text("rotated\n")  # truncation restarts from the top
+    assert tail.read_new() == ["rotated"]
+
+
+def test_subscriber_backpressure_merges_status_and_bounds_lines():
+    sub = Subscriber(log_path="/x/open.log", max_lines=3)
+    sub.push_status({"trade_count": 1, "pnl": 5})
+    sub.push_status({"trade_count": 2})
+    sub.push_lines([f"line {i}" for i in range(10)])
+    events = dict(sub.drain(0))
+    assert events["status"] == {"trade_count": 2, "pnl": 5}
+    assert events["dropped"] == {"lines": 7}
+    assert events["log"] == {"file": "open.log", "lines": ["line 7", "line 8", "line 9"]}
+    assert sub.drain(0) == []
+
+
+def test_status_delta_ignores_volatile_fields():
+    prev = {"state": "running", "timestamp_utc": "a", "gone": 1}
+    cur = {"state": "trading", "timestamp_utc": "b"}
+    assert status_delta(prev, cur) == {"state": "trading", "gone": None}
+
+
+class _NoThread:
+    def is_alive(self):
+        return True
+
+
+def _hub(tmp_path, src, max_clients=5):
+    hub = EventHub(state_reader=lambda: src["state"], state_path=lambda: str(tmp_path / "bot_state.txt"),
+                   status_provider=lambda: dict(src["status"]), max_clients=max_clients, scan_interval=60)
+    hub._thread = _NoThread()  # no watcher thread: tests drive scan() by hand
+    return hub
+
+
+def test_hub_scan_fans_out_changes(tmp_path):
+    log = tmp_path / "mid.log"
+    log.write_text("")
+    src = {"state": "running", "status": {"trade_count": 0, "timestamp_utc": "t0"}}
+    hub = _hub(tmp_path, src)
+    tailing = hub.subscribe(str(log), "mid.log")
+    plain = hub.subscribe()
+    hub.scan()
+    assert tailing.drain(0) == [] and plain.drain(0) == []
+
+    src["state"] = "trading"
+    src["status"] = {"trade_count": 1, "timestamp_utc": "t1"}
+    log.write_text("filled AAPL\n")
+    hub.scan()
+    events = dict(tailing.drain(0))
+    assert events["state"]["from"] == "running" and events["state"]["to"] == "trading"
+    assert events["status"] == {"trade_count": 1}
+    assert events["log"]["lines"] == ["filled AAPL"]
+    assert "log" not in dict(plain.drain(0))
+
+    hub.unsubscribe(tailing)
+    assert hub.client_count() == 1 and str(log) not in hub._tails
+
+
+def test_idle_hub_forgets_last_state(tmp_path):
+    src = {"state": "running", "status": {"trade_count": 1}}
+    hub = _hub(tmp_path, src)
+    sub = hub.subscribe()
+    hub.scan()
+    hub.unsubscribe(sub)
+    hub._run()  # watcher exits with no subscribers
+    assert hub._thread is None
+
+    src["state"], src["status"] = "idle", {"trade_count": 2}
+    assert hub.snapshot() == ("idle", {"trade_count": 2})
+    hub._thread = _NoThread()
+    sub = hub.subscribe()
+    hub.scan()
+    assert sub.drain(0) == []  # no transition relative to the pre-idle state
+
+
+def test_connection_cap(tmp_path):
+    hub = _hub(tmp_path, {"state": "idle", "status": {}}, max_clients=2)
+    assert hub.subscribe() and hub.subscribe()
+    assert hub.subscribe() is None and hub.rejected == 1
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    hub = _hub(tmp_path, {"state": "running", "status": {"trade_count": 3}}, max_clients=1)
+    monkeypatch.setattr(sw, "_EVENT_HUB", hub)
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(sw.status_blueprint, url_prefix="/status")
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s["authenticated"] = True
+    return c, hub
+
+
+def test_stream_route_sends_snapshot_and_caps(client):
+    c, hub = client
+    resp = c.get("/status/stream", buffered=False)
+    assert resp.status_code == 200 and resp.mimetype == "text/event-stream"
+    body = iter(resp.response)
+    assert next(body).startswith(b"retry:")
+    assert next(body).startswith(b'event: state\ndata: {"from":null,"to":"running"')
+    assert next(body) == b'event: status\ndata: {"trade_count":3}\n\n'
+    assert c.get("/status/stream").status_code == 503
+    resp.close()
+    assert hub.client_count() == 0
@@ -0,0 +1,147 @@
+# tbot_bot/test/test_group_summary.py
+# trade_group_summary: triggers keep one row per group in step with inserts/edits/deletes, the representative
+# matches collapse_group(), install on an existing ledger backfills, verify/rebuild catch and repair drift.
+
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+print(f"[LAUNCH] test_group_summary launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.accounting.ledger_modules import ledger_group_summary as lgs
+from tbot_bot.accounting.ledger_modules import ledger_grouping as lg
+
+SCHEMA = Path(__file__).resolve().parents[1] / "accounting" / "tbot_ledger_schema.sql"
+COLS = ("datetime_utc", "symbol", "action", "quantity", "price", "total_value", "amount", "side", "fee",
+        "broker_code", "account", "trade_id", "group_id", "status", "jurisdiction_code", "entity_code")
+
+
+def _legs(g, ts, sym, qty, px, fee):
+    common = (sym, "long", qty, px, qty * px)
+    return [
+        (ts,) + common + (qty * px, "credit", 0.0, "ALPACA", "Cash", f"T{g}", f"G{g}", "ok", "US", "E"),
+        (ts,) + common + (-qty * px, "debit", fee, "ALPACA", "Equity", f"T{g}", f"G{g}", "ok", "US", "E"),
+    ]
+
+
+def _connect(db):
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    return conn
+
+
+def _insert(conn, rows):
+    conn.executemany(f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})", rows)
+    conn.commit()
+
+
+def _seed(db, groups):
+    rng = random.Random(5)
+    t0 = datetime(2025, 6, 2, 14, 30)
+    rows = []
+    for g in range(groups):
+        ts = (t0 + timedelta(minutes=rng.randint(0, 900))).strftime("%Y-%m-%dT%H:%M:%SZ")
+        rows += _legs(g, ts, rng.choice(["AAPL", "MSFT", "SPY"]), rng.randint(1, 9), rng.choice([10.0, 25.5]),
+                      rng.choice([0.0, 0.35, None]))
+    with _connect(db) as conn:
+        _insert(conn, rows)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    db = str(tmp_path / "ledger.db")
+    with sqlite3.connect(db) as conn:
+        conn.executescript(SCHEMA.read_text())
+    lgs._ENSURED.discard(db)
+    return db
+
+
+def _summary(db, gid):
+    with sqlite3.connect(db) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute(f"SELECT * FROM {lgs.SUMMARY_TABLE} WHERE group_id = ?", (gid,)).fetchone()
+    return dict(row) if row else None
+
+
+def test_install_on_existing_ledger_backfills(ledger):
+    _seed(ledger, 40)  # written before the triggers exist
+    lgs.ensure_group_summary(ledger)
+    report = lgs.verify_group_summaries(ledger)
+    assert report["ok"] and report["groups"] == 40
+
+
+def test_outdated_triggers_are_replaced_and_summaries_rebuilt(ledger):
+    _seed(ledger, 5)
+    with _connect(ledger) as conn:
+        conn.executescript(lgs._TABLE_SQL)
+        for name in lgs._TRIGGER_NAMES:  # an older trigger body that summarises nothing
+            conn.execute(f"CREATE TRIGGER {name} AFTER INSERT ON trades BEGIN SELECT 1; END")
+    lgs.ensure_group_summary(ledger)
+    assert lgs.verify_group_summaries(ledger)["ok"]
+    with _connect(ledger) as conn:
+        _insert(conn, _legs(99, "2025-06-03T10:00:00Z", "SPY", 1, 10.0, 0.0))
+    assert _summary(ledger, "G99")["leg_count"] == 2
+
+
+def test_triggers_track_inserts_edits_and_deletes(ledger):
+    lgs.ensure_group_summary(ledger)
+    _seed(ledger, 25)
+    with _connect(ledger) as conn:
+        conn.row_factory = sqlite3.Row
+        legs = [dict(r) for r in conn.execute("SELECT * FROM trades WHERE group_id = 'G3' ORDER BY id")]
+        s = _summary(ledger, "G3")
+        rep = lg.collapse_group(legs)
+        assert s["rep_id"] == rep["id"] and s["leg_count"] == 2
+        assert (s["symbol"], s["quantity"], s["total_value"]) == (rep["symbol"], rep["quantity"], rep["total_value"])
+
+        # Fee edit on the representative leg, then an earlier debit leg takes over as representative
+        conn.execute("UPDATE trades SET fee = 1.25, status = 'mismatch' WHERE id = ?", (rep["id"],))
+        _insert(conn, [("2025-06-01T09:00:00Z", "AAPL", "long", 2, 5.0, 10.0, -10.0, "debit", 0.5, "ALPACA",
+                        "Equity", "T3b", "G3", "ok", "US", "E")])
+        s = _summary(ledger, "G3")
+        assert s["leg_count"] == 3 and s["fee_total"] == 1.75 and s["first_datetime_utc"] == "2025-06-01T09:00:00Z"
+        assert s["symbol"] == "AAPL" and s["quantity"] == 2
+
+        # Moving every leg of G4 into G5 removes G4 and grows G5
+        conn.execute("UPDATE trades SET group_id = 'G5' WHERE group_id = 'G4'")
+        conn.execute("DELETE FROM trades WHERE group_id = 'G6'")
+        conn.commit()
+    assert _summary(ledger, "G4") is None and _summary(ledger, "G6") is None
+    assert _summary(ledger, "G5")["leg_count"] == 4
+    assert lgs.verify_group_summaries(ledger)["ok"]
+
+
+def test_verify_reports_drift_and_rebuild_repairs(ledger):
+    _seed(ledger, 30)
+    lgs.ensure_group_summary(ledger)
+    with _connect(ledger) as conn:
+        conn.execute(f"UPDATE {lgs.SUMMARY_TABLE} SET total_value = -1 WHERE group_id = 'G1'")
+        conn.execute(f"DELETE FROM {lgs.SUMMARY_TABLE} WHERE group_id = 'G2'")
+        conn.execute(f"INSERT INTO {lgs.SUMMARY_TABLE} (group_id, rep_id, leg_count) VALUES ('GX', 0, 1)")
+        conn.commit()
+    report = lgs.verify_group_summaries(ledger)
+    assert not report["ok"]
+    assert (report["stale"], report["missing"], report["orphaned"]) == (["G1"], ["G2"], ["GX"])
+    assert lgs.rebuild_group_summaries(ledger) == 30
+    assert lgs.verify_group_summaries(ledger)["ok"]
+
+
+def test_totals_match_python_aggregation(ledger):
+    _seed(ledger, 60)
+    rows = lgs.fetch_group_summaries(ledger)
+    assert len(rows) == 60
+    assert [r["last_datetime_utc"] for r in rows] == sorted((r["last_datetime_utc"] for r in rows), reverse=True)
+    expected = {}
+    for r in rows:
+        t = expected.setdefault(r["symbol"], {"quantity": 0, "total_value": 0, "fee": 0})
+        t["quantity"] += r["quantity"] or 0
+        t["total_value"] += r["total_value"] or 0
+        t["fee"] += r["fee"] or 0
+    totals = lgs.summary_totals_by_symbol(ledger)
+    for sym, t in expected.items():
+        assert totals[sym]["quantity"] == pytest.approx(t["quantity"])
+        assert totals[sym]["total_value"] == pytest.approx(t["total_value"])
+        assert totals[sym]["fee"] == pytest.approx(t["fee"])
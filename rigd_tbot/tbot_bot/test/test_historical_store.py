@@ -0,0 +1,87 @@
+# tbot_bot/test/test_historical_store.py
+# Columnar historical-data cache: parity with the CSV path, pushdown filters and staleness detection.
+
+import os
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_historical_store launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from tbot_bot.backtest import historical_store
+from tbot_bot.backtest.load_historical_data import load_data
+from tbot_bot.backtest.simulators import generate_synthetic_bars
+
+
+@pytest.fixture
+def bars_csv(tmp_path, monkeypatch):
+    monkeypatch.setenv("TBOT_HISTORICAL_CACHE_DIR", str(tmp_path / "cache"))
+    df = generate_synthetic_bars(["AAA", "BBB", "123"], days=30, start="2023-01-25", session_minutes=30)
+    path = tmp_path / "bars.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def _norm(df):
+    df = df.copy()
+    df["symbol"] = df["symbol"].astype(str)
+    return df.sort_values(["timestamp", "symbol"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("fmt", historical_store.FORMATS)
+def test_cached_load_matches_csv_and_pushes_down_filters(bars_csv, fmt):
+    csv_df = _norm(load_data(bars_csv, use_cache=False))
+    cached = historical_store.load_bars(bars_csv, fmt=fmt)
+    assert str(cached["timestamp"].dt.tz) == "UTC"
+    pd.testing.assert_frame_equal(_norm(cached)[csv_df.columns], csv_df, check_dtype=False)
+
+    sub = historical_store.load_bars(bars_csv, start="2023-02-01", end="2023-02-10", symbols=["123"],
+                                     columns=["symbol", "close"], fmt=fmt)
+    assert list(sub.columns) == ["timestamp", "symbol", "close"]
+    assert set(sub["symbol"].astype(str)) == {"123"}
+    assert sub["timestamp"].min() >= pd.Timestamp("2023-02-01", tz="UTC")
+    assert sub["timestamp"].max() <= pd.Timestamp("2023-02-10", tz="UTC")
+    expected = csv_df[(csv_df["symbol"] == "123") & (csv_df["timestamp"] >= "2023-02-01")
+                      & (csv_df["timestamp"] <= "2023-02-10")]
+    assert sub["close"].tolist() == pytest.approx(expected["close"].tolist(), rel=1e-12)
+
+
+def test_manifest_detects_stale_and_touched_sources(bars_csv):
+    store = historical_store.ensure_store(bars_csv)
+    built = historical_store.read_manifest(store)["converted_at"]
+
+    # Touch without changing content: no reconversion
+    st = os.stat(bars_csv)
+    os.utime(bars_csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert historical_store.is_fresh(bars_csv, store)
+    assert historical_store.ensure_store(bars_csv) == store
+    assert historical_store.read_manifest(store)["converted_at"] == built
+
+    # Changed content: stale, reconverted on next load
+    with open(bars_csv, "a", encoding="utf-8") as f:
+        f.write("2023-03-31 14:30:00+00:00,ZZZ,1,2,0.5,1.5,100\n")
+    assert not historical_store.is_fresh(bars_csv, store)
+    df = load_data(bars_csv)
+    assert "ZZZ" in set(df["symbol"].astype(str))
+
+
+@pytest.mark.parametrize("fmt", historical_store.FORMATS)
+def test_blank_optional_and_invalid_numeric_cells_match_csv_path(tmp_path, monkeypatch, fmt):
+    monkeypatch.setenv("TBOT_HISTORICAL_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "dirty.csv"
+    path.write_text(
+        "timestamp,symbol,open,high,low,close,volume,vix\n"
+        "2024-01-02T14:30:00Z,AAA,10,11,9,10.5,100,\n"         # blank optional column: kept
+        "2024-01-02T14:31:00Z,AAA,10,11,9,abc,100,18.5\n"      # invalid required cell: row dropped
+        "2024-01-02T14:32:00Z,AAA, 10 ,11,9,NaN,100,18.5\n"    # NaN required cell: row dropped
+        "2024-01-02T14:33:00Z,AAA,1e1,+11,9,10.25,200,19\n",
+        encoding="utf-8",
+    )
+    csv_df = _norm(load_data(str(path), use_cache=False))
+    cached = _norm(historical_store.load_bars(str(path), fmt=fmt))
+    assert len(csv_df) == 2
+    pd.testing.assert_frame_equal(cached[csv_df.columns], csv_df, check_dtype=False)
+
@@ -0,0 +1,161 @@
+# tbot_bot/test/test_holdings_engine.py
+# Change-driven holdings engine: skip unchanged snapshots, re-decide on cash/position/target changes,
+# adaptive poll interval and request metrics.
+
+import json
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_holdings_engine launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.trading import holdings_engine as he
+from tbot_bot.trading.holdings_engine import HoldingsEngine, HoldingsSnapshot, fetch_snapshot
+
+
+class StubBroker:
+    def __init__(self):
+        self.account_value = 100000.0
+        self.cash = 10000.0
+        self.holdings = {"SCHD": 45000.0, "SCHY": 45000.0}
+        self.requests = 0
+
+    def get_account_snapshot(self):
+        self.requests += 2
+        return {"account_value": self.account_value, "cash": self.cash,
+                "etf_holdings": dict(self.holdings), "requests": 2}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, s):
+        self.now += s
+
+
+def _engine(broker, decisions, targets, orders=0):
+    clock = Clock()
+
+    def decide(snap):
+        decisions.append(snap)
+        return orders
+
+    eng = HoldingsEngine(lambda: broker, decide, targets_loader=lambda: dict(targets), base_interval=60,
+                         fast_interval=10, max_interval=300, change_tol=1.0, drift_pct=0.5,
+                         clock=clock, sleep=clock.sleep)
+    return eng, clock
+
+
+def test_unchanged_snapshots_skip_decision_and_back_off():
+    broker, decisions, targets = StubBroker(), [], {"etf": "SCHD:50,SCHY:50"}
+    eng, _ = _engine(broker, decisions, targets)
+    assert eng.poll() is True and eng.last_changes == ["initial"]
+    intervals = []
+    for _ in range(5):
+        broker.holdings["SCHD"] += 20.0  # intraday drift below 0.5%
+        assert eng.poll() is False
+        intervals.append(eng.interval)
+    assert len(decisions) == 1
+    assert intervals == [120, 240, 300, 300, 300]
+
+    # Drift accumulates against the last decision's snapshot
+    broker.holdings["SCHD"] += 150.0
+    assert eng.poll() is True and eng.last_changes == ["position:SCHD"]
+    assert eng.interval == 60
+
+
+def test_cash_and_target_changes_trigger_decision():
+    broker, decisions, targets = StubBroker(), [], {"etf": "SCHD:50,SCHY:50"}
+    eng, _ = _engine(broker, decisions, targets)
+    eng.poll()
+    broker.cash += 5.0
+    assert eng.poll() is True and eng.last_changes == ["cash"]
+    targets["etf"] = "SCHD:60,SCHY:40"
+    assert eng.poll() is True and eng.last_changes == ["targets"]
+    broker.holdings["VTI"] = 10.0
+    assert eng.poll() is True and "position:VTI" in eng.last_changes
+    assert len(decisions) == 4
+
+
+def test_orders_wait_for_fills_to_settle_before_deciding_again():
+    broker, decisions = StubBroker(), []
+    eng, clock = _engine(broker, decisions, {}, orders=2)
+    assert eng.poll() is True
+    assert eng.interval == 10 and eng.last_snapshot is decisions[0]
+    clock.sleep(10)
+    assert eng.poll() is False  # orders pending: account unchanged, no duplicate orders
+    broker.cash -= 500.0
+    broker.holdings["SCHD"] += 250.0
+    clock.sleep(10)
+    assert eng.poll() is False  # first fill seen, may still be partial
+    broker.holdings["SCHY"] += 250.0
+    clock.sleep(10)
+    assert eng.poll() is False
+    clock.sleep(10)
+    assert eng.poll() is True and len(decisions) == 2  # two equal post-fill snapshots: settled
+    assert decisions[1].holdings["SCHY"] == 45250.0
+    assert eng.metrics()["orders"] == 4
+
+
+def test_unfilled_orders_redecide_after_settle_delay():
+    broker, decisions = StubBroker(), []
+    eng, clock = _engine(broker, decisions, {}, orders=1)
+    eng.poll()
+    for _ in range(5):
+        clock.sleep(10)
+        assert eng.poll() is False
+    clock.sleep(10)
+    assert eng.poll() is True and eng.last_changes == ["settled"]
+
+
+def test_not_ready_skips_broker():
+    broker, decisions = StubBroker(), []
+    eng, _ = _engine(broker, decisions, {})
+    eng.ready = lambda: False
+    assert eng.poll() is False
+    assert broker.requests == 0 and eng.metrics()["polls"] == 0
+
+
+def test_run_metrics_and_save(tmp_path):
+    broker, decisions = StubBroker(), []
+    eng, clock = _engine(broker, decisions, {})
+    stops = iter([False] * 9 + [True])
+    errors = []
+    eng.run(should_stop=lambda: next(stops), on_poll=lambda e, err: errors.append(err))
+    m = eng.metrics()
+    assert m["polls"] == 10 and m["decisions"] == 1 and m["skipped"] == 9
+    assert m["broker_requests"] == broker.requests == 20
+    assert m["requests_per_hour"] == round(20 / (clock.now / 3600.0), 2)
+    assert m["decision_latency_s"]["count"] == 1
+    assert errors == [None] * 10
+    out = tmp_path / "metrics.json"
+    eng.save_metrics(str(out))
+    assert json.loads(out.read_text())["polls"] == 10
+
+
+def test_decision_latencies_are_capped(monkeypatch):
+    monkeypatch.setattr(he, "LATENCY_WINDOW", 5)
+    broker, decisions = StubBroker(), []
+    eng, _ = _engine(broker, decisions, {})
+    for _ in range(12):
+        broker.cash += 5.0
+        assert eng.poll() is True
+    m = eng.metrics()
+    assert m["decisions"] == 12 and m["decision_latency_s"]["count"] == 5
+
+
+def test_fetch_snapshot_legacy_getters():
+    class Legacy:
+        def get_account_value(self):
+            return 1000
+
+        def get_cash_balance(self):
+            return "100.5"
+
+        def get_etf_holdings(self):
+            return {"SCHD": 900}
+
+    snap = fetch_snapshot(Legacy(), clock=lambda: 7.0)
+    assert snap == HoldingsSnapshot(1000.0, 100.5, {"SCHD": 900.0}, 3, 7.0)
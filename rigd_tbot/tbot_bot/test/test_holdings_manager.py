@@ -91,6 +91,26 @@ def test_perform_rebalance_cycle(mock_broker_func, mock_secrets):
     holdings_manager.perform_rebalance_cycle(user="test")
     # No direct broker, so just check that function runs without error
 
+def test_unset_broker_is_not_ready(monkeypatch):
+    def no_broker():
+        raise RuntimeError("[broker_api] Unknown or unset BROKER_CODE: ")
+
+    monkeypatch.setattr(holdings_manager, "_is_bot_initialized", lambda: True)
+    monkeypatch.setattr(holdings_manager, "get_active_broker", no_broker)
+    monkeypatch.setattr(holdings_manager, "_BROKER_VERIFIED", False)
+    assert holdings_manager._is_holdings_ready() is False
+
+    broker = MockBroker()
+    probes = []
+    monkeypatch.setattr(broker, "get_account_value", lambda: probes.append(1) or 100000)
+    monkeypatch.setattr(holdings_manager, "get_active_broker", lambda: broker)
+    assert holdings_manager._is_holdings_ready() is True
+    assert holdings_manager._is_holdings_ready() is True
+    assert len(probes) == 1  # account probed once, then only the adapter lookup
+
+    monkeypatch.setattr(holdings_manager, "get_active_broker", no_broker)
+    assert holdings_manager._is_holdings_ready() is False
+
 def run_test():
     import pytest as _pytest
     ret = _pytest.main([__file__])
@@ -0,0 +1,80 @@
+# tbot_bot/test/test_import_budget.py
+# Entry-point import budgets: every `python -m` target imports without secrets/config, within budget,
+# and without writing files; lazy settings load once and retry after a failed load.
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+print(f"[LAUNCH] test_import_budget launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.support.import_profiler import IMPORT_BUDGETS_MS, budget_ms, parse_importtime, profile_import
+from tbot_bot.support.lazy_settings import LazyMapping, LazySettings
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _snapshot(*dirs):
+    files = set()
+    for d in dirs:
+        if d.exists():
+            files.update(p for p in d.rglob("*") if p.is_file())
+    return files
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_entry_point_import_within_budget(module):
+    watched = (ROOT / "tbot_bot" / "output", ROOT / "tbot_bot" / "storage", ROOT / "logs")
+    before = _snapshot(*watched)
+    prof = profile_import(module)
+    assert prof.ok, prof.error
+    assert prof.seconds * 1000 <= budget_ms(module), f"{module} took {prof.seconds * 1000:.0f} ms"
+    assert _snapshot(*watched) - before == set(), f"importing {module} wrote files"
+
+
+def test_parse_importtime():
+    rows = parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+        "noise\n"
+    )
+    assert [(r.name, r.self_us, r.cumulative_us, r.depth) for r in rows] == [
+        ("json.decoder", 120, 120, 1), ("json", 300, 420, 0)]
+
+
+def test_lazy_settings_load_once_and_retry_on_failure():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("not configured")
+        return {"MAX_TRADES": 4}
+
+    ns = {"__name__": "fake_mod"}
+    settings = LazySettings(ns, loader, ("MAX_TRADES",))
+    with pytest.raises(RuntimeError):
+        settings.module_getattr("MAX_TRADES")
+    assert not settings.loaded
+    assert settings.module_getattr("MAX_TRADES") == 4
+    assert settings.module_getattr("MAX_TRADES") == 4 and ns["MAX_TRADES"] == 4
+    assert len(calls) == 2
+    with pytest.raises(AttributeError):
+        settings.module_getattr("OTHER")
+
+
+def test_lazy_settings_missing_names():
+    settings = LazySettings({}, lambda: {"A": 1}, ("A", "B"))
+    with pytest.raises(KeyError):
+        settings.ensure()
+
+
+def test_lazy_mapping():
+    calls = []
+    m = LazyMapping(lambda: calls.append(1) or {"LOG_FORMAT": "csv"})
+    assert not m.loaded and not calls
+    assert m.get("LOG_FORMAT") == "csv" and m.get("X", "d") == "d" and dict(m) == {"LOG_FORMAT": "csv"}
+    assert len(calls) == 1
@@ -0,0 +1,125 @@
+# tbot_bot/test/test_ledger_pagination.py
+# Keyset pagination of grouped trades: SQL order matches a full Python sort, cursors walk every group once,
+# sibling legs without group_id stay attached, cached counts invalidate on writes.
+
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+print(f"[LAUNCH] test_ledger_pagination launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.accounting.ledger_modules import ledger_grouping as lg
+
+SCHEMA = Path(__file__).resolve().parents[1] / "accounting" / "tbot_ledger_schema.sql"
+COLS = ("datetime_utc", "symbol", "action", "quantity", "price", "total_value", "amount", "side", "fee",
+        "broker_code", "account", "trade_id", "group_id", "strategy", "status", "jurisdiction_code", "entity_code")
+
+
+def _insert(conn, rows):
+    conn.executemany(f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})", rows)
+    conn.commit()
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    db = str(tmp_path / "ledger.db")
+    conn = sqlite3.connect(db)
+    conn.executescript(SCHEMA.read_text())
+    conn.execute("PRAGMA foreign_keys = OFF")
+    # Ledgers written before the natural-key index can hold a same-side sibling leg (the P&L leg below)
+    conn.execute("DROP INDEX uq_trades_natural_key")
+    rng = random.Random(3)
+    t0 = datetime(2025, 3, 3, 14, 30)
+    rows = []
+    for g in range(57):
+        ts = (t0 + timedelta(minutes=rng.randint(0, 500))).strftime("%Y-%m-%dT%H:%M:%SZ")
+        sym = rng.choice(["AAPL", "MSFT", "SPY"])
+        qty, px = rng.randint(1, 9), rng.choice([10.0, 20.0, 30.0])
+        status = rng.choice(["ok", None, "mismatch"])
+        common = (sym, "long", qty, px, qty * px)
+        # credit leg inserted first: the representative must still be the debit leg
+        rows.append((ts,) + common + (qty * px, "credit", 0.0, "ALPACA", "Cash", f"T{g}", f"G{g}", "open", status, "US", "E"))
+        rows.append((ts,) + common + (-qty * px, "debit", rng.choice([0.0, 1.0, None]), "ALPACA", "Equity",
+                                      f"T{g}", f"G{g}", rng.choice(["open", None]), status, "US", "E"))
+    _insert(conn, rows)
+    # P&L leg sharing G0's trade_id but without group_id
+    _insert(conn, [("2025-03-03T23:59:00Z", "AAPL", "long", 0, 0.0, 5.0, 5.0, "credit", 0.0, "ALPACA", "PnL",
+                    "T0", None, None, None, "US", "E")])
+    conn.close()
+    return db
+
+
+def _reference(db, sort_key, desc):
+    expr = lg.PAGE_SORT_EXPRESSIONS[sort_key]
+    with sqlite3.connect(db) as conn:
+        reps = conn.execute(
+            f"SELECT group_id, {expr}, id FROM trades WHERE LOWER(side) = 'debit' AND group_id <> ''").fetchall()
+    reps.sort(key=lambda r: (r[1], r[2]), reverse=desc)
+    return [r[0] for r in reps]
+
+
+@pytest.mark.parametrize("sort_key,desc", [("datetime_utc", True), ("symbol", False), ("fee", True),
+                                           ("status", False), ("strategy", True), ("total_value", False)])
+def test_cursor_walk_matches_full_sort(ledger, sort_key, desc):
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = lg.fetch_grouped_trades_page(limit=10, cursor=cursor, sort_by=sort_key, sort_desc=desc, db_path=ledger)
+        seen += [e["group_id"] for e in page["entries"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == _reference(ledger, sort_key, desc)
+    assert pages == 6 and page["total_groups"] == 57
+
+
+def test_page_shape_and_sibling_legs(ledger):
+    page = lg.fetch_grouped_trades_page(limit=100, sort_by="datetime_utc", db_path=ledger)
+    g0 = next(e for e in page["entries"] if e["group_id"] == "G0")
+    assert g0["collapsed"] is True and g0["side"] == "debit"
+    assert [s["account"] for s in g0["sub_entries"]].count("PnL") == 1
+    assert all(s["group_id"] == "G0" for s in g0["sub_entries"])
+
+    expanded = lg.fetch_grouped_trades_page(limit=100, show_expanded_groups=["G0"], db_path=ledger)
+    legs = [e for e in expanded["entries"] if e["group_id"] == "G0"]
+    assert len(legs) == 3 and not any(e["collapsed"] for e in legs)
+
+
+def test_foreign_or_garbled_cursor_restarts(ledger):
+    first = lg.fetch_grouped_trades_page(limit=5, sort_by="symbol", sort_desc=False, db_path=ledger)
+    other = lg.fetch_grouped_trades_page(limit=5, cursor=first["next_cursor"], sort_by="price", db_path=ledger)
+    assert other["entries"] == lg.fetch_grouped_trades_page(limit=5, sort_by="price", db_path=ledger)["entries"]
+    assert lg.decode_cursor("not-a-cursor", "symbol", False) is None
+    # Unknown sort keys (e.g. running_balance) fall back to datetime_utc
+    assert lg.fetch_grouped_trades_page(limit=5, sort_by="running_balance", db_path=ledger)["sort_by"] == "datetime_utc"
+
+
+def test_total_count_cache_invalidates_on_write(ledger):
+    assert lg.count_groups(ledger) == 57
+    with sqlite3.connect(ledger) as conn:
+        conn.execute("PRAGMA foreign_keys = OFF")
+        _insert(conn, [("2025-03-04T10:00:00Z", "SPY", "long", 1, 10.0, 10.0, -10.0, "debit", 0.0, "ALPACA",
+                        "Equity", "T999", "G999", None, None, "US", "E")])
+    assert lg.count_groups(ledger) == 58
+
+
+@pytest.mark.parametrize("by", ["group_id", "trade_id"])
+def test_mixed_case_debit_legs_seed_pages_like_their_representative(ledger, by):
+    with sqlite3.connect(ledger) as conn:
+        # Legacy ledgers (no CHECK on side) can hold "DEBIT"/"Debit"; the credit leg of each group has the lower id
+        conn.execute("PRAGMA ignore_check_constraints = ON")
+        conn.execute("UPDATE trades SET side = CASE WHEN id % 4 = 0 THEN 'DEBIT' ELSE 'Debit' END WHERE side = 'debit'")
+    seen, cursor = [], None
+    while True:
+        page = lg.fetch_grouped_trades_page(by=by, limit=10, cursor=cursor, sort_by="fee", sort_desc=True,
+                                            db_path=ledger)
+        assert all(e["account"] == "Equity" and e["side"].lower() == "debit" for e in page["entries"])
+        seen += [e["group_id"] for e in page["entries"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == _reference(ledger, "fee", True)  # ordered by the debit legs' fees, not the credit legs' 0.0
+
@@ -62,3 +62,12 @@ def test_ledger_schema_validation():
     except Exception as e:
         pytest.fail(f"Ledger schema validation failed: {e}")
     assert result is True, "Ledger schema is not valid or compliant (missing 'amount' and 'side' columns in 'trades' or other schema violation)."
+
+def test_fresh_ledger_passes_schema_validation(tmp_path):
+    """validate_ledger_schema splits the schema on ';': comments must not break a statement apart."""
+    import sqlite3
+    schema_path = Path(__file__).resolve().parents[1] / "accounting" / "tbot_ledger_schema.sql"
+    db_path = str(tmp_path / "ledger.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(schema_path.read_text(encoding="utf-8"))
+    assert validate_ledger_schema(db_path=db_path, schema_path=str(schema_path)) is True
@@ -0,0 +1,97 @@
+# tbot_bot/test/test_log_index.py
+# Log time index: incremental sampling, rotation rebuild, windowed tail reads, size cap and cursor paging.
+
+import json
+from datetime import datetime, timedelta, timezone
+
+print(f"[LAUNCH] test_log_index launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.support.log_index import LogIndex, index_path_for, line_ts, read_window
+
+T0 = datetime(2026, 1, 2, 12, 0, 0)
+
+
+def _write(path, start, count, mode="w"):
+    with open(path, mode) as f:
+        for i in range(count):
+            ts = (start + timedelta(seconds=20 * i)).strftime("%Y-%m-%dT%H:%M:%S")
+            f.write(json.dumps({"timestamp": ts + "+00:00", "message": f"event {i}"}) + "\n")
+            if i % 50 == 0:
+                f.write("Traceback line without timestamp\n")
+
+
+def _brute(path, since):
+    # Untimestamped lines go with the entry above them
+    out, keep = [], True
+    for line in path.read_text().splitlines():
+        ts = line_ts(line.encode())
+        if ts is not None:
+            keep = since is None or ts >= since.strftime("%Y-%m-%dT%H:%M:%S")
+        if keep:
+            out.append(line)
+    return out
+
+
+def test_line_ts_formats():
+    assert line_ts(b'{"timestamp": "2026-01-02T14:30:05.123+00:00"}') == "2026-01-02T14:30:05"
+    assert line_ts(b"[2026-01-02 14:30] INFO") == "2026-01-02T14:30"
+    assert line_ts(b"no time here") is None
+
+
+def test_window_matches_full_scan_and_seeks(tmp_path):
+    log = tmp_path / "open.log"
+    _write(log, T0, 1500)  # ~8 hours
+    idx = LogIndex(log, stride=1024).refresh()
+    assert idx.keys == sorted(idx.keys) and len(idx.keys) > 50
+    assert index_path_for(log).exists()
+
+    since = T0 + timedelta(hours=7)
+    page = read_window(log, since=since, index=idx)
+    assert page.lines == _brute(log, since)
+    assert not page.truncated
+    # Seek skipped almost the whole file
+    assert page.start_offset > log.stat().st_size * 0.8
+
+    assert read_window(log, since=None, index=idx, max_bytes=10 ** 9).lines == _brute(log, None)
+
+
+def test_size_cap_and_cursor_paging(tmp_path):
+    log = tmp_path / "mid.log"
+    _write(log, T0, 1500)
+    idx = LogIndex(log, stride=1024).refresh()
+    since = T0 + timedelta(hours=4)
+    pages, before = [], None
+    while True:
+        page = read_window(log, since=since, before=before, max_bytes=8000, index=idx)
+        assert sum(len(ln) + 1 for ln in page.lines) <= 8000 + 200
+        pages.insert(0, page.lines)
+        if not page.truncated:
+            break
+        before = page.next_before
+    assert len(pages) > 3
+    assert [ln for p in pages for ln in p] == _brute(log, since)
+
+
+def test_incremental_refresh_rotation_and_partial_line(tmp_path):
+    log = tmp_path / "close.log"
+    _write(log, T0, 300)
+    idx = LogIndex(log, stride=1024).refresh()
+    n, indexed = len(idx.keys), idx.indexed_to
+    _write(log, T0 + timedelta(hours=2), 300, mode="a")
+    idx.refresh()
+    assert len(idx.keys) > n and idx.indexed_to > indexed
+    assert idx.keys[-1] >= (T0 + timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M")
+
+    # Reloaded from the sidecar without re-sampling
+    again = LogIndex(log, stride=1024)
+    again._load()
+    assert again.keys == idx.keys and again.indexed_to == idx.indexed_to
+
+    with open(log, "a") as f:
+        f.write('{"timestamp": "2026-01-02T16:00:00", "message": "half wri')
+    assert read_window(log, index=idx).lines[-1].endswith('"event 299"}')
+
+    log.unlink()
+    _write(log, T0 + timedelta(days=1), 10)  # rotated: new inode, smaller file
+    idx.refresh()
+    assert idx.keys[0].startswith("2026-01-03") and idx.offsets[0] == 0
@@ -0,0 +1,57 @@
+# tbot_bot/test/test_param_sweep.py
+# Parameter sweep runner: samplers, shared-memory workers, ranking and resume.
+
+import json
+import os
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_param_sweep launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.backtest import param_sweep
+from tbot_bot.backtest.param_sweep import expand_grid, latin_hypercube, run_sweep, load_completed
+from tbot_bot.backtest.simulators import generate_synthetic_bars
+
+BASE = {"SHORT_TYPE_MID": "InverseETF", "MAX_TRADES": 2}
+GRID = {"STRAT_MID_VWAP_THRESHOLD": [0.002, 0.004], "TRADING_TRAILING_STOP_PCT": [0.005, 0.02]}
+
+
+def _csv(tmp_path):
+    path = tmp_path / "bars.csv"
+    generate_synthetic_bars([f"S{i}" for i in range(6)], days=4, vol=0.003).to_csv(path, index=False)
+    return str(path)
+
+
+def test_samplers():
+    grid = expand_grid(GRID)
+    assert len(grid) == 4 and {"STRAT_MID_VWAP_THRESHOLD": 0.002, "TRADING_TRAILING_STOP_PCT": 0.02} in grid
+    lhs = latin_hypercube({"X": (0.0, 1.0), "N": (1, 4), "C": ["a", "b"]}, 8, seed=3)
+    assert len(lhs) == 8
+    # One draw per stratum in every dimension
+    assert sorted(int(p["X"] * 8) for p in lhs) == list(range(8))
+    assert sorted(p["N"] for p in lhs) == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert sorted(p["C"] for p in lhs) == ["a"] * 4 + ["b"] * 4
+
+
+def test_parallel_matches_serial_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.setenv("TBOT_HISTORICAL_CACHE_DIR", str(tmp_path / "cache"))
+    data = _csv(tmp_path)
+    params = expand_grid(GRID)
+    serial = run_sweep("mid", data, params, base_config=BASE, workers=1, out_dir=str(tmp_path / "serial"))
+    parallel = run_sweep("mid", data, params, base_config=BASE, workers=2, out_dir=str(tmp_path / "par"))
+    assert len(serial) == 4
+    assert serial.drop(columns=["elapsed_s"], errors="ignore").equals(parallel.drop(columns=["elapsed_s"], errors="ignore"))
+    assert list(serial["rank"]) == [1, 2, 3, 4]
+    assert serial["sharpe_ratio"].is_monotonic_decreasing
+    assert os.path.exists(tmp_path / "par" / "ranked.csv")
+
+    # Simulate an interrupted sweep: keep only the first recorded run, then rerun
+    results = tmp_path / "serial" / "results.jsonl"
+    first = results.read_text().splitlines()[0]
+    results.write_text(first + "\n" + '{"run_id": "torn')
+    calls = []
+    real = param_sweep._evaluate
+    monkeypatch.setattr(param_sweep, "_evaluate", lambda *a, **k: calls.append(a[2]) or real(*a, **k))
+    resumed = run_sweep("mid", data, params, base_config=BASE, workers=1, out_dir=str(tmp_path / "serial"))
+    assert len(calls) == 3 and json.loads(first)["run_id"] not in calls
+    assert len(load_completed(str(tmp_path / "serial"))) == 4
+    assert resumed[["run_id", "sharpe_ratio"]].equals(serial[["run_id", "sharpe_ratio"]])
@@ -0,0 +1,53 @@
+# tbot_bot/test/test_quote_stream.py
+# Quote table semantics and end-to-end streaming against the local replay server.
+
+import time
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_quote_stream launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners.quote_stream import QuoteTable, QuoteStream
+from tbot_bot.screeners.quote_replay_server import ReplayServer, generate_synthetic_ticks
+
+
+def _wait_for(pred, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_quote_table_sequence_staleness_and_ordering():
+    table = QuoteTable()
+    s1 = table.update("aapl", 100.0, provider_ts=2000, received_at=time.monotonic())
+    s2 = table.update("AAPL", 99.0, provider_ts=1000)  # older print is ignored
+    assert s2 == s1
+    assert table.get_price("AAPL") == 100.0
+    table.update("MSFT", 300.0, received_at=time.monotonic() - 60)
+    assert table.get_price("MSFT", max_age_s=5) is None
+    assert table.get_price("MSFT", max_age_s=None) == 300.0
+    assert table.stale_symbols(["AAPL", "MSFT", "NOPE"]) == ["MSFT", "NOPE"]
+
+
+def test_stream_ingests_replay_and_resubscribes_after_reconnect():
+    symbols = [f"S{i:03d}" for i in range(20)]
+    ticks = list(generate_synthetic_ticks(symbols, 2000))
+    last = {t["s"]: t["p"] for t in ticks}
+    srv = ReplayServer(ticks, speed=0, batch_size=100).start()
+    stream = QuoteStream(srv.url, backoff_initial_s=0.05).start()
+    try:
+        stream.subscribe(symbols[:10])
+        assert stream.wait_connected(5)
+        assert _wait_for(lambda: len(stream.table) == 10)
+        assert _wait_for(lambda: all(stream.table.get_price(s) == last[s] for s in symbols[:10]))
+
+        # Drop the connection: the stream reconnects and replays the full subscription set
+        stream.reconnect()
+        stream.subscribe(symbols[10:])
+        assert _wait_for(lambda: stream.connects >= 2 and len(stream.table) == 20)
+        assert _wait_for(lambda: stream.table.get_price("S015") == last["S015"])
+    finally:
+        stream.stop()
+        srv.stop()
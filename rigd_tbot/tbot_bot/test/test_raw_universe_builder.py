@@ -0,0 +1,118 @@
+# tbot_bot/test/test_raw_universe_builder.py
+# Concurrent raw universe builder: per-symbol merge with provider priority (gaps filled by lower priority),
+# dedupe across/within providers, failing providers tolerated, atomic publish, exit codes, provider discovery.
+
+import json
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_raw_universe_builder launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import symbol_universe_raw_builder as rb
+
+
+class StubProvider:
+    def __init__(self, records, gate=None, error=None):
+        self.records, self.gate, self.error = records, gate, error
+
+    def fetch_symbols(self):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return self.records
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return {r["symbol"]: r for r in map(json.loads, f)}
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(rb, "LOG_PATH", str(tmp_path / "universe_ops.log"))
+    return tmp_path / "symbol_universe.symbols_raw.json"
+
+
+def test_merge_priority_and_dedupe(paths):
+    gate = threading.Event()
+    primary = StubProvider([
+        {"symbol": "aapl ", "exchange": "NASDAQ", "companyName": ""},
+        {"symbol": "MSFT", "exchange": "NASDAQ", "companyName": "Microsoft"},
+        {"symbol": "MSFT", "exchange": "XNAS"},
+        {"symbol": ""},
+    ], gate=gate)  # finishes last: its fields must still win
+    secondary = StubProvider([{"symbol": "AAPL", "exchange": "NMS", "companyName": "Apple Inc", "sector": "Tech"},
+                              {"symbol": "TSLA", "exchange": "NASDAQ", "companyName": "Tesla"}])
+    broken = StubProvider(None, error="HTTP 503")
+    threading.Timer(0.05, gate.set).start()
+
+    result = rb.build_raw_universe([("NASDAQ", primary), ("YAHOO", secondary), ("FINNHUB", broken)], str(paths),
+                                   batch_size=1)
+    rows = _read(paths)
+    assert rows == {
+        "AAPL": {"symbol": "AAPL", "exchange": "NASDAQ", "companyName": "Apple Inc", "sector": "Tech"},
+        "MSFT": {"symbol": "MSFT", "exchange": "NASDAQ", "companyName": "Microsoft"},
+        "TSLA": {"symbol": "TSLA", "exchange": "NASDAQ", "companyName": "Tesla"},
+    }
+    assert result["count"] == 3 and result["duplicates"] == 2
+    stats = {s["provider"]: s for s in result["providers"]}
+    assert stats["NASDAQ"]["records"] == 4 and stats["FINNHUB"]["error"] == "HTTP 503"
+    assert not paths.with_name(paths.name + ".tmp").exists()
+
+
+def test_providers_sharing_a_name_do_not_hang(paths):
+    first = StubProvider([{"symbol": "AAPL", "exchange": "NASDAQ"}])
+    second = StubProvider([{"symbol": "AAPL", "exchange": "XNAS", "sector": "Tech"}, {"symbol": "MSFT"}])
+    done = []
+    t = threading.Thread(target=lambda: done.append(
+        rb.build_raw_universe([("FINNHUB", first), ("FINNHUB", second)], str(paths), batch_size=1)), daemon=True)
+    t.start()
+    t.join(5)
+    assert done, "build_raw_universe hung on duplicate provider names"
+    assert [s["provider"] for s in done[0]["providers"]] == ["FINNHUB", "FINNHUB"]
+    assert _read(paths) == {"AAPL": {"symbol": "AAPL", "exchange": "NASDAQ", "sector": "Tech"},
+                            "MSFT": {"symbol": "MSFT"}}
+
+
+def test_merger_emits_once_no_running_provider_can_contribute():
+    m = rb.RawSymbolMerger({"A": 0, "B": 1})
+    assert m.add("B", {"symbol": "X", "v": 2}) is None
+    assert m.add("A", {"symbol": "x", "v": 1}) == {"symbol": "X", "v": 1}
+    assert m.add("A", {"symbol": "Y", "v": 1}) is None and m.pending == 1
+    assert m.finish("B") == [{"symbol": "Y", "v": 1}]
+    assert m.add("A", {"symbol": "Z"}) == {"symbol": "Z"}
+
+
+def test_empty_result_keeps_last_good_and_main_exit_codes(paths, monkeypatch):
+    paths.write_text('{"symbol": "OLD"}\n', encoding="utf-8")
+    result = rb.build_raw_universe([("YAHOO", StubProvider([]))], str(paths))
+    assert result["count"] == 0 and paths.read_text(encoding="utf-8") == '{"symbol": "OLD"}\n'
+
+    monkeypatch.setattr(rb, "RAW_PATH", str(paths))
+    monkeypatch.setattr(rb, "get_raw_provider_configs", lambda: [("YAHOO", {}), ("NOPE", {})])
+    monkeypatch.setattr(rb, "get_provider_class", lambda name: (lambda cfg: StubProvider(None, error="down"))
+                        if name == "YAHOO" else None)
+    with pytest.raises(SystemExit) as exc:
+        rb.main()
+    assert exc.value.code == rb.FETCH_FAIL_EXIT
+
+    monkeypatch.setattr(rb, "get_provider_class", lambda name: (lambda cfg: StubProvider([{"symbol": "NEW"}]))
+                        if name == "YAHOO" else None)
+    rb.main()
+    assert list(_read(paths)) == ["NEW"]
+
+
+def test_provider_configs_in_index_order(monkeypatch):
+    monkeypatch.setattr(rb, "load_screener_credentials", lambda: {
+        "PROVIDER_10": "x", "SCREENER_NAME_10": "finnhub", "UNIVERSE_ENABLED_10": "true", "API_KEY_10": "k10",
+        "PROVIDER_02": "y", "SCREENER_NAME_02": "YAHOO", "UNIVERSE_ENABLED_02": "1",
+        "PROVIDER_03": "z", "SCREENER_NAME_03": "NASDAQ_TXT", "UNIVERSE_ENABLED_03": "1",
+        "PROVIDER_04": "w", "SCREENER_NAME_04": "NYSE", "UNIVERSE_ENABLED_04": "0",
+    })
+    configs = rb.get_raw_provider_configs()
+    assert [name for name, _c in configs] == ["YAHOO", "FINNHUB"]
+    assert configs[1][1] == {"SCREENER_NAME": "finnhub", "UNIVERSE_ENABLED": "true", "API_KEY": "k10"}
+    assert rb.get_raw_provider_creds()["SCREENER_NAME"] == "YAHOO"
@@ -0,0 +1,69 @@
+# tbot_bot/test/test_reconciliation_log.py
+# Batched reconciliation log writes: one executemany per batch, defaults/overrides, JSON encoding of raw records,
+# schema/migration/index checks once per process, indexed lookups in get_reconciliation_entries.
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_reconciliation_log launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.accounting import reconciliation_log as rl
+
+
+@pytest.fixture
+def recon_db(tmp_path, monkeypatch):
+    db = str(tmp_path / "ledger.db")
+    monkeypatch.setattr(rl, "_get_db_path", lambda: db)
+    monkeypatch.setattr(rl, "get_bot_identity", lambda: "ENT_US_ALPACA_BOT1")
+    rl._SCHEMA_READY.discard(db)
+    return db
+
+
+def test_batch_insert_defaults_and_json(recon_db):
+    entries = [
+        {"trade_id": f"T{i}", "api_hash": "h", "raw_record": {"legs": (1, 2), "when": datetime(2025, 1, 2)}}
+        for i in range(250)
+    ]
+    entries[7]["status"] = "mismatched"
+    n = rl.log_reconciliation_entries(entries, status="matched", sync_run_id="run-1", broker="ALPACA",
+                                      compare_fields={}, event_type=rl.EVENT_LEDGER_SYNC)
+    assert n == 250
+    rows = rl.get_reconciliation_entries(sync_run_id="run-1")
+    assert len(rows) == 250
+    r0 = rows[0]
+    assert (r0["entity_code"], r0["jurisdiction_code"], r0["broker_code"]) == ("ENT", "US", "ALPACA")
+    assert r0["event_type"] == rl.EVENT_LEDGER_SYNC and r0["status"] == "matched"
+    assert json.loads(r0["raw_record_json"]) == {"legs": [1, 2], "when": "2025-01-02 00:00:00"}
+    assert [r["trade_id"] for r in rl.get_reconciliation_entries(status="mismatched")] == ["T7"]
+    assert rl.log_reconciliation_entries([]) == 0
+
+
+def test_single_entry_api_and_schema_checked_once(recon_db, monkeypatch):
+    calls = []
+    real = rl._ensure_schema
+    monkeypatch.setattr(rl, "_ensure_schema", lambda conn: (calls.append(1), real(conn)))
+    for i in range(3):
+        rl.log_reconciliation_entry(trade_id=f"X{i}", status="pending", compare_fields={"qty": (1, 2)},
+                                    sync_run_id="run-2", api_hash="", broker="ALPACA", raw_record={}, event_type=" ")
+    assert len(calls) == 1
+    rows = rl.get_reconciliation_entries(trade_id="X1")
+    assert len(rows) == 1 and rows[0]["event_type"] == rl.EVENT_UNKNOWN
+    assert json.loads(rows[0]["compare_fields"]) == {"qty": [1, 2]}
+
+
+def test_legacy_table_migrated_and_indexed(recon_db):
+    with sqlite3.connect(recon_db) as conn:
+        conn.execute(rl.RECON_TABLE_SCHEMA.replace("    event_type TEXT NOT NULL,\n", ""))
+        conn.execute("INSERT INTO reconciliation_log (trade_id, entity_code, jurisdiction_code, broker_code) "
+                     "VALUES ('OLD', 'ENT', 'US', 'ALPACA')")
+    rl.log_reconciliation_entries([{"trade_id": "NEW"}], sync_run_id="run-3")
+    with sqlite3.connect(recon_db) as conn:
+        assert conn.execute("SELECT event_type FROM reconciliation_log WHERE trade_id = 'OLD'").fetchone()[0] == \
+            rl.EVENT_UNKNOWN
+        for col in ("sync_run_id", "trade_id", "status"):
+            plan = " ".join(r[3] for r in conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM reconciliation_log WHERE 1=1 AND {col} = ?", ("x",)))
+            assert f"idx_recon_{col}" in plan
@@ -0,0 +1,91 @@
+# tbot_bot/test/test_status_cache.py
+# Status API cache: components recompute only when their source changes; full_status honours If-None-Match.
+
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+print(f"[LAUNCH] test_status_cache launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_web.py import status_web as sw
+from tbot_web.support.status_cache import STATUS_CACHE, StatusCache, file_key, payload_etag
+
+
+def test_component_recomputes_only_on_key_change(tmp_path):
+    cache = StatusCache()
+    src = tmp_path / "stamp.txt"
+    src.write_text("2026-01-02T14:30:00Z OK")
+    calls = []
+
+    def read():
+        calls.append(1)
+        return src.read_text()
+
+    assert cache.get("stamp", file_key(src), read) == "2026-01-02T14:30:00Z OK"
+    assert cache.get("stamp", file_key(src), read) == "2026-01-02T14:30:00Z OK"
+    assert len(calls) == 1
+    src.write_text("2026-01-02T14:31:00Z Failed")
+    os.utime(src, ns=(1, 1))
+    assert cache.get("stamp", file_key(src), read) == "2026-01-02T14:31:00Z Failed"
+    assert len(calls) == 2 and cache.stats()["hits"] == 1
+    assert file_key(tmp_path / "missing") is None
+
+
+def test_etag_ignores_volatile_timestamps():
+    a = {"bot_state": "running", "timestamp_utc": "2026-01-02T14:30:00Z", "created_utc": "x"}
+    b = dict(a, timestamp_utc="2026-01-02T14:30:05Z", created_utc="y")
+    assert payload_etag(a) == payload_etag(b)
+    assert payload_etag(a) != payload_etag(dict(a, bot_state="trading"))
+
+
+@pytest.fixture
+def status_client(tmp_path, monkeypatch):
+    stamps = {n: str(tmp_path / n) for n in sw._JOB_STAMPS + ("opening_equity.json",)}
+    stamps.update({f"strategy_{k}_error.txt": str(tmp_path / f"strategy_{k}_error.txt") for k in sw._STRATEGY_KINDS})
+    paths = {
+        "identity": "",
+        "status_json": str(tmp_path / "status.json"),
+        "schedule": str(tmp_path / "schedule.json"),
+        "stamps": stamps,
+        "snapshots": {k: str(tmp_path / f"strategy_{k}_last.json") for k in sw._STRATEGY_KINDS},
+        "universe_final": str(tmp_path / "symbol_universe.json"),
+        "universe": str(tmp_path / "symbol_universe.json"),
+        "ledger_db": None,
+        "screener_creds": None,
+    }
+    (tmp_path / "status.json").write_text(json.dumps({"active_strategy": "none", "trade_count": 1}))
+    monkeypatch.setattr(sw, "_status_paths", lambda: paths)
+    monkeypatch.setattr(sw, "_cached_provider", lambda paths=None: ({"name": "NONE", "enabled": False}, "NONE (disabled)"))
+    STATUS_CACHE.clear()
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(sw.status_blueprint, url_prefix="/status")
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s["authenticated"] = True
+    yield client, tmp_path
+    STATUS_CACHE.clear()
+
+
+def test_full_status_etag_and_invalidation(status_client):
+    client, tmp_path = status_client
+    r1 = client.get("/status/full_status")
+    assert r1.status_code == 200 and r1.get_json()["trade_count"] == 1
+    etag = r1.headers["ETag"]
+    misses = STATUS_CACHE.misses
+
+    r2 = client.get("/status/full_status", headers={"If-None-Match": etag})
+    assert r2.status_code == 304 and r2.headers["ETag"] == etag and r2.data == b""
+    # Nothing changed on disk: every component was served from cache
+    assert STATUS_CACHE.misses == misses
+
+    status = tmp_path / "status.json"
+    status.write_text(json.dumps({"active_strategy": "none", "trade_count": 2}))
+    os.utime(status, ns=(2, 2))
+    r3 = client.get("/status/full_status", headers={"If-None-Match": etag})
+    assert r3.status_code == 200 and r3.get_json()["trade_count"] == 2
+    assert r3.headers["ETag"] != etag
+    assert STATUS_CACHE.misses == misses + 1
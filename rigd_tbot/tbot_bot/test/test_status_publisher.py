@@ -0,0 +1,128 @@
+# tbot_bot/test/test_status_publisher.py
+# Status publisher: bursts coalesce into one write per interval, unchanged content (timestamp aside) is not
+# rewritten until the heartbeat, writes are atomic, and the mmap view serves readers only while it mirrors
+# the current status.json.
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+print(f"[LAUNCH] test_status_publisher launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.support import status_publisher as sp
+from tbot_bot.support.status_publisher import StatusPublisher, StatusView
+
+
+def _publisher(tmp_path, status, **kw):
+    path = tmp_path / "status.json"
+    kw.setdefault("interval", 0.2)
+    kw.setdefault("heartbeat", 0)
+    return path, StatusPublisher(path, lambda: dict(status, timestamp=time.time()), **kw)
+
+
+def test_publish_skips_unchanged_content(tmp_path):
+    status = {"state": "idle", "trade_count": 0}
+    path, pub = _publisher(tmp_path, status)
+    assert pub.publish() is True and pub.version == 1
+    mtime = os.stat(path).st_mtime_ns
+    assert pub.publish() is False  # only the timestamp moved
+    assert os.stat(path).st_mtime_ns == mtime
+    status["trade_count"] = 1
+    assert pub.publish() is True and pub.version == 2
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["trade_count"] == 1
+    assert not [p for p in os.listdir(tmp_path) if ".tmp." in p]
+
+    os.unlink(path)
+    assert pub.publish() is True and pub.version == 2  # missing file rewritten, same content version
+
+
+def test_heartbeat_rewrites_unchanged(tmp_path):
+    path, pub = _publisher(tmp_path, {"state": "idle"}, heartbeat=0.05)
+    pub.publish()
+    assert pub.publish() is False
+    time.sleep(0.06)
+    assert pub.publish() is True and pub.version == 1
+
+
+def test_requests_coalesce_within_interval(tmp_path):
+    status = {"trade_count": 0}
+    path, pub = _publisher(tmp_path, status, interval=0.2)
+    for i in range(50):
+        status["trade_count"] = i
+        pub.request()
+    assert pub.stats["writes"] == 1  # first request writes immediately, the rest are pending
+    time.sleep(0.4)
+    assert pub.stats["writes"] == 2
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["trade_count"] == 49
+
+    status["trade_count"] = 50
+    pub.request()
+    pub.flush()  # written inline if the interval had passed, else by the flush
+    assert pub.stats["writes"] == 3
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["trade_count"] == 50
+
+
+def test_flusher_restart_registers_atexit_once(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(sp.atexit, "register", registered.append)
+    path, pub = _publisher(tmp_path, {"state": "idle"}, interval=60)
+    pub.publish()
+    for _ in range(3):
+        pub.request()
+        pub._flusher = None  # as if the flusher thread had died: next request restarts it
+    assert registered == [pub.flush]
+
+
+def test_view_mirrors_current_file(tmp_path):
+    status = {"state": "running", "enabled_strategies": {"open": True}}
+    path, pub = _publisher(tmp_path, status)
+    view = StatusView(path)
+    assert view.read() is None  # nothing published yet
+    pub.publish()
+    version, data = view.read(json_key=sp._file_key(path))
+    assert version == 1 and data["enabled_strategies"] == {"open": True}
+    assert view.read(json_key=sp._file_key(path))[1] is data  # unchanged: cached
+
+    status["state"] = "idle"
+    pub.publish()
+    version, data = view.read(json_key=sp._file_key(path))
+    assert version == 2 and data["state"] == "idle"
+
+    # Another writer replaces status.json: the view no longer describes it
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"state": "other"}, f)
+    assert view.read(json_key=sp._file_key(path)) is None
+
+
+def test_view_oversized_and_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(sp, "VIEW_CAPACITY", 16)
+    path, pub = _publisher(tmp_path, {"state": "x" * 64})
+    pub.publish()
+    assert StatusView(path).read() is None and os.path.exists(path)
+
+    path2 = tmp_path / "other.json"
+    pub2 = StatusPublisher(path2, lambda: {"state": "idle"}, view=False)
+    pub2.publish()
+    assert os.path.exists(path2) and not os.path.exists(str(path2) + sp.VIEW_SUFFIX)
+
+
+def test_bot_status_save_is_coalesced(tmp_path, monkeypatch):
+    from tbot_bot.runtime import status_bot
+
+    bs = status_bot.BotStatus()
+    bs._config_applied = True
+    path = tmp_path / "status.json"
+    bs.publisher = StatusPublisher(path, bs.to_dict, interval=60, heartbeat=0)
+    monkeypatch.setattr(status_bot, "get_state", lambda default=None: default)
+    for _ in range(20):
+        bs.set_trade_result(win=True, pnl=1.0)
+        bs.save_status()
+    assert bs.publisher.stats["writes"] == 1
+    assert bs.publisher.flush() is True
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["trade_count"] == 20
+    assert bs.publish_status() is False
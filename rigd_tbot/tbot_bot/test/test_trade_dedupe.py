@@ -0,0 +1,137 @@
+# tbot_bot/test/test_trade_dedupe.py
+# Set-based dedupe: staged legs anti-joined on (trade_id, broker_code, side), first occurrence wins within a
+# batch, the unique natural-key index rejects duplicate legs, re-posting a sync batch is a no-op.
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+print(f"[LAUNCH] test_trade_dedupe launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.accounting.ledger_modules import ledger_deduplication as dd
+from tbot_bot.accounting.ledger_modules import ledger_double_entry as lde
+
+SCHEMA = Path(__file__).resolve().parents[1] / "accounting" / "tbot_ledger_schema.sql"
+COLS = ("datetime_utc", "symbol", "action", "quantity", "price", "total_value", "amount", "side", "broker_code",
+        "account", "trade_id", "group_id", "jurisdiction_code", "entity_code")
+
+
+def _leg(tid, side, account="Cash"):
+    v = 100.0 if side == "debit" else -100.0
+    return dict(zip(COLS, ("2025-06-02T14:30:00Z", "AAPL", "long", 1.0, 100.0, v, v, side, "ALPACA", account,
+                           tid, tid, "US", "E")))
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    db = str(tmp_path / "ledger.db")
+    with sqlite3.connect(db) as conn:
+        conn.executescript(SCHEMA.read_text())
+    return db
+
+
+def _connect(db):
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    return conn
+
+
+def _fk_off(conn):
+    conn.execute("PRAGMA foreign_keys = OFF")
+    return conn
+
+
+def _count(db, where="1=1"):
+    with sqlite3.connect(db) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM trades WHERE {where}").fetchone()[0]
+
+
+def test_insert_new_legs_anti_join_and_batch_dedupe(ledger):
+    with _connect(ledger) as conn:
+        assert dd.insert_new_legs(conn, [_leg("T1", "debit"), _leg("T1", "credit")], COLS) == 2
+        conn.commit()
+        batch = [_leg("T1", "debit"), _leg("T2", "debit"), _leg("T2", "credit"),
+                 _leg("T2", "debit", account="Other"), _leg("T3", "credit")]
+        assert dd.insert_new_legs(conn, batch, COLS) == 3
+        conn.commit()
+        # First occurrence of a repeated key wins
+        assert conn.execute("SELECT account FROM trades WHERE trade_id = 'T2' AND side = 'debit'").fetchall() == \
+            [("Cash",)]
+        assert dd.insert_new_legs(conn, [], COLS) == 0
+    assert _count(ledger) == 5
+
+
+def test_unique_index_rejects_duplicate_legs(ledger):
+    with _connect(ledger) as conn:
+        assert dd.ensure_natural_key_index(conn)
+        sql = f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})"
+        conn.execute(sql, tuple(_leg("T9", "debit").values()))
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(sql, tuple(_leg("T9", "debit", account="Other").values()))
+        # Same trade, other side or other broker: distinct keys
+        conn.execute(sql, tuple(_leg("T9", "credit").values()))
+        conn.execute(sql, tuple(dict(_leg("T9", "debit"), broker_code="IBKR").values()))
+        conn.commit()
+
+
+def test_existing_duplicates_do_not_block_posting(ledger):
+    with _connect(ledger) as conn:
+        conn.execute(f"DROP INDEX {dd.NATURAL_KEY_INDEX}")
+        sql = f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})"
+        conn.executemany(sql, [tuple(_leg("T5", "debit").values())] * 2)
+        conn.commit()
+        assert dd.ensure_natural_key_index(conn) is False
+        assert dd.insert_new_legs(conn, [_leg("T5", "debit"), _leg("T6", "debit")], COLS) == 1
+
+
+def test_blocked_index_is_not_retried_per_post(ledger, monkeypatch):
+    with _connect(ledger) as conn:
+        conn.execute(f"DROP INDEX {dd.NATURAL_KEY_INDEX}")
+        sql = f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})"
+        conn.executemany(sql, [tuple(_leg("T5", "debit").values())] * 2)
+        conn.commit()
+    logged = []
+    monkeypatch.setattr(dd, "log_event", lambda *a, **k: logged.append(a))
+    monkeypatch.setattr(dd, "_UNKEYED_DBS", set())
+    monkeypatch.setattr(dd, "_KEYED_DBS", set())
+    with _connect(ledger) as conn:
+        assert dd.ensure_natural_key_index(conn, ledger) is False
+        statements = []
+        conn.set_trace_callback(statements.append)
+        assert dd.ensure_natural_key_index(conn, ledger) is False
+        assert statements == [] and len(logged) == 1
+
+    monkeypatch.setattr(dd, "get_identity_tuple", lambda: ("E", "US", "ALPACA", "BOT1"))
+    monkeypatch.setattr(dd, "resolve_ledger_db_path", lambda *a: ledger)
+    assert dd.remove_duplicate_trades() == 1
+    with _connect(ledger) as conn:
+        assert dd.ensure_natural_key_index(conn, ledger) is True
+
+
+def test_post_double_entry_is_idempotent_and_atomic(ledger, monkeypatch):
+    monkeypatch.setattr(lde, "get_identity_tuple", lambda: ("E", "US", "ALPACA", "BOT1"))
+    monkeypatch.setattr(lde, "resolve_ledger_db_path", lambda *a: ledger)
+    dd._KEYED_DBS.discard(ledger)
+
+    def legs(n):
+        out = []
+        for i in range(n):
+            for side, acct in (("debit", "Brokerage:Equity"), ("credit", "Brokerage:Cash")):
+                out.append({"trade_id": f"S{i}", "group_id": f"S{i}", "side": side, "account": acct,
+                            "symbol": "SPY", "action": "long", "quantity": 1, "price": 10.0, "total_value": 10.0,
+                            "datetime_utc": "2025-06-02T15:00:00Z", "sync_run_id": "run-x"})
+        return out
+
+    monkeypatch.setattr(lde.sqlite3, "connect", lambda p, _c=sqlite3.connect: _fk_off(_c(p)))
+    lde.post_double_entry(legs(20), mapping_table={})
+    assert _count(ledger) == 40
+    lde.post_double_entry(legs(25), mapping_table={})
+    assert _count(ledger) == 50
+
+    bad = legs(30)
+    bad[-1]["side"] = "debit"  # S29 no longer sums to zero
+    with pytest.raises(RuntimeError):
+        lde.post_double_entry(bad, mapping_table={})
+    assert _count(ledger) == 50  # nothing from the rejected batch was written
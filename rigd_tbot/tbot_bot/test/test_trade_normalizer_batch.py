@@ -0,0 +1,71 @@
+# tbot_bot/test/test_trade_normalizer_batch.py
+# Batch trade normalization: normalize_trades()/iter_trade_rows() must match normalize_trade() (+ the ledger
+# compliance filter) record for record, including key order, across mixed broker schemas and edge values.
+
+import json
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_trade_normalizer_batch launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.broker.utils import ledger_normalizer as ln
+from tbot_bot.accounting.ledger_modules.ledger_compliance_filter import compliance_filter_entries
+from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
+
+ACTIONS = ["buy", "SELL", "Long", "short", "fill", "partial_fill", "debit", "credit", "exercise", "weird", "",
+           None, 0, 1, True]
+OPTIONAL = ["id", "trade_id", "order_id", "symbol", "underlying", "qty", "quantity", "filled_qty", "price",
+            "filled_avg_price", "fill_price", "fee", "commission", "transaction_time", "filled_at", "date",
+            "status", "order_status", "strategy", "currency", "currency_code", "broker", "broker_code",
+            "accrued_interest", "tax", "activity_type", "type", "net_amount", "description", "unrelated"]
+VALUES = {"qty": [0, 1, "2.5", None, 10], "quantity": [0, 3, None], "filled_qty": ["1", 0], "price": [0, 12.5, "7"],
+          "filled_avg_price": [None, 1.25], "fill_price": ["0", 3], "fee": [0, 0.1, "0.2"], "commission": [0, 1],
+          "accrued_interest": [0, "0.5"], "tax": [0.0, 2], "activity_type": ["FILL", "NEW", "DIV", None],
+          "type": ["fill", "CANCELED", ""], "status": ["filled", None, ""], "id": ["A1", "", None, 7]}
+
+
+def _records(n, seed=3):
+    rng = random.Random(seed)
+    out = []
+    schemas = [rng.sample(OPTIONAL, rng.randint(3, len(OPTIONAL))) for _ in range(12)]
+    for i in range(n):
+        rec = {}
+        key = rng.choice(["action", "side", None])
+        if key:
+            rec[key] = rng.choice(ACTIONS)
+        for k in rng.choice(schemas):
+            rec[k] = rng.choice(VALUES.get(k, [f"{k}-{i}", None, ""]))
+        out.append(rec)
+    return out + ["not-a-dict", None, {}]
+
+
+def test_batch_matches_per_record():
+    records = _records(3000)
+    expected = [ln.normalize_trade(r, "hash") for r in records]
+    got = ln.normalize_trades(records, "hash")
+    assert got == expected
+    assert [list(g) for g in got] == [list(e) for e in expected]  # same key order too
+    assert ln.normalize_trades(iter(records[:50])) == [ln.normalize_trade(r) for r in records[:50]]
+
+
+def test_fused_compliance_matches_filter():
+    records = _records(3000, seed=9)
+    expected = compliance_filter_entries([ln.normalize_trade(r) for r in records if isinstance(r, dict)])
+    assert expected and len(expected) < len(records)
+    assert ln.normalize_trades(records, compliance=True) == expected
+
+
+def test_trade_rows_for_executemany():
+    records = [{"action": "buy", "symbol": "AAPL", "qty": 2, "price": 10, "id": "T1"},
+               {"side": "sell", "symbol": "AAPL", "qty": 1, "filled_avg_price": 12, "order_id": "T2", "fee": 0.5},
+               {"action": "fill", "id": "T3"}, "junk"]
+    rows = list(ln.iter_trade_rows(records, "h"))
+    assert len(rows) == 2 and all(len(r) == len(TRADES_FIELDS) for r in rows)
+    col = {c: i for i, c in enumerate(TRADES_FIELDS)}
+    assert rows[1][col["action"]] == "short" and rows[1][col["total_value"]] == 12.0
+    assert json.loads(rows[0][col["json_metadata"]])["raw_broker"]["id"] == "T1"
+
+    with pytest.raises(ValueError):  # same failure as the per-record path
+        ln.normalize_trades([{"action": "buy", "qty": "abc"}])
@@ -0,0 +1,167 @@
+# tbot_bot/test/test_trailing_stop_monitor.py
+# Unit tests for the batched trailing-stop monitor (parity with trailing_stop.py scalar math, persistence).
+
+import random
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+print(f"[LAUNCH] test_trailing_stop_monitor launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.trading.trailing_stop import (
+    TrailingStopState,
+    compute_trailing_exit_threshold,
+    place_or_prepare_trailing_stop,
+)
+from tbot_bot.trading.trailing_stop_monitor import TrailingStopMonitor, compute_thresholds
+
+
+def _nan(v):
+    return np.nan if v is None else float(v)
+
+
+def test_vectorized_thresholds_match_scalar_api():
+    rng = random.Random(7)
+    rows = []
+    for _ in range(500):
+        side = rng.choice(["long", "short"])
+        entry = rng.uniform(5, 100)
+        rows.append(dict(
+            side=side,
+            current_price=entry * rng.uniform(0.9, 1.1),
+            entry_price=entry,
+            peak_price=entry * rng.uniform(1.0, 1.2) if side == "long" else None,
+            trough_price=entry * rng.uniform(0.8, 1.0) if side == "short" else None,
+            trail_pct=rng.choice([None, 0.01, 0.02, 0.05]),
+            atr=rng.choice([None, 0.5, 1.5]),
+            atr_mult=rng.choice([None, 2.0, 3.0]),
+            min_stop_pct=rng.choice([None, 0.005]),
+            max_stop_pct=rng.choice([None, 0.15]),
+        ))
+    vec = compute_thresholds(
+        np.array([r["side"] == "long" for r in rows]),
+        np.array([r["current_price"] for r in rows]),
+        np.array([r["entry_price"] for r in rows]),
+        np.array([_nan(r["peak_price"]) for r in rows]),
+        np.array([_nan(r["trough_price"]) for r in rows]),
+        np.array([_nan(r["trail_pct"]) for r in rows]),
+        np.array([_nan(r["atr"]) for r in rows]),
+        np.array([_nan(r["atr_mult"]) for r in rows]),
+        np.array([_nan(r["min_stop_pct"]) for r in rows]),
+        np.array([_nan(r["max_stop_pct"]) for r in rows]),
+    )
+    for r, v in zip(rows, vec):
+        assert v == pytest.approx(compute_trailing_exit_threshold(**r), rel=1e-12)
+
+
+def test_batch_emits_one_exit_per_position_and_tracks_peaks(tmp_path):
+    events = []
+    mon = TrailingStopMonitor(on_exit=events.append, state_path=str(tmp_path / "tsm.json"))
+    long_id = mon.add_position(symbol="AAPL", side="long", qty=10, entry_price=100.0, trail_pct=0.02)
+    short_id = mon.add_position(symbol="TSLA", side="short", qty=5, entry_price=50.0, trail_pct=0.02)
+
+    assert mon.ingest([("AAPL", 105.0), ("TSLA", 48.0)]) == []
+    pos = {p["position_id"]: p for p in mon.positions()}
+    assert pos[long_id]["peak"] == 105.0
+    assert pos[short_id]["trough"] == 48.0
+
+    # Dip below 105 * 0.98 then recover inside the same batch still triggers the long exit
+    out = mon.ingest([("AAPL", 102.0), ("AAPL", 104.0), ("TSLA", 48.5)])
+    assert [e["position_id"] for e in out] == [long_id]
+    assert out[0]["threshold"] == pytest.approx(102.9)
+
+    mon.ingest([("AAPL", 90.0), ("TSLA", 49.0)])
+    assert [e["position_id"] for e in events] == [long_id, short_id]
+    assert len(mon) == 0
+
+
+def test_state_persists_across_restart(tmp_path):
+    path = str(tmp_path / "tsm.json")
+    mon = TrailingStopMonitor(on_exit=lambda e: None, state_path=path)
+    state = place_or_prepare_trailing_stop(
+        broker=object(), symbol="MSFT", side="long", quantity=3, trail_pct=0.03,
+        entry_price=200.0, monitor=mon, strategy="open",
+    )
+    assert state["placed"] is False and state["position_id"]
+    mon.ingest([("MSFT", 220.0)])
+    mon.save_state()
+
+    restored = TrailingStopMonitor(on_exit=lambda e: None, state_path=path)
+    (p,) = restored.positions()
+    assert p["position_id"] == state["position_id"]
+    assert p["peak"] == 220.0 and p["strategy"] == "open"
+    assert restored.ingest([("MSFT", 213.0)])[0]["symbol"] == "MSFT"
+
+
+def test_add_from_inactive_state_is_ignored(tmp_path):
+    mon = TrailingStopMonitor(on_exit=lambda e: None, state_path=str(tmp_path / "tsm.json"))
+    st = TrailingStopState(side="long", pct=0.02, active=False)
+    assert mon.add_from_state(st, symbol="X", qty=1) is None
+    assert len(mon) == 0
+
+
+def test_dirty_only_on_stop_changes_and_fired_positions_pruned(tmp_path):
+    mon = TrailingStopMonitor(on_exit=lambda e: None, state_path=str(tmp_path / "tsm.json"))
+    keep = mon.add_position(symbol="AAPL", side="long", qty=1, entry_price=100.0, trail_pct=0.05)
+    mon.add_position(symbol="TSLA", side="long", qty=1, entry_price=50.0, trail_pct=0.02)
+    mon.save_state()
+
+    mon.ingest([("AAPL", 99.0), ("TSLA", 49.5)])  # below peak, above threshold: nothing to persist
+    assert mon._dirty is False
+    mon.ingest([("AAPL", 101.0)])
+    assert mon._dirty is True
+    mon.save_state()
+
+    assert len(mon.ingest([("TSLA", 40.0)])) == 1
+    assert mon._dirty is True
+    assert [p["position_id"] for p in mon.positions()] == [keep]
+    assert mon.ingest([("TSLA", 30.0)]) == [] and len(mon) == 1
+
+
+def test_dip_after_intra_batch_high_fires_like_tick_by_tick(tmp_path):
+    mon = TrailingStopMonitor(on_exit=lambda e: None, state_path=str(tmp_path / "tsm.json"))
+    pid = mon.add_position(symbol="AAPL", side="long", qty=1, entry_price=100.0, trail_pct=0.05)
+    out = mon.ingest([("AAPL", 110.0), ("AAPL", 104.0), ("AAPL", 120.0)])
+    assert [e["position_id"] for e in out] == [pid]
+    assert out[0]["price"] == 104.0 and out[0]["threshold"] == pytest.approx(104.5)
+    assert out[0]["peak"] == 110.0 and len(mon) == 0
+
+    # Randomized parity with the scalar state machine, one tick at a time
+    rng = random.Random(3)
+    for _ in range(200):
+        batch_mon = TrailingStopMonitor(on_exit=lambda e: None, persist=False)
+        batch_mon.add_position(symbol="X", side=rng.choice(["long", "short"]), qty=1, entry_price=100.0,
+                               trail_pct=0.03, position_id="p")
+        side = batch_mon.positions()[0]["side"]
+        state = TrailingStopState(side=side, pct=0.03, peak=100.0, trough=100.0)
+        ticks = [("X", 100.0 * rng.uniform(0.95, 1.08)) for _ in range(12)]
+        expected = None
+        for _, px in ticks:
+            state.register_tick(px)
+            thr = state.exit_trigger_price()
+            if (px <= thr) if side == "long" else (px >= thr):
+                expected = px
+                break
+        got = batch_mon.ingest(ticks)
+        assert [e["price"] for e in got] == ([] if expected is None else [expected])
+
+
+def test_failed_exit_handler_rearms_and_pending_exit_is_persisted(tmp_path):
+    path = str(tmp_path / "tsm.json")
+    calls = []
+
+    def flaky(ev):
+        calls.append(ev["position_id"])
+        # The pending exit is already on disk: a crash here would restore the stop armed
+        restored = TrailingStopMonitor(on_exit=lambda e: None, state_path=path)
+        assert [p["position_id"] for p in restored.positions()] == [ev["position_id"]] and len(restored) == 1
+        if len(calls) == 1:
+            raise RuntimeError("broker down")
+
+    mon = TrailingStopMonitor(on_exit=flaky, state_path=path)
+    pid = mon.add_position(symbol="TSLA", side="long", qty=1, entry_price=50.0, trail_pct=0.02)
+    assert len(mon.ingest([("TSLA", 40.0)])) == 1
+    assert len(mon) == 1 and mon.positions()[0]["pending_exit"] is False  # re-armed
+    assert len(mon.ingest([("TSLA", 39.0)])) == 1
+    assert calls == [pid, pid] and mon.positions() == []
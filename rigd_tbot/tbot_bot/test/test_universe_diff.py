@@ -0,0 +1,74 @@
+# tbot_bot/test/test_universe_diff.py
+# Universe diff engine: columnar NDJSON/JSON loading, fingerprint-first matching (reordered keys are not a change),
+# per-field absolute/relative numeric tolerances, change-set shape, legacy diff_universes API and the --json CLI.
+
+import json
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_universe_diff launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import universe_diff as ud
+
+OLD = [
+    {"symbol": "AAA", "lastClose": 10.0, "marketCap": 1000.0, "exchange": "NYSE"},
+    {"symbol": "BBB", "lastClose": 20.0, "marketCap": 2000.0, "exchange": "NYSE"},
+    {"symbol": "CCC", "lastClose": 30.0, "marketCap": 3000.0, "exchange": "NASDAQ"},
+    {"symbol": "DDD", "lastClose": 40.0, "marketCap": 4000.0, "exchange": "NASDAQ"},
+]
+NEW = [
+    {"exchange": "NYSE", "marketCap": 1000.0, "lastClose": 10.0, "symbol": "AAA"},  # same row, other key order
+    {"symbol": "BBB", "lastClose": 20.004, "marketCap": 2000.0, "exchange": "NYSE"},  # within tolerance
+    {"symbol": "CCC", "lastClose": 31.0, "marketCap": 3010.0, "exchange": "NYSE"},
+    {"symbol": "EEE", "lastClose": 50.0, "marketCap": 5000.0, "exchange": "NYSE"},
+]
+
+
+def _write_ndjson(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+    return str(path)
+
+
+def test_change_set_with_tolerances(tmp_path):
+    c1 = ud.load_columns(_write_ndjson(tmp_path / "a.json", OLD))
+    c2 = ud.load_columns(_write_ndjson(tmp_path / "b.json", NEW))
+    assert c1.symbols == ["AAA", "BBB", "CCC", "DDD"] and c1.rows[0] == json.dumps(OLD[0])  # rows left undecoded
+
+    result = ud.diff_columns(c1, c2, ud.parse_tolerances(["lastClose=0.01", "marketCap=0.5%"]))
+    assert result["added"] == ["EEE"] and result["removed"] == ["DDD"]
+    assert result["changed"] == [{"symbol": "CCC", "fields": {"lastClose": [30.0, 31.0, 1.0],
+                                                              "exchange": ["NASDAQ", "NYSE"]}}]
+    assert result["counts"] == {"old": 4, "new": 4, "added": 1, "removed": 1, "changed": 1, "compared": 3,
+                                "unchanged": 2}
+
+    strict = ud.diff_columns(c1, c2)
+    assert [c["symbol"] for c in strict["changed"]] == ["BBB", "CCC"]
+    assert strict["changed"][1]["fields"]["marketCap"] == [3000.0, 3010.0, 10.0]
+    assert ud.diff_columns(c1, c2, ud.parse_tolerances(["*=100"]))["changed"][0]["fields"] == {
+        "exchange": ["NASDAQ", "NYSE"]}
+
+
+def test_legacy_formats_and_record_api(tmp_path):
+    array = tmp_path / "array.json"
+    array.write_text(json.dumps(OLD, indent=2), encoding="utf-8")
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(json.dumps({"build_timestamp_utc": "x", "symbols": NEW}), encoding="utf-8")
+    result = ud.diff_columns(ud.load_columns(str(array)), ud.load_columns(str(wrapped)))
+    assert result["counts"]["changed"] == 2 and result["counts"]["compared"] == 2  # decoded rows hash canonically
+
+    only_1, only_2, changed = ud.diff_universes(OLD, NEW, {"lastClose": (0.01, 0.0), "marketCap": (20.0, 0.0)})
+    assert only_1 == ["DDD"] and only_2 == ["EEE"]
+    assert changed == [{"symbol": "CCC", "diffs": {"lastClose": (30.0, 31.0), "exchange": ("NASDAQ", "NYSE")}}]
+    with pytest.raises(ValueError):
+        ud.parse_tolerances(["lastClose"])
+
+
+def test_cli_json_output(tmp_path, monkeypatch, capsys):
+    a, b = _write_ndjson(tmp_path / "a.json", OLD), _write_ndjson(tmp_path / "b.json", NEW)
+    monkeypatch.setattr(sys, "argv", ["universe_diff.py", a, b, "--json", "--tol", "lastClose=0.01",
+                                      "--tol", "marketCap=1%"])
+    ud.main()
+    out = json.loads(capsys.readouterr().out)
+    assert out["added"] == ["EEE"] and [c["symbol"] for c in out["changed"]] == ["CCC"]
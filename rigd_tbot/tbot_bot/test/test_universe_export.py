@@ -0,0 +1,103 @@
+# tbot_bot/test/test_universe_export.py
+# Streaming universe export: incremental reader over NDJSON/array/wrapper files (tiny chunks cross every token),
+# CSV header from the schema, column selection, gzip encoding, content-hash ETag with 304 revalidation.
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+print(f"[LAUNCH] test_universe_export launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners.universe_stream import iter_universe_items
+from tbot_web.support import export_stream as es
+from tbot_web.py import universe_web as uw
+
+RECORDS = [
+    {"symbol": "AAPL", "exchange": "NASDAQ", "lastClose": 190.5, "marketCap": 3e12, "companyName": "APPLE, INC \"A\""},
+    {"symbol": "BRK.B", "exchange": "NYSE", "lastClose": 410, "marketCap": 9e11, "note": "extra", "tags": [1, {"x": "]"}]},
+    {"symbol": "ZZZ", "lastClose": -1.25e-3},
+]
+
+
+@pytest.mark.parametrize("layout", ["ndjson", "array", "wrapper", "wrapper_compact", "single"])
+@pytest.mark.parametrize("chunk_size", [3, 1 << 16])
+def test_reader_layouts(tmp_path, layout, chunk_size):
+    path = tmp_path / "u.json"
+    expected = RECORDS
+    if layout == "ndjson":
+        text = "".join(json.dumps(r) + "\n" for r in RECORDS) + "garbage\n"
+    elif layout == "array":
+        text = json.dumps(RECORDS, indent=2)
+    elif layout == "wrapper":
+        text = json.dumps({"status": {"state": "ok", "n": [3]}, "symbols": RECORDS, "after": 1}, indent=2)
+    elif layout == "wrapper_compact":
+        text = json.dumps({"built_utc": "2025-01-01", "universe": RECORDS})
+    else:
+        text, expected = json.dumps(RECORDS[0]), RECORDS[:1]
+    path.write_text(text, encoding="utf-8")
+    assert list(iter_universe_items(path, chunk_size=chunk_size)) == expected
+
+
+def test_status_only_and_empty_files(tmp_path):
+    (tmp_path / "s.json").write_text('{"status": "waiting_for_credentials"}', encoding="utf-8")
+    (tmp_path / "e.json").write_text("  \n", encoding="utf-8")
+    assert list(iter_universe_items(tmp_path / "s.json")) == []
+    assert list(iter_universe_items(tmp_path / "e.json")) == []
+
+
+def test_chunk_generators(monkeypatch):
+    monkeypatch.setattr(es, "CHUNK_CHARS", 16)
+    items = RECORDS + ["MSFT"]
+    text = "".join(es.csv_chunks(iter(items), ["symbol", "lastClose", "companyName"]))
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert [r["symbol"] for r in rows] == ["AAPL", "BRK.B", "ZZZ", "MSFT"]
+    assert rows[0]["companyName"] == RECORDS[0]["companyName"] and rows[2]["companyName"] == ""
+
+    assert json.loads("".join(es.json_array_chunks(iter(items)))) == items
+    assert json.loads("".join(es.json_array_chunks(iter(())))) == []
+    lines = "".join(es.ndjson_chunks(iter(items), ["symbol"])).splitlines()
+    assert [json.loads(l) for l in lines] == [{"symbol": s} for s in ("AAPL", "BRK.B", "ZZZ", "MSFT")]
+    body = b"".join(es.encode_chunks(es.ndjson_chunks(iter(items)), gzip=True))
+    assert gzip.decompress(body).decode("utf-8") == "".join(es.ndjson_chunks(iter(items)))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    final = tmp_path / "symbol_universe.json"
+    final.write_text("".join(json.dumps(r) + "\n" for r in RECORDS), encoding="utf-8")
+    monkeypatch.setattr(uw, "FINAL_PATH", str(final))
+    monkeypatch.setattr(uw, "screener_creds_exist", lambda: True)
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(uw.universe_bp, url_prefix="/universe")
+    return app.test_client(), final
+
+
+def test_export_endpoint(client):
+    client, final = client
+    resp = client.get("/universe/export/csv")
+    assert resp.headers["Content-Disposition"].endswith("symbol_universe.csv") and "Content-Encoding" not in resp.headers
+    header = resp.get_data(as_text=True).splitlines()[0]
+    assert header == ",".join(uw.UNIVERSE_EXPORT_COLUMNS)
+    etag = resp.headers["ETag"]
+
+    assert client.get("/universe/export/csv", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/universe/export/json").headers["ETag"] != etag
+    assert client.get("/universe/export/json").get_json() == RECORDS
+
+    resp = client.get("/universe/export/ndjson?columns=symbol,exchange", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    lines = gzip.decompress(resp.get_data()).decode("utf-8").splitlines()
+    assert json.loads(lines[1]) == {"symbol": "BRK.B", "exchange": "NYSE"}
+
+    final.write_text(json.dumps(RECORDS[0]) + "\n", encoding="utf-8")
+    resp = client.get("/universe/export/csv", headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and resp.headers["ETag"] != etag
+
+    final.write_text('{"status": "waiting_for_credentials"}', encoding="utf-8")
+    assert client.get("/universe/export/json").status_code == 302
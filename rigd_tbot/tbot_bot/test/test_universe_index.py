@@ -0,0 +1,113 @@
+# tbot_bot/test/test_universe_index.py
+# Universe table index: NDJSON/array/wrapper-object files, counts, offset and keyset pages in file order,
+# substring (previous filter semantics) and prefix search, rebuild on change, sidecar reuse, table/counts endpoints.
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+print(f"[LAUNCH] test_universe_index launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import universe_index as ui
+from tbot_web.py import universe_web as uw
+
+SYMBOLS = ["AAPL", "AA", "MSFT", "BAAB", "aal", "TSLA", "AAPX", "NVDA", "GAAP", "AMD"]
+
+
+def _records():
+    return [{"symbol": s, "exchange": "NYSE", "lastClose": i + 1.5} for i, s in enumerate(SYMBOLS)]
+
+
+def _write_ndjson(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+        f.write("not json\n\n")
+
+
+def _legacy_filter(records, search):
+    return [r for r in records if search in r["symbol"].upper()]
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch):
+    monkeypatch.setattr(ui, "_MEMO", {})
+
+
+def test_formats_and_counts(tmp_path):
+    nd = tmp_path / "symbol_universe.unfiltered.json"
+    _write_ndjson(nd, _records())
+    arr = tmp_path / "array.json"
+    arr.write_text(json.dumps(_records(), indent=2), encoding="utf-8")
+    final = tmp_path / "symbol_universe.json"
+    final.write_text(json.dumps({"status": "complete", "symbols": _records()[:4]}, indent=2), encoding="utf-8")
+    single = tmp_path / "single.json"
+    single.write_text(json.dumps(_records()[0]) + "\n", encoding="utf-8")
+
+    assert ui.universe_count(nd) == 10 and ui.universe_count(arr) == 10
+    assert ui.universe_count(final) == 4 and ui.get_universe_index(final).status() == "complete"
+    assert ui.universe_count(single) == 1
+    assert ui.universe_count(tmp_path / "missing.json") == 0
+    assert ui.index_path_for(nd).exists()
+
+
+def test_pages_and_search_match_previous_filter(tmp_path):
+    path = tmp_path / "u.json"
+    records = _records()
+    _write_ndjson(path, records)
+    idx = ui.get_universe_index(path)
+
+    rows, cursor = idx.page(offset=2, limit=3)
+    assert rows == records[2:5] and cursor is not None
+    # Keyset paging walks the whole file in order
+    seen, after = [], None
+    while True:
+        rows, after = idx.page(limit=4, after=after)
+        seen += rows
+        if after is None:
+            break
+    assert seen == records
+
+    for search in ("AA", "A", "P", "ZZZ"):
+        assert idx.page(search=search, limit=100)[0] == _legacy_filter(records, search)
+    assert idx.page(search="AA", offset=1, limit=2)[0] == _legacy_filter(records, "AA")[1:3]
+    assert [r["symbol"] for r in idx.page(search="aa", limit=100, prefix=True)[0]] == ["AAPL", "AA", "aal", "AAPX"]
+
+
+def test_rebuilt_on_change_and_sidecar_reused(tmp_path, monkeypatch):
+    path = tmp_path / "u.json"
+    _write_ndjson(path, _records())
+    assert ui.universe_count(path) == 10
+    _write_ndjson(path, _records()[:3])
+    assert ui.universe_count(path) == 3
+
+    # Another process (fresh instance) adopts the sidecar without re-reading the source
+    monkeypatch.setattr(ui, "iter_universe_records", lambda p: pytest.fail("source re-read"))
+    other = ui.UniverseIndex(path)
+    assert other.count() == 3 and other.page(search="AA", limit=10)[0][0]["symbol"] == "AAPL"
+
+
+def test_table_and_counts_endpoints(tmp_path, monkeypatch):
+    unfiltered, partial, final = tmp_path / "unf.json", tmp_path / "part.json", tmp_path / "final.json"
+    _write_ndjson(unfiltered, _records())
+    _write_ndjson(partial, _records()[:6])
+    final.write_text(json.dumps({"status": "complete", "symbols": _records()[:2]}), encoding="utf-8")
+    monkeypatch.setattr(uw, "UNFILTERED_PATH", str(unfiltered))
+    monkeypatch.setattr(uw, "PARTIAL_PATH", str(partial))
+    monkeypatch.setattr(uw, "FINAL_PATH", str(final))
+    monkeypatch.setattr(uw, "get_blocklist_count", lambda: 7)
+    app = Flask(__name__)
+    app.register_blueprint(uw.universe_bp, url_prefix="/universe")
+    client = app.test_client()
+
+    resp = client.get("/universe/table/unfiltered?search=aa&limit=2")
+    assert [r["symbol"] for r in resp.get_json()] == ["AAPL", "AA"]
+    assert resp.headers["X-Total-Count"] == "10"
+    resp = client.get(f"/universe/table/unfiltered?search=aa&limit=2&after={resp.headers['X-Next-After']}")
+    assert [r["symbol"] for r in resp.get_json()] == ["BAAB", "aal"]
+    resp = client.get("/universe/table/final?match=prefix&search=M")
+    assert resp.get_json() == [] and "X-Next-After" not in resp.headers
+    assert client.get("/universe/table/bogus").status_code == 400
+    assert client.get("/universe/counts").get_json() == {"unfiltered": 10, "partial": 6, "filtered": 2, "blocklist": 7}
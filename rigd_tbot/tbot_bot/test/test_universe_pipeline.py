@@ -0,0 +1,170 @@
+# tbot_bot/test/test_universe_pipeline.py
+# In-process universe orchestration: stages pass records in memory and checkpoint to disk, unchanged inputs skip
+# stages (no provider calls), blocklist/checkpoint changes re-run only what depends on them, --force and the
+# subprocess isolation switch.
+
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+print(f"[LAUNCH] test_universe_pipeline launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.screeners import universe_orchestrator as orch
+from tbot_bot.screeners import symbol_universe_raw_builder as rb
+from tbot_bot.screeners import symbol_enrichment as enr
+from tbot_bot.screeners import blocklist_manager as bm
+
+CALLS = {"symbols": 0, "quotes": 0}
+SYMBOLS = [f"SYM{i:02d}" for i in range(12)]
+
+
+class StubProvider:
+    def __init__(self, config):
+        self.config = config
+
+    def fetch_symbols(self):
+        CALLS["symbols"] += 1
+        return [{"symbol": s, "exchange": "NYSE", "companyName": f"{s} INC"} for s in SYMBOLS]
+
+    def fetch_quotes(self, symbols):
+        CALLS["quotes"] += 1
+        return [{"symbol": s, "c": 20.0, "marketCap": 1000.0, "volume": 10} for s in symbols]
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    d = str(tmp_path)
+    paths = {k: os.path.join(d, v) for k, v in {
+        "raw": "symbol_universe.symbols_raw.json", "unfiltered": "symbol_universe.unfiltered.json",
+        "partial": "symbol_universe.partial.json", "final": "symbol_universe.json",
+        "blocklist": "screener_blocklist.txt"}.items()}
+    monkeypatch.setattr(orch, "FINAL_PATH", paths["final"])
+    monkeypatch.setattr(orch, "PARTIAL_PATH", paths["partial"])
+    monkeypatch.setattr(orch, "MANIFEST_PATH", os.path.join(d, ".pipeline", "universe_stages.json"))
+    monkeypatch.setattr(orch, "UNIVERSE_LOG_PATH", os.path.join(d, "universe_ops.log"))
+    monkeypatch.setattr(orch, "set_state", lambda *a, **k: None)
+    monkeypatch.setattr(rb, "RAW_PATH", paths["raw"])
+    monkeypatch.setattr(rb, "LOG_PATH", os.path.join(d, "universe_ops.log"))
+    monkeypatch.setattr(rb, "get_raw_provider_configs", lambda: [("STUB", {"SCREENER_NAME": "STUB"})])
+    monkeypatch.setattr(rb, "get_provider_class", lambda name: StubProvider)
+    monkeypatch.setattr(enr, "RAW_PATH", paths["raw"])
+    monkeypatch.setattr(enr, "UNFILTERED_PATH", paths["unfiltered"])
+    monkeypatch.setattr(enr, "PARTIAL_PATH", paths["partial"])
+    monkeypatch.setattr(enr, "BLOCKLIST_PATH", paths["blocklist"])
+    monkeypatch.setattr(enr, "LOG_PATH", os.path.join(d, "universe_ops.log"))
+    monkeypatch.setattr(enr, "load_env_bot_config", lambda: {})
+    monkeypatch.setattr(enr, "get_enrichment_provider_creds", lambda: {"SCREENER_NAME": "STUB"})
+    monkeypatch.setattr(enr, "get_provider_class", lambda name: StubProvider)
+    monkeypatch.setattr(bm, "_STORES", {})
+    monkeypatch.delenv("TBOT_UNIVERSE_FORCE", raising=False)
+    CALLS.update(symbols=0, quotes=0)
+    return paths
+
+
+def _final_symbols(paths):
+    with open(paths["final"], encoding="utf-8") as f:
+        return [r["symbol"] for r in json.load(f)["symbols"]]
+
+
+def test_full_then_no_change_rebuild(pipeline):
+    orch.main(isolation="inprocess")
+    assert CALLS == {"symbols": 1, "quotes": len(SYMBOLS)}
+    assert _final_symbols(pipeline) == SYMBOLS
+    with open(pipeline["final"], encoding="utf-8") as f:
+        assert "\n" not in f.read().strip()  # compact publish
+    for key in ("raw", "unfiltered", "partial"):
+        assert os.path.exists(pipeline[key])  # checkpoints
+    final_mtime = os.stat(pipeline["final"]).st_mtime_ns
+
+    orch.main(isolation="inprocess")
+    assert CALLS == {"symbols": 1, "quotes": len(SYMBOLS)}
+    assert os.stat(pipeline["final"]).st_mtime_ns == final_mtime
+
+    orch.main(isolation="inprocess", force=True)
+    assert CALLS == {"symbols": 2, "quotes": 2 * len(SYMBOLS)}
+
+
+def test_dependent_stages_rerun_from_checkpoints(pipeline):
+    orch.main()
+    with open(pipeline["blocklist"], "w", encoding="utf-8") as f:
+        f.write("SYM03|manual|2025-01-01T00:00:00Z|ui\n")
+    orch.main()
+    # raw reused from its checkpoint, enrichment re-run without the blocked symbol
+    assert CALLS["symbols"] == 1 and CALLS["quotes"] == 2 * len(SYMBOLS) - 1
+    assert "SYM03" not in _final_symbols(pipeline)
+
+    # A damaged checkpoint invalidates its stage
+    with open(pipeline["partial"], "w", encoding="utf-8") as f:
+        f.write("[]")
+    orch.main()
+    assert CALLS["quotes"] == 3 * len(SYMBOLS) - 2 and len(_final_symbols(pipeline)) == len(SYMBOLS) - 1
+
+
+def test_raw_refetched_after_credential_change_or_degraded_fetch(pipeline, monkeypatch):
+    orch.main()
+    assert CALLS["symbols"] == 1
+    monkeypatch.setattr(rb, "get_raw_provider_configs", lambda: [("STUB", {"SCREENER_NAME": "STUB", "API_KEY": "new"})])
+    orch.main()
+    assert CALLS["symbols"] == 2  # same provider name, new credentials: raw not reused
+
+    class Broken:
+        def __init__(self, config):
+            pass
+
+        def fetch_symbols(self):
+            raise RuntimeError("HTTP 503")
+
+    monkeypatch.setattr(rb, "get_raw_provider_configs",
+                        lambda: [("STUB", {"SCREENER_NAME": "STUB"}), ("DOWN", {"SCREENER_NAME": "DOWN"})])
+    monkeypatch.setattr(rb, "get_provider_class", lambda name: Broken if name == "DOWN" else StubProvider)
+    orch.main()
+    assert CALLS["symbols"] == 3 and _final_symbols(pipeline) == SYMBOLS  # degraded fetch still published
+    orch.main()
+    assert CALLS["symbols"] == 4  # ...but never reused as a fresh checkpoint
+
+
+def test_enrich_with_provider_misses_is_not_cached(pipeline, monkeypatch):
+    down = {"SYM05"}
+    quotes = StubProvider.fetch_quotes
+
+    def flaky(self, symbols):
+        if down & set(symbols):
+            CALLS["quotes"] += 1
+            raise RuntimeError("HTTP 503 timeout")
+        return quotes(self, symbols)
+
+    monkeypatch.setattr(StubProvider, "fetch_quotes", flaky)
+    orch.main()
+    assert "SYM05" not in _final_symbols(pipeline)
+    down.clear()  # provider recovered: same-day rebuild must not reuse the degraded universe
+    orch.main()
+    assert CALLS["symbols"] == 1 and CALLS["quotes"] == 2 * len(SYMBOLS)  # raw reused, enrichment retried
+    assert _final_symbols(pipeline) == SYMBOLS
+    orch.main()
+    assert CALLS["quotes"] == 2 * len(SYMBOLS)  # clean run cached
+
+
+def test_enrichment_failure_keeps_last_good(pipeline, monkeypatch):
+    orch.main()
+    before = _final_symbols(pipeline)
+
+    def boom(self, symbols):
+        raise RuntimeError("HTTP 401 unauthorized")
+
+    monkeypatch.setattr(StubProvider, "fetch_quotes", boom)
+    with pytest.raises(SystemExit) as exc:
+        orch.main(force=True)
+    assert exc.value.code == 1 and _final_symbols(pipeline) == before
+    assert os.path.exists(os.path.join(os.path.dirname(pipeline["final"]), "universe_build.failed"))
+
+
+def test_subprocess_isolation_dispatch(pipeline, monkeypatch):
+    modules = []
+    monkeypatch.setattr(orch, "run_module", lambda module, tolerate_rcs=(): modules.append(module) or 0)
+    with open(pipeline["partial"], "w", encoding="utf-8") as f:
+        json.dump([{"symbol": "AAA"}], f)
+    orch.main(isolation="subprocess")
+    assert modules == ["tbot_bot.screeners.symbol_universe_raw_builder", "tbot_bot.screeners.symbol_enrichment"]
+    assert _final_symbols(pipeline) == ["AAA"] and CALLS["symbols"] == 0
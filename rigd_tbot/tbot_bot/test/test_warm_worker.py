@@ -0,0 +1,68 @@
+# tbot_bot/test/test_warm_worker.py
+# Warm phase workers: preload then run on go, cold fallback when the worker is gone, latency probe.
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+print(f"[LAUNCH] test_warm_worker launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
+
+from tbot_bot.runtime import phase_latency
+from tbot_bot.runtime.warm_worker import WarmWorker
+
+ROOT = Path(__file__).resolve().parents[2]
+
+PHASE_MODULE = '''
+import json, os, sys
+def main():
+    with open(os.environ["PROBE_OUT"], "w") as f:
+        json.dump({"argv": sys.argv[1:], "mode": os.environ.get("TBOT_PHASE_MODE")}, f)
+    return 3
+'''
+
+
+def _env(tmp_path):
+    (tmp_path / "phase_probe_mod.py").write_text(PHASE_MODULE)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), str(ROOT)])
+    env["PROBE_OUT"] = str(tmp_path / "out.json")
+    return env
+
+
+def test_warm_worker_runs_phase_on_go(tmp_path):
+    w = WarmWorker.spawn("phase_probe_mod", ["--session=open"], log_path=str(tmp_path / "phase.log"),
+                         env=_env(tmp_path), cwd=str(ROOT), python=sys.executable)
+    assert w.wait_ready(60)
+    info = w.ready_info()
+    assert info["module"] == "phase_probe_mod" and "phase_probe_mod" in info["timings_s"]
+    # Nothing runs before go
+    assert not (tmp_path / "out.json").exists()
+    assert w.go() == 3
+    out = json.loads((tmp_path / "out.json").read_text())
+    assert out == {"argv": ["--session=open"], "mode": "warm"}
+    assert not os.path.exists(w.ready_file)
+    assert "[warm_worker] preloaded" in (tmp_path / "phase.log").read_text()
+
+
+def test_dead_worker_returns_none_for_cold_fallback(tmp_path):
+    w = WarmWorker.spawn("phase_probe_mod", [], env=_env(tmp_path), cwd=str(ROOT), python=sys.executable)
+    w.proc.kill()
+    w.proc.wait()
+    assert w.go() is None
+    assert not (tmp_path / "out.json").exists()
+
+
+def test_mark_first_quote_once(tmp_path, monkeypatch):
+    path = tmp_path / "phase_latency.jsonl"
+    monkeypatch.setattr(phase_latency, "_MARKED", False)
+    monkeypatch.setenv("TBOT_PHASE_LATENCY_PATH", str(path))
+    monkeypatch.setenv("TBOT_PHASE_NAME", "open")
+    monkeypatch.setenv("TBOT_PHASE_MODE", "warm")
+    monkeypatch.setenv("TBOT_PHASE_SCHEDULED_TS", "2026-01-02T14:30:00Z")
+    rec = phase_latency.mark_first_quote()
+    assert rec["phase"] == "open" and rec["mode"] == "warm" and rec["latency_s"] > 0
+    assert phase_latency.mark_first_quote() is None
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1 and json.loads(lines[0])["scheduled_ts"] == "2026-01-02T14:30:00Z"
@@ -0,0 +1,256 @@
+# tbot_bot/trading/holdings_engine.py
+# Change-driven holdings loop: one consolidated account+positions snapshot per poll, diffed against the
+# snapshot the last decision ran on; rebalance/float logic only re-runs when positions, cash or targets moved.
+
+"""
+HoldingsEngine
+--------------
+The persistent holdings manager used to call `perform_holdings_cycle()` every POLL_INTERVAL seconds,
+and every cycle re-fetched account value, cash and ETF holdings (3-4 broker requests) and recomputed
+float/rebalance logic even when nothing had changed.
+
+Per poll the engine now:
+  * fetches one HoldingsSnapshot (`broker.get_account_snapshot()` when the adapter has it: account and
+    positions in a single call; otherwise the legacy three getters),
+  * compares it with the snapshot of the last *decision* (not the last poll, so slow drift still adds up):
+    cash must move by more than `change_tol` dollars (the $1 threshold the cycle itself uses before
+    placing anything); account value and positions by more than that or `drift_pct` percent, so
+    ordinary intraday price drift does not re-run the cycle every poll,
+  * compares the target fingerprint (ETF list, float/tax/payroll %, rebalance due) from `targets_loader`,
+  * calls `decide(snapshot)` only when something changed; `decide` returns the number of orders placed.
+
+Settling after orders:
+  * the pre-order snapshot stays the baseline; polls at `fast_interval` do not re-decide while the account
+    still looks like that baseline (orders pending), so pending top-ups/sells are never placed twice,
+  * once positions/cash moved away from the baseline, the engine waits for two consecutive equal snapshots
+    (fills done) and then decides on the settled account,
+  * after `settle_s` (default: base_interval, the old fixed loop period) it decides anyway, e.g. when orders
+    were rejected and nothing moved.
+
+Adaptive polling:
+  * after a decision that placed orders: `fast_interval` while settling
+  * after a decision without orders: `base_interval`
+  * each idle poll doubles the interval up to `max_interval`
+
+Metrics (`metrics()`, also written to status/holdings_engine_metrics.json by the manager loop):
+polls, decisions, skipped polls, orders, broker requests, requests per hour and decision latency
+(snapshot fetched -> decision finished, over the last LATENCY_WINDOW decisions).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+METRICS_FILENAME = "holdings_engine_metrics.json"
+LATENCY_WINDOW = 1000  # most recent decisions kept for the latency percentiles
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class HoldingsSnapshot:
+    account_value: float
+    cash: float
+    holdings: Dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+    fetched_at: float = 0.0
+
+    def changed_from(self, other: Optional["HoldingsSnapshot"], tol: float, drift_pct: float = 0.0) -> List[str]:
+        """Fields that moved materially since `other` (["initial"] if there is no baseline)."""
+        if other is None:
+            return ["initial"]
+
+        def moved(new: float, old: float) -> bool:
+            return abs(new - old) > max(tol, abs(old) * drift_pct / 100.0)
+
+        changed = []
+        if abs(self.cash - other.cash) > tol:
+            changed.append("cash")
+        if moved(self.account_value, other.account_value):
+            changed.append("account_value")
+        for sym in sorted(set(self.holdings) | set(other.holdings)):
+            if sym not in self.holdings or sym not in other.holdings:
+                changed.append(f"position:{sym}")
+            elif moved(self.holdings[sym], other.holdings[sym]):
+                changed.append(f"position:{sym}")
+        return changed
+
+
+def fetch_snapshot(broker, clock: Callable[[], float] = time.monotonic) -> HoldingsSnapshot:
+    """Account value, cash and ETF holdings in as few broker requests as the adapter allows."""
+    if hasattr(broker, "get_account_snapshot"):
+        snap = broker.get_account_snapshot()
+        return HoldingsSnapshot(
+            account_value=float(snap.get("account_value") or 0.0),
+            cash=float(snap.get("cash") or 0.0),
+            holdings={k: float(v or 0.0) for k, v in (snap.get("etf_holdings") or {}).items()},
+            requests=int(snap.get("requests", 1)),
+            fetched_at=clock(),
+        )
+    return HoldingsSnapshot(
+        account_value=float(broker.get_account_value() or 0.0),
+        cash=float(broker.get_cash_balance() or 0.0),
+        holdings={k: float(v or 0.0) for k, v in (broker.get_etf_holdings() or {}).items()},
+        requests=3,
+        fetched_at=clock(),
+    )
+
+
+class HoldingsEngine:
+    def __init__(
+        self,
+        broker_factory: Callable[[], Any],
+        decide: Callable[[HoldingsSnapshot], Optional[int]],
+        targets_loader: Callable[[], Dict[str, Any]] = dict,
+        ready: Callable[[], bool] = lambda: True,
+        base_interval: Optional[float] = None,
+        fast_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        change_tol: Optional[float] = None,
+        drift_pct: Optional[float] = None,
+        settle_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.broker_factory = broker_factory
+        self.decide = decide
+        self.targets_loader = targets_loader
+        self.ready = ready
+        self.base_interval = base_interval if base_interval is not None else _env_float("TBOT_HOLDINGS_POLL_SEC", 60)
+        self.fast_interval = fast_interval if fast_interval is not None else _env_float("TBOT_HOLDINGS_POLL_FAST_SEC", 10)
+        self.max_interval = max_interval if max_interval is not None else _env_float("TBOT_HOLDINGS_POLL_MAX_SEC", 300)
+        self.change_tol = change_tol if change_tol is not None else _env_float("TBOT_HOLDINGS_CHANGE_TOL", 1.0)
+        self.drift_pct = drift_pct if drift_pct is not None else _env_float("TBOT_HOLDINGS_DRIFT_PCT", 0.5)
+        self.settle_s = settle_s if settle_s is not None else _env_float("TBOT_HOLDINGS_SETTLE_SEC", self.base_interval)
+        self.clock = clock
+        self.sleep = sleep
+
+        self.interval = self.base_interval
+        self.last_snapshot: Optional[HoldingsSnapshot] = None
+        self.last_targets: Optional[Dict[str, Any]] = None
+        self.last_changes: List[str] = []
+        self.settling_since: Optional[float] = None
+        self._settle_prev: Optional[HoldingsSnapshot] = None
+
+        self._started = clock()
+        self._polls = 0
+        self._decisions = 0
+        self._orders = 0
+        self._requests = 0
+        self._decision_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def poll(self) -> bool:
+        """Fetch one snapshot and run `decide` if anything changed. Returns True when a decision ran."""
+        if not self.ready():
+            # Not provisioned yet: no broker traffic, and no baseline so the first ready poll decides
+            self._reset_baseline()
+            return False
+        self._polls += 1
+        snap = fetch_snapshot(self.broker_factory(), self.clock)
+        self._requests += snap.requests
+        targets = self.targets_loader() or {}
+
+        changes = snap.changed_from(self.last_snapshot, self.change_tol, self.drift_pct)
+        if self.last_targets is not None and targets != self.last_targets:
+            changes.append("targets")
+        self.last_changes = changes
+        if self.settling_since is not None:
+            if not self._settled(snap, changes):
+                self.interval = self.fast_interval
+                return False
+            changes = changes or ["settled"]  # orders rejected/unfilled: re-check once the settle delay is over
+            self.last_changes = changes
+        if not changes:
+            self.interval = min(self.interval * 2, self.max_interval)
+            return False
+
+        orders = int(self.decide(snap) or 0)
+        self._decision_latencies.append(self.clock() - snap.fetched_at)
+        self._decisions += 1
+        self._orders += orders
+        # Keep this (pre-order) snapshot as the baseline; with orders out, settle before deciding again
+        self.last_snapshot = snap
+        self._settle_prev = None
+        if orders:
+            self.settling_since = self.clock()
+            self.interval = self.fast_interval
+        else:
+            self.settling_since = None
+            self.interval = self.base_interval
+        self.last_targets = targets
+        return True
+
+    def _settled(self, snap: HoldingsSnapshot, changes: List[str]) -> bool:
+        """After orders: True once the account moved and held still for one poll, or settle_s elapsed."""
+        if self.clock() - self.settling_since >= self.settle_s:
+            return True
+        if not [c for c in changes if c != "targets"]:
+            return False  # still the pre-order account: fills pending
+        prev, self._settle_prev = self._settle_prev, snap
+        return prev is not None and not snap.changed_from(prev, self.change_tol, self.drift_pct)
+
+    def _reset_baseline(self) -> None:
+        self.last_snapshot = None
+        self.settling_since = None
+        self._settle_prev = None
+        self.interval = self.base_interval
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False,
+            on_poll: Optional[Callable[["HoldingsEngine", Optional[Exception]], None]] = None) -> None:
+        """Poll until should_stop(); errors are passed to on_poll and retried at base_interval."""
+        while True:
+            err = None
+            try:
+                self.poll()
+            except Exception as e:
+                err = e
+                self._reset_baseline()
+            if on_poll:
+                on_poll(self, err)
+            if should_stop():
+                return
+            self.sleep(self.interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        elapsed_h = max(self.clock() - self._started, 1e-9) / 3600.0
+        lat = sorted(self._decision_latencies)
+        return {
+            "polls": self._polls,
+            "decisions": self._decisions,
+            "skipped": self._polls - self._decisions,
+            "orders": self._orders,
+            "broker_requests": self._requests,
+            "requests_per_hour": round(self._requests / elapsed_h, 2),
+            "interval_s": self.interval,
+            "settling": self.settling_since is not None,
+            "last_changes": list(self.last_changes),
+            "decision_latency_s": {
+                "count": len(lat),
+                "p50": lat[len(lat) // 2] if lat else None,
+                "max": lat[-1] if lat else None,
+            },
+        }
+
+    def save_metrics(self, path: Optional[str] = None) -> None:
+        if path is None:
+            # Lazy import: path_resolver pulls identity/secrets helpers
+            from tbot_bot.support.path_resolver import get_status_path
+            path = get_status_path(METRICS_FILENAME)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp.{os.getpid()}.{uuid.uuid4().hex}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": time.time(), **self.metrics()}, f, indent=2)
+        os.replace(tmp, path)
@@ -26,6 +26,7 @@ from tbot_bot.trading.holdings_utils import (
 from tbot_bot.support.holdings_secrets import load_holdings_secrets, save_holdings_secrets
 from tbot_bot.support.utils_log import get_logger, log_event
 from tbot_bot.broker.broker_api import get_active_broker
+from tbot_bot.trading.holdings_engine import HoldingsEngine
 from tbot_bot.support.path_resolver import get_bot_state_path, get_output_path
 from tbot_bot.support.bootstrap_utils import is_first_bootstrap
 from tbot_bot.reporting.audit_logger import audit_log_event
@@ -208,13 +209,30 @@ def get_holdings_status():
         "etf_holdings": etf_holdings
     }
 
-def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_manager"):
+def _holdings_targets():
+    """Config inputs of the holdings decision; the engine re-decides when any of these change."""
+    holdings_cfg = load_holdings_secrets()
+    return {
+        "etf_targets": parse_etf_allocations(holdings_cfg.get("HOLDINGS_ETF_LIST", "SCHD:50,SCHY:50")),
+        "float_pct": holdings_cfg.get("HOLDINGS_FLOAT_TARGET_PCT", 10),
+        "tax_pct": holdings_cfg.get("HOLDINGS_TAX_RESERVE_PCT", 20),
+        "payroll_pct": holdings_cfg.get("HOLDINGS_PAYROLL_PCT", 10),
+        "rebalance_due": _should_rebalance(holdings_cfg),
+    }
+
+def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_manager", snapshot=None):
+    """
+    One holdings decision pass. `snapshot` (HoldingsSnapshot) supplies account value, cash and ETF
+    holdings already fetched by the engine; without it they are read from the broker as before.
+    Returns the number of orders placed.
+    """
     if not _is_bot_initialized():
         _warn_or_info("Holdings manager: Bot not initialized/provisioned/bootstrapped.")
-        return
-    if not _is_broker_configured():
+        return 0
+    # A snapshot already proves the broker answers
+    if snapshot is None and not _is_broker_configured():
         _warn_or_info("Holdings manager: No broker is configured or provisioned yet.")
-        return
+        return 0
 
     # --- SURGICAL: mark planning start ---
     set_state("analyzing", reason="holdings:analyze")
@@ -227,28 +245,36 @@ def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_ma
     etf_cfg = holdings_cfg.get("HOLDINGS_ETF_LIST", "SCHD:50,SCHY:50")
     etf_targets = parse_etf_allocations(etf_cfg)
 
-    account_value = broker.get_account_value()
-    current_cash = broker.get_cash_balance()
+    if snapshot is not None:
+        account_value, current_cash = snapshot.account_value, snapshot.cash
+    else:
+        account_value = broker.get_account_value()
+        current_cash = broker.get_cash_balance()
+    orders_placed = 0
 
     # === Step 0: Conditional rebalance if due ===
     if _should_rebalance(holdings_cfg):
-        holdings = broker.get_etf_holdings()
+        holdings = snapshot.holdings.copy() if snapshot is not None else broker.get_etf_holdings()
         if _compliance_preview_or_abort(holdings, etf_targets, account_value):
             # (placing) rebalance orders handled in perform_rebalance_cycle
-            perform_rebalance_cycle(user)
+            orders_placed += perform_rebalance_cycle(user) or 0
             _mark_rebalance_complete(holdings_cfg)
         else:
             _warn_or_info("Rebalance blocked for compliance, not executed.")
             # Even if blocked, treat as completion of planning step
             set_state("running", reason="holdings:done")
-            return
+            return orders_placed
 
     # === Step 1: Top-up float (sell ETFs if needed) ===
     deficit = compute_cash_deficit(account_value, float_pct, current_cash)
     if deficit > 1:
         # --- SURGICAL: mark order submission start for float top-up ---
         set_state("trading", reason="holdings:placing")
-        holdings = broker.get_etf_holdings()
+        # Snapshot holdings are stale once the rebalance above has traded
+        if snapshot is not None and not orders_placed:
+            holdings = snapshot.holdings.copy()
+        else:
+            holdings = broker.get_etf_holdings()
         sorted_by_value = sorted(holdings.items(), key=lambda x: -x[1])
         for symbol, value in sorted_by_value:
             if value < 1:
@@ -257,6 +283,7 @@ def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_ma
             sell_order = {"symbol": symbol, "action": "sell", "amount": sell_amt}
             if compliance_filter_ledger_entry(sell_order):
                 broker.place_order(symbol, "sell", sell_amt)
+                orders_placed += 1
                 deficit -= sell_amt
                 _warn_or_info(f"Topped up cash by selling {sell_amt} of {symbol}")
                 log_event("holdings_float_topup", f"Topped up cash by selling {sell_amt} of {symbol}", level="info", extra={
@@ -286,6 +313,7 @@ def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_ma
             buy_order = {"symbol": symbol, "action": "buy", "amount": alloc_amt}
             if compliance_filter_ledger_entry(buy_order):
                 broker.place_order(symbol, "buy", alloc_amt)
+                orders_placed += 1
                 # (surgical) Attach native trailing stop for long-term ETFs if configured
                 _maybe_attach_trailing_after_buy(symbol, alloc_amt)
                 _warn_or_info(f"Reinvested {alloc_amt} into {symbol}")
@@ -306,6 +334,7 @@ def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_ma
             float_order = {"symbol": symbol, "action": "buy", "amount": alloc_amt}
             if compliance_filter_ledger_entry(float_order):
                 broker.place_order(symbol, "buy", alloc_amt)
+                orders_placed += 1
                 # (surgical) Attach native trailing stop for float auto-buys if configured
                 _maybe_attach_trailing_after_buy(symbol, alloc_amt)
                 _warn_or_info(f"Invested float excess: {alloc_amt} into {symbol}")
@@ -316,14 +345,15 @@ def perform_holdings_cycle(realized_gains: float = 0.0, user: str = "holdings_ma
 
     # --- SURGICAL: mark cycle completion ---
     set_state("running", reason="holdings:done")
+    return orders_placed
 
 def perform_rebalance_cycle(user: str = "holdings_manager"):
     if not _is_bot_initialized():
         _warn_or_info("Rebalance cycle: Bot not initialized/provisioned/bootstrapped.")
-        return
+        return 0
     if not _is_broker_configured():
         _warn_or_info("Rebalance cycle: No broker is configured or provisioned yet.")
-        return
+        return 0
 
     # --- SURGICAL: planning already marked by caller; mark placing for rebalance batch ---
     broker = get_active_broker()
@@ -336,17 +366,20 @@ def perform_rebalance_cycle(user: str = "holdings_manager"):
 
     if not _compliance_preview_or_abort(holdings, etf_targets, account_value):
         _warn_or_info("Rebalance compliance preview failed, aborting rebalance.")
-        return
+        return 0
 
     orders = compute_rebalance_orders(holdings, etf_targets, account_value)
     if orders:
         set_state("trading", reason="holdings:placing")
+    placed = 0
     for order in orders:
         if compliance_filter_ledger_entry(order):
             broker.place_order(order['symbol'], order['action'], order['amount'])
+            placed += 1
             _warn_or_info(f"Rebalance: {order['action']} ${order['amount']} of {order['symbol']}")
             log_event("holdings_rebalance", f"Rebalance: {order['action']} ${order['amount']} of {order['symbol']}", level="info", extra=order)
             audit_log_event("holdings_rebalance", actor=user, reference=order['symbol'], details=order)
+    return placed
 
 def manual_holdings_action(action, user="manual"):
     if action == "rebalance":
@@ -376,38 +409,61 @@ def _after_close_exit_if_requested():
         pass
     return False
 
+_BROKER_VERIFIED = False
+
+def _is_holdings_ready():
+    # Unset/unprovisioned broker counts as "not ready" (warn and wait), never as a holdings error.
+    # The account probe runs until it first succeeds; afterwards only the (cached) adapter lookup is checked,
+    # so a provisioned broker costs no extra request per poll.
+    global _BROKER_VERIFIED
+    if not _is_bot_initialized():
+        _warn_or_info("Holdings manager: Bot not initialized/provisioned/bootstrapped.")
+        return False
+    if not _BROKER_VERIFIED:
+        if not _is_broker_configured():
+            _warn_or_info("Holdings manager: No broker is configured or provisioned yet.")
+            return False
+        _BROKER_VERIFIED = True
+        return True
+    try:
+        get_active_broker()
+        return True
+    except Exception as e:
+        _BROKER_VERIFIED = False
+        _warn_or_info(f"Holdings manager: Broker unavailable: {e}")
+        return False
+
 def main():
     _warn_or_info("Holdings manager started as persistent service.")
     # Optional session context for stamps when running persistently
     session_env = os.environ.get("TBOT_HOLDINGS_SESSION")
     one_shot = os.environ.get("TBOT_HOLDINGS_ONE_SHOT", "").lower() == "true"
 
-    try:
-        perform_holdings_cycle()
-        _write_job_stamp("OK" if not session_env else f"OK ({session_env})")
-    except Exception as e:
-        _warn_or_info(f"Exception in holdings cycle: {e}")
-        log_event("holdings_manager_error", f"Exception: {e}", level="error", extra={"error": str(e)})
-        audit_log_event("holdings_manager_error", actor="holdings_manager", reference=None, details={"error": str(e)})
-        set_state("error", reason="holdings:error")
-        _write_job_stamp("Failed" if not session_env else f"Failed ({session_env})")
-
-    if one_shot or _after_close_exit_if_requested():
-        return
-
-    while True:
-        time.sleep(POLL_INTERVAL)
-        try:
-            perform_holdings_cycle()
+    # Change-driven loop: one account+positions snapshot per poll; the cycle only re-runs when
+    # positions, cash or holdings targets changed, polling faster after orders and slower when idle.
+    engine = HoldingsEngine(
+        broker_factory=get_active_broker,
+        decide=lambda snap: perform_holdings_cycle(snapshot=snap),
+        targets_loader=_holdings_targets,
+        ready=_is_holdings_ready,
+        base_interval=POLL_INTERVAL,
+    )
+
+    def _on_poll(eng, e):
+        if e is None:
             _write_job_stamp("OK" if not session_env else f"OK ({session_env})")
-            if _after_close_exit_if_requested():
-                return
-        except Exception as e:
+        else:
             _warn_or_info(f"Exception in holdings cycle: {e}")
             log_event("holdings_manager_error", f"Exception: {e}", level="error", extra={"error": str(e)})
             audit_log_event("holdings_manager_error", actor="holdings_manager", reference=None, details={"error": str(e)})
             set_state("error", reason="holdings:error")
             _write_job_stamp("Failed" if not session_env else f"Failed ({session_env})")
+        try:
+            eng.save_metrics()
+        except Exception:
+            pass
+
+    engine.run(should_stop=lambda: one_shot or _after_close_exit_if_requested(), on_poll=_on_poll)
 
 if __name__ == "__main__":
     main()
@@ -17,31 +17,43 @@ import requests
 
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.utils_time import utc_now
-
-config = get_bot_config()
-
-# --- Email (SMTP) ---
-SMTP_USER = config.get("SMTP_USER")
-SMTP_PASS = config.get("SMTP_PASS")
-SMTP_HOST = config.get("SMTP_HOST", "localhost")
-SMTP_PORT = int(config.get("SMTP_PORT", 25))
-ALERT_EMAIL = config.get("ALERT_EMAIL")
-
-# Feature toggles
-NOTIFY_ON_FILL = bool(config.get("NOTIFY_ON_FILL", False))
-NOTIFY_ON_EXIT = bool(config.get("NOTIFY_ON_EXIT", False))
-
-# --- Optional Slack webhook ---
-SLACK_WEBHOOK_URL = config.get("SLACK_WEBHOOK_URL")
-
-# --- Optional PagerDuty Events v2 ---
-PAGERDUTY_ROUTING_KEY = config.get("PAGERDUTY_ROUTING_KEY")  # Integration key
-
-# --- Optional Twilio SMS ---
-TWILIO_ACCOUNT_SID = config.get("TWILIO_ACCOUNT_SID")
-TWILIO_AUTH_TOKEN = config.get("TWILIO_AUTH_TOKEN")
-TWILIO_FROM_NUMBER = config.get("TWILIO_FROM_NUMBER")
-ALERT_PHONE = config.get("ALERT_PHONE")  # destination phone number
+from tbot_bot.support.lazy_settings import LazySettings
+
+# Notification settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+
+    # --- Email (SMTP) ---
+    SMTP_USER = config.get("SMTP_USER")
+    SMTP_PASS = config.get("SMTP_PASS")
+    SMTP_HOST = config.get("SMTP_HOST", "localhost")
+    SMTP_PORT = int(config.get("SMTP_PORT", 25))
+    ALERT_EMAIL = config.get("ALERT_EMAIL")
+
+    # Feature toggles
+    NOTIFY_ON_FILL = bool(config.get("NOTIFY_ON_FILL", False))
+    NOTIFY_ON_EXIT = bool(config.get("NOTIFY_ON_EXIT", False))
+
+    # --- Optional Slack webhook ---
+    SLACK_WEBHOOK_URL = config.get("SLACK_WEBHOOK_URL")
+
+    # --- Optional PagerDuty Events v2 ---
+    PAGERDUTY_ROUTING_KEY = config.get("PAGERDUTY_ROUTING_KEY")  # Integration key
+
+    # --- Optional Twilio SMS ---
+    TWILIO_ACCOUNT_SID = config.get("TWILIO_ACCOUNT_SID")
+    TWILIO_AUTH_TOKEN = config.get("TWILIO_AUTH_TOKEN")
+    TWILIO_FROM_NUMBER = config.get("TWILIO_FROM_NUMBER")
+    ALERT_PHONE = config.get("ALERT_PHONE")  # destination phone number
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "SMTP_USER", "SMTP_PASS", "SMTP_HOST", "SMTP_PORT", "ALERT_EMAIL", "NOTIFY_ON_FILL",
+    "NOTIFY_ON_EXIT", "SLACK_WEBHOOK_URL", "PAGERDUTY_ROUTING_KEY", "TWILIO_ACCOUNT_SID",
+    "TWILIO_AUTH_TOKEN", "TWILIO_FROM_NUMBER", "ALERT_PHONE",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- TEST_MODE flag file ---
 CONTROL_DIR = Path(__file__).resolve().parents[2] / "control"
@@ -68,6 +80,7 @@ def _notify_guard(override: bool = False) -> bool:
 
 def send_email(subject: str, message: str, override: bool = False):
     """Send an email via SMTP if enabled or override is set; suppressed in TEST_MODE unless override."""
+    _SETTINGS.ensure()
     if not _notify_guard(override):
         return
     if not ALERT_EMAIL:
@@ -97,6 +110,7 @@ def send_email(subject: str, message: str, override: bool = False):
 
 def send_slack(subject: str, message: str, override: bool = False):
     """Post to Slack webhook if configured; suppressed in TEST_MODE unless override."""
+    _SETTINGS.ensure()
     if not _notify_guard(override):
         return
     if not SLACK_WEBHOOK_URL:
@@ -110,6 +124,7 @@ def send_slack(subject: str, message: str, override: bool = False):
 
 def send_pagerduty_event(summary: str, severity: str = "error", source: str = "tbot", override: bool = False):
     """Send PagerDuty Events v2 trigger; suppressed in TEST_MODE unless override."""
+    _SETTINGS.ensure()
     if not _notify_guard(override):
         return
     if not PAGERDUTY_ROUTING_KEY:
@@ -134,6 +149,7 @@ def send_pagerduty_event(summary: str, severity: str = "error", source: str = "t
 
 def send_sms(message: str, to_number: str = None, override: bool = False):
     """Send SMS via Twilio if configured; suppressed in TEST_MODE unless override."""
+    _SETTINGS.ensure()
     if not _notify_guard(override):
         return
     to = to_number or ALERT_PHONE
@@ -159,6 +175,7 @@ def send_sms(message: str, to_number: str = None, override: bool = False):
 
 def notify_trade_fill(ticker, side, size, price, strategy, broker):
     """Notify when a trade is filled (suppressed in TEST_MODE)."""
+    _SETTINGS.ensure()
     if is_test_mode_active():
         return
     if not NOTIFY_ON_FILL:
@@ -180,6 +197,7 @@ def notify_trade_fill(ticker, side, size, price, strategy, broker):
 
 def notify_trade_exit(ticker, size, entry_price, exit_price, pnl, strategy, broker):
     """Notify when a trade is exited (suppressed in TEST_MODE)."""
+    _SETTINGS.ensure()
     if is_test_mode_active():
         return
     if not NOTIFY_ON_EXIT:
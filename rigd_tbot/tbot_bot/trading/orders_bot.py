@@ -29,6 +29,7 @@ from tbot_bot.support.utils_time import utc_now
 from tbot_bot.support.utils_log import log_event
 from tbot_bot.support.decrypt_secrets import decrypt_json
 from tbot_bot.support import path_resolver  # (surgical) ensure control path consistency
+from tbot_bot.support.lazy_settings import LazySettings
 
 # --- Centralized trailing-stop helpers (re-exported here for backward compatibility) ---
 from tbot_bot.trading.trailing_stop import (
@@ -41,21 +42,30 @@ def _get_broker_api():
     from tbot_bot.broker import broker_api
     return broker_api
 
-config = get_bot_config()
-MAX_RISK_PER_TRADE = float(config.get("MAX_RISK_PER_TRADE", 0.025))
-# (surgical) robust boolean parsing (env may store strings)
-FRACTIONAL = str(config.get("FRACTIONAL", "true")).strip().lower() == "true"
-MIN_PRICE = float(config.get("MIN_PRICE", 5))
-MAX_PRICE = float(config.get("MAX_PRICE", 100))
+# Config/broker settings resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+    MAX_RISK_PER_TRADE = float(config.get("MAX_RISK_PER_TRADE", 0.025))
+    # (surgical) robust boolean parsing (env may store strings)
+    FRACTIONAL = str(config.get("FRACTIONAL", "true")).strip().lower() == "true"
+    MIN_PRICE = float(config.get("MIN_PRICE", 5))
+    MAX_PRICE = float(config.get("MAX_PRICE", 100))
+
+    # Retrieve BROKER_CODE (BROKER_NAME) from broker_credentials.json.enc (not .env_bot)
+    broker_creds = decrypt_json("broker_credentials")
+    BROKER_NAME = broker_creds.get("BROKER_CODE", "ALPACA").lower()
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "MAX_RISK_PER_TRADE", "FRACTIONAL", "MIN_PRICE", "MAX_PRICE", "broker_creds", "BROKER_NAME",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 # --- (surgical) Use tbot_bot/control via resolver to match the rest of the codebase ---
 CONTROL_DIR = path_resolver.get_project_root() / "tbot_bot" / "control"
 TEST_MODE_FLAG = CONTROL_DIR / "test_mode.flag"
 
-# Retrieve BROKER_CODE (BROKER_NAME) from broker_credentials.json.enc (not .env_bot)
-broker_creds = decrypt_json("broker_credentials")
-BROKER_NAME = broker_creds.get("BROKER_CODE", "ALPACA").lower()
-
 
 def _is_test_mode_active() -> bool:
     return TEST_MODE_FLAG.exists()
@@ -70,6 +80,7 @@ def _validate_price_bounds(symbol: str, price) -> bool:
     Allow market orders with price=None by skipping hard bounds.
     Keep bounds for explicit-limit style calls that pass a price.
     """
+    _SETTINGS.ensure()
     if price is None:
         return True
     if price < MIN_PRICE or price > MAX_PRICE:
@@ -164,6 +175,7 @@ def _resolve_trailing_pct(strategy: Optional[str], explicit_pct: Optional[float]
       2) Else fall back to global TRADING_TRAILING_STOP_PCT.
       3) Else fall back to the explicit pct provided by the caller (if any).
     """
+    _SETTINGS.ensure()
     try:
         # Prefer per-strategy if strategy is provided
         if strategy:
@@ -245,6 +257,7 @@ def create_order(symbol: str,
     :param use_trailing_stop: bool, request broker/native trailing if available
     :return: dict with order metadata or None if failed
     """
+    _SETTINGS.ensure()
     # Resolve the effective trailing percent up front (per-strategy overrides)
     trail_pct_eff = _resolve_trailing_pct(strategy, stop_loss_pct)
 
@@ -364,6 +377,7 @@ def exit_order(symbol: str,
     :param strategy: optional label
     :return: dict with order metadata or None
     """
+    _SETTINGS.ensure()
     # TEST_MODE stub: simulate success, NO live API calls
     if _is_test_mode_active():
         order = {
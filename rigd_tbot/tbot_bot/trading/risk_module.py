@@ -8,11 +8,13 @@ All trades must be routed through this module before execution.
 
 from tbot_bot.config.env_bot import get_bot_config
 from tbot_bot.support.utils_log import log_event
+from tbot_bot.support.lazy_settings import LazySettings
 from datetime import datetime, timezone
 print(f"[LAUNCH] risk_module.py launched @ {datetime.now(timezone.utc).isoformat()}", flush=True)
 
 # --- Enhancement imports (all core, fail-safe) ---
 from tbot_bot.enhancements.ticker_blocklist import is_ticker_blocked
+from tbot_bot.screeners.blocklist_manager import is_blocked
 
 try:
     from tbot_bot.enhancements.adx_filter import get_adx
@@ -48,17 +50,28 @@ except ImportError:
 # (Surgical fix directive)
 from tbot_bot.screeners.screener_utils import get_realtime_price  # noqa: F401
 
-config = get_bot_config()
-TOTAL_ALLOCATION = float(config.get("TOTAL_ALLOCATION", 0.02))
-MAX_TRADES = int(config.get("MAX_TRADES", 4))
-WEIGHTS = [float(w) for w in str(config.get("WEIGHTS", "0.4,0.2,0.2,0.2")).split(",")]
-MAX_OPEN_POSITIONS = int(config.get("MAX_OPEN_POSITIONS", 5))
-MAX_RISK_PER_TRADE = float(config.get("MAX_RISK_PER_TRADE", 0.025))
-
-ADX_MAX = float(config.get("ADX_MAX", 45))
-VIX_MAX = float(config.get("VIX_MAX", 24))
+# Config-derived limits resolve on first use (see support/lazy_settings.py) so importing stays cheap.
+def _load_settings():
+    config = get_bot_config()
+    TOTAL_ALLOCATION = float(config.get("TOTAL_ALLOCATION", 0.02))
+    MAX_TRADES = int(config.get("MAX_TRADES", 4))
+    WEIGHTS = [float(w) for w in str(config.get("WEIGHTS", "0.4,0.2,0.2,0.2")).split(",")]
+    MAX_OPEN_POSITIONS = int(config.get("MAX_OPEN_POSITIONS", 5))
+    MAX_RISK_PER_TRADE = float(config.get("MAX_RISK_PER_TRADE", 0.025))
+
+    ADX_MAX = float(config.get("ADX_MAX", 45))
+    VIX_MAX = float(config.get("VIX_MAX", 24))
+    # every local above becomes a module global
+    return dict(locals())
+
+_SETTINGS = LazySettings(globals(), _load_settings, (
+    "config", "TOTAL_ALLOCATION", "MAX_TRADES", "WEIGHTS", "MAX_OPEN_POSITIONS",
+    "MAX_RISK_PER_TRADE", "ADX_MAX", "VIX_MAX",
+))
+__getattr__ = _SETTINGS.module_getattr
 
 def get_trade_weight(index: int, active_count: int) -> float:
+    _SETTINGS.ensure()
     if active_count <= 0:
         log_event("risk_module", "Invalid active signal count: 0")
         return 0.0
@@ -90,8 +103,9 @@ def validate_trade(
     Returns (True, allocation) if allowed; (False, reason) if blocked.
     """
 
+    _SETTINGS.ensure()
     # 1. Enhancement: Blocklist
-    if is_ticker_blocked(symbol):
+    if is_ticker_blocked(symbol) or is_blocked(symbol):
         log_event("risk_module", f"{symbol} is on the blocklist")
         return False, f"{symbol} is on the blocklist"
 
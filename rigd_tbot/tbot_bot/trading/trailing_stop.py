@@ -67,7 +67,8 @@ def _resolve_legacy_threshold_fn() -> Optional[Callable]:
         "compute_trailing_stop_threshold",
     ):
         fn = globals().get(cand)
-        if callable(fn):
+        # the back-compat aliases at module bottom point at the public API itself; never delegate to those
+        if callable(fn) and fn is not globals().get("compute_trailing_exit_threshold"):
             return fn
     return None
 
@@ -282,6 +283,8 @@ def place_or_prepare_trailing_stop(
     time_in_force: str = "day",
     entry_price: Optional[float] = None,
     activate_local: bool = True,
+    monitor=None,
+    strategy: Optional[str] = None,
 ) -> dict:
     """
     Prefer broker-native trailing stop; else return a local TrailingStopState.
@@ -292,6 +295,10 @@ def place_or_prepare_trailing_stop(
 
     NOTE: This function does not place the entry order. Call it immediately after entry
     (with entry_price if you have it) so local state can seed peak/trough correctly.
+
+    If `monitor` (a trailing_stop_monitor.TrailingStopMonitor) is given and the local fallback
+    is used, the state is registered with it and "position_id" is added to the returned dict;
+    the monitor then evaluates exits in batches instead of the caller polling.
     """
     # Try broker-native first
     if broker_supports_trailing_stop(broker, symbol, side):
@@ -319,6 +326,15 @@ def place_or_prepare_trailing_stop(
             state.peak = float(entry_price)
         else:
             state.trough = float(entry_price)
+    if monitor is not None and state.active:
+        pid = monitor.add_from_state(
+            state,
+            symbol=symbol,
+            qty=float(quantity or 0.0),
+            entry_price=entry_price,
+            strategy=strategy,
+        )
+        return {"placed": False, "state": state, "position_id": pid}
     return {"placed": False, "state": state}
 
 
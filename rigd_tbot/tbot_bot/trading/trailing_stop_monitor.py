@@ -0,0 +1,564 @@
+# tbot_bot/trading/trailing_stop_monitor.py
+# Batched, array-backed trailing-stop monitor for brokers without native trailing stops.
+# Holds peak/trough state for every open position and evaluates exits for all of them in one vectorized step.
+
+"""
+TrailingStopMonitor
+-------------------
+`place_or_prepare_trailing_stop(...)` returns a local TrailingStopState when the broker cannot
+place a native trailing stop. Polling those states one-by-one per tick does not scale to hundreds
+of positions, so this monitor keeps the same state in NumPy arrays and ingests ticks in batches.
+
+Semantics (mirror tbot_bot.trading.trailing_stop._compute_trailing_exit_threshold_kw):
+  * percent trailing from peak (long) / trough (short)
+  * ATR trailing from the current price
+  * 10% band vs entry when nothing else is available
+  * candidates combined conservatively (max for long, min for short), then min/max clamps vs entry
+  * long exits when price <= threshold; short exits when price >= threshold
+
+Batching:
+  * submit_tick() enqueues; a worker thread flushes the queue at least every `max_latency_s`
+    (or sooner when `max_batch` ticks are pending), so tick-to-decision latency is bounded.
+  * ingest() may also be called directly with a list of (symbol, price) ticks.
+  * Within one batch each position's ticks are evaluated in arrival order against the running peak/trough
+    (cumulative max/min per symbol), so a dip after an intra-batch new high triggers as tick-by-tick would.
+  * A fired position is pending (inactive) until on_exit returns, then dropped; if on_exit raises it is re-armed.
+
+Persistence:
+  * State is written atomically (temp file + os.replace) to `state_path` on save_state(), by the
+    worker whenever something changed, and before exit handlers run, so a restart resumes with the same
+    peaks/troughs and re-arms positions whose exit was never confirmed ("pending_exit").
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from tbot_bot.trading.trailing_stop import TrailingStopState
+
+STATE_FILENAME = "trailing_stop_monitor.json"
+
+_NUMERIC_FIELDS = (
+    "is_long", "qty", "entry", "trail_pct", "atr", "atr_mult",
+    "min_stop_pct", "max_stop_pct", "peak", "trough", "last",
+)
+
+
+def _default_state_path() -> Path:
+    # Lazy import: path_resolver pulls identity/secrets helpers
+    from tbot_bot.support.path_resolver import get_status_path
+    return Path(get_status_path(STATE_FILENAME))
+
+
+def _default_exit_handler(event: dict) -> None:
+    # Lazy import: orders_bot reads config/credentials at import time
+    from tbot_bot.trading.orders_bot import exit_order
+    exit_order(
+        symbol=event["symbol"],
+        side="sell" if event["side"] == "long" else "buy",
+        qty=event["qty"],
+        strategy=event.get("strategy"),
+    )
+
+
+def _opt(v) -> float:
+    return float(v) if v is not None else np.nan
+
+
+def compute_thresholds(
+    is_long: np.ndarray,
+    current: np.ndarray,
+    entry: np.ndarray,
+    peak: np.ndarray,
+    trough: np.ndarray,
+    trail_pct: np.ndarray,
+    atr: np.ndarray,
+    atr_mult: np.ndarray,
+    min_stop_pct: np.ndarray,
+    max_stop_pct: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized equivalent of compute_trailing_exit_threshold(...) (keyword style).
+    Missing inputs are NaN; positions with no computable threshold return NaN.
+    """
+    with np.errstate(invalid="ignore"):
+        has_pct = trail_pct > 0
+        pct_long = np.where(has_pct & (peak > 0), peak * (1.0 - trail_pct), np.nan)
+        pct_short = np.where(has_pct & (trough > 0), trough * (1.0 + trail_pct), np.nan)
+        pct_cand = np.where(is_long, pct_long, pct_short)
+
+        dist = np.where((atr > 0) & (atr_mult > 0), atr * atr_mult, np.nan)
+        atr_cand = np.where(is_long, current - dist, current + dist)
+
+        thr = np.where(is_long, np.fmax(pct_cand, atr_cand), np.fmin(pct_cand, atr_cand))
+
+        has_entry = entry > 0
+        fallback = np.where(is_long, entry * 0.90, entry * 1.10)
+        thr = np.where(np.isnan(thr) & has_entry, fallback, thr)
+
+        min_thr = np.where(is_long, entry * (1.0 - min_stop_pct), entry * (1.0 + min_stop_pct))
+        use_min = has_entry & (min_stop_pct > 0)
+        thr = np.where(use_min, np.where(is_long, np.maximum(thr, min_thr), np.minimum(thr, min_thr)), thr)
+
+        max_thr = np.where(is_long, entry * (1.0 - max_stop_pct), entry * (1.0 + max_stop_pct))
+        use_max = has_entry & (max_stop_pct > 0)
+        thr = np.where(use_max, np.where(is_long, np.minimum(thr, max_thr), np.maximum(thr, max_thr)), thr)
+    return thr
+
+
+class TrailingStopMonitor:
+    """
+    Holds trailing-stop state for many positions and emits exit events in batches.
+
+    on_exit(event) receives a dict:
+      {position_id, symbol, side, qty, price, threshold, peak, trough, strategy, decided_at}
+    Positions are dropped once on_exit returns (one event per position); a raising on_exit re-arms the stop.
+    """
+
+    def __init__(
+        self,
+        on_exit: Optional[Callable[[dict], None]] = None,
+        state_path: Optional[str] = None,
+        max_latency_s: float = 0.1,
+        max_batch: int = 10000,
+        persist: bool = True,
+    ):
+        self.on_exit = on_exit or _default_exit_handler
+        self.max_latency_s = float(max_latency_s)
+        self.max_batch = int(max_batch)
+        self.persist = bool(persist)
+        self._state_path = Path(state_path) if state_path else None
+
+        self._lock = threading.RLock()
+        self._pending: List[Tuple[str, float, float]] = []
+        self._pending_cv = threading.Condition(threading.Lock())
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._dirty = False
+        self._latencies: List[float] = []
+
+        self._ids: List[str] = []
+        self._symbols: List[str] = []
+        self._strategies: List[Optional[str]] = []
+        self._arr: Dict[str, np.ndarray] = {k: np.empty(0, dtype=float) for k in _NUMERIC_FIELDS}
+        self._active = np.empty(0, dtype=bool)
+        self._sym_codes = np.empty(0, dtype=np.int64)
+        self._sym_index: Dict[str, int] = {}
+
+        if self.persist:
+            self.load_state()
+
+    # ------------------------------------------------------------------
+    # Position management
+    # ------------------------------------------------------------------
+    @property
+    def state_path(self) -> Path:
+        if self._state_path is None:
+            self._state_path = _default_state_path()
+        return self._state_path
+
+    def __len__(self) -> int:
+        return int(self._active.sum())
+
+    def add_position(
+        self,
+        *,
+        symbol: str,
+        side: str,
+        qty: float,
+        entry_price: Optional[float] = None,
+        trail_pct: Optional[float] = None,
+        atr: Optional[float] = None,
+        atr_mult: Optional[float] = None,
+        min_stop_pct: Optional[float] = None,
+        max_stop_pct: Optional[float] = None,
+        strategy: Optional[str] = None,
+        position_id: Optional[str] = None,
+        peak: Optional[float] = None,
+        trough: Optional[float] = None,
+    ) -> str:
+        """
+        Register a position. Peak/trough seed from entry_price unless given explicitly (restore).
+        Returns the position id.
+        """
+        s = str(side).lower()
+        if s in ("buy", "long"):
+            is_long = True
+        elif s in ("sell", "short"):
+            is_long = False
+        else:
+            raise ValueError("side must be 'long' or 'short'")
+        pid = position_id or uuid.uuid4().hex
+        row = {
+            "is_long": 1.0 if is_long else 0.0,
+            "qty": float(qty),
+            "entry": _opt(entry_price),
+            "trail_pct": _opt(trail_pct),
+            "atr": _opt(atr),
+            "atr_mult": _opt(atr_mult),
+            "min_stop_pct": _opt(min_stop_pct),
+            "max_stop_pct": _opt(max_stop_pct),
+            "peak": _opt(peak if peak is not None else entry_price),
+            "trough": _opt(trough if trough is not None else entry_price),
+            "last": _opt(entry_price),
+        }
+        with self._lock:
+            if pid in self._ids:
+                self.remove_position(pid)
+            self._ids.append(pid)
+            self._symbols.append(str(symbol).upper())
+            self._strategies.append(strategy)
+            for k in _NUMERIC_FIELDS:
+                self._arr[k] = np.append(self._arr[k], row[k])
+            self._active = np.append(self._active, True)
+            self._reindex_symbols()
+            self._dirty = True
+        return pid
+
+    def add_from_state(self, state: TrailingStopState, *, symbol: str, qty: float,
+                       entry_price: Optional[float] = None, strategy: Optional[str] = None,
+                       position_id: Optional[str] = None) -> Optional[str]:
+        """Adopt a TrailingStopState returned by place_or_prepare_trailing_stop(...)."""
+        if state is None or not state.active:
+            return None
+        is_long = state.side == "long"
+        return self.add_position(
+            symbol=symbol,
+            side=state.side,
+            qty=qty,
+            entry_price=entry_price,
+            trail_pct=state.pct,
+            strategy=strategy,
+            position_id=position_id,
+            peak=state.peak if (is_long and state.peak > 0) else None,
+            trough=state.trough if (not is_long and state.trough < 10**12) else None,
+        )
+
+    def remove_position(self, position_id: str) -> bool:
+        with self._lock:
+            try:
+                i = self._ids.index(position_id)
+            except ValueError:
+                return False
+            del self._ids[i]
+            del self._symbols[i]
+            del self._strategies[i]
+            for k in _NUMERIC_FIELDS:
+                self._arr[k] = np.delete(self._arr[k], i)
+            self._active = np.delete(self._active, i)
+            self._reindex_symbols()
+            self._dirty = True
+            return True
+
+    def _reindex_symbols(self) -> None:
+        self._sym_index = {}
+        codes = np.empty(len(self._symbols), dtype=np.int64)
+        for i, sym in enumerate(self._symbols):
+            codes[i] = self._sym_index.setdefault(sym, len(self._sym_index))
+        self._sym_codes = codes
+
+    def positions(self) -> List[dict]:
+        with self._lock:
+            out = []
+            for i, pid in enumerate(self._ids):
+                row = {k: self._arr[k][i].item() for k in _NUMERIC_FIELDS}
+                out.append({
+                    "position_id": pid,
+                    "symbol": self._symbols[i],
+                    "strategy": self._strategies[i],
+                    "active": bool(self._active[i]),
+                    "pending_exit": not self._active[i],
+                    "side": "long" if row.pop("is_long") else "short",
+                    **{k: (None if np.isnan(v) else v) for k, v in row.items()},
+                })
+            return out
+
+    # ------------------------------------------------------------------
+    # Tick ingestion and evaluation
+    # ------------------------------------------------------------------
+    def thresholds(self, current: Optional[np.ndarray] = None) -> np.ndarray:
+        a = self._arr
+        cur = a["last"] if current is None else current
+        return compute_thresholds(
+            a["is_long"] > 0, cur, a["entry"], a["peak"], a["trough"],
+            a["trail_pct"], a["atr"], a["atr_mult"], a["min_stop_pct"], a["max_stop_pct"],
+        )
+
+    def ingest(self, ticks: Iterable[Tuple[str, float]], received_at: Optional[Iterable[float]] = None) -> List[dict]:
+        """
+        Apply a batch of (symbol, price) ticks in arrival order and return emitted exit events.
+        Fired positions stay pending (inactive, persisted) until on_exit returns; a failing handler re-arms them.
+        """
+        codes: List[int] = []
+        prices: List[float] = []
+        with self._lock:
+            index = self._sym_index
+            for sym, px in ticks:
+                code = index.get(str(sym).upper())
+                if code is not None:
+                    codes.append(code)
+                    prices.append(float(px))
+            events = self._evaluate(np.asarray(codes, dtype=np.int64), np.asarray(prices, dtype=float)) if codes else []
+        self._record_latency(received_at)
+        if events and self.persist:
+            try:
+                self.save_state()  # pending exits survive a crash inside the handler
+            except Exception as e:
+                _log(f"state save before exits failed: {e}", level="warning")
+        done = set()
+        for ev in events:
+            try:
+                self.on_exit(ev)
+            except Exception as e:
+                _log(f"exit handler failed for {ev.get('symbol')}, stop re-armed: {e}", level="error")
+                self._rearm(ev["position_id"])
+            else:
+                done.add(ev["position_id"])
+        if done:
+            self._drop(done)
+        return events
+
+    def _evaluate(self, codes: np.ndarray, prices: np.ndarray) -> List[dict]:
+        # Group ticks per symbol (stable sort keeps arrival order), running high/low within each group
+        order = np.argsort(codes, kind="stable")
+        codes, prices = codes[order], prices[order]
+        new_grp = np.r_[True, codes[1:] != codes[:-1]]
+        starts = np.flatnonzero(new_grp)
+        ends = np.r_[starts[1:], len(codes)]
+        # Grouped running max/min in one pass: accumulate (group, price rank) keys, groups ascending
+        n = len(prices)
+        by_px = np.argsort(prices, kind="stable")
+        rank = np.empty(n, dtype=np.int64)
+        rank[by_px] = np.arange(n)
+        base = (np.cumsum(new_grp) - 1) * n
+        run_hi = prices[by_px[np.maximum.accumulate(base + rank) - base]]
+        run_lo = prices[by_px[n - 1 - (np.maximum.accumulate(base + n - 1 - rank) - base)]]
+        n_sym = len(self._sym_index)
+        grp_start = np.zeros(n_sym, dtype=np.int64)
+        grp_len = np.zeros(n_sym, dtype=np.int64)
+        grp_start[codes[starts]] = starts
+        grp_len[codes[starts]] = ends - starts
+
+        a = self._arr
+        pos_len = np.where(self._active, grp_len[self._sym_codes], 0)
+        if not pos_len.any():
+            return []
+
+        # One row per (position, tick of its symbol): positions in order, ticks in arrival order within each
+        seg_end = np.cumsum(pos_len)
+        row_pos = np.repeat(np.arange(len(pos_len)), pos_len)
+        row_tick = (np.repeat(grp_start[self._sym_codes], pos_len)
+                    + np.arange(len(row_pos)) - np.repeat(seg_end - pos_len, pos_len))
+        is_long = a["is_long"] > 0
+        long_r = is_long[row_pos]
+        px = prices[row_tick]
+        # Peak/trough as of each tick, the tick itself included (as TrailingStopState.register_tick)
+        peak_r = np.where(long_r, np.fmax(a["peak"][row_pos], run_hi[row_tick]), a["peak"][row_pos])
+        trough_r = np.where(~long_r, np.fmin(a["trough"][row_pos], run_lo[row_tick]), a["trough"][row_pos])
+        thr_r = compute_thresholds(
+            long_r, px, a["entry"][row_pos], peak_r, trough_r, a["trail_pct"][row_pos], a["atr"][row_pos],
+            a["atr_mult"][row_pos], a["min_stop_pct"][row_pos], a["max_stop_pct"][row_pos],
+        )
+        with np.errstate(invalid="ignore"):
+            hit = np.where(long_r, px <= thr_r, px >= thr_r)
+
+        # A position's state ends at its first hit (later ticks in the batch are ignored) or its last tick
+        hit_rows = np.flatnonzero(hit)
+        fired, first = np.unique(row_pos[hit_rows], return_index=True)
+        fire_row = hit_rows[first]
+        end_row = seg_end - 1
+        end_row[fired] = fire_row
+        ticked = np.flatnonzero(pos_len)
+        end_row = end_row[ticked]
+
+        peak, trough = a["peak"].copy(), a["trough"].copy()
+        peak[ticked], trough[ticked] = peak_r[end_row], trough_r[end_row]
+        # Only peak/trough/active moves need persisting; "last" alone is not worth an fsync
+        if not (np.array_equal(peak, a["peak"], equal_nan=True) and np.array_equal(trough, a["trough"], equal_nan=True)):
+            self._dirty = True
+        a["peak"], a["trough"] = peak, trough
+        a["last"][ticked] = px[end_row]
+        if not len(fired):
+            return []
+
+        now = time.time()
+        events = []
+        for i, r in zip(fired.tolist(), fire_row.tolist()):
+            events.append({
+                "position_id": self._ids[i],
+                "symbol": self._symbols[i],
+                "side": "long" if is_long[i] else "short",
+                "qty": float(a["qty"][i]),
+                "price": float(px[r]),
+                "threshold": float(thr_r[r]),
+                "peak": None if np.isnan(a["peak"][i]) else float(a["peak"][i]),
+                "trough": None if np.isnan(a["trough"][i]) else float(a["trough"][i]),
+                "strategy": self._strategies[i],
+                "decided_at": now,
+            })
+        self._active[fired] = False
+        self._dirty = True
+        return events
+
+    def _drop(self, position_ids) -> None:
+        """Remove positions whose exit was confirmed (one pass for the whole batch)."""
+        with self._lock:
+            keep = np.array([pid not in position_ids for pid in self._ids], dtype=bool)
+            if keep.all():
+                return
+            idx = np.flatnonzero(keep).tolist()
+            self._ids = [self._ids[i] for i in idx]
+            self._symbols = [self._symbols[i] for i in idx]
+            self._strategies = [self._strategies[i] for i in idx]
+            for k in _NUMERIC_FIELDS:
+                self._arr[k] = self._arr[k][keep]
+            self._active = self._active[keep]
+            self._reindex_symbols()
+            self._dirty = True
+
+    def _rearm(self, position_id: str) -> None:
+        """Exit handler failed: make the stop live again so the next tick past the threshold retries."""
+        with self._lock:
+            try:
+                i = self._ids.index(position_id)
+            except ValueError:
+                return
+            self._active[i] = True
+            self._dirty = True
+
+    def _record_latency(self, received_at: Optional[Iterable[float]]) -> None:
+        if received_at is None:
+            return
+        now = time.perf_counter()
+        lat = [now - t for t in received_at]
+        if lat:
+            self._latencies.extend(lat)
+            if len(self._latencies) > 100000:
+                del self._latencies[:-100000]
+
+    # ------------------------------------------------------------------
+    # Background worker (bounded tick-to-decision latency)
+    # ------------------------------------------------------------------
+    def submit_tick(self, symbol: str, price: float) -> None:
+        with self._pending_cv:
+            self._pending.append((symbol, price, time.perf_counter()))
+            if len(self._pending) >= self.max_batch:
+                self._pending_cv.notify()
+
+    def flush(self) -> List[dict]:
+        with self._pending_cv:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return []
+        return self.ingest(((s, p) for s, p, _ in batch), received_at=[t for _, _, t in batch])
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._pending_cv:
+                if len(self._pending) < self.max_batch:
+                    self._pending_cv.wait(timeout=self.max_latency_s)
+            try:
+                self.flush()
+                if self.persist and self._dirty:
+                    self.save_state()
+            except Exception as e:
+                _log(f"monitor cycle failed: {e}", level="error")
+        self.flush()
+        if self.persist:
+            self.save_state()
+
+    def start(self) -> None:
+        if self._worker and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="trailing_stop_monitor", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        with self._pending_cv:
+            self._pending_cv.notify()
+        if self._worker:
+            self._worker.join(timeout=timeout)
+            self._worker = None
+
+    def latency_stats(self) -> dict:
+        """Tick-to-decision latency (seconds) for ticks submitted via submit_tick()."""
+        if not self._latencies:
+            return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+        arr = np.asarray(self._latencies)
+        return {
+            "count": int(arr.size),
+            "p50": float(np.percentile(arr, 50)),
+            "p95": float(np.percentile(arr, 95)),
+            "p99": float(np.percentile(arr, 99)),
+            "max": float(arr.max()),
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save_state(self) -> None:
+        with self._lock:
+            payload = {"version": 1, "saved_at": time.time(), "positions": self.positions()}
+            self._dirty = False
+        path = self.state_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp.{os.getpid()}.{uuid.uuid4().hex}")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def load_state(self) -> int:
+        """Restore active positions from state_path. Returns the number restored."""
+        try:
+            path = self.state_path
+            if not path.exists():
+                return 0
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            _log(f"state load skipped: {e}", level="warning")
+            return 0
+        n = 0
+        for p in payload.get("positions", []):
+            # Inactive without pending_exit: exit confirmed (older state files). Pending exits come back armed.
+            if not p.get("active", True) and not p.get("pending_exit"):
+                continue
+            self.add_position(
+                symbol=p["symbol"],
+                side=p["side"],
+                qty=p["qty"],
+                entry_price=p.get("entry"),
+                trail_pct=p.get("trail_pct"),
+                atr=p.get("atr"),
+                atr_mult=p.get("atr_mult"),
+                min_stop_pct=p.get("min_stop_pct"),
+                max_stop_pct=p.get("max_stop_pct"),
+                strategy=p.get("strategy"),
+                position_id=p.get("position_id"),
+                peak=p.get("peak"),
+                trough=p.get("trough"),
+            )
+            if p.get("last") is not None:
+                self._arr["last"][-1] = float(p["last"])
+            n += 1
+        self._dirty = False
+        return n
+
+
+def _log(msg: str, level: str = "info") -> None:
+    try:
+        from tbot_bot.support.utils_log import log_event
+        log_event("trailing_stop_monitor", msg, level=level)
+    except Exception:
+        print(f"[trailing_stop_monitor] {msg}", flush=True)
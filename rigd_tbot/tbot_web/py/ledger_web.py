@@ -32,6 +32,7 @@ from tbot_bot.support.bot_state_manager import get_state  # ADDED
 
 from tbot_bot.accounting.ledger_modules.ledger_grouping import (
     fetch_grouped_trades,
+    fetch_grouped_trades_page,
     fetch_trade_group_by_id,
     collapse_expand_group,
 )
@@ -183,27 +184,20 @@ def _get_sort_params() -> Tuple[str, bool]:
     return col, desc
 
 
-def _python_sort_groups(entries: List[Dict[str, Any]], sort_col: str, sort_desc: bool) -> List[Dict[str, Any]]:
+def _fetch_groups_page(sort_col: str, sort_desc: bool) -> Dict[str, Any]:
     """
-    Stable fallback sort in Python when fetch_grouped_trades() doesn't support sort kwargs yet.
+    One keyset page of grouped trades for the current request (?cursor=, ?limit=), sorted in SQL.
+    Returns fetch_grouped_trades_page()'s dict with display-filtered entries.
     """
-    col_map = {
-        "trade_id": "datetime_utc",
-        "strategy": "action",
-        "tags": "action",
-        "notes": "action",
-        "action_detail": "action",
-    }
-    key = col_map.get(sort_col, sort_col or "datetime_utc")
-
-    def safe(v):
-        return "" if v is None else v
-
     try:
-        entries.sort(key=lambda e: (safe(e.get(key)), safe(e.get("datetime_utc"))), reverse=bool(sort_desc))
-    except Exception:
-        entries.sort(key=lambda e: safe(e.get("datetime_utc")), reverse=bool(sort_desc))
-    return entries
+        limit = max(1, min(int(request.args.get("limit", 100)), 1000))
+    except (TypeError, ValueError):
+        limit = 100
+    page = fetch_grouped_trades_page(
+        limit=limit, cursor=request.args.get("cursor"), sort_by=sort_col, sort_desc=sort_desc
+    )
+    page["entries"] = [e for e in page["entries"] if _is_display_entry(e)]
+    return page
 
 
 # --- Audit-trail migration helpers (surgical, non-blocking) ---
@@ -300,15 +294,10 @@ def ledger_reconcile():
         # COA lists (both shapes for UI)
         coa_accounts, coa_accounts_dropdown, coa_meta = _get_coa_lists()
 
-        # grouped + sorted (server-side if supported; else Python fallback)
+        # grouped + sorted in SQL, one keyset page at a time
         sort_col, sort_desc = _get_sort_params()
-        try:
-            entries = fetch_grouped_trades(sort_by=sort_col, sort_desc=sort_desc)
-        except TypeError:
-            entries = fetch_grouped_trades()
-            entries = _python_sort_groups(entries, sort_col, sort_desc)
-
-        entries = [e for e in entries if _is_display_entry(e)]
+        page = _fetch_groups_page(sort_col, sort_desc)
+        entries = page["entries"]
         _user, role = _current_user_and_role()
 
         return render_template(
@@ -321,6 +310,11 @@ def ledger_reconcile():
             coa_meta=coa_meta,
             user_role=role,
             has_unmapped=_has_unmapped(entries),
+            total_groups=page["total_groups"],
+            next_cursor=page["next_cursor"],
+            cursor=request.args.get("cursor"),
+            sort_col=page["sort_by"],
+            sort_dir="desc" if page["sort_desc"] else "asc",
         )
     except FileNotFoundError:
         error = "Ledger database or table not found. Please initialize via admin tools."
@@ -349,13 +343,26 @@ def ledger_groups():
         return jsonify({"error": "Not permitted"}), 403
     try:
         sort_col, sort_desc = _get_sort_params()
-        try:
-            groups = fetch_grouped_trades(sort_by=sort_col, sort_desc=sort_desc)
-        except TypeError:
-            groups = fetch_grouped_trades()
-            groups = _python_sort_groups(groups, sort_col, sort_desc)
-        groups = [g for g in groups if _is_display_entry(g)]
-        return jsonify(groups)
+        page = _fetch_groups_page(sort_col, sort_desc)
+        # Plain list for ledger.js; paging metadata travels in headers
+        resp = jsonify(page["entries"])
+        resp.headers["X-Total-Groups"] = str(page["total_groups"])
+        if page["next_cursor"]:
+            resp.headers["X-Next-Cursor"] = page["next_cursor"]
+        return resp
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+
+@ledger_web.route("/groups/page", methods=["GET"])
+def ledger_groups_page():
+    # RBAC: viewers allowed (GET). ?sort=&dir=&cursor=&limit= -> {entries, next_cursor, total_groups, ...}
+    if provisioning_guard() or identity_guard():
+        return jsonify({"error": "Not permitted"}), 403
+    try:
+        sort_col, sort_desc = _get_sort_params()
+        return jsonify(_fetch_groups_page(sort_col, sort_desc))
     except Exception as e:
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
@@ -728,11 +735,7 @@ def ledger_edit(entry_id: int):
     if wants_json:
         try:
             sort_col, sort_desc = _get_sort_params()
-            try:
-                groups = fetch_grouped_trades(sort_by=sort_col, sort_desc=sort_desc)
-            except TypeError:
-                groups = fetch_grouped_trades()
-                groups = _python_sort_groups(groups, sort_col, sort_desc)
+            groups = _fetch_groups_page(sort_col, sort_desc)["entries"]
             try:
                 bals = calculate_account_balances(include_opening=True)
             except TypeError:
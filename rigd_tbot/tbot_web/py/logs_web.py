@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 
 from tbot_bot.support.path_resolver import get_output_path, validate_bot_identity
 from tbot_bot.support.decrypt_secrets import load_bot_identity
+from tbot_bot.support.log_index import MAX_RESPONSE_BYTES, read_window
 
 logs_blueprint = Blueprint("logs_web", __name__)
 
@@ -121,23 +122,23 @@ def logs_page():
     except Exception:
         hour_window = 24
 
+    try:
+        before = int(request.args["before"]) if request.args.get("before") else None
+    except ValueError:
+        before = None
+
     log_content = ""
     warnings = []
+    older_before = None
     file_path = find_log_file(selected_log, warn_list=warnings)
     if file_path:
-        lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
-        if hour_window:
-            cutoff = now - timedelta(hours=hour_window)
-            filtered = []
-            for line in lines:
-                ts = parse_timestamp(line)
-                if ts and ts >= cutoff:
-                    filtered.append(line)
-                elif ts is None:
-                    filtered.append(line)
-            log_content = "\n".join(filtered)
-        else:
-            log_content = "\n".join(lines)
+        # Seek via the log's time index and read back from the tail; capped at TBOT_LOG_VIEW_MAX_BYTES
+        since = now - timedelta(hours=hour_window) if hour_window else None
+        page = read_window(file_path, since=since, before=before)
+        log_content = "\n".join(page.lines)
+        if page.truncated:
+            older_before = page.next_before
+            warnings.append(f"Showing the newest {MAX_RESPONSE_BYTES // 1024} KiB of this window; use \"Older lines\" to page back.")
     else:
         log_content = f"Selected log unavailable: {selected_log}"
 
@@ -147,5 +148,6 @@ def logs_page():
         selected_log=selected_log,
         log_files=log_files,
         selected_hours=selected_hours,
-        warnings=warnings
+        warnings=warnings,
+        older_before=older_before
     )
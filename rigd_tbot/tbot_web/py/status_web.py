@@ -11,7 +11,7 @@ import subprocess  # <<< ADDED
 import shlex       # <<< ADDED
 import sys         # <<< ADDED
 
-from flask import Blueprint, render_template, jsonify, request  # <<< request ADDED
+from flask import Blueprint, Response, render_template, jsonify, request  # <<< request ADDED
 
 from .login_web import login_required
 from tbot_bot.support.path_resolver import (
@@ -25,6 +25,8 @@ from tbot_bot.support.path_resolver import (
     get_bot_identity,
     # (surgical) needed for universe size warning
     resolve_universe_cache_path,
+    resolve_ledger_db_path,
+    is_test_mode_active,
 )
 from tbot_bot.config.env_bot import (
     get_open_time_utc,
@@ -33,14 +35,20 @@ from tbot_bot.config.env_bot import (
     get_market_close_utc,
 )
 from tbot_bot.config.env_bot import get_bot_config  # <-- ensure enabled flags come from encrypted config
+from tbot_bot.config.env_bot import get_bot_config_version
+from tbot_bot.support.bootstrap_utils import CONFIG_REQUIRED_FILES
 # (surgical) provider state
-from tbot_bot.support.secrets_manager import load_screener_credentials
+from tbot_bot.support.secrets_manager import load_screener_credentials, get_screener_credentials_path
 # (surgical) clock payload helper (read-only)
 from tbot_bot.support.utils_time import clock_payload as _clock_payload
 # (surgical) use canonical market tz from runtime config instead of inferring from identity
 from tbot_bot.support.utils_time import get_market_tz_str  # ADDED
 # SURGICAL: centralized state manager
 from tbot_bot.support.bot_state_manager import get_state  # ADDED
+# Per-component status cache (file-stat keyed) + ETag responses
+from tbot_web.support.status_cache import STATUS_CACHE, etag_json_response, file_key, files_key
+from tbot_bot.support.status_publisher import StatusView
+from tbot_web.support.event_stream import EventHub, stream as _sse_stream
 
 status_blueprint = Blueprint("status_web", __name__)
 
@@ -63,15 +71,30 @@ DEFAULT_STATUS = {
     "supervisor_state": "not_scheduled",  # one of: not_scheduled|scheduled|launched|running|failed
 }
 
-def _read_status_json() -> dict:
+_STATUS_VIEWS: dict = {}
+
+def _read_status_view(path: Path):
+    # status_bot mirrors status.json into an mmap view; used only while it describes the current file
+    key = file_key(str(path))
+    if key is None:
+        return None
+    view = _STATUS_VIEWS.get(path)
+    if view is None:
+        view = _STATUS_VIEWS[path] = StatusView(path)
+    hit = view.read(json_key=key)
+    return hit[1] if hit else None
+
+def _read_status_json(path: str | None = None) -> dict:
     """
     Always return a fully-populated dict so templates have values (zeros/'none') even if file missing/malformed.
     """
     payload = dict(DEFAULT_STATUS)
-    status_file_path = Path(resolve_status_log_path())
+    status_file_path = Path(path or resolve_status_log_path())
     try:
-        with open(status_file_path, "r", encoding="utf-8") as f:
-            data = json.load(f) or {}
+        data = _read_status_view(status_file_path)
+        if data is None:
+            with open(status_file_path, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
         # Merge with defaults; file values win
         payload.update({k: v for k, v in data.items() if v is not None})
     except Exception:
@@ -102,14 +125,14 @@ def _parse_iso_utc(s: str):
     except Exception:
         return None
 
-def _read_schedule():
+def _read_schedule(path: str | None = None):
     """
     Read logs/schedule.json written by the supervisor.
     NO FALLBACKS. If the file is missing or malformed, return None so the UI
     surfaces the real state instead of masking problems.
     """
     # Use output/logs path; do NOT use get_schedule_json_path here.
-    sched_path = Path(get_output_path("logs", "schedule.json"))
+    sched_path = Path(path or get_output_path("logs", "schedule.json"))
     if not sched_path.exists():
         return None
     try:
@@ -230,13 +253,13 @@ def _local_time_str(dt: datetime | None, tz_str: str) -> str:
         label = abbr or "UTC"
     return local.strftime("%-I:%M:%S %p ") + label if hasattr(local, "strftime") else local.strftime("%I:%M:%S %p ") + label
 
-def _read_holdings_launch_stamp() -> str:
+def _read_holdings_launch_stamp(path: str | None = None) -> str:
     """
     Read last line from stamps/holdings_launch_last.txt and format as 'YYYY-MM-DD HH:MM:SS'.
     If unavailable, return '—'.
     """
     try:
-        p = Path(get_stamp_path("holdings_launch_last.txt"))
+        p = Path(path or get_stamp_path("holdings_launch_last.txt"))
         if not p.exists():
             return "—"
         lines = [ln.strip() for ln in p.read_text(encoding="utf-8").splitlines() if ln.strip()]
@@ -255,12 +278,17 @@ def _build_schedule_view() -> dict:
     Build the exact schedule dict required by the template from logs/schedule.json.
     Uses configured TIMEZONE (fallback America/New_York) for 'local' fields.
     """
-    raw = _read_schedule() or {}
     tz_str = None
     try:
         tz_str = get_market_tz_str() or "America/New_York"
     except Exception:
         tz_str = "America/New_York"
+    paths = _status_paths()
+    key = (file_key(paths["schedule"]), file_key(paths["stamps"]["holdings_launch_last.txt"]), tz_str)
+    return STATUS_CACHE.get("schedule_view", key, lambda: _compute_schedule_view(paths, tz_str))
+
+def _compute_schedule_view(paths: dict, tz_str: str) -> dict:
+    raw = _read_schedule(paths["schedule"]) or {}
 
     # Parse instants
     dt_open = _parse_iso_utc(raw.get("open_utc"))
@@ -282,7 +310,7 @@ def _build_schedule_view() -> dict:
     schedule_view = {
         "trading_date": (raw.get("trading_date") or "—"),
         "created_at": created.strftime("%Y-%m-%d %H:%M:%S") if created else "—",
-        "holdings_launched_utc": _read_holdings_launch_stamp(),
+        "holdings_launched_utc": _read_holdings_launch_stamp(paths["stamps"]["holdings_launch_last.txt"]),
         "open": {
             "date": open_date,
             "utc": open_utc,
@@ -319,11 +347,11 @@ def _build_schedule_view() -> dict:
 # ---------------------------
 # NEW: Read-only helpers for MVP contract
 # ---------------------------
-def _read_opening_equity_stamp() -> dict:
+def _read_opening_equity_stamp(path: str | None = None) -> dict:
     """
     Load {ts_utc, equity} from stamps/opening_equity.json
     """
-    path = Path(get_stamp_path("opening_equity.json"))
+    path = Path(path or get_stamp_path("opening_equity.json"))
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
         ts = (data.get("ts_utc") or "").strip()
@@ -332,12 +360,12 @@ def _read_opening_equity_stamp() -> dict:
     except Exception:
         return {"ts_utc": None, "equity": None}
 
-def _read_job_stamp(name: str) -> dict:
+def _read_job_stamp(name: str, path: str | None = None) -> dict:
     """
     Parse one-line stamps like: "2025-09-18T21:05:00Z OK" or "… Failed"
     Returns {last_run_utc, status}
     """
-    path = Path(get_stamp_path(name))
+    path = Path(path or get_stamp_path(name))
     try:
         line = path.read_text(encoding="utf-8").strip()
         if not line:
@@ -349,12 +377,12 @@ def _read_job_stamp(name: str) -> dict:
     except Exception:
         return {"last_run_utc": None, "status": None}
 
-def _read_strategy_snapshot(kind: str) -> dict:
+def _read_strategy_snapshot(kind: str, path: str | None = None) -> dict:
     """
     Load {ts_utc, candidates[], trades{}} from status/strategy_{kind}_last.json (truncate candidates to 5)
     """
     fname = f"strategy_{kind}_last.json"
-    path = Path(get_snapshot_path(fname))
+    path = Path(path or get_snapshot_path(fname))
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
         # Normalize
@@ -367,13 +395,13 @@ def _read_strategy_snapshot(kind: str) -> dict:
     except Exception:
         return {"ts_utc": None, "candidates": [], "trades": {"count": 0, "wins": 0, "losses": 0, "realized_pnl": 0.0}}
 
-def _read_strategy_error(kind: str) -> str | None:
+def _read_strategy_error(kind: str, path: str | None = None) -> str | None:
     """
     Read text from stamps/strategy_{kind}_error.txt, only if it's for TODAY (UTC).
     We accept either lines prefixed with ISO timestamp or plain message; when ts present, require same YYYY-MM-DD.
     """
     fname = f"strategy_{kind}_error.txt"
-    path = Path(get_stamp_path(fname))
+    path = Path(path or get_stamp_path(fname))
     try:
         txt = path.read_text(encoding="utf-8").strip()
         if not txt:
@@ -433,7 +461,7 @@ def _ledger_pnl() -> dict:
             "win_rate_cumulative_pct": 0.0,
         }
 
-def _resolve_strategy_states(schedule: dict, cfg_enabled: dict, active_strategy: str) -> dict:
+def _resolve_strategy_states(schedule: dict, cfg_enabled: dict, active_strategy: str, paths: dict | None = None) -> dict:
     """
     Compute per-strategy state per rules:
       - if disabled flag false → state="disabled"
@@ -449,7 +477,7 @@ def _resolve_strategy_states(schedule: dict, cfg_enabled: dict, active_strategy:
         scheduled_key = f"{kind}_utc" if kind != "open" else "open_utc"
         scheduled_utc = (schedule or {}).get(scheduled_key) or None
         scheduled_dt = _parse_iso_utc(scheduled_utc) if scheduled_utc else None
-        last_error = _read_strategy_error(kind)
+        last_error = _cached_strategy_error(kind, paths)
 
         if not enabled:
             state = "disabled"
@@ -486,12 +514,12 @@ def _is_test_mode_active() -> bool:
         pass
     return False
 
-def _read_universe_final_size() -> int | None:
+def _read_universe_final_size(path: str | None = None) -> int | None:
     """
     Count symbols in the final universe cache. Supports JSON array or NDJSON.
     """
     try:
-        final_path = Path(resolve_universe_cache_path())
+        final_path = Path(path or resolve_universe_cache_path())
         if not final_path.exists():
             return None
         with final_path.open("r", encoding="utf-8") as f:
@@ -571,6 +599,149 @@ def _market_tz_label(tz_str: str) -> str:
     except Exception:
         return "UTC"
 
+# ---------------------------
+# Cached status components: each is recomputed only when its source changes (file stat, ledger DB/WAL stat,
+# trading date, config version). Shared values are read-only; _enrich_status copies before mutating.
+# ---------------------------
+_CONTROL_DIR = Path(__file__).resolve().parents[2] / "tbot_bot" / "control"
+_BOT_STATE_PATH = get_bot_state_path()
+_JOB_STAMPS = ("holdings_launch_last.txt", "holdings_manager_last.txt", "universe_rebuild_last.txt")
+_STRATEGY_KINDS = ("open", "mid", "close")
+
+def _resolve_status_paths() -> dict:
+    """Identity-scoped paths resolved once per identity/bootstrap change (each resolution decrypts the identity)."""
+    identity = get_bot_identity() or None
+    stamp_names = _JOB_STAMPS + ("opening_equity.json",) + tuple(f"strategy_{k}_error.txt" for k in _STRATEGY_KINDS)
+    try:
+        from tbot_bot.support.path_resolver import get_universe_path
+        universe = get_universe_path("symbol_universe.json")
+    except Exception:
+        universe = resolve_universe_cache_path()
+    try:
+        ledger_db = resolve_ledger_db_path(*identity.split("_"))
+    except Exception:
+        ledger_db = None
+    try:
+        screener_creds = get_screener_credentials_path()
+    except Exception:
+        screener_creds = None
+    return {
+        "identity": identity or "",
+        "status_json": resolve_status_log_path(identity),
+        "schedule": get_output_path("logs", "schedule.json", identity),
+        "stamps": {name: get_stamp_path(name, identity) for name in stamp_names},
+        "snapshots": {k: get_snapshot_path(f"strategy_{k}_last.json", identity) for k in _STRATEGY_KINDS},
+        "universe_final": resolve_universe_cache_path(),
+        "universe": universe,
+        "ledger_db": ledger_db,
+        "screener_creds": screener_creds,
+    }
+
+def _status_paths() -> dict:
+    key = (files_key(CONFIG_REQUIRED_FILES), _cached_bot_state(), is_test_mode_active())
+    return STATUS_CACHE.get("paths", key, _resolve_status_paths)
+
+def _cached_file(component: str, path, reader, *extra_key):
+    return STATUS_CACHE.get(component, (path, file_key(path)) + extra_key, reader)
+
+def _cached_bot_state() -> str:
+    return STATUS_CACHE.get("bot_state", file_key(_BOT_STATE_PATH), _read_bot_state)
+
+def _cached_status_json(paths: dict | None = None) -> dict:
+    path = (paths or _status_paths())["status_json"]
+    return dict(_cached_file("status_json", path, lambda: _read_status_json(path)))
+
+def _cached_schedule(paths: dict | None = None):
+    path = (paths or _status_paths())["schedule"]
+    return _cached_file("schedule", path, lambda: _read_schedule(path))
+
+def _cached_job_stamp(name: str, paths: dict | None = None) -> dict:
+    path = (paths or _status_paths())["stamps"][name]
+    return _cached_file(f"stamp:{name}", path, lambda: _read_job_stamp(name, path))
+
+def _cached_opening_equity(paths: dict | None = None) -> dict:
+    path = (paths or _status_paths())["stamps"]["opening_equity.json"]
+    return _cached_file("opening_equity", path, lambda: _read_opening_equity_stamp(path))
+
+def _cached_strategy_snapshot(kind: str, paths: dict | None = None) -> dict:
+    path = (paths or _status_paths())["snapshots"][kind]
+    return _cached_file(f"snapshot:{kind}", path, lambda: _read_strategy_snapshot(kind, path))
+
+def _cached_strategy_error(kind: str, paths: dict | None = None) -> str | None:
+    # Only today's (UTC) error counts, so the date is part of the key
+    path = (paths or _status_paths())["stamps"][f"strategy_{kind}_error.txt"]
+    return _cached_file(f"strategy_error:{kind}", path, lambda: _read_strategy_error(kind, path),
+                        datetime.now(timezone.utc).date())
+
+def _cached_ledger(paths: dict | None = None) -> tuple[dict, dict]:
+    db = (paths or _status_paths())["ledger_db"]
+    key = (file_key(db), file_key(f"{db}-wal") if db else None, datetime.now(timezone.utc).date())
+    return STATUS_CACHE.get("ledger", key, lambda: (_ledger_balances(), _ledger_pnl()))
+
+def _load_config_view() -> dict:
+    view = {"cfg": {}, "ok": False}
+    try:
+        view["cfg"] = get_bot_config() or {}
+        view["ok"] = True
+    except Exception:
+        pass
+    view["config_schedule_utc"] = {
+        "open_hhmm": (get_open_time_utc() or "13:30").strip(),
+        "mid_hhmm": (get_mid_time_utc() or "16:00").strip(),
+        "close_hhmm": (get_close_time_utc() or "19:45").strip(),
+        "market_close_hhmm": (get_market_close_utc() or "21:00").strip(),
+    }
+    return view
+
+def _cached_config_view() -> dict:
+    return STATUS_CACHE.get("config", get_bot_config_version(), _load_config_view)
+
+def _read_test_mode_flags() -> bool:
+    # --- (surgical 6.1) TEST MODE flag via control path/glob ---
+    try:
+        from tbot_bot.support.path_resolver import get_control_path
+        return bool(glob.glob(os.path.join(get_control_path(""), "test_mode*.flag")))
+    except Exception:
+        return False
+
+def _cached_test_mode() -> bool:
+    # Flag files are created/removed in the control dir, which bumps its mtime
+    return _cached_file("test_mode", str(_CONTROL_DIR), _read_test_mode_flags)
+
+def _read_universe_size(path) -> int:
+    try:
+        p = Path(path)
+        if p.exists():
+            try:
+                return len(json.loads(p.read_text(encoding="utf-8")))
+            except Exception:
+                return 0
+        return 0
+    except Exception:
+        return 0
+
+def _cached_universe_sizes(paths: dict | None = None) -> tuple[int | None, int]:
+    """(final-cache symbol count, strict JSON length) — the universe file is large; parse it once per change."""
+    paths = paths or _status_paths()
+    final_path, uni_path = paths["universe_final"], paths["universe"]
+    key = (final_path, file_key(final_path), uni_path, file_key(uni_path))
+    return STATUS_CACHE.get("universe", key, lambda: (_read_universe_final_size(final_path), _read_universe_size(uni_path)))
+
+def _resolve_universe_provider() -> str:
+    # --- (surgical 8.1) Provider info ---
+    try:
+        from tbot_bot.screeners import screener_utils
+        sc = screener_utils.get_universe_screener_secrets() or {}
+        return f'{(sc.get("SCREENER_NAME") or "NONE").upper()} ' \
+               f'({"enabled" if sc.get("UNIVERSE_ENABLED") else "disabled"})'
+    except Exception:
+        return "NONE (disabled)"
+
+def _cached_provider(paths: dict | None = None) -> tuple[dict, str]:
+    # Both values come from the encrypted screener credentials; decrypt only when that file changes
+    path = (paths or _status_paths())["screener_creds"]
+    return _cached_file("provider", path, lambda: (_resolve_provider_state(), _resolve_universe_provider()))
+
 # ---------------------------
 # Enrichment + API payload assembly
 # ---------------------------
@@ -578,19 +749,16 @@ def _enrich_status(base_status: dict) -> dict:
     # Ensure baseline keys exist
     enriched = dict(DEFAULT_STATUS)
     enriched.update(base_status or {})
+    paths = _status_paths()
     # Bot state
-    bot_state = _read_bot_state()
+    bot_state = _cached_bot_state()
     enriched["state"] = bot_state
     enriched["bot_state"] = bot_state
     # Config (UTC HH:MM) for display fallback
-    enriched["config_schedule_utc"] = {
-        "open_hhmm": (get_open_time_utc() or "13:30").strip(),
-        "mid_hhmm": (get_mid_time_utc() or "16:00").strip(),
-        "close_hhmm": (get_close_time_utc() or "19:45").strip(),
-        "market_close_hhmm": (get_market_close_utc() or "21:00").strip(),
-    }
+    config_view = _cached_config_view()
+    enriched["config_schedule_utc"] = dict(config_view["config_schedule_utc"])
     # schedule + current_phase (existing)
-    schedule = _read_schedule()
+    schedule = _cached_schedule(paths)
     enriched["schedule"] = {k: v for k, v in (schedule or {}).items() if not k.startswith("_dt_")}
     enriched["current_phase"] = _determine_current_phase(schedule)
 
@@ -621,28 +789,22 @@ def _enrich_status(base_status: dict) -> dict:
     enriched["supervisor"] = sup
 
     # --- (surgical 6.1) TEST MODE flag via control path/glob ---
-    try:
-        from tbot_bot.support.path_resolver import get_control_path
-        flags = glob.glob(os.path.join(get_control_path(""), "test_mode*.flag"))
-        enriched["test_mode_active"] = bool(flags)
-    except Exception:
-        enriched["test_mode_active"] = False
+    enriched["test_mode_active"] = _cached_test_mode()
 
     # --- FIX: source strategy enabled flags from encrypted config (not stale status.json defaults) ---
-    cfg = {}  # ensure defined even if get_bot_config() raises
-    try:
-        cfg = get_bot_config() or {}
+    cfg = config_view["cfg"]  # {} if get_bot_config() raised
+    if config_view["ok"]:
         enabled_flags = {
             "open": bool(cfg.get("STRAT_OPEN_ENABLED", False)),
             "mid": bool(cfg.get("STRAT_MID_ENABLED", False)),
             "close": bool(cfg.get("STRAT_CLOSE_ENABLED", False)),
         }
         enriched["enabled_strategies"] = enabled_flags
-    except Exception:
+    else:
         enabled_flags = enriched.get("enabled_strategies", {"open": False, "mid": False, "close": False})
 
     # ======== NEW: Contract fields ========
-    identity = get_bot_identity() or ""
+    identity = paths["identity"]
     now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     # Inject market timezone from canonical runtime config (instead of inferring from identity)
     market_tz = get_market_tz_str()  # CHANGED
@@ -656,11 +818,10 @@ def _enrich_status(base_status: dict) -> dict:
         enriched["server_clock"] = {}
 
     # Account balances + PnL
-    balances = _ledger_balances()
-    pnl = _ledger_pnl()
+    balances, pnl = _cached_ledger(paths)
 
     # Daily gain/loss via opening-equity stamp
-    opening = _read_opening_equity_stamp()
+    opening = _cached_opening_equity(paths)
     opening_equity = opening.get("equity")
     realized_equity_now = balances.get("equity")
     delta = (realized_equity_now - opening_equity) if (opening_equity is not None and realized_equity_now is not None) else None
@@ -673,18 +834,18 @@ def _enrich_status(base_status: dict) -> dict:
 
     # Strategy states + last-run snapshots
     active_strategy = (enriched.get("active_strategy") or "none").lower()
-    strategy_states = _resolve_strategy_states(schedule, enabled_flags, active_strategy)
+    strategy_states = _resolve_strategy_states(schedule, enabled_flags, active_strategy, paths)
     strategy_last_run = {
-        "open": _read_strategy_snapshot("open"),
-        "mid": _read_strategy_snapshot("mid"),
-        "close": _read_strategy_snapshot("close"),
+        "open": _cached_strategy_snapshot("open", paths),
+        "mid": _cached_strategy_snapshot("mid", paths),
+        "close": _cached_strategy_snapshot("close", paths),
     }
 
     # Jobs (holdings launch/manager, universe rebuild)
     jobs = {
-        "holdings_launch": _read_job_stamp("holdings_launch_last.txt"),
-        "holdings_manager": _read_job_stamp("holdings_manager_last.txt"),
-        "universe_rebuild": _read_job_stamp("universe_rebuild_last.txt"),
+        "holdings_launch": _cached_job_stamp("holdings_launch_last.txt", paths),
+        "holdings_manager": _cached_job_stamp("holdings_manager_last.txt", paths),
+        "universe_rebuild": _cached_job_stamp("universe_rebuild_last.txt", paths),
     }
 
     # Risk controls (from config if present)
@@ -709,11 +870,12 @@ def _enrich_status(base_status: dict) -> dict:
     }
 
     # (surgical) TEST MODE badge + universe size warning + provider state
-    enriched.setdefault("test_mode_active", _is_test_mode_active())  # honor 6.1 value if already set
+    if "test_mode_active" not in enriched:  # honor 6.1 value if already set
+        enriched["test_mode_active"] = _is_test_mode_active()
     if enriched["test_mode_active"]:
         enriched["test_mode_banner"] = "TEST MODE"
 
-    universe_size = _read_universe_final_size()
+    universe_size, size = _cached_universe_sizes(paths)
     enriched["universe_size"] = universe_size
     try:
         warn_threshold = int(cfg.get("UNIVERSE_MIN_DISPLAY_WARN", 100))
@@ -724,33 +886,9 @@ def _enrich_status(base_status: dict) -> dict:
     else:
         enriched["universe_warning"] = ""
 
-    enriched["screener_provider"] = _resolve_provider_state()
-
     # --- (surgical 8.1) Provider info + universe size warn fields requested ---
-    try:
-        from tbot_bot.screeners import screener_utils
-        sc = screener_utils.get_universe_screener_secrets() or {}
-        enriched["universe_provider"] = f'{(sc.get("SCREENER_NAME") or "NONE").upper()} ' \
-                                        f'({"enabled" if sc.get("UNIVERSE_ENABLED") else "disabled"})'
-    except Exception:
-        enriched["universe_provider"] = "NONE (disabled)"
+    enriched["screener_provider"], enriched["universe_provider"] = _cached_provider(paths)
 
-    try:
-        # Prefer get_universe_path if available; else fall back to resolver used above
-        try:
-            from tbot_bot.support.path_resolver import get_universe_path
-            uni_path = Path(get_universe_path("symbol_universe.json"))
-        except Exception:
-            uni_path = Path(resolve_universe_cache_path())
-        if uni_path.exists():
-            try:
-                size = len(json.loads(uni_path.read_text(encoding="utf-8")))
-            except Exception:
-                size = 0
-        else:
-            size = 0
-    except Exception:
-        size = 0
     enriched["universe_size"] = size  # keep existing field in sync if present
     warn_threshold_env = int(os.environ.get("UNIVERSE_MIN_SIZE_WARN", "100"))
     enriched["universe_size_warn"] = (size < warn_threshold_env)
@@ -798,7 +936,7 @@ def _enrich_status(base_status: dict) -> dict:
 @status_blueprint.route("/")
 @login_required
 def status_page():
-    status_data = _enrich_status(_read_status_json())
+    status_data = _enrich_status(_cached_status_json())
     # Candidate status (optional)
     candidate_status_file = Path(get_output_path("logs", "candidate_pool_status.json"))
     try:
@@ -818,24 +956,63 @@ def status_page():
 @login_required
 def bot_state_api():
     # Extended JSON including contract fields
-    return jsonify(_enrich_status(_read_status_json()))
+    return etag_json_response(_enrich_status(_cached_status_json()))
 
 @status_blueprint.route("/api/full_status")
 @login_required
 def full_status_api():
     # Extended JSON including contract fields
-    return jsonify(_enrich_status(_read_status_json()))
+    return etag_json_response(_enrich_status(_cached_status_json()))
 
 # Compatibility routes expected by status_live.js (relative fetch('full_status'))
 @status_blueprint.route("/full_status")
 @login_required
 def full_status_compat():
-    return jsonify(_enrich_status(_read_status_json()))
+    return etag_json_response(_enrich_status(_cached_status_json()))
 
 @status_blueprint.route("/bot_state")
 @login_required
 def bot_state_compat():
-    return jsonify({"bot_state": _read_bot_state()})
+    return etag_json_response({"bot_state": _cached_bot_state()})
+
+# ---------------------------
+# Server-sent events: state transitions, status deltas and appended log lines (replaces polling when supported)
+# ---------------------------
+def _full_status() -> dict:
+    return _enrich_status(_cached_status_json())
+
+def _status_watch_dirs() -> list:
+    paths = _status_paths()
+    files = [paths["status_json"], paths["schedule"], *paths["stamps"].values(), *paths["snapshots"].values()]
+    return sorted({os.path.dirname(str(p)) for p in files if p})
+
+_EVENT_HUB = EventHub(
+    state_reader=_cached_bot_state,
+    state_path=lambda: str(_BOT_STATE_PATH),
+    status_provider=_full_status,
+    watch_dirs=_status_watch_dirs,
+)
+
+@status_blueprint.route("/stream")
+@login_required
+def status_stream():
+    """
+    text/event-stream of `state`, `status` (changed keys only), `log` and `dropped` events.
+    ?log=<name> additionally tails one of the files listed on the logs page, starting at its current end.
+    Answers 503 once TBOT_SSE_MAX_CLIENTS streams are open; clients then fall back to polling.
+    """
+    log_path = log_name = None
+    requested = request.args.get("log")
+    if requested:
+        from tbot_web.py.logs_web import enumerate_log_files, find_log_file
+        if requested in enumerate_log_files():
+            found = find_log_file(requested)
+            log_path, log_name = (str(found) if found else None), requested
+    sub = _EVENT_HUB.subscribe(log_path, log_name)
+    if sub is None:
+        return Response("too many event streams\n", status=503, mimetype="text/plain", headers={"Retry-After": "30"})
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(_sse_stream(_EVENT_HUB, sub), mimetype="text/event-stream", headers=headers)
 
 # ---------------------------
 # NEW: One-click "Calculate Schedule" trigger
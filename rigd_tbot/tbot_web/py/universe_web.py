@@ -2,7 +2,7 @@
 # Flask blueprint for universe cache and blocklist management per staged symbol universe spec.
 
 from __future__ import annotations
-from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file, Response, send_from_directory, current_app, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file, Response, send_from_directory, current_app, jsonify, stream_with_context
 import subprocess
 from tbot_bot.screeners.screener_utils import load_universe_cache, load_blocklist, UniverseCacheError
 from tbot_bot.screeners.blocklist_manager import (
@@ -10,6 +10,7 @@ from tbot_bot.screeners.blocklist_manager import (
     remove_from_blocklist,
     load_blocklist as blocklist_manager_load,
     get_blocklist_count,
+    get_blocklist_lines,
 )
 from tbot_bot.support.path_resolver import (
     resolve_universe_cache_path,
@@ -18,9 +19,10 @@ from tbot_bot.support.path_resolver import (
     resolve_universe_unfiltered_path,
     resolve_universe_log_path,
 )
+from tbot_bot.screeners.universe_index import get_universe_index, universe_count
+from tbot_bot.screeners.universe_stream import iter_universe_items
+from tbot_web.support.export_stream import csv_chunks, ndjson_chunks, json_array_chunks, encode_chunks, export_etag
 from tbot_bot.support.secrets_manager import get_screener_credentials_path
-import csv
-import io
 import json
 import os
 import sys
@@ -32,6 +34,16 @@ BLOCKLIST_PATH = resolve_screener_blocklist_path()
 LOG_PATH = resolve_universe_log_path()
 FINAL_PATH = resolve_universe_cache_path()
 PARTIAL_PATH = resolve_universe_partial_path()
+MAX_TABLE_PAGE = int(os.environ.get("TBOT_UNIVERSE_TABLE_MAX_PAGE", "5000"))
+
+# Export schema: CSV header and default column order (records missing a field export it empty)
+UNIVERSE_EXPORT_COLUMNS = ("symbol", "exchange", "companyName", "lastClose", "marketCap", "c", "o", "vwap")
+# fmt -> (chunk generator, mimetype, download name)
+EXPORT_FORMATS = {
+    "csv": (csv_chunks, "text/csv", "symbol_universe.csv"),
+    "ndjson": (ndjson_chunks, "application/x-ndjson", "symbol_universe.ndjson"),
+    "json": (json_array_chunks, "application/json", "symbol_universe.json"),
+}
 
 
 def screener_creds_exist():
@@ -128,20 +140,15 @@ def get_symbols_and_source():
 
 
 def get_all_counts():
-    unfiltered = load_json_file(UNFILTERED_PATH)
-    partial = load_json_file(PARTIAL_PATH)
-    try:
-        final, _status = load_final_symbols_and_status()
-    except Exception:
-        final = []
+    # Counts come from the per-file universe index (rebuilt only when a file changes)
     try:
         block_count = get_blocklist_count()
     except Exception:
         block_count = 0
     return {
-        "unfiltered": len(unfiltered),
-        "partial": len(partial),
-        "filtered": len(final),
+        "unfiltered": universe_count(UNFILTERED_PATH),
+        "partial": universe_count(PARTIAL_PATH),
+        "filtered": universe_count(FINAL_PATH),
         "blocklist": block_count,
     }
 
@@ -154,8 +161,7 @@ def universe_status():
 
     # Blocklist entries (best-effort)
     try:
-        with open(BLOCKLIST_PATH, "r", encoding="utf-8") as bf:
-            blocklist_entries = [line.strip() for line in bf if line.strip() and not line.startswith("#")]
+        blocklist_entries = get_blocklist_lines()
     except Exception:
         blocklist_entries = []
 
@@ -224,38 +230,63 @@ def universe_log():
         return Response("Log file not found.", mimetype="text/plain")
 
 
+def _export_columns(fmt):
+    """?columns=a,b,c selects/orders columns; CSV defaults to the schema, JSON formats to whole records."""
+    raw = request.args.get("columns", "")
+    cols = [c.strip() for c in raw.split(",") if c.strip()]
+    if cols:
+        return list(dict.fromkeys(cols))
+    return list(UNIVERSE_EXPORT_COLUMNS) if fmt == "csv" else None
+
+
+def _stream_universe_export(fmt):
+    """Stream the final universe as CSV/NDJSON/JSON straight from the file, gzip when the client accepts it."""
+    items = iter_universe_items(FINAL_PATH)
+    try:
+        first = next(items, None) if os.path.exists(FINAL_PATH) else None
+    except Exception:
+        current_app.logger.exception("[universe_export] unreadable universe cache")
+        first = None
+    if first is None:
+        items.close()
+        flash("Universe cache not loaded.", "error")
+        return redirect(url_for("universe.universe_status"))
+
+    render, mimetype, filename = EXPORT_FORMATS[fmt]
+    columns = _export_columns(fmt)
+    use_gzip = "gzip" in request.headers.get("Accept-Encoding", "").lower()
+    etag = export_etag(FINAL_PATH, fmt, columns, use_gzip)
+    headers = {"Content-Disposition": f"attachment;filename={filename}", "Vary": "Accept-Encoding"}
+    if etag:
+        headers["ETag"] = etag
+        if etag in request.headers.get("If-None-Match", ""):
+            items.close()
+            return Response(status=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    def records():
+        yield first
+        try:
+            yield from items
+        except Exception:
+            current_app.logger.exception("[universe_export] universe cache read failed mid-export")
+
+    chunks = render(records(), columns) if columns is not None else render(records())
+    return Response(stream_with_context(encode_chunks(chunks, gzip=use_gzip)), mimetype=mimetype, headers=headers)
+
+
 @universe_bp.route("/export/<fmt>", methods=["GET"])
 def universe_export(fmt):
     if not screener_creds_exist():
         flash("Screener credentials not configured. Please configure screener credentials before exporting.", "error")
         return redirect(url_for("universe.universe_status"))
 
-    final_symbols, _status = load_final_symbols_and_status()
-    if not final_symbols:
-        flash("Universe cache not loaded.", "error")
-        return redirect(url_for("universe.universe_status"))
-
-    if fmt == "csv":
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=list(final_symbols[0].keys()))
-        writer.writeheader()
-        writer.writerows(final_symbols)
-        output.seek(0)
-        return Response(
-            output.getvalue(),
-            mimetype="text/csv",
-            headers={"Content-Disposition": "attachment;filename=symbol_universe.csv"}
-        )
-    elif fmt == "json":
-        return Response(
-            json.dumps(final_symbols, indent=2),
-            mimetype="application/json",
-            headers={"Content-Disposition": "attachment;filename=symbol_universe.json"}
-        )
+    if fmt in EXPORT_FORMATS:
+        return _stream_universe_export(fmt)
     elif fmt == "blocklist":
         try:
-            with open(BLOCKLIST_PATH, "r", encoding="utf-8") as bf:
-                data = bf.read()
+            data = "".join(f"{line}\n" for line in get_blocklist_lines())
             return Response(
                 data,
                 mimetype="text/plain",
@@ -329,8 +360,7 @@ def universe_blocklist():
                 flash(f"Removed {symbol} from blocklist.", "success")
     blocklist = []
     try:
-        with open(BLOCKLIST_PATH, "r", encoding="utf-8") as bf:
-            blocklist = [line.strip() for line in bf if line.strip() and not line.startswith("#")]
+        blocklist = get_blocklist_lines()
     except Exception:
         blocklist = []
     return render_template(
@@ -341,28 +371,47 @@ def universe_blocklist():
 
 @universe_bp.route("/table/<table_type>")
 def universe_table_api(table_type):
+    """
+    One page of a universe table, in file order. Query args: search (symbol substring, or prefix with
+    match=prefix), offset/limit, or after=<cursor> from the X-Next-After header of the previous page.
+    X-Total-Count carries the unfiltered row count.
+    """
     search = request.args.get("search", "").upper()
-    offset = int(request.args.get("offset", 0))
-    limit = int(request.args.get("limit", 100))
-
-    if table_type == "unfiltered":
-        data = load_json_file(UNFILTERED_PATH)
-    elif table_type == "partial":
-        data = load_json_file(PARTIAL_PATH)
-    elif table_type == "final":
-        data, _status = load_final_symbols_and_status()
-    elif table_type == "blocklist":
+    offset = max(0, int(request.args.get("offset", 0)))
+    limit = max(0, min(int(request.args.get("limit", 100)), MAX_TABLE_PAGE))
+    after = request.args.get("after")
+    prefix = request.args.get("match") == "prefix"
+
+    paths = {"unfiltered": UNFILTERED_PATH, "partial": PARTIAL_PATH, "final": FINAL_PATH}
+    if table_type in paths:
+        try:
+            index = get_universe_index(paths[table_type])
+            rows, next_after = index.page(search=search, offset=offset, limit=limit,
+                                          after=int(after) if after not in (None, "") else None, prefix=prefix)
+            total = index.count()
+        except Exception:
+            current_app.logger.exception(f"[universe_table_api] index read failed for {table_type}")
+            rows, next_after, total = [], None, 0
+        resp = jsonify(rows)
+        resp.headers["X-Total-Count"] = str(total)
+        if next_after is not None:
+            resp.headers["X-Next-After"] = str(next_after)
+        return resp
+
+    if table_type == "blocklist":
         try:
-            with open(BLOCKLIST_PATH, "r", encoding="utf-8") as bf:
-                data = [line.strip() for line in bf if line.strip() and not line.startswith("#")]
+            data = get_blocklist_lines()
         except Exception:
             data = []
     else:
         return jsonify({"error": "Invalid table type"}), 400
 
+    total = len(data)
     if search:
-        data = [s for s in data if search in (s if isinstance(s, str) else s.get("symbol", "")).upper()]
-    return jsonify(data[offset:offset+limit])
+        data = [s for s in data if (s.upper().startswith(search) if prefix else search in s.upper())]
+    resp = jsonify(data[offset:offset+limit])
+    resp.headers["X-Total-Count"] = str(total)
+    return resp
 
 
 @universe_bp.route("/counts")
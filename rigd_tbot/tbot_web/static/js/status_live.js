@@ -69,7 +69,8 @@ document.addEventListener("DOMContentLoaded", function () {
     async function pollBotStatus() {
         try {
             // FIX: blueprint mounted under /status — use that path
-            const resp = await fetch('/status/full_status', { cache: "no-store" });
+            // "no-cache": revalidate with If-None-Match every poll; an unchanged status comes back as 304
+            const resp = await fetch('/status/full_status', { cache: "no-cache" });
             if (!resp.ok) throw new Error("HTTP not OK");
             const payload = await resp.json();
             if (!payload || Object.keys(payload).length === 0) throw new Error("Empty JSON");
@@ -410,10 +411,34 @@ document.addEventListener("DOMContentLoaded", function () {
         // Note: Strategy Toggles grid removed (no updates performed here).
     }
 
-    // Poll every 30s
-    setInterval(pollBotStatus, 30000);
+    // Live updates: server-sent events push state transitions and status deltas (changed keys only).
+    // Polling stays as the fallback while the stream is down (unsupported, refused at the connection cap, ...).
+    let streamOpen = false;
+    function openStatusStream() {
+        if (!window.EventSource) return;
+        const es = new EventSource('/status/stream');
+        es.onopen = function () { streamOpen = true; };
+        es.onerror = function () { streamOpen = false; };
+        es.addEventListener('status', function (ev) {
+            try {
+                lastData = { ...(lastData || {}), ...JSON.parse(ev.data) };
+                updateUI(lastData);
+            } catch (e) { /* ignore malformed event */ }
+        });
+        es.addEventListener('state', function (ev) {
+            try {
+                const st = JSON.parse(ev.data);
+                lastData = { ...(lastData || DEFAULTS), state: st.to, bot_state: st.to };
+                updateUI(lastData);
+            } catch (e) { /* ignore malformed event */ }
+        });
+    }
+
+    // Poll every 30s (skipped while the event stream is open)
+    setInterval(function () { if (!streamOpen) pollBotStatus(); }, 30000);
     // Initial fetch
     pollBotStatus();
+    openStatusStream();
 
     // Also do a one-time adornment for the schedule that was server-rendered on first load.
     updateScheduleLocalConversions();
@@ -0,0 +1,349 @@
+# tbot_web/support/event_stream.py
+# Server-sent events for the web UI: one watcher thread tails bot_state.txt, the status sources and
+# selected log files (inotify wake-ups, stat polling fallback) and fans events out to subscribers.
+
+"""
+Event types pushed to subscribers:
+
+    state   {"from": "running", "to": "trading", "timestamp_utc": ...}   bot_state.txt transition
+    status  {...changed top-level keys only...}                         delta of the enriched status
+    log     {"file": "open.log", "lines": [...]}                        lines appended to a tailed log
+    dropped {"lines": n}                                                log lines lost to backpressure
+
+Backpressure is per subscriber: status deltas are merged into one pending dict (a slow client
+receives the union of missed changes, never a stale key), state transitions are queued, and log
+lines go to a bounded buffer that drops the oldest lines and reports how many were lost.
+
+The hub thread only runs while at least one subscriber is connected. Connection count is capped by
+TBOT_SSE_MAX_CLIENTS; subscribe() returns None past the cap so the route can answer 503.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tbot_web.support.status_cache import VOLATILE_FIELDS, file_key
+
+MAX_CLIENTS = int(os.environ.get("TBOT_SSE_MAX_CLIENTS", "20"))
+MAX_BUFFERED_LINES = int(os.environ.get("TBOT_SSE_MAX_LINES", "500"))
+# Upper bound between scans; inotify wakes the hub earlier when a watched directory changes
+SCAN_INTERVAL = float(os.environ.get("TBOT_SSE_SCAN_SEC", "2"))
+HEARTBEAT_SEC = float(os.environ.get("TBOT_SSE_HEARTBEAT_SEC", "15"))
+# Coalesce bursts of writes (a log flush is often several write() calls)
+_DEBOUNCE_SEC = 0.05
+_MAX_READ_BYTES = 256 * 1024
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+_IN_EVENT_HDR = struct.calcsize("iIII")
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class _Inotify:
+    """Minimal inotify wrapper used only as a wake-up source; the hub still stats files to decide what changed."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[str, int] = {}
+
+    def watch_dir(self, directory: str) -> None:
+        if directory in self._dirs or not os.path.isdir(directory):
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_MASK)
+        if wd >= 0:
+            self._dirs[directory] = wd
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        time.sleep(_DEBOUNCE_SEC)
+        try:
+            while os.read(self.fd, 64 * _IN_EVENT_HDR + 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class _PollWaiter:
+    """Fallback when inotify is unavailable: sleep until the next scan."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def watch_dir(self, directory: str) -> None:
+        pass
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(min(timeout, self.interval))
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+def _make_waiter(poll_interval: float):
+    if os.environ.get("TBOT_SSE_INOTIFY", "1").strip().lower() in ("0", "false", "no", "off"):
+        return _PollWaiter(poll_interval)
+    try:
+        return _Inotify()
+    except Exception:
+        return _PollWaiter(poll_interval)
+
+
+class LogTail:
+    """Incremental reader for an append-only log; restarts from the top after truncation or rotation."""
+
+    def __init__(self, path: str, from_end: bool = True):
+        self.path = path
+        self.offset = 0
+        self.ino = None
+        self._partial = b""
+        key = file_key(path)
+        if key and from_end:
+            self.offset, self.ino = key[1], key[2]
+
+    def read_new(self) -> List[str]:
+        key = file_key(self.path)
+        if key is None:
+            return []
+        _, size, ino = key
+        if ino != self.ino or size < self.offset:
+            self.offset, self.ino, self._partial = 0, ino, b""
+        if size == self.offset:
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(min(size - self.offset, _MAX_READ_BYTES))
+        self.offset += len(chunk)
+        data = self._partial + chunk
+        *lines, self._partial = data.split(b"\n")
+        return [ln.decode("utf-8", errors="replace").rstrip("\r") for ln in lines]
+
+
+class Subscriber:
+    def __init__(self, log_path: Optional[str] = None, log_name: Optional[str] = None,
+                 max_lines: int = MAX_BUFFERED_LINES):
+        self.log_path = log_path
+        self.log_name = log_name or (os.path.basename(log_path) if log_path else None)
+        self.max_lines = max_lines
+        self._cond = threading.Condition()
+        self._states: deque = deque(maxlen=32)
+        self._status: Dict[str, Any] = {}
+        self._lines: deque = deque()
+        self.dropped = 0
+        self.closed = False
+
+    def push_state(self, event: Dict[str, Any]) -> None:
+        with self._cond:
+            self._states.append(event)
+            self._cond.notify()
+
+    def push_status(self, delta: Dict[str, Any]) -> None:
+        with self._cond:
+            self._status.update(delta)
+            self._cond.notify()
+
+    def push_lines(self, lines: List[str]) -> None:
+        with self._cond:
+            for line in lines:
+                if len(self._lines) >= self.max_lines:
+                    self._lines.popleft()
+                    self.dropped += 1
+                self._lines.append(line)
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+
+    def drain(self, timeout: float) -> List[Tuple[str, Dict[str, Any]]]:
+        """Block up to `timeout` for pending events; returns [(event, data), ...] (empty on timeout)."""
+        with self._cond:
+            if not (self._states or self._status or self._lines or self.closed):
+                self._cond.wait(timeout)
+            out: List[Tuple[str, Dict[str, Any]]] = [("state", s) for s in self._states]
+            self._states.clear()
+            if self._status:
+                out.append(("status", self._status))
+                self._status = {}
+            if self.dropped:
+                out.append(("dropped", {"lines": self.dropped}))
+                self.dropped = 0
+            if self._lines:
+                out.append(("log", {"file": self.log_name, "lines": list(self._lines)}))
+                self._lines.clear()
+            return out
+
+
+def status_delta(prev: Optional[Dict[str, Any]], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """Top-level keys of `cur` that differ from `prev` (volatile timestamps ignored)."""
+    if prev is None:
+        return {k: v for k, v in cur.items() if k not in VOLATILE_FIELDS}
+    delta = {k: v for k, v in cur.items() if k not in VOLATILE_FIELDS and prev.get(k) != v}
+    for k in prev:
+        if k not in cur and k not in VOLATILE_FIELDS:
+            delta[k] = None
+    return delta
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'), default=str)}\n\n"
+
+
+class EventHub:
+    def __init__(self, state_reader: Callable[[], str], state_path: Callable[[], str],
+                 status_provider: Callable[[], Dict[str, Any]], watch_dirs: Callable[[], List[str]] = lambda: [],
+                 max_clients: int = MAX_CLIENTS, scan_interval: float = SCAN_INTERVAL):
+        self.state_reader = state_reader
+        self.state_path = state_path
+        self.status_provider = status_provider
+        self.watch_dirs = watch_dirs
+        self.max_clients = max_clients
+        self.scan_interval = scan_interval
+        self._lock = threading.Lock()
+        self._subs: List[Subscriber] = []
+        self._tails: Dict[str, LogTail] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._state: Optional[str] = None
+        self._status: Optional[Dict[str, Any]] = None
+        self.scans = 0
+        self.rejected = 0
+
+    # ---- subscriptions ----
+
+    def subscribe(self, log_path: Optional[str] = None, log_name: Optional[str] = None) -> Optional[Subscriber]:
+        with self._lock:
+            if len(self._subs) >= self.max_clients:
+                self.rejected += 1
+                return None
+            sub = Subscriber(log_path, log_name)
+            self._subs.append(sub)
+            if log_path and log_path not in self._tails:
+                self._tails[log_path] = LogTail(log_path)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="tbot-sse-hub", daemon=True)
+                self._thread.start()
+            return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        sub.close()
+        with self._lock:
+            if sub in self._subs:
+                self._subs.remove(sub)
+            live = {s.log_path for s in self._subs}
+            for path in [p for p in self._tails if p not in live]:
+                del self._tails[path]
+
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._subs)
+
+    def snapshot(self) -> Tuple[str, Dict[str, Any]]:
+        """Current state and full status, sent to a client right after it connects."""
+        state = self._state if self._state is not None else self.state_reader()
+        status = self._status if self._status is not None else self.status_provider()
+        return state, status
+
+    # ---- watcher thread ----
+
+    def _run(self) -> None:
+        waiter = _make_waiter(self.scan_interval)
+        try:
+            while True:
+                with self._lock:
+                    if not self._subs:
+                        # Forget the last seen state/status: the next client must not get a stale snapshot
+                        # or a transition relative to it
+                        self._thread = None
+                        self._state = None
+                        self._status = None
+                        return
+                    tail_dirs = {os.path.dirname(p) for p in self._tails}
+                for d in tail_dirs | {os.path.dirname(self.state_path())} | set(self.watch_dirs()):
+                    waiter.watch_dir(d)
+                self.scan()
+                waiter.wait(self.scan_interval)
+        finally:
+            waiter.close()
+
+    def scan(self) -> None:
+        """Check every source once and publish what changed."""
+        self.scans += 1
+        with self._lock:
+            subs = list(self._subs)
+            tails = dict(self._tails)
+
+        state = self.state_reader()
+        if self._state is not None and state != self._state:
+            event = {"from": self._state, "to": state, "timestamp_utc": _utc_now_iso()}
+            for s in subs:
+                s.push_state(event)
+        self._state = state
+
+        try:
+            status = self.status_provider()
+        except Exception:
+            status = None
+        if status is not None:
+            delta = status_delta(self._status, status) if self._status is not None else {}
+            self._status = status
+            if delta:
+                for s in subs:
+                    s.push_status(delta)
+
+        for path, tail in tails.items():
+            try:
+                lines = tail.read_new()
+            except OSError:
+                continue
+            if lines:
+                for s in subs:
+                    if s.log_path == path:
+                        s.push_lines(lines)
+
+
+def stream(hub: EventHub, sub: Subscriber, heartbeat: float = HEARTBEAT_SEC):
+    """SSE body generator; unsubscribes when the client disconnects (generator closed)."""
+    try:
+        yield "retry: 5000\n\n"
+        state, status = hub.snapshot()
+        yield format_sse("state", {"from": None, "to": state, "timestamp_utc": _utc_now_iso()})
+        yield format_sse("status", status)
+        while not sub.closed:
+            events = sub.drain(heartbeat)
+            if not events:
+                yield ": keepalive\n\n"
+                continue
+            yield "".join(format_sse(name, data) for name, data in events)
+    finally:
+        hub.unsubscribe(sub)
@@ -0,0 +1,127 @@
+# tbot_web/support/export_stream.py
+# Chunked export bodies for large record sources: CSV / NDJSON / JSON-array generators that consume an
+# iterator of records and yield ~64 KB text chunks, optional gzip encoding, and content-hash ETags.
+
+"""
+Responses built from these generators are sent as the records are read, so memory stays flat and the first
+byte goes out after one chunk instead of after the whole export is rendered:
+
+    chunks = csv_chunks(iter_universe_items(path), columns)
+    Response(encode_chunks(chunks, gzip=True), headers={"Content-Encoding": "gzip", ...})
+
+CSV headers come from the column list given by the caller (a schema), not from the first record, so records
+with missing or extra keys still line up; missing fields are written empty and extra fields are dropped.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import threading
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from tbot_web.support.status_cache import file_key
+
+CHUNK_CHARS = 1 << 16
+GZIP_LEVEL = 6
+
+_HASH_MEMO: Dict[str, Tuple[Any, str]] = {}
+_HASH_LOCK = threading.Lock()
+
+
+def _as_row(item: Any) -> Dict[str, Any]:
+    return item if isinstance(item, dict) else {"symbol": item}
+
+
+def _project(item: Any, columns: Optional[Sequence[str]]) -> Any:
+    if not columns:
+        return item
+    row = _as_row(item)
+    return {c: row.get(c) for c in columns}
+
+
+def csv_chunks(items: Iterable[Any], columns: Sequence[str]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(columns), extrasaction="ignore")
+    writer.writeheader()
+    for item in items:
+        writer.writerow(_as_row(item))
+        if buf.tell() >= CHUNK_CHARS:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def ndjson_chunks(items: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Iterator[str]:
+    parts, size = [], 0
+    for item in items:
+        line = json.dumps(_project(item, columns), ensure_ascii=False) + "\n"
+        parts.append(line)
+        size += len(line)
+        if size >= CHUNK_CHARS:
+            yield "".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts)
+
+
+def json_array_chunks(items: Iterable[Any], columns: Optional[Sequence[str]] = None) -> Iterator[str]:
+    """A JSON array, one record per line."""
+    parts, size, sep = ["["], 1, "\n"
+    for item in items:
+        part = sep + json.dumps(_project(item, columns), ensure_ascii=False)
+        sep = ",\n"
+        parts.append(part)
+        size += len(part)
+        if size >= CHUNK_CHARS:
+            yield "".join(parts)
+            parts, size = [], 0
+    parts.append("\n]\n")
+    yield "".join(parts)
+
+
+def encode_chunks(chunks: Iterable[str], gzip: bool = False, level: int = GZIP_LEVEL) -> Iterator[bytes]:
+    """UTF-8 encode text chunks, optionally as one gzip stream (flushed per chunk so bytes keep flowing)."""
+    if not gzip:
+        for chunk in chunks:
+            yield chunk.encode("utf-8")
+        return
+    comp = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        out = comp.compress(chunk.encode("utf-8")) + comp.flush(zlib.Z_SYNC_FLUSH)
+        if out:
+            yield out
+    yield comp.flush()
+
+
+def file_hash(path) -> Optional[str]:
+    """sha1 of the file contents, re-hashed only when (mtime, size, inode) changes; None if missing."""
+    key = file_key(path)
+    if key is None:
+        return None
+    name = str(path)
+    memo = _HASH_MEMO.get(name)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+    h = hashlib.sha1()
+    with open(name, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    with _HASH_LOCK:
+        _HASH_MEMO[name] = (key, digest)
+    return digest
+
+
+def export_etag(path, *variant: Any) -> Optional[str]:
+    """Strong ETag: source content hash plus the representation (format, columns, encoding)."""
+    digest = file_hash(path)
+    if digest is None:
+        return None
+    tag = hashlib.sha1(json.dumps(variant, default=str).encode("utf-8")).hexdigest()[:8]
+    return f'"{digest[:24]}-{tag}"'
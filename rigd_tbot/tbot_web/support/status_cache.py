@@ -0,0 +1,98 @@
+# tbot_web/support/status_cache.py
+# Per-component cache for the status API: each component is recomputed only when its invalidation key
+# (source file stat, ledger DB/WAL stat, trading date, ...) changes; plus ETag/If-None-Match handling.
+
+"""
+Browsers poll /status/full_status every few seconds. Without a cache each poll re-read status.json,
+bot_state.txt, schedule.json and every stamp/snapshot file, re-parsed the whole universe cache,
+re-decrypted screener credentials and re-resolved identity-scoped paths (one identity decryption per
+path). With StatusCache each of those is a component:
+
+    value = STATUS_CACHE.get("schedule", file_key(path), _read_schedule)
+
+`key` is any hashable; the compute function runs only when the key differs from the stored one.
+Values are shared between requests and must be treated as read-only by callers.
+
+Set TBOT_STATUS_CACHE=0 to bypass the cache (every get() recomputes).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# Response fields regenerated on every request; excluded from the ETag so an unchanged status revalidates
+VOLATILE_FIELDS = ("created_utc", "timestamp_utc")
+
+
+def file_key(path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of `path`, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def files_key(paths: Iterable) -> Tuple:
+    return tuple(file_key(p) for p in paths)
+
+
+def _enabled() -> bool:
+    return os.environ.get("TBOT_STATUS_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class StatusCache:
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Hashable, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if _enabled():
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+        value = compute()
+        with self._lock:
+            self._entries[name] = (key, value)
+            self.misses += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"components": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+STATUS_CACHE = StatusCache()
+
+
+def payload_etag(payload: Dict[str, Any], volatile: Iterable[str] = VOLATILE_FIELDS) -> str:
+    """Weak ETag over the payload minus per-request timestamps."""
+    skip = set(volatile)
+    body = json.dumps({k: v for k, v in payload.items() if k not in skip}, sort_keys=True, default=str)
+    return 'W/"' + hashlib.sha1(body.encode("utf-8")).hexdigest()[:24] + '"'
+
+
+def etag_json_response(payload: Dict[str, Any]):
+    """jsonify(payload) with an ETag; 304 Not Modified when the request's If-None-Match already matches."""
+    from flask import jsonify, make_response, request
+
+    etag = payload_etag(payload)
+    if etag in request.headers.get("If-None-Match", ""):
+        resp = make_response("", 304)
+    else:
+        resp = jsonify(payload)
+    resp.headers["ETag"] = etag
+    # Clients may store the response but must revalidate every poll
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
@@ -0,0 +1,112 @@
+# tools/bench_archive_store.py
+# Benchmarks universe archiving over --days (default 90) daily versions of a --symbols (default 50k) universe
+# (compact symbol_universe.json; every day prices/caps/volumes move for --move of the symbols, --churn of symbols
+# are replaced) plus a slowly growing blocklist:
+#   copy   legacy archive_file: shutil.copy2 of each file per archive run
+#   store  ArchiveStore.put (record-aligned chunk dedup + zlib/zstd delta against the previous version)
+# Reports bytes on disk, archive time per run, restore time (oldest/middle/newest), lookup and range prune times.
+# Usage: python tools/bench_archive_store.py [--days 90] [--symbols 50000] [--move 1.0] [--churn 0.002]
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.screeners import archive_store as store_mod
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Universe archive benchmark (full copies vs archive store)")
+    ap.add_argument("--days", type=int, default=90)
+    ap.add_argument("--symbols", type=int, default=50000)
+    ap.add_argument("--move", type=float, default=1.0, help="share of symbols whose quote fields change daily")
+    ap.add_argument("--churn", type=float, default=0.002)
+    args = ap.parse_args()
+
+    rng = random.Random(11)
+    tmp = tempfile.TemporaryDirectory()
+    live = os.path.join(tmp.name, "live")
+    copies = os.path.join(tmp.name, "copies")
+    os.makedirs(live)
+    os.makedirs(copies)
+    store = store_mod.ArchiveStore(os.path.join(tmp.name, "store"))
+    universe = {f"S{i:06d}": {"symbol": f"S{i:06d}", "exchange": rng.choice(["NYSE", "NASDAQ"]),
+                              "companyName": f"COMPANY {i} HOLDINGS INC", "sector": "Industrials",
+                              "industry": "Machinery", "lastClose": round(rng.uniform(5, 500), 2),
+                              "marketCap": round(rng.uniform(1e8, 1e11), 2), "volume": rng.randint(1000, 10 ** 7)}
+                for i in range(args.symbols)}
+    blocklist = []
+    next_id = args.symbols
+    copy_s = store_s = 0.0
+    logical = 0
+    ids, snapshots = [], {}
+    print(f"{args.days} daily versions, {args.symbols} symbols, {args.move:.0%} quotes move daily, "
+          f"{args.churn:.1%} churn, codec {'zstd' if store_mod._zstd else 'zlib'}", flush=True)
+    for day in range(args.days):
+        for sym, rec in universe.items():
+            if rng.random() < args.move:
+                rec["lastClose"] = round(rec["lastClose"] * rng.uniform(0.97, 1.03), 2)
+                rec["marketCap"] = round(rec["marketCap"] * rng.uniform(0.97, 1.03), 2)
+                rec["volume"] = rng.randint(1000, 10 ** 7)
+        for sym in rng.sample(sorted(universe), int(args.symbols * args.churn)):
+            del universe[sym]
+            blocklist.append(f"{sym}|delisted|2025-01-{day % 28 + 1:02d}T00:00:00Z|FINNHUB\n")
+            universe[f"S{next_id:06d}"] = dict(universe[next(iter(universe))], symbol=f"S{next_id:06d}")
+            next_id += 1
+        ts = f"2025{(day // 28) + 1:02d}{day % 28 + 1:02d}T060000Z"
+        body = json.dumps({"build_timestamp_utc": ts, "symbols": sorted(universe.values(),
+                                                                         key=lambda r: r["symbol"])})
+        files = {"symbol_universe.json": body, "screener_blocklist.txt": "".join(blocklist)}
+        for name, text in files.items():
+            with open(os.path.join(live, name), "w", encoding="utf-8") as f:
+                f.write(text)
+            logical += len(text)
+        t0 = time.perf_counter()
+        for name in files:
+            shutil.copy2(os.path.join(live, name), os.path.join(copies, f"{name}.{ts}.bak"))
+        copy_s += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for name in files:
+            vid = store.put(os.path.join(live, name), ts=ts)
+            if name == "symbol_universe.json":
+                ids.append(vid)
+        store_s += time.perf_counter() - t0
+        if day in (0, args.days // 2, args.days - 1):
+            snapshots[ids[-1]] = body.encode("utf-8")
+
+    du = lambda d: sum(os.path.getsize(os.path.join(r, f)) for r, _d, fs in os.walk(d) for f in fs)
+    copy_bytes, store_bytes = du(copies), du(store.root)
+    print(f"  logical bytes     {logical / 1e6:9.1f} MB")
+    print(f"  copy   on disk    {copy_bytes / 1e6:9.1f} MB   archive {copy_s / args.days * 1000:7.1f} ms/run")
+    print(f"  store  on disk    {store_bytes / 1e6:9.1f} MB   archive {store_s / args.days * 1000:7.1f} ms/run   "
+          f"({copy_bytes / store_bytes:.1f}x smaller, index {store.stats()['index_bytes'] / 1e6:.1f} MB)")
+    for label, vid in zip(("oldest", "middle", "newest"), snapshots):
+        t0 = time.perf_counter()
+        store.restore(vid, os.path.join(tmp.name, "restored.json"))
+        dt = time.perf_counter() - t0
+        with open(os.path.join(tmp.name, "restored.json"), "rb") as f:
+            assert f.read() == snapshots[vid]
+        t1 = time.perf_counter()
+        shutil.copy2(os.path.join(copies, vid + ".bak"), os.path.join(tmp.name, "copied.json"))
+        print(f"  restore {label:7s}  store {dt * 1000:7.1f} ms   copy {(time.perf_counter() - t1) * 1000:6.1f} ms")
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        store.get(ids[len(ids) // 3])
+    print(f"  version lookup    {(time.perf_counter() - t0) * 1000:7.3f} us")
+    t0 = time.perf_counter()
+    removed = store.prune(before=store.get(ids[len(ids) // 3])["ts"])
+    print(f"  prune oldest third: {len(removed)} versions in {(time.perf_counter() - t0) * 1000:.0f} ms, "
+          f"store now {du(store.root) / 1e6:.1f} MB")
+    assert store.read(ids[-1]) == snapshots[ids[-1]]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# tools/bench_blocklist.py
+# Benchmarks screener blocklist checks: --checks symbols (default 50k, ~40% blocked) against a --size entry
+# blocklist (default 20k) on a scratch file:
+#   legacy   previous is_blocked: load_blocklist() re-reads and parses the whole file per symbol
+#            (run on --legacy-checks and extrapolated)
+#   store    is_blocked per symbol on the in-memory store (one os.stat per call)
+#   bulk     is_blocked_many for the whole batch
+# Then removals: legacy whole-file rewrite per symbol vs. tombstone appends (with threshold compaction).
+# Usage: python tools/bench_blocklist.py [--size 20000] [--checks 50000] [--legacy-checks 500] [--removals 200]
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.screeners import blocklist_manager as bm
+
+
+def legacy_load(path):
+    blockset = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            blockset.add(line.split("|", 1)[0].upper())
+    return blockset
+
+
+def legacy_remove(path, symbol):
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.strip().split("|")
+            entries.append(parts + [""] * (4 - len(parts)))
+    with open(path, "w", encoding="utf-8") as f:
+        for e in entries:
+            if e[0].upper() != symbol:
+                f.write(f"{e[0]}|{e[1]}|{e[2]}|{e[3]}\n")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Blocklist membership benchmark")
+    ap.add_argument("--size", type=int, default=20000)
+    ap.add_argument("--checks", type=int, default=50000)
+    ap.add_argument("--legacy-checks", type=int, default=500)
+    ap.add_argument("--removals", type=int, default=200)
+    args = ap.parse_args()
+
+    rng = random.Random(3)
+    tmp = tempfile.TemporaryDirectory()
+    path = str(Path(tmp.name) / "screener_blocklist.txt")
+    bm.BLOCKLIST_PATH = path
+    bm.BLOCKLIST_LOG_PATH = str(Path(tmp.name) / "blocklist_ops.log")
+    blocked = [f"B{i:05d}" for i in range(args.size)]
+    with open(path, "w", encoding="utf-8") as f:
+        for s in blocked:
+            f.write(f"{s}|PRICE_BELOW_MIN|2026-01-02T00:00:00+00:00Z|finnhub\n")
+    checks = [rng.choice(blocked) if rng.random() < 0.4 else f"C{i:05d}" for i in range(args.checks)]
+
+    t0 = time.perf_counter()
+    hits = sum(1 for s in checks[:args.legacy_checks] if s.upper() in legacy_load(path))
+    dt = time.perf_counter() - t0
+    print(f"legacy  {args.legacy_checks:6d} checks: {dt:8.3f} s  ({args.legacy_checks / dt:10.0f} checks/s, "
+          f"~{dt * args.checks / args.legacy_checks:.1f} s extrapolated to {args.checks})")
+
+    t0 = time.perf_counter()
+    bm.get_blocklist_count()
+    print(f"store   initial load ({args.size} entries): {(time.perf_counter() - t0) * 1000:.1f} ms")
+    t0 = time.perf_counter()
+    hits = sum(1 for s in checks if bm.is_blocked(s))
+    dt = time.perf_counter() - t0
+    print(f"store   {args.checks:6d} checks: {dt:8.3f} s  ({args.checks / dt:10.0f} checks/s, {hits} blocked)")
+
+    t0 = time.perf_counter()
+    bulk = bm.is_blocked_many(checks)
+    dt = time.perf_counter() - t0
+    assert len(bulk) == len(set(s for s in checks if s in set(blocked)))
+    print(f"bulk    {args.checks:6d} checks: {dt:8.3f} s  ({args.checks / dt:10.0f} checks/s)")
+
+    victims = rng.sample(blocked, args.removals)
+    legacy_path = str(Path(tmp.name) / "legacy_blocklist.txt")
+    with open(path, "r", encoding="utf-8") as src, open(legacy_path, "w", encoding="utf-8") as dst:
+        dst.write(src.read())
+    t0 = time.perf_counter()
+    for s in victims:
+        legacy_remove(legacy_path, s)
+    dt = time.perf_counter() - t0
+    print(f"remove  legacy rewrite  {args.removals} symbols: {dt:8.3f} s  ({dt / args.removals * 1000:.2f} ms each)")
+    t0 = time.perf_counter()
+    for s in victims:
+        bm.get_blocklist_store().remove(s)
+    dt = time.perf_counter() - t0
+    print(f"remove  tombstones      {args.removals} symbols: {dt:8.3f} s  ({dt / args.removals * 1000:.2f} ms each, "
+          f"{bm.get_blocklist_store().dead_lines} dead lines pending compaction)")
+    assert bm.load_blocklist() == legacy_load(legacy_path)
+
+
+if __name__ == "__main__":
+    main()
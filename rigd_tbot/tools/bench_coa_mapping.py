@@ -0,0 +1,113 @@
+# tools/bench_coa_mapping.py
+# Benchmarks COA mapping resolution for sync: --entries (default 100k) transactions against --rules (default 2,000:
+# half legacy 'mappings', half programmatic 'rules') on a scratch mapping table file.
+#   scan       previous get_mapping_for_transaction: linear scan of mappings (type normalized per rule), then rules
+#   scan+load  same, with the table re-read from JSON per entry (no table passed; run on --load-entries, extrapolated)
+#   indexed    compiled index, table passed (sync path)
+#   indexed+disk  compiled index, no table passed (on-disk table cached until the file changes)
+# Results of scan and indexed are compared entry by entry.
+# Usage: python tools/bench_coa_mapping.py [--entries 100000] [--rules 2000] [--load-entries 500]
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.accounting import coa_mapping_table as cm
+
+TYPES = ["dividend", "interest", "fee", "deposit", "withdrawal", "split", "merger", "spinoff", "journal", "adr_fee"]
+BROKERS = [None, "ALPACA", "IBKR", "TRADIER"]
+
+
+def build_table(rng, n_rules):
+    n_legacy = n_rules // 2
+    mappings = []
+    for i in range(n_legacy):
+        mappings.append({
+            "broker": rng.choice(BROKERS), "type": f"{rng.choice(TYPES)}_{i % 97}" if i > 20 else rng.choice(TYPES),
+            "subtype": rng.choice([None, "cash", f"st{i % 13}"]), "description": rng.choice([None, f"memo {i % 211}"]),
+            "debit_account": f"Assets:D{i}", "credit_account": f"Income:C{i}",
+        })
+    rules = [{"rule_key": f"{rng.choice(BROKERS[1:]).lower()}|other|sym{i}", "account_code": f"R{i}"}
+             for i in range(n_rules - n_legacy)]
+    return {"mappings": mappings, "rules": rules, "version": 7, "entity_code": "RGL", "jurisdiction_code": "US",
+            "broker_code": "ALPACA"}
+
+
+def build_entries(rng, n, n_rules):
+    out = []
+    for i in range(n):
+        r = rng.random()
+        if r < 0.4:  # legacy mapping candidates (some never match)
+            out.append({"action": f"{rng.choice(TYPES)}_{rng.randint(0, 120)}", "broker": rng.choice(BROKERS),
+                        "subtype": rng.choice([None, "cash", f"st{rng.randint(0, 15)}"]),
+                        "description": rng.choice([None, f"memo {rng.randint(0, 250)}"]), "total_value": 10})
+        elif r < 0.8:  # programmatic rule keys
+            out.append({"action": "other", "broker": rng.choice(BROKERS[1:]), "symbol": f"SYM{rng.randint(0, n_rules)}",
+                        "total_value": 10})
+        else:
+            out.append({"action": rng.choice(TYPES), "broker": rng.choice(BROKERS), "total_value": 10})
+    return out
+
+
+def scan(txn, table):
+    txn_type = cm._normalize_type(txn.get("type") or txn.get("txn_type") or txn.get("action"))
+    txn_broker = (txn.get("broker") or txn.get("broker_code") or "").strip() or None
+    return cm._scan_mapping_for_transaction(txn, table, txn_type, txn_broker)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="COA mapping resolver benchmark")
+    ap.add_argument("--entries", type=int, default=100000)
+    ap.add_argument("--rules", type=int, default=2000)
+    ap.add_argument("--load-entries", type=int, default=500)
+    args = ap.parse_args()
+
+    rng = random.Random(11)
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / "coa_mapping_table.json"
+    cm._get_mapping_path = lambda *a: path
+    table = build_table(rng, args.rules)
+    cm.save_mapping_table(table)
+    entries = build_entries(rng, args.entries, args.rules)
+
+    t0 = time.perf_counter()
+    expected = [scan(e, table) for e in entries]
+    dt_scan = time.perf_counter() - t0
+    print(f"scan          {args.entries:7d} entries: {dt_scan:8.2f} s  ({args.entries / dt_scan:9.0f} entries/s)")
+
+    t0 = time.perf_counter()
+    for e in entries[:args.load_entries]:
+        scan(e, json.loads(path.read_text(encoding="utf-8")))
+    dt = time.perf_counter() - t0
+    print(f"scan+load     {args.load_entries:7d} entries: {dt:8.2f} s  ({args.load_entries / dt:9.0f} entries/s, "
+          f"~{dt * args.entries / args.load_entries:.0f} s extrapolated to {args.entries})")
+
+    t0 = time.perf_counter()
+    got = [cm.get_mapping_for_transaction(e, table) for e in entries]
+    dt_idx = time.perf_counter() - t0
+    print(f"indexed       {args.entries:7d} entries: {dt_idx:8.2f} s  ({args.entries / dt_idx:9.0f} entries/s, "
+          f"{dt_scan / dt_idx:.0f}x vs scan)")
+    assert got == expected
+    matched = sum(1 for g in got if g)
+    print(f"              {matched} entries mapped ({sum(1 for g in got if g and 'rule_key' in g)} by rule_key)")
+
+    t0 = time.perf_counter()
+    for e in entries:
+        cm.get_mapping_for_transaction(e)
+    dt = time.perf_counter() - t0
+    print(f"indexed+disk  {args.entries:7d} entries: {dt:8.2f} s  ({args.entries / dt:9.0f} entries/s)")
+
+    t0 = time.perf_counter()
+    cm._compile_mapping_index(table)
+    print(f"compile index ({args.rules} rules): {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# tools/bench_group_summary.py
+# Benchmarks trade_group_summary on a synthetic ledger (default 500k groups x 2 legs, built like bench_ledger_pages):
+#   install    ensure_group_summary on an existing ledger (trigger install + set-based backfill), rebuild, verify
+#   report     grouped report + per-symbol totals: regrouping raw legs in Python vs reading the summary table
+#   writes     leg inserts with and without the summary triggers (batched, and one commit per group as posted live)
+# Usage: python tools/bench_group_summary.py [--groups 500000] [--writes 2000] [--db /tmp/bench_ledger.db]
+
+import argparse
+import itertools
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from bench_ledger_pages import build
+from tbot_bot.accounting.ledger_modules import ledger_group_summary as lgs
+from tbot_bot.accounting.ledger_modules.ledger_grouping import collapse_group, ensure_page_indexes
+
+COLS = ("datetime_utc", "symbol", "action", "quantity", "price", "total_value", "amount", "side", "fee",
+        "broker_code", "account", "trade_id", "group_id", "jurisdiction_code", "entity_code")
+
+
+def legacy_report(db):
+    """Previous shape of the report: every leg read and regrouped in Python, totals summed per symbol."""
+    with sqlite3.connect(db) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute(
+            "SELECT * FROM trades WHERE group_id IS NOT NULL AND group_id <> '' ORDER BY group_id, datetime_utc, id"
+        )
+        reps = [collapse_group([dict(r) for r in legs]) for _, legs in itertools.groupby(cur, lambda r: r["group_id"])]
+    totals = {}
+    for g in reps:
+        t = totals.setdefault(g["symbol"], {"quantity": 0, "total_value": 0, "fee": 0})
+        t["quantity"] += g.get("quantity") or 0
+        t["total_value"] += g.get("total_value") or 0
+        t["fee"] += g.get("fee") or 0
+    return reps, totals
+
+
+def summary_report(db):
+    return lgs.fetch_group_summaries(db), lgs.summary_totals_by_symbol(db)
+
+
+def write_legs(db, start, groups, per_group_commit):
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    sql = f"INSERT INTO trades ({','.join(COLS)}) VALUES ({','.join('?' * len(COLS))})"
+    t0 = time.perf_counter()
+    for g in range(start, start + groups):
+        ts = f"2030-01-01T00:{g % 60:02d}:00Z"
+        gid, tid = f"W{g:08d}", f"WT{g:08d}"
+        conn.executemany(sql, [
+            (ts, "SPY", "long", 1.0, 500.0, 500.0, -500.0, "debit", 0.1, "ALPACA", "Brokerage:Equity", tid, gid,
+             "US", "RGL"),
+            (ts, "SPY", "long", 1.0, 500.0, 500.0, 500.0, "credit", 0.0, "ALPACA", "Brokerage:Cash", tid, gid,
+             "US", "RGL"),
+        ])
+        if per_group_commit:
+            conn.commit()
+    conn.commit()
+    dt = time.perf_counter() - t0
+    conn.close()
+    return dt
+
+
+def drop_triggers(db):
+    with sqlite3.connect(db) as conn:
+        for name in lgs._TRIGGER_NAMES:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    lgs._ENSURED.discard(db)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="trade_group_summary install/report/write benchmark")
+    ap.add_argument("--groups", type=int, default=500000)
+    ap.add_argument("--writes", type=int, default=2000, help="groups inserted per write scenario")
+    ap.add_argument("--db", default="")
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    db = args.db or str(Path(tmp.name) / "ledger.db")
+    if not Path(db).exists():
+        t0 = time.perf_counter()
+        build(db, args.groups)
+        print(f"built {args.groups} groups / {2 * args.groups} legs in {time.perf_counter() - t0:.1f} s")
+    drop_triggers(db)
+
+    t0 = time.perf_counter()
+    lgs.ensure_group_summary(db)
+    print(f"install + backfill:  {time.perf_counter() - t0:7.2f} s")
+    t0 = time.perf_counter()
+    n = lgs.rebuild_group_summaries(db)
+    print(f"rebuild ({n} groups): {time.perf_counter() - t0:7.2f} s")
+    t0 = time.perf_counter()
+    report = lgs.verify_group_summaries(db)
+    print(f"verify:              {time.perf_counter() - t0:7.2f} s  ok={report['ok']}")
+    ensure_page_indexes(db)  # ledger UI indexes on trades and the summary: part of the realistic write cost
+
+    t0 = time.perf_counter()
+    reps, totals = legacy_report(db)
+    dt_legacy = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    rows, totals2 = summary_report(db)
+    dt_summary = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    lgs.summary_totals_by_symbol(db)
+    dt_totals = time.perf_counter() - t0
+    print(f"report legacy  (regroup {len(reps)} groups from legs): {dt_legacy:7.2f} s")
+    print(f"report summary (read {len(rows)} summary rows + totals): {dt_summary:7.2f} s")
+    print(f"totals only (SQL GROUP BY on summary):              {dt_totals * 1000:7.1f} ms")
+    assert set(totals) == set(totals2)
+
+    start = 0
+    for per_group_commit in (False, True):
+        label = "commit per group" if per_group_commit else "single batch    "
+        with_trg = write_legs(db, start, args.writes, per_group_commit)
+        start += args.writes
+        drop_triggers(db)
+        without = write_legs(db, start, args.writes, per_group_commit)
+        start += args.writes
+        lgs.ensure_group_summary(db)  # reinstall (+ backfill of the untracked writes)
+        print(f"writes {label} {args.writes} groups: triggers {with_trg * 1000:8.1f} ms  "
+              f"none {without * 1000:8.1f} ms  ({(with_trg - without) / args.writes * 1e6:+.0f} us/group)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# tools/bench_historical_store.py
+# Benchmarks historical bar loading: pandas CSV parse vs columnar cache (cold convert, warm read,
+# filtered warm read). Each phase runs in its own process so peak RSS is measured per phase.
+# Usage: python tools/bench_historical_store.py [--gb 1.0] [--format parquet|feather] [--skip-csv]
+
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+BYTES_PER_ROW = 88  # approx. CSV row size of generate_synthetic_bars output
+
+
+def _write_csv(path, gb, symbols):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    from tbot_bot.backtest.simulators import generate_synthetic_bars
+
+    target = int(gb * (1 << 30))
+    names = [f"S{i:04d}" for i in range(symbols)]
+    day, chunk = 0, 5
+    with pacsv.CSVWriter(path, pa.schema([("timestamp", pa.timestamp("ns", tz="UTC")), ("symbol", pa.string()),
+                                          ("open", pa.float64()), ("high", pa.float64()), ("low", pa.float64()),
+                                          ("close", pa.float64()), ("volume", pa.float64())])) as w:
+        while os.path.getsize(path) < target:
+            import pandas as pd
+            df = generate_synthetic_bars(names, chunk, start=str((pd.Timestamp("2020-01-01") + pd.offsets.BDay(day)).date()),
+                                         seed=day + 1)
+            df["symbol"] = df["symbol"].astype(str)
+            w.write_table(pa.Table.from_pandas(df, preserve_index=False))
+            day += chunk
+
+
+def _phase(args):
+    from tbot_bot.backtest import historical_store
+    from tbot_bot.backtest.load_historical_data import load_data
+
+    t0 = time.perf_counter()
+    if args.phase == "csv":
+        df = load_data(args.csv, use_cache=False)
+    elif args.phase in ("cold", "warm") and not args.skip_full:
+        df = historical_store.load_bars(args.csv, fmt=args.format)
+    else:
+        df = historical_store.load_bars(args.csv, fmt=args.format, start="2020-02-01", end="2020-02-29",
+                                        symbols=[f"S{i:04d}" for i in range(0, args.symbols, 10)],
+                                        columns=["symbol", "close", "volume"])
+    print(f"{time.perf_counter() - t0:.2f} {len(df)}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Historical data loader benchmark")
+    ap.add_argument("--gb", type=float, default=1.0, help="CSV size to generate")
+    ap.add_argument("--symbols", type=int, default=500)
+    ap.add_argument("--format", default="parquet", choices=["parquet", "feather"])
+    ap.add_argument("--skip-csv", action="store_true", help="skip the pandas CSV baseline (needs RAM ~4x the CSV)")
+    ap.add_argument("--skip-full", action="store_true", help="cold/warm phases run the filtered query instead of a full read")
+    ap.add_argument("--phase", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--csv", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.phase:
+        return _phase(args)
+
+    tmp = tempfile.mkdtemp(prefix="bench_hist_")
+    try:
+        csv = os.path.join(tmp, "bars.csv")
+        t0 = time.perf_counter()
+        _write_csv(csv, args.gb, args.symbols)
+        print(f"csv: {os.path.getsize(csv) / (1 << 30):.2f} GB generated in {time.perf_counter() - t0:.1f}s "
+              f"({args.symbols} symbols, format={args.format})")
+        env = dict(os.environ, TBOT_HISTORICAL_CACHE_DIR=os.path.join(tmp, "cache"))
+        phases = ([] if args.skip_csv else ["csv"]) + ["cold"] + ([] if args.skip_full else ["warm"]) + ["filtered"]
+        for phase in phases:
+            cmd = [sys.executable, __file__, "--phase", phase, "--csv", csv, "--format", args.format,
+                   "--symbols", str(args.symbols)] + (["--skip-full"] if args.skip_full else [])
+            proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, text=True)
+            out = proc.stdout.read().strip().splitlines()
+            _, status, usage = os.wait4(proc.pid, 0)
+            if status != 0 or not out:
+                print(f"{phase:>9}: failed (status {status}, peak RSS {usage.ru_maxrss / 1024:,.0f} MB)")
+                continue
+            secs, rows = out[-1].split()
+            print(f"{phase:>9}: {float(secs):7.2f}s  rows={int(rows):,}  peak RSS {usage.ru_maxrss / 1024:,.0f} MB")
+        cache_mb = sum(f.stat().st_size for f in Path(tmp, "cache").rglob("*") if f.is_file()) / (1 << 20)
+        print(f"cache size on disk: {cache_mb:,.0f} MB")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
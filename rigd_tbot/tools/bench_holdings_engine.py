@@ -0,0 +1,154 @@
+# tools/bench_holdings_engine.py
+# Benchmarks the holdings loop over one simulated session against a stub broker: legacy fixed polling
+# (perform_holdings_cycle every POLL_INTERVAL) vs the change-driven HoldingsEngine.
+# Broker requests are counted the way the Alpaca adapter issues them; time is simulated, decision
+# latency is real wall time of perform_holdings_cycle with ledger/audit/state side effects stubbed.
+# Usage: python tools/bench_holdings_engine.py [--hours 6.5] [--poll 60] [--seed 7]
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.trading import holdings_manager as hm
+from tbot_bot.trading.holdings_engine import HoldingsEngine
+
+
+class SimClock:
+    def __init__(self):
+        self.sim = 0.0
+
+    def __call__(self):
+        # Simulated session time plus real elapsed time, so decision latency stays measurable
+        return self.sim + time.perf_counter()
+
+    def sleep(self, s):
+        self.sim += s
+
+
+class StubBroker:
+    """Account with drifting ETF prices; one request per account/positions call, like AlpacaBroker."""
+
+    def __init__(self, clock, seed):
+        self.clock = clock
+        self.rng = random.Random(seed)
+        self.units = {"SCHD": 1800.0, "SCHY": 1900.0}
+        self.price = {"SCHD": 25.0, "SCHY": 23.7}
+        self.cash = 10000.0
+        self.requests = 0
+        self.orders = 0
+        self._last = clock.sim
+        self.events = []  # (sim_time, fn)
+
+    def _advance(self):
+        while self._last + 60 <= self.clock.sim:
+            self._last += 60
+            for s in self.price:
+                self.price[s] *= 1 + self.rng.gauss(0, 0.0002)
+            while self.events and self.events[0][0] <= self._last:
+                self.events.pop(0)[1](self)
+
+    def _holdings(self):
+        return {s: round(self.units[s] * self.price[s], 2) for s in self.units}
+
+    def get_account_value(self):
+        self._advance()
+        self.requests += 1
+        return self.cash + sum(self._holdings().values())
+
+    def get_cash_balance(self):
+        self._advance()
+        self.requests += 1
+        return self.cash
+
+    def get_etf_holdings(self):
+        self._advance()
+        self.requests += 1
+        return self._holdings()
+
+    def place_order(self, symbol, side, amount):
+        self.orders += 1
+        qty = amount / self.price[symbol]
+        self.units[symbol] += qty if side == "buy" else -qty
+        self.cash += -amount if side == "buy" else amount
+
+
+class SnapshotBroker(StubBroker):
+    def get_account_snapshot(self):
+        self._advance()
+        self.requests += 2
+        h = self._holdings()
+        return {"account_value": self.cash + sum(h.values()), "cash": self.cash, "etf_holdings": h, "requests": 2}
+
+
+CFG = {"HOLDINGS_FLOAT_TARGET_PCT": 10, "HOLDINGS_TAX_RESERVE_PCT": 20, "HOLDINGS_PAYROLL_PCT": 10,
+       "HOLDINGS_ETF_LIST": "SCHD:50,SCHY:50"}
+
+
+def _patch(broker, cfg):
+    noop = lambda *a, **k: None
+    hm._is_bot_initialized = lambda: True
+    hm.get_active_broker = lambda: broker
+    hm.load_holdings_secrets = lambda: dict(cfg)
+    hm.set_state = hm.log_event = hm.audit_log_event = hm._maybe_attach_trailing_after_buy = noop
+    hm._warn_or_info = noop
+    hm.compliance_filter_ledger_entry = lambda entry: True
+
+
+def _events(cfg):
+    # A deposit two hours in, a target change four hours in
+    return [(2 * 3600, lambda b: setattr(b, "cash", b.cash + 5000.0)),
+            (4 * 3600, lambda b: cfg.update(HOLDINGS_ETF_LIST="SCHD:60,SCHY:40"))]
+
+
+def run_legacy(hours, poll, seed):
+    clock = SimClock()
+    broker, cfg = StubBroker(clock, seed), dict(CFG)
+    broker.events = _events(cfg)
+    _patch(broker, cfg)
+    lat, decisions = [], 0
+    while clock.sim < hours * 3600:
+        t0 = time.perf_counter()
+        hm.perform_holdings_cycle()
+        lat.append(time.perf_counter() - t0)
+        decisions += 1
+        clock.sleep(poll)
+    return broker, decisions, lat
+
+
+def run_engine(hours, poll, seed):
+    clock = SimClock()
+    broker, cfg = SnapshotBroker(clock, seed), dict(CFG)
+    broker.events = _events(cfg)
+    _patch(broker, cfg)
+    eng = HoldingsEngine(hm.get_active_broker, lambda snap: hm.perform_holdings_cycle(snapshot=snap),
+                         targets_loader=hm._holdings_targets, base_interval=poll, clock=clock, sleep=clock.sleep)
+    eng.run(should_stop=lambda: clock.sim >= hours * 3600)
+    return broker, eng
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Holdings loop benchmark (fixed polling vs change-driven)")
+    ap.add_argument("--hours", type=float, default=6.5)
+    ap.add_argument("--poll", type=float, default=60.0)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    b, decisions, lat = run_legacy(args.hours, args.poll, args.seed)
+    lat.sort()
+    print(f"legacy  requests={b.requests:5d} req/h={b.requests / args.hours:7.1f} decisions={decisions:4d} "
+          f"orders={b.orders:4d} decision p50={lat[len(lat) // 2] * 1000:.3f} ms")
+
+    b, eng = run_engine(args.hours, args.poll, args.seed)
+    m = eng.metrics()
+    print(f"engine  requests={b.requests:5d} req/h={b.requests / args.hours:7.1f} decisions={m['decisions']:4d} "
+          f"orders={b.orders:4d} decision p50={m['decision_latency_s']['p50'] * 1000:.3f} ms "
+          f"polls={m['polls']} skipped={m['skipped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# tools/bench_ledger_pages.py
+# Benchmarks ledger UI page loads on a synthetic ledger (default 500k groups x 2 legs = 1M trade rows):
+#   legacy   fetch_grouped_trades(limit, offset): GROUP BY over all legs, two queries per group, Python sort
+#   keyset   fetch_grouped_trades_page(cursor=...): SQL-sorted representative legs via idx_trades_page_*
+# First page and a deep page (~80% through the ledger) for several sort columns.
+# Usage: python tools/bench_ledger_pages.py [--groups 500000] [--page 100] [--db /tmp/bench_ledger.db]
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.accounting.ledger_modules import ledger_grouping as lg
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOG", "META", "TSLA", "SCHD", "SCHY", "SPY", "QQQ", "IWM"]
+STRATEGIES = ["open", "mid", "close", None]
+
+
+def build(db: str, groups: int, seed: int = 7):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db)
+    conn.executescript((ROOT / "tbot_bot" / "accounting" / "tbot_ledger_schema.sql").read_text())
+    conn.execute("PRAGMA foreign_keys = OFF")  # synthetic rows: no brokers/jurisdictions reference data
+    t0 = datetime(2024, 1, 2, 14, 30)
+    rows = []
+    cols = ("datetime_utc", "symbol", "action", "quantity", "price", "total_value", "amount", "side", "fee",
+            "broker_code", "account", "trade_id", "group_id", "strategy", "tags", "notes", "jurisdiction_code",
+            "entity_code", "status")
+    sql = f"INSERT INTO trades ({','.join(cols)}) VALUES ({','.join('?' * len(cols))})"
+    for g in range(groups):
+        ts = (t0 + timedelta(seconds=60 * g)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        sym = rng.choice(SYMBOLS)
+        qty = round(rng.uniform(1, 500), 2)
+        px = round(rng.uniform(5, 900), 2)
+        tv = round(qty * px, 2)
+        tid, gid = f"T{g:08d}", f"G{g:08d}"
+        strat = rng.choice(STRATEGIES)
+        status = rng.choice(["ok", "mismatch", None])
+        rows.append((ts, sym, "long", qty, px, tv, -tv, "debit", round(rng.uniform(0, 2), 2), "ALPACA",
+                     "Brokerage:Equity", tid, gid, strat, "", "", "US", "RGL", status))
+        rows.append((ts, sym, "long", qty, px, tv, tv, "credit", 0.0, "ALPACA",
+                     "Brokerage:Cash", tid, gid, strat, "", "", "US", "RGL", status))
+        if len(rows) >= 50000:
+            conn.executemany(sql, rows)
+            rows = []
+    if rows:
+        conn.executemany(sql, rows)
+    conn.commit()
+    conn.close()
+
+
+def timed(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, out
+
+
+def deep_cursor(db, sort_key, desc, position):
+    expr = lg.PAGE_SORT_EXPRESSIONS[sort_key]
+    order = "DESC" if desc else "ASC"
+    with sqlite3.connect(db) as conn:
+        row = conn.execute(
+            f"SELECT {expr}, id FROM trades WHERE side = 'debit' ORDER BY {expr} {order}, id {order} LIMIT 1 OFFSET ?",
+            (position,),
+        ).fetchone()
+    return lg.encode_cursor(sort_key, desc, row[0], row[1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Ledger page latency (offset + Python sort vs keyset)")
+    ap.add_argument("--groups", type=int, default=500000)
+    ap.add_argument("--page", type=int, default=100)
+    ap.add_argument("--db", default="")
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    db = args.db or str(Path(tmp.name) / "ledger.db")
+    if not Path(db).exists():
+        t0 = time.perf_counter()
+        build(db, args.groups)
+        print(f"built {args.groups} groups / {2 * args.groups} legs in {time.perf_counter() - t0:.1f} s")
+    lg.get_identity_tuple = lambda: ("RGL", "US", "ALPACA", "BENCH")
+    lg.resolve_ledger_db_path = lambda *a: db
+
+    t0 = time.perf_counter()
+    lg.ensure_page_indexes(db)
+    print(f"page indexes: {time.perf_counter() - t0:.1f} s (one-off)")
+    t0 = time.perf_counter()
+    total = lg.count_groups(db)
+    dt_count = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    lg.count_groups(db)
+    print(f"count_groups={total}: cold {dt_count * 1000:.0f} ms, cached {(time.perf_counter() - t0) * 1e6:.0f} us")
+
+    deep = int(total * 0.8)
+    dt, _ = timed(lambda: lg.fetch_grouped_trades(limit=args.page, offset=0), repeat=1)
+    print(f"legacy  first page             {dt * 1000:9.1f} ms")
+    dt, _ = timed(lambda: lg.fetch_grouped_trades(limit=args.page, offset=deep), repeat=1)
+    print(f"legacy  deep page (offset {deep}) {dt * 1000:9.1f} ms")
+
+    for sort_key, desc in (("datetime_utc", True), ("symbol", False), ("total_value", True), ("status", False)):
+        dt1, page = timed(lambda: lg.fetch_grouped_trades_page(limit=args.page, sort_by=sort_key, sort_desc=desc))
+        cur = deep_cursor(db, sort_key, desc, deep)
+        dt2, page2 = timed(lambda: lg.fetch_grouped_trades_page(limit=args.page, cursor=cur, sort_by=sort_key,
+                                                                sort_desc=desc))
+        print(f"keyset  {sort_key:>12s} {'desc' if desc else 'asc ':4s} first {dt1 * 1000:7.1f} ms  "
+              f"deep {dt2 * 1000:7.1f} ms  ({len(page['entries'])}/{len(page2['entries'])} groups)")
+
+
+if __name__ == "__main__":
+    main()
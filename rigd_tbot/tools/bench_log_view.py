@@ -0,0 +1,116 @@
+# tools/bench_log_view.py
+# Benchmarks the logs page read path on a large JSON log (default 1 GiB spanning 30 days up to now):
+#   legacy   read_text() + parse_timestamp() on every line (previous logs_page), run on a --legacy-mb tail copy
+#            because the full-file version needs several GiB of RAM
+#   indexed  tbot_bot.support.log_index.read_window (cold = index built from scratch, warm = sidecar reused)
+# Usage: python tools/bench_log_view.py [--size-mb 1024] [--legacy-mb 100] [--keep /tmp/bench_open.log]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.support import log_index
+from tbot_bot.support.log_index import LogIndex, index_path_for, read_window
+from tbot_web.py.logs_web import parse_timestamp
+
+WINDOWS = (("1h", 1), ("24h", 24), ("all", None))
+
+
+def generate(path: Path, size_mb: int, days: int = 30):
+    target = size_mb * 1024 * 1024
+    line_len = len(json.dumps({"timestamp": "2026-01-02T14:30:05.123456+00:00", "module": "strategy_open",
+                               "level": "info", "message": "x" * 60})) + 1
+    n = target // line_len
+    step = timedelta(days=days) / n
+    t = datetime.utcnow() - timedelta(days=days)
+    chunk = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            chunk.append(json.dumps({"timestamp": (t + step * i).isoformat() + "+00:00", "module": "strategy_open",
+                                     "level": "info", "message": f"order {i:012d} filled " + "x" * 41}))
+            if len(chunk) == 10000:
+                f.write("\n".join(chunk) + "\n")
+                chunk = []
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+
+
+def legacy(path: Path, hours):
+    now = datetime.utcnow()
+    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    if hours:
+        cutoff = now - timedelta(hours=hours)
+        filtered = []
+        for line in lines:
+            ts = parse_timestamp(line)
+            if (ts and ts >= cutoff) or ts is None:
+                filtered.append(line)
+        return "\n".join(filtered)
+    return "\n".join(lines)
+
+
+def indexed(path: Path, hours, idx):
+    since = datetime.utcnow() - timedelta(hours=hours) if hours else None
+    page = read_window(path, since=since, index=idx)
+    return "\n".join(page.lines), page
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Log viewer benchmark (full read vs indexed tail read)")
+    ap.add_argument("--size-mb", type=int, default=1024)
+    ap.add_argument("--legacy-mb", type=int, default=100)
+    ap.add_argument("--keep", default="", help="reuse/keep the generated log at this path")
+    args = ap.parse_args()
+
+    tmpdir = tempfile.TemporaryDirectory()
+    path = Path(args.keep) if args.keep else Path(tmpdir.name) / "open.log"
+    if not path.exists() or path.stat().st_size < args.size_mb * 1024 * 1024 * 0.95:
+        t0 = time.perf_counter()
+        generate(path, args.size_mb)
+        print(f"generated {path.stat().st_size / 2**20:.0f} MiB in {time.perf_counter() - t0:.1f} s")
+    size = path.stat().st_size
+
+    index_path_for(path).unlink(missing_ok=True)
+    t0 = time.perf_counter()
+    idx = LogIndex(path).refresh()
+    print(f"index build (cold): {time.perf_counter() - t0:.3f} s, {len(idx.keys)} minute buckets, "
+          f"sidecar {index_path_for(path).stat().st_size / 1024:.0f} KiB")
+    t0 = time.perf_counter()
+    LogIndex(path).refresh()
+    print(f"index load (warm sidecar): {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    for label, hours in WINDOWS:
+        t0 = time.perf_counter()
+        text, page = indexed(path, hours, idx)
+        dt = time.perf_counter() - t0
+        print(f"indexed {label:>3s} on {size / 2**20:6.0f} MiB: {dt * 1000:8.1f} ms  {len(page.lines):7d} lines  "
+              f"{len(text) / 1024:7.0f} KiB  truncated={page.truncated}")
+
+    # Legacy path on a tail copy of the file
+    tail = Path(tmpdir.name) / "legacy_tail.log"
+    with open(path, "rb") as src, open(tail, "wb") as dst:
+        src.seek(max(0, size - args.legacy_mb * 1024 * 1024))
+        src.readline()
+        dst.write(src.read())
+    tail_size = tail.stat().st_size
+    for label, hours in WINDOWS:
+        t0 = time.perf_counter()
+        text = legacy(tail, hours)
+        dt = time.perf_counter() - t0
+        print(f"legacy  {label:>3s} on {tail_size / 2**20:6.0f} MiB: {dt * 1000:8.1f} ms  "
+              f"{len(text) / 1024:7.0f} KiB  (~{dt * size / tail_size:.0f} s extrapolated to full file)")
+    log_index._MEMO.clear()
+    if not args.keep:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# tools/bench_param_sweep.py
+# Benchmarks parameter-sweep scaling from 1 to N worker processes over shared-memory market data.
+# Usage: python tools/bench_param_sweep.py [--symbols 200] [--days 63] [--runs 16] [--max-workers N]
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tbot_bot.backtest.param_sweep import latin_hypercube, run_sweep
+from tbot_bot.backtest.simulators import generate_synthetic_bars
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parameter sweep scaling benchmark")
+    ap.add_argument("--symbols", type=int, default=200)
+    ap.add_argument("--days", type=int, default=63)
+    ap.add_argument("--runs", type=int, default=16)
+    ap.add_argument("--strategy", default="mid", choices=["open", "mid", "close"])
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_sweep_")
+    try:
+        data = os.path.join(tmp, "bars.csv")
+        generate_synthetic_bars([f"S{i:04d}" for i in range(args.symbols)], args.days).to_csv(data, index=False)
+        params = latin_hypercube({"STRAT_MID_VWAP_THRESHOLD": (0.002, 0.02),
+                                  "TRADING_TRAILING_STOP_PCT": (0.005, 0.03),
+                                  "CANDIDATE_MULTIPLIER": (1, 5)}, args.runs)
+        print(f"cpus={os.cpu_count()} data={args.symbols} symbols x {args.days} days, {args.runs} runs ({args.strategy})")
+        base = None
+        workers = 1
+        while workers <= args.max_workers:
+            t0 = time.perf_counter()
+            run_sweep(args.strategy, data, params, workers=workers, out_dir=os.path.join(tmp, f"w{workers}"))
+            dt = time.perf_counter() - t0
+            base = base or dt
+            print(f"workers={workers:>2}: {dt:6.2f}s  speedup x{base / dt:.2f}")
+            workers *= 2
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
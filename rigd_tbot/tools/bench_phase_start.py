@@ -0,0 +1,97 @@
+# tools/bench_phase_start.py
+# Benchmarks phase start latency (scheduled time -> first quote request) for cold spawns vs warm workers.
+# The stand-in phase imports the importable part of the phase stack (numpy/pandas/requests/screener_utils/
+# backtest simulators) and then calls get_realtime_price(), whose phase_latency hook stamps the record.
+# Usage: python tools/bench_phase_start.py [--runs 5] [--lead 3]
+
+import argparse
+import datetime
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.runtime.warm_worker import WarmWorker
+
+PHASE_MODULE = '''
+import numpy, pandas, requests
+import tbot_bot.screeners.screener_utils as su
+import tbot_bot.backtest.simulators
+
+def main():
+    try:
+        su.get_realtime_price("AAPL", timeout=1)
+    except Exception:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def _iso(dt):
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _env(tmp, phase, scheduled, mode, latency_path):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([tmp, str(ROOT)])
+    env["TBOT_PHASE_NAME"] = phase
+    env["TBOT_PHASE_SCHEDULED_TS"] = _iso(scheduled)
+    env["TBOT_PHASE_MODE"] = mode
+    env["TBOT_PHASE_LATENCY_PATH"] = latency_path
+    return env
+
+
+def _sleep_until(dt):
+    rem = (dt - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    if rem > 0:
+        time.sleep(rem)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Phase start latency benchmark (cold vs warm)")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--lead", type=float, default=3.0, help="seconds between warm spawn and scheduled time")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_phase_")
+    Path(tmp, "bench_phase_mod.py").write_text(PHASE_MODULE)
+    latency_path = os.path.join(tmp, "phase_latency.jsonl")
+
+    for i in range(args.runs):
+        # Cold: the dispatcher spawns `python -m <phase>` at the scheduled time.
+        scheduled = datetime.datetime.now(datetime.timezone.utc)
+        subprocess.run(shlex.split(f"{shlex.quote(sys.executable)} -m bench_phase_mod"), cwd=str(ROOT),
+                       env=_env(tmp, "cold", scheduled, "cold", latency_path),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+        # Warm: spawned `lead` seconds ahead, released at the scheduled time.
+        scheduled = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=args.lead)
+        w = WarmWorker.spawn("bench_phase_mod", [], env=_env(tmp, "warm", scheduled, "warm", latency_path),
+                             cwd=str(ROOT))
+        ready = w.wait_ready(args.lead * 10)
+        _sleep_until(scheduled)
+        rc = w.go()
+        if not ready or rc is None:
+            print(f"run {i}: warm worker not ready/died (rc={rc})")
+
+    recs = [json.loads(l) for l in Path(latency_path).read_text().splitlines() if l.strip()]
+    for mode in ("cold", "warm"):
+        lat = [r["latency_s"] for r in recs if r["mode"] == mode]
+        if lat:
+            print(f"{mode:5s} runs={len(lat)} median={statistics.median(lat) * 1000:8.1f} ms "
+                  f"min={min(lat) * 1000:8.1f} ms max={max(lat) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# tools/bench_quote_stream.py
+# Benchmarks streaming quote ingest throughput (via the local replay server) and in-memory lookup latency.
+# Usage: python tools/bench_quote_stream.py [--symbols 1000] [--ticks 500000]
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tbot_bot.screeners.quote_stream import QuoteStream
+from tbot_bot.screeners.quote_replay_server import ReplayServer, generate_synthetic_ticks
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Quote stream ingest/lookup benchmark")
+    ap.add_argument("--symbols", type=int, default=1000)
+    ap.add_argument("--ticks", type=int, default=500000)
+    ap.add_argument("--batch", type=int, default=500, help="ticks per WebSocket message")
+    ap.add_argument("--lookups", type=int, default=1000000)
+    args = ap.parse_args()
+
+    symbols = [f"S{i:05d}" for i in range(args.symbols)]
+    ticks = list(generate_synthetic_ticks(symbols, args.ticks))
+    srv = ReplayServer(ticks, speed=0, batch_size=args.batch).start()
+    stream = QuoteStream(srv.url)
+    stream.subscribe(symbols)
+    t0 = time.perf_counter()
+    stream.start()
+    stream.wait_connected(10)
+    while stream.table.updates < args.ticks and time.perf_counter() - t0 < 300:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - t0
+    ingested = stream.table.updates
+    stream.stop()
+    srv.stop()
+
+    table = stream.table
+    t0 = time.perf_counter()
+    for i in range(args.lookups):
+        table.get_price(symbols[i % len(symbols)], max_age_s=None)
+    per_lookup = (time.perf_counter() - t0) / args.lookups
+
+    print(f"symbols={args.symbols} ticks={args.ticks} batch={args.batch}")
+    print(f"ingest: {ingested:,} ticks in {elapsed:.2f}s -> {ingested / elapsed:,.0f} ticks/s (end-to-end over localhost)")
+    print(f"lookup: {per_lookup * 1e9:,.0f} ns per get_price() ({args.lookups:,} lookups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# tools/bench_raw_builder.py
+# Benchmarks the raw universe build with --providers local stub providers of --symbols (default 20k) each
+# (overlap --overlap between neighbours) that emulate paged API fetches (--pages pages, --page-ms latency each):
+#   sequential  providers queried one after another, everything buffered, merged, then written in one go
+#   concurrent  build_raw_universe: one worker per provider, streaming merge + incremental temp-file write
+# Output of both is compared record by record. Per-provider latency/record counts come from the builder stats.
+# Usage: python tools/bench_raw_builder.py [--providers 4] [--symbols 20000] [--pages 20] [--page-ms 50]
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.screeners import symbol_universe_raw_builder as rb
+
+
+class StubProvider:
+    def __init__(self, idx, n, overlap, pages, page_ms):
+        rng = random.Random(idx)
+        start = int(idx * n * (1 - overlap))
+        self.records = [{"symbol": f"s{i:06d}".upper() if i % 3 else f" s{i:06d} ", "exchange": f"EX{idx}",
+                         "companyName": "" if rng.random() < 0.2 else f"Company {i} via {idx}",
+                         f"field{idx}": i} for i in range(start, start + n)]
+        self.pages, self.page_s = pages, page_ms / 1000.0
+
+    def fetch_symbols(self):
+        per = -(-len(self.records) // self.pages)
+        out = []
+        for p in range(self.pages):
+            time.sleep(self.page_s)  # emulated HTTP round trip
+            out.extend(self.records[p * per:(p + 1) * per])
+        return out
+
+
+def sequential(providers, out_path):
+    merged, field_prio = {}, {}
+    for prio, (name, p) in enumerate(providers):
+        for rec in p.fetch_symbols():
+            sym = rb.normalize_symbol(rec.get("symbol"))
+            if not sym:
+                continue
+            m, fp = merged.setdefault(sym, {}), field_prio.setdefault(sym, {})
+            for k, v in rec.items():
+                if v not in (None, "") and (k not in fp or prio < fp[k]):
+                    m[k], fp[k] = v, prio
+            m["symbol"] = sym
+    rb._atomic_write_ndjson([json.dumps(r, ensure_ascii=False) for r in merged.values()], out_path)
+    return len(merged)
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return {r["symbol"]: r for r in map(json.loads, f)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Raw universe builder benchmark (sequential vs concurrent)")
+    ap.add_argument("--providers", type=int, default=4)
+    ap.add_argument("--symbols", type=int, default=20000)
+    ap.add_argument("--overlap", type=float, default=0.5)
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--page-ms", type=float, default=50)
+    args = ap.parse_args()
+
+    rb.LOG_PATH = os.devnull
+    tmp = tempfile.TemporaryDirectory()
+    names = ["NASDAQ", "NYSE", "YAHOO", "FINNHUB", "IBKR"]
+    providers = [(names[i % len(names)] + ("" if i < len(names) else str(i)),
+                  StubProvider(i, args.symbols, args.overlap, args.pages, args.page_ms))
+                 for i in range(args.providers)]
+    print(f"{args.providers} providers x {args.symbols} symbols, overlap {args.overlap:.0%}, "
+          f"{args.pages} pages x {args.page_ms:.0f} ms each")
+
+    for page_ms in (args.page_ms, 0):
+        for _n, p in providers:
+            p.page_s = page_ms / 1000.0
+        seq_path, con_path = os.path.join(tmp.name, "seq.json"), os.path.join(tmp.name, "con.json")
+        t0 = time.perf_counter()
+        n_seq = sequential(providers, seq_path)
+        dt_seq = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        result = rb.build_raw_universe(providers, con_path)
+        dt_con = time.perf_counter() - t0
+        assert read(seq_path) == read(con_path) and n_seq == result["count"]
+        print(f"\npage latency {page_ms:.0f} ms")
+        print(f"  sequential  {dt_seq:7.2f} s  {n_seq} symbols")
+        print(f"  concurrent  {dt_con:7.2f} s  {result['count']} symbols, {result['duplicates']} duplicates merged "
+              f"({dt_seq / dt_con:.1f}x)")
+        for st in result["providers"]:
+            print(f"    {st['provider']:8s} {st['records']:6d} records  {st['seconds']:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# tools/bench_recon_log.py
+# Benchmarks reconciliation log writes for one sync run (default 100k rows) on a scratch ledger DB:
+#   legacy   previous log_reconciliation_entry: connect + CREATE TABLE + column check + make_json_safe +
+#            json.dumps + insert + commit per row (run on --legacy-rows and extrapolated)
+#   batch    log_reconciliation_entries: rows encoded with a reused encoder, one executemany transaction
+# Then get_reconciliation_entries lookups by sync_run_id / trade_id / status with and without the indexes.
+# Usage: python tools/bench_recon_log.py [--rows 100000] [--legacy-rows 5000] [--batch 0]
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.accounting import reconciliation_log as rl
+
+
+def raw_entry(i):
+    return {
+        "trade_id": f"T{i:08d}", "symbol": "AAPL", "action": "long", "quantity": 10.0, "price": 187.25,
+        "total_value": 1872.5, "side": "debit", "datetime_utc": "2026-01-02T14:30:00Z", "broker_code": "ALPACA",
+        "json_metadata": {"api_hash": "abc123", "raw_broker": {"id": f"ord-{i}", "legs": ({"qty": 10},)}},
+        "tags": "", "notes": "", "sync_run_id": "run-bench",
+    }
+
+
+def legacy_log(db, trade_id, raw_record, sync_run_id, i):
+    """The pre-batch write path, verbatim in behaviour."""
+    def make_json_safe(obj):
+        if isinstance(obj, tuple):
+            return [make_json_safe(x) for x in obj]
+        elif isinstance(obj, dict):
+            return {k: make_json_safe(v) for k, v in obj.items()}
+        elif isinstance(obj, list):
+            return [make_json_safe(x) for x in obj]
+        return obj
+
+    compare_fields_json = json.dumps(make_json_safe({}))
+    raw_record_json = json.dumps(make_json_safe(raw_record))
+    with sqlite3.connect(db) as conn:
+        conn.execute(rl.RECON_TABLE_SCHEMA)
+        rl._ensure_event_type_column(conn)
+        conn.execute(
+            rl._INSERT_SQL,
+            (trade_id, "RGL", "US", "ALPACA", "ALPACA", None, None, None, None, None, None, None, "matched",
+             rl.EVENT_LEDGER_SYNC, None, None, None, None, "Imported by sync", None, raw_record_json,
+             compare_fields_json, "{}", datetime.utcnow().isoformat(), sync_run_id, "abc123", None, None, None, "1"),
+        )
+        conn.commit()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Reconciliation log write/query benchmark")
+    ap.add_argument("--rows", type=int, default=100000)
+    ap.add_argument("--legacy-rows", type=int, default=5000)
+    ap.add_argument("--batch", type=int, default=0, help="rows per log_reconciliation_entries call (0 = all)")
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    legacy_db = str(Path(tmp.name) / "legacy.db")
+    batch_db = str(Path(tmp.name) / "batch.db")
+    entries = [raw_entry(i) for i in range(args.rows)]
+
+    t0 = time.perf_counter()
+    for i, e in enumerate(entries[:args.legacy_rows]):
+        legacy_log(legacy_db, e["trade_id"], e, "run-bench", i)
+    dt = time.perf_counter() - t0
+    print(f"legacy  {args.legacy_rows:7d} rows: {dt:7.2f} s  ({args.legacy_rows / dt:8.0f} rows/s, "
+          f"~{dt * args.rows / args.legacy_rows:.0f} s extrapolated to {args.rows})")
+
+    rl._get_db_path = lambda: batch_db
+    rl.get_bot_identity = lambda: "RGL_US_ALPACA_BENCH"
+    step = args.batch or args.rows
+    t0 = time.perf_counter()
+    for s in range(0, args.rows, step):
+        rl.log_reconciliation_entries(
+            [{"trade_id": e["trade_id"], "api_hash": "abc123", "raw_record": e} for e in entries[s:s + step]],
+            status="matched", compare_fields={}, sync_run_id="run-bench", broker="ALPACA", mapping_version="1",
+            notes="Imported by sync", event_type=rl.EVENT_LEDGER_SYNC,
+        )
+    dt = time.perf_counter() - t0
+    print(f"batch   {args.rows:7d} rows: {dt:7.2f} s  ({args.rows / dt:8.0f} rows/s, {step} rows per call)")
+
+    # Spread the log over many runs/statuses so the filters are selective
+    with sqlite3.connect(batch_db) as conn:
+        conn.execute("UPDATE reconciliation_log SET sync_run_id = 'run-' || (id % 200), "
+                     "status = CASE WHEN id % 50 = 0 THEN 'mismatched' ELSE 'matched' END")
+    queries = (("sync_run_id", {"sync_run_id": "run-17"}), ("trade_id", {"trade_id": "T00054321"}),
+               ("status", {"status": "mismatched"}))
+    for label in ("indexed", "no index"):
+        if label == "no index":
+            with sqlite3.connect(batch_db) as conn:
+                for stmt in rl.RECON_INDEX_SQL:
+                    conn.execute(f"DROP INDEX {stmt.split()[5]}")
+        for col, kw in queries:
+            t0 = time.perf_counter()
+            for _ in range(5):
+                rows = rl.get_reconciliation_entries(**kw)
+            print(f"query {label:8s} {col:11s}: {(time.perf_counter() - t0) / 5 * 1000:8.1f} ms  ({len(rows)} rows)")
+
+
+if __name__ == "__main__":
+    main()
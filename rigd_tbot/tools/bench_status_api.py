@@ -0,0 +1,74 @@
+# tools/bench_status_api.py
+# Benchmarks /status/full_status under concurrent pollers: uncached (TBOT_STATUS_CACHE=0), cached,
+# and cached + If-None-Match revalidation (304 bodies). Uses the Flask test client in-process, so the
+# numbers are handler cost only (no network/WSGI server).
+# Usage: python tools/bench_status_api.py [--clients 20] [--seconds 5]
+
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from flask import Flask
+
+from tbot_web.py.status_web import status_blueprint
+from tbot_web.support.status_cache import STATUS_CACHE
+
+
+def _app():
+    app = Flask(__name__)
+    app.secret_key = "bench"
+    app.register_blueprint(status_blueprint, url_prefix="/status")
+    return app
+
+
+def run(app, clients, seconds, revalidate):
+    lat, codes, lock = [], {}, threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def poller():
+        client = app.test_client()
+        with client.session_transaction() as s:
+            s["authenticated"] = True
+        etag, mine = None, []
+        while time.perf_counter() < deadline:
+            headers = {"If-None-Match": etag} if (revalidate and etag) else {}
+            t0 = time.perf_counter()
+            r = client.get("/status/full_status", headers=headers)
+            mine.append(time.perf_counter() - t0)
+            etag = r.headers.get("ETag", etag)
+            with lock:
+                codes[r.status_code] = codes.get(r.status_code, 0) + 1
+        with lock:
+            lat.extend(mine)
+
+    threads = [threading.Thread(target=poller) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lat.sort()
+    return len(lat) / seconds, lat[int(len(lat) * 0.95)] if lat else 0.0, codes
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Status API benchmark (uncached vs cached vs ETag)")
+    ap.add_argument("--clients", type=int, default=20)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    args = ap.parse_args()
+
+    app = _app()
+    for label, cache, revalidate in (("uncached", "0", False), ("cached", "1", False), ("cached+etag", "1", True)):
+        os.environ["TBOT_STATUS_CACHE"] = cache
+        STATUS_CACHE.clear()
+        rps, p95, codes = run(app, args.clients, args.seconds, revalidate)
+        print(f"{label:12s} req/s={rps:8.1f} p95={p95 * 1000:7.2f} ms codes={codes} cache={STATUS_CACHE.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# tools/bench_status_publisher.py
+# Simulates a busy trading session against status.json in a scratch dir and compares:
+#   legacy      every update + every loop tick rewrites status.json in place (json.dump indent=2, as status_bot did)
+#   publisher   StatusPublisher: coalesced writes, content-change check, atomic rename, mmap view
+# Time is compressed by --scale (a 2 s write interval becomes 2/scale s); writes are reported per simulated hour.
+# A reader thread polls like the web dashboard (stat + parse on change) and records latency and torn reads.
+# Usage: python tools/bench_status_publisher.py [--minutes 5] [--scale 100] [--updates-per-sec 20]
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.support.status_publisher import StatusPublisher, StatusView, _file_key  # noqa: E402
+
+
+class Session:
+    """Status fields the bot mutates during a session (trades, errors, state flips)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.status = {"state": "running", "active_strategy": "open", "trade_count": 0, "win_trades": 0,
+                       "loss_trades": 0, "error_count": 0, "pnl": 0.0, "win_rate": 0.0,
+                       "enabled_strategies": {"open": True, "mid": True, "close": True}, "broker_code": "alpaca",
+                       "version": "v1.0.0", "supervisor_running": True}
+
+    def update(self, rng):
+        with self.lock:
+            s = self.status
+            s["trade_count"] += 1
+            win = rng.random() < 0.55
+            s["win_trades" if win else "loss_trades"] += 1
+            s["pnl"] = round(s["pnl"] + rng.uniform(-5, 6), 2)
+            s["win_rate"] = round(100.0 * s["win_trades"] / s["trade_count"], 2)
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.status, timestamp=time.time())
+
+
+def run(mode, args, tmp):
+    path = os.path.join(tmp, f"status_{mode}.json")
+    session, rng = Session(), random.Random(7)
+    duration = args.minutes * 60 / args.scale
+    interval, heartbeat = 2.0 / args.scale, 60.0 / args.scale
+    writes = [0]
+    if mode == "publisher":
+        pub = StatusPublisher(path, session.snapshot, interval=interval, heartbeat=heartbeat)
+        on_update = on_tick = pub.request
+    else:
+        def legacy_write():
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(session.snapshot(), f, indent=2)
+            writes[0] += 1
+        on_update = on_tick = legacy_write
+    on_tick()
+    stop = threading.Event()
+    latencies, torn = [], [0]
+
+    def reader():
+        view = StatusView(path) if mode == "publisher" else None
+        last_key, cached = None, None
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            key = _file_key(path)
+            if key != last_key:
+                hit = view.read(json_key=key) if view else None
+                if hit:
+                    cached = hit[1]
+                else:
+                    try:
+                        with open(path, encoding="utf-8") as f:
+                            cached = json.load(f)
+                    except (ValueError, OSError):
+                        torn[0] += 1
+                        time.sleep(args.read_every / args.scale)
+                        continue
+                last_key = key
+            latencies.append(time.perf_counter() - t0)
+            time.sleep(args.read_every / args.scale)
+
+    rt = threading.Thread(target=reader, daemon=True)
+    rt.start()
+    t_end = time.monotonic() + duration
+    next_tick = time.monotonic() + interval
+    gap = 1.0 / (args.updates_per_sec * args.scale)
+    while time.monotonic() < t_end:
+        # Bursty: trades cluster (fills arrive in groups), quiet spells in between
+        if rng.random() < 0.3:
+            for _ in range(rng.randint(1, 8)):
+                session.update(rng)
+                on_update()
+        now = time.monotonic()
+        if now >= next_tick:
+            on_tick()
+            next_tick = now + interval
+        time.sleep(gap)
+    stop.set()
+    rt.join()
+    if mode == "publisher":
+        pub.flush()
+        writes[0] = pub.stats["writes"]
+    per_hour = writes[0] * 60.0 / args.minutes
+    lat = sorted(latencies) or [0.0]
+    pct = lambda q: lat[min(len(lat) - 1, int(q * len(lat)))] * 1e6
+    print(f"  {mode:10s} writes/hour {per_hour:9.0f}   reads {len(lat):7d}   read p50 {pct(0.5):7.1f} us   "
+          f"p99 {pct(0.99):8.1f} us   torn {torn[0]}", flush=True)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="status.json write coalescing benchmark")
+    ap.add_argument("--minutes", type=float, default=5.0, help="simulated session length")
+    ap.add_argument("--scale", type=float, default=100.0, help="time compression factor")
+    ap.add_argument("--updates-per-sec", type=float, default=20.0, help="loop iterations per simulated second")
+    ap.add_argument("--read-every", type=float, default=0.5, help="simulated seconds between reader polls")
+    args = ap.parse_args()
+    print(f"{args.minutes:g} simulated minutes at {args.scale:g}x, 2 s write interval, 60 s heartbeat")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("legacy", "publisher"):
+            run(mode, args, tmp)
+
+
+if __name__ == "__main__":
+    main()
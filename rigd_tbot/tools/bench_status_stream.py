@@ -0,0 +1,158 @@
+# tools/bench_status_stream.py
+# Benchmarks N open dashboards against a bot that appends log lines and updates status.json:
+#   polling  each dashboard fetches /status/full_status and re-renders the logs page (whole file) every --poll s
+#   sse      each dashboard holds one /status/stream?log=... connection
+# Reports process CPU seconds and response bytes. Everything runs in-process on the Flask test client,
+# so CPU includes the (identical) writer thread and the clients' read loops.
+# Usage: python tools/bench_status_stream.py [--dashboards 10] [--seconds 20] [--poll 5] [--lines-per-sec 5]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from flask import Flask
+
+from tbot_web.py import logs_web
+from tbot_web.py import status_web as sw
+from tbot_web.support.status_cache import STATUS_CACHE
+
+
+def _setup(tmp: Path, log_lines: int):
+    names = sw._JOB_STAMPS + ("opening_equity.json",) + tuple(f"strategy_{k}_error.txt" for k in sw._STRATEGY_KINDS)
+    paths = {
+        "identity": "",
+        "status_json": str(tmp / "status.json"),
+        "schedule": str(tmp / "schedule.json"),
+        "stamps": {n: str(tmp / n) for n in names},
+        "snapshots": {k: str(tmp / f"strategy_{k}_last.json") for k in sw._STRATEGY_KINDS},
+        "universe_final": str(tmp / "symbol_universe.json"),
+        "universe": str(tmp / "symbol_universe.json"),
+        "ledger_db": None,
+        "screener_creds": None,
+    }
+    (tmp / "status.json").write_text(json.dumps({"active_strategy": "open", "trade_count": 0}))
+    log = tmp / "logs" / "open.log"
+    log.parent.mkdir()
+    with open(log, "w") as f:
+        for i in range(log_lines):
+            f.write(f'{{"timestamp": "2026-01-02T14:{i % 60:02d}:00Z", "msg": "history line {i}"}}\n')
+    sw._status_paths = lambda: paths
+    sw._cached_provider = lambda paths=None: ({"name": "NONE", "enabled": False}, "NONE (disabled)")
+    logs_web.enumerate_log_files = lambda: ["open.log"]
+    logs_web.find_log_file = lambda name, warn_list=None: log
+    app = Flask(__name__, template_folder=str(ROOT / "tbot_web" / "templates"))
+    app.secret_key = "bench"
+    app.register_blueprint(sw.status_blueprint, url_prefix="/status")
+    app.register_blueprint(logs_web.logs_blueprint, url_prefix="/logs")
+    return app, tmp / "status.json", log
+
+
+def _writer(status_path, log, stop, lines_per_sec):
+    n = 0
+    while not stop.is_set():
+        with open(log, "a") as f:
+            f.write(f'{{"timestamp": "{time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}", "msg": "live line {n}"}}\n')
+        n += 1
+        if n % max(1, int(lines_per_sec * 5)) == 0:  # a status change every ~5 s
+            tmp = str(status_path) + ".tmp"
+            Path(tmp).write_text(json.dumps({"active_strategy": "open", "trade_count": n}))
+            os.replace(tmp, status_path)
+        stop.wait(1.0 / lines_per_sec)
+
+
+def _client(app):
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s["authenticated"] = True
+    return c
+
+
+def run_polling(app, dashboards, seconds, poll):
+    total, lock, stop = [0, 0], threading.Lock(), threading.Event()
+
+    def dash():
+        c, nbytes, reqs = _client(app), 0, 0
+        while not stop.is_set():
+            for url in ("/status/full_status", "/logs/?file=open.log&hours=all"):
+                nbytes += len(c.get(url).data)
+                reqs += 1
+            stop.wait(poll)
+        with lock:
+            total[0] += nbytes
+            total[1] += reqs
+
+    threads = [threading.Thread(target=dash) for _ in range(dashboards)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return total[0], total[1]
+
+
+def run_sse(app, dashboards, seconds):
+    total, lock = [0, 0], threading.Lock()
+
+    def dash():
+        resp = _client(app).get("/status/stream?log=open.log", buffered=False)
+        nbytes = events = 0
+        for chunk in resp.response:
+            nbytes += len(chunk)
+            events += chunk.count(b"event: ")
+        resp.close()
+        with lock:
+            total[0] += nbytes
+            total[1] += events
+
+    threads = [threading.Thread(target=dash) for _ in range(dashboards)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    for sub in list(sw._EVENT_HUB._subs):
+        sub.close()
+    for t in threads:
+        t.join()
+    return total[0], total[1]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Dashboard transport benchmark (polling vs server-sent events)")
+    ap.add_argument("--dashboards", type=int, default=10)
+    ap.add_argument("--seconds", type=float, default=20.0)
+    ap.add_argument("--poll", type=float, default=5.0)
+    ap.add_argument("--lines-per-sec", type=float, default=5.0)
+    ap.add_argument("--log-lines", type=int, default=5000, help="existing lines in the tailed log")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        app, status_path, log = _setup(Path(d), args.log_lines)
+        for mode in ("polling", "sse"):
+            STATUS_CACHE.clear()
+            stop = threading.Event()
+            writer = threading.Thread(target=_writer, args=(status_path, log, stop, args.lines_per_sec))
+            cpu0 = time.process_time()
+            writer.start()
+            if mode == "polling":
+                nbytes, count = run_polling(app, args.dashboards, args.seconds, args.poll)
+                unit = "requests"
+            else:
+                nbytes, count = run_sse(app, args.dashboards, args.seconds)
+                unit = "events"
+            stop.set()
+            writer.join()
+            cpu = time.process_time() - cpu0
+            print(f"{mode:8s} dashboards={args.dashboards} cpu={cpu:6.2f} s ({cpu / args.seconds * 100:5.1f}% of one core) "
+                  f"bytes={nbytes:>11,d} ({nbytes / args.seconds / 1024:8.1f} KiB/s) {unit}={count}")
+
+
+if __name__ == "__main__":
+    main()
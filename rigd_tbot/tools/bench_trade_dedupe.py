@@ -0,0 +1,138 @@
+# tools/bench_trade_dedupe.py
+# Benchmarks sync dedupe of incoming legs (default 50k, half already posted) against a large ledger (default 2M legs):
+#   exists   trade_exists pattern: new connection + SELECT per leg, single-row INSERTs, then the
+#            remove_duplicate_trades ROW_NUMBER() pass over the whole table
+#   legacy   previous post_double_entry inner loop: one SELECT ... WHERE trade_id = ? AND side = ? per leg on the
+#            open connection, then a single-row INSERT for each miss
+#   setbased ledger_deduplication.insert_new_legs: temp-table stage + one INSERT ... SELECT anti-join on the
+#            (trade_id, broker_code, side) unique index
+# legacy and setbased run in one transaction; each mode gets a copy of the same ledger and row counts must match.
+# Prints the anti-join plan.
+# Usage: python tools/bench_trade_dedupe.py [--ledger-rows 2000000] [--incoming 50000]
+
+import argparse
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.accounting.ledger_modules import ledger_deduplication as dd
+from tbot_bot.accounting.ledger_modules.ledger_fields import TRADES_FIELDS
+
+SCHEMA = ROOT / "tbot_bot" / "accounting" / "tbot_ledger_schema.sql"
+
+
+def leg(i, side):
+    v = 100.0 + i % 97
+    return {
+        "datetime_utc": "2026-01-02T14:30:00Z", "symbol": "AAPL", "action": "long", "quantity": 1.0, "price": v,
+        "total_value": v if side == "debit" else -v, "amount": v if side == "debit" else -v, "side": side,
+        "account": "Brokerage:Equity" if side == "debit" else "Brokerage:Cash", "broker_code": "ALPACA",
+        "trade_id": f"T{i:09d}", "group_id": f"T{i:09d}", "entity_code": "RGL", "jurisdiction_code": "US",
+        "status": "ok",
+    }
+
+
+def legs(start, stop):
+    for i in range(start, stop):
+        yield leg(i, "debit")
+        yield leg(i, "credit")
+
+
+def insert_sql():
+    return f"INSERT INTO trades ({', '.join(TRADES_FIELDS)}) VALUES ({', '.join('?' * len(TRADES_FIELDS))})"
+
+
+def legacy(conn, incoming):
+    sql = insert_sql()
+    n = 0
+    for l in incoming:
+        if conn.execute("SELECT 1 FROM trades WHERE trade_id = ? AND side = ?",
+                        (l.get("trade_id"), l.get("side"))).fetchone():
+            continue
+        conn.execute(sql, tuple(l.get(c) for c in TRADES_FIELDS))
+        n += 1
+    return n
+
+
+def exists_then_cleanup(db, incoming):
+    def trade_exists(trade_id, side):
+        with sqlite3.connect(db) as c:
+            return c.execute("SELECT 1 FROM trades WHERE trade_id = ? AND side = ? LIMIT 1",
+                             (trade_id, side)).fetchone() is not None
+
+    new = [l for l in incoming if not trade_exists(l["trade_id"], l["side"])]
+    with sqlite3.connect(db) as conn:
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.executemany(insert_sql(), (tuple(l.get(c) for c in TRADES_FIELDS) for l in new))
+        dup_ids = conn.execute("SELECT id FROM (SELECT id, ROW_NUMBER() OVER (PARTITION BY trade_id, side ORDER BY id)"
+                               " AS rn FROM trades WHERE trade_id IS NOT NULL) WHERE rn > 1").fetchall()
+        conn.executemany("DELETE FROM trades WHERE id = ?", dup_ids)
+    return len(new)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Set-based vs per-leg trade dedupe benchmark")
+    ap.add_argument("--ledger-rows", type=int, default=2000000)
+    ap.add_argument("--incoming", type=int, default=50000)
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    base = str(Path(tmp.name) / "base.db")
+    groups = args.ledger_rows // 2
+    t0 = time.perf_counter()
+    with sqlite3.connect(base) as conn:
+        conn.executescript(SCHEMA.read_text())
+        conn.execute("PRAGMA foreign_keys = OFF")
+        # The summary triggers are not part of the schema file; this measures the trades insert alone
+        conn.executemany(insert_sql(), (tuple(l.get(c) for c in TRADES_FIELDS) for l in legs(0, groups)))
+    print(f"built ledger: {groups * 2} legs in {time.perf_counter() - t0:.1f} s")
+
+    # Half of the incoming batch is already posted (a re-synced window), half is new
+    new_groups = args.incoming // 2
+    incoming = list(legs(groups - new_groups // 2, groups + new_groups - new_groups // 2))
+    results = {}
+    for label in ("exists", "legacy", "setbased"):
+        db = str(Path(tmp.name) / f"{label}.db")
+        shutil.copyfile(base, db)
+        if label == "exists":
+            t0 = time.perf_counter()
+            n = exists_then_cleanup(db, incoming)
+            dt = time.perf_counter() - t0
+            with sqlite3.connect(db) as conn:
+                total = conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+            results[label] = (n, total)
+            print(f"{label:8s} {len(incoming):7d} incoming legs: {dt:7.2f} s  ({len(incoming) / dt:9.0f} legs/s, "
+                  f"{n} inserted, ledger {total})")
+            continue
+        with sqlite3.connect(db) as conn:
+            conn.execute("PRAGMA foreign_keys = OFF")
+            t0 = time.perf_counter()
+            conn.execute("BEGIN")
+            if label == "legacy":
+                n = legacy(conn, incoming)
+            else:
+                n = dd.insert_new_legs(conn, incoming, TRADES_FIELDS)
+            conn.commit()
+            dt = time.perf_counter() - t0
+            total = conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+        results[label] = (n, total)
+        print(f"{label:8s} {len(incoming):7d} incoming legs: {dt:7.2f} s  ({len(incoming) / dt:9.0f} legs/s, "
+              f"{n} inserted, ledger {total})")
+    assert len(set(results.values())) == 1, results
+
+    with sqlite3.connect(base) as conn:
+        conn.execute(f"CREATE TEMP TABLE {dd._INCOMING} (_seq INTEGER PRIMARY KEY, {', '.join(TRADES_FIELDS)})")
+        key_match = " AND ".join(f"t.{k} = i.{k}" for k in dd.NATURAL_KEY)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT 1 FROM temp.{dd._INCOMING} i "
+                            f"WHERE NOT EXISTS (SELECT 1 FROM trades t WHERE {key_match})").fetchall()
+    print("anti-join plan: " + " | ".join(r[3] for r in plan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# tools/bench_trade_normalizer.py
+# Benchmarks broker trade normalization over synthetic Alpaca-style fills/activities (--records, default 100k
+# and 1M; a share are status-only / unmapped noise):
+#   per-record   [normalize_trade(r) for r in records] + compliance_filter_entries (broker_api before)
+#   batch        normalize_trades(records)              (schema-compiled builders, action lookup table)
+#   fused        normalize_trades(records, compliance=True, skip_non_dict=True)  (broker_api now)
+#   rows         list(iter_trade_rows(records))  (compliant TRADES_FIELDS tuples for executemany)
+# Outputs of per-record and batch/fused are compared before timing.
+# --no-gc pauses cyclic GC around every timed run (rows are acyclic; at 1M rows GC passes cost ~30%).
+# Usage: python tools/bench_trade_normalizer.py [--records 100000 1000000] [--repeat 3] [--no-gc]
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.broker.utils import ledger_normalizer as ln
+from tbot_bot.accounting.ledger_modules.ledger_compliance_filter import compliance_filter_entries
+
+
+def make_records(n, seed=5):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        kind = rng.random()
+        if kind < 0.7:  # order fill
+            out.append({"id": f"o{i}", "symbol": f"S{i % 3000:04d}", "side": rng.choice(["buy", "sell"]),
+                        "qty": str(rng.randint(1, 500)), "filled_avg_price": f"{rng.uniform(1, 900):.2f}",
+                        "filled_at": f"2025-03-{i % 28 + 1:02d}T14:30:00Z", "status": "filled",
+                        "commission": 0, "strategy": "open", "broker": "ALPACA"})
+        elif kind < 0.9:  # account activity
+            out.append({"id": f"a{i}", "activity_type": rng.choice(["FILL", "DIV", "NEW"]),
+                        "symbol": f"S{i % 3000:04d}", "side": rng.choice(["buy", "sell", "partial_fill"]),
+                        "qty": rng.choice(["0", "10"]), "price": rng.choice(["0", "12.5"]),
+                        "transaction_time": "2025-03-01T15:00:00Z", "order_status": "filled"})
+        else:  # cash journal
+            out.append({"id": f"c{i}", "activity_type": "TRANS", "action": rng.choice(["debit", "credit"]),
+                        "net_amount": "100.00", "date": "2025-03-01", "description": "ACH"})
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Broker trade normalization benchmark (per-record vs batch)")
+    ap.add_argument("--records", type=int, nargs="+", default=[100000, 1000000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--no-gc", action="store_true", help="disable cyclic GC while timing")
+    args = ap.parse_args()
+
+    def per_record(records):
+        return compliance_filter_entries([ln.normalize_trade(r) for r in records if isinstance(r, dict)])
+
+    for n in args.records:
+        records = make_records(n)
+        sample = records[:20000]
+        assert ln.normalize_trades(sample) == [ln.normalize_trade(r) for r in sample]
+        assert ln.normalize_trades(sample, compliance=True, skip_non_dict=True) == per_record(sample)
+        print(f"{n} records, best/median of {args.repeat}", flush=True)
+        for label, fn in (("per-record + filter", per_record),
+                          ("batch normalize", ln.normalize_trades),
+                          ("fused normalize + filter", lambda r: ln.normalize_trades(r, compliance=True,
+                                                                                    skip_non_dict=True)),
+                          ("executemany rows", lambda r: list(ln.iter_trade_rows(r)))):
+            samples, out = [], None
+            for _ in range(args.repeat):
+                if args.no_gc:
+                    gc.disable()
+                t0 = time.perf_counter()
+                out = fn(records)
+                samples.append(time.perf_counter() - t0)
+                gc.enable()
+                out_len = len(out)
+                out = None
+            best, median = min(samples), sorted(samples)[len(samples) // 2]
+            print(f"  {label:26s} best {best * 1000:8.0f} ms  median {median * 1000:8.0f} ms  "
+                  f"{n / best / 1e3:7.0f} k rec/s  -> {out_len} rows", flush=True)
+
+
+if __name__ == "__main__":
+    main()
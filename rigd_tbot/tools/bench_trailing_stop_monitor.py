@@ -0,0 +1,65 @@
+# tools/bench_trailing_stop_monitor.py
+# Benchmarks tick-to-decision latency of TrailingStopMonitor (default: 500 positions x 10 ticks/sec each).
+# Usage: python tools/bench_trailing_stop_monitor.py [--positions 500] [--rate 10] [--seconds 10]
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tbot_bot.trading.trailing_stop_monitor import TrailingStopMonitor
+
+
+def main():
+    ap = argparse.ArgumentParser(description="TrailingStopMonitor latency benchmark")
+    ap.add_argument("--positions", type=int, default=500)
+    ap.add_argument("--rate", type=float, default=10.0, help="ticks per second per position")
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--max-latency", type=float, default=0.05, help="monitor flush interval (s)")
+    args = ap.parse_args()
+
+    exits = []
+    with tempfile.TemporaryDirectory() as td:
+        mon = TrailingStopMonitor(
+            on_exit=exits.append,
+            state_path=str(Path(td) / "tsm.json"),
+            max_latency_s=args.max_latency,
+        )
+        rng = random.Random(1)
+        prices = {}
+        for i in range(args.positions):
+            sym = f"S{i:04d}"
+            prices[sym] = rng.uniform(10, 200)
+            mon.add_position(symbol=sym, side=rng.choice(["long", "short"]), qty=10,
+                             entry_price=prices[sym], trail_pct=0.02)
+        syms = list(prices)
+        mon.start()
+        tick_interval = 1.0 / args.rate
+        t_end = time.perf_counter() + args.seconds
+        sent = 0
+        next_round = time.perf_counter()
+        while time.perf_counter() < t_end:
+            for sym in syms:
+                prices[sym] *= 1.0 + rng.gauss(0, 0.002)
+                mon.submit_tick(sym, prices[sym])
+            sent += len(syms)
+            next_round += tick_interval
+            delay = next_round - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        mon.stop()
+        stats = mon.latency_stats()
+
+    print(f"positions={args.positions} rate={args.rate}/s/pos seconds={args.seconds} ticks={sent} exits={len(exits)}")
+    print(f"ticks/sec offered: {sent / args.seconds:,.0f}")
+    print("tick-to-decision latency (ms): "
+          f"p50={stats['p50'] * 1e3:.2f} p95={stats['p95'] * 1e3:.2f} "
+          f"p99={stats['p99'] * 1e3:.2f} max={stats['max'] * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
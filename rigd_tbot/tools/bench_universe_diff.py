@@ -0,0 +1,107 @@
+# tools/bench_universe_diff.py
+# Benchmarks universe diffing on two --symbols (default 100k) NDJSON universes where --churn of symbols are
+# added/removed, --changed of rows change materially and every other row gets a sub-cent price tick:
+#   legacy       load_json_symbols (json.loads every line) + dict-of-records field-by-field comparison
+#   fingerprint  load_columns + diff_columns (rows matched by fingerprint, only differing rows decoded),
+#                once exact and once with --tol lastClose=0.01 (ticks suppressed)
+#   identical    fingerprint engine on an unchanged copy (no row decoded at all)
+# Usage: python tools/bench_universe_diff.py [--symbols 100000] [--churn 0.01] [--changed 0.02] [--repeat 3]
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tbot_bot.screeners import universe_diff as ud
+
+
+def legacy_diff(u1, u2):
+    """diff_universes as it was before the columnar engine."""
+    u1_map = {rec["symbol"]: rec for rec in u1 if "symbol" in rec}
+    u2_map = {rec["symbol"]: rec for rec in u2 if "symbol" in rec}
+    only_in_1 = sorted(set(u1_map) - set(u2_map))
+    only_in_2 = sorted(set(u2_map) - set(u1_map))
+    changed = []
+    for sym in set(u1_map) & set(u2_map):
+        diffs = {k: (u1_map[sym].get(k), u2_map[sym].get(k))
+                 for k in set(u1_map[sym]) | set(u2_map[sym]) if u1_map[sym].get(k) != u2_map[sym].get(k)}
+        if diffs:
+            changed.append({"symbol": sym, "diffs": diffs})
+    return only_in_1, only_in_2, changed
+
+
+def make_universes(n, churn, changed, tick):
+    rng = random.Random(7)
+    old, new = [], []
+    for i in range(n):
+        rec = {"symbol": f"S{i:06d}", "exchange": "NYSE", "companyName": f"COMPANY {i} INC",
+               "lastClose": round(5 + rng.random() * 500, 2), "marketCap": round(rng.random() * 1e10, 2),
+               "volume": rng.randint(1000, 10 ** 7), "sector": "Industrials", "industry": "Machinery"}
+        old.append(rec)
+        r = rng.random()
+        if r < churn:
+            continue  # removed
+        upd = dict(rec)
+        if r < churn + changed:
+            upd["marketCap"] = round(upd["marketCap"] * 1.1, 2)
+            upd["exchange"] = "NASDAQ"
+        elif rng.random() < tick:
+            upd["lastClose"] = round(upd["lastClose"] + 0.001, 3)
+        new.append(upd)
+    new.extend({"symbol": f"N{i:06d}", "exchange": "NYSE", "lastClose": 1.0} for i in range(int(n * churn)))
+    return old, new
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Universe diff benchmark (legacy vs fingerprint-first columnar)")
+    ap.add_argument("--symbols", type=int, default=100000)
+    ap.add_argument("--churn", type=float, default=0.01)
+    ap.add_argument("--changed", type=float, default=0.02)
+    ap.add_argument("--tick", type=float, default=0.5, help="share of other rows that get a sub-cent price tick")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    old, new = make_universes(args.symbols, args.churn, args.changed, args.tick)
+    paths = {}
+    for name, rows in (("old", old), ("new", new), ("copy", old)):
+        paths[name] = os.path.join(tmp.name, f"{name}.json")
+        with open(paths[name], "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(r) + "\n" for r in rows)
+    tols = ud.parse_tolerances(["lastClose=0.01"])
+
+    def timed(label, fn):
+        samples, out = [], None
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            out = fn()
+            samples.append(time.perf_counter() - t0)
+        print(f"  {label:30s} best {min(samples) * 1000:8.1f} ms   median {sorted(samples)[len(samples) // 2] * 1000:8.1f} ms"
+              f"   {out}", flush=True)
+
+    def legacy(a, b):
+        r = legacy_diff(ud.load_json_symbols(paths[a]), ud.load_json_symbols(paths[b]))
+        return f"-{len(r[0])} +{len(r[1])} ~{len(r[2])}"
+
+    def fast(a, b, tolerances=None):
+        c = ud.diff_columns(ud.load_columns(paths[a]), ud.load_columns(paths[b]), tolerances)["counts"]
+        return f"-{c['removed']} +{c['added']} ~{c['changed']} (decoded {c['compared']})"
+
+    print(f"{args.symbols} symbols, churn {args.churn:.0%}, material changes {args.changed:.0%}, "
+          f"price ticks on {args.tick:.0%} of the rest, best/median of {args.repeat}")
+    timed("legacy", lambda: legacy("old", "new"))
+    timed("fingerprint exact", lambda: fast("old", "new"))
+    timed("fingerprint lastClose=0.01", lambda: fast("old", "new", tols))
+    timed("legacy identical", lambda: legacy("old", "copy"))
+    timed("fingerprint identical", lambda: fast("old", "copy"))
+
+
+if __name__ == "__main__":
+    main()
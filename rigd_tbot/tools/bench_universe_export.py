@@ -0,0 +1,107 @@
+# tools/bench_universe_export.py
+# Benchmarks /universe/export/<fmt> on NDJSON final universe files of --rows (default 100k and 1M records):
+#   legacy     previous handler: load the whole universe, render CSV in a StringIO / json.dumps(indent=2), send
+#   stream     streaming export (universe_stream reader + export_stream generators) through the Flask test client
+#   stream+gz  same with Accept-Encoding: gzip
+# Each case runs in a fresh subprocess; reports time to first byte, total time, peak RSS growth over the
+# post-import baseline (ru_maxrss), and bytes sent. Stream cases hash the file once for the ETag first.
+# Usage: python tools/bench_universe_export.py [--rows 100000 1000000] [--formats csv json ndjson]
+
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def write_universe(path, n):
+    rng = random.Random(3)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            c = round(rng.uniform(1, 500), 2)
+            f.write(json.dumps({"symbol": f"S{i:07d}", "lastClose": c, "marketCap": rng.uniform(1e7, 1e12),
+                                "companyName": f"COMPANY {i} INC", "exchange": rng.choice(["NYSE", "NASDAQ", "OTC"]),
+                                "c": c, "o": c, "vwap": c}) + "\n")
+
+
+def child(mode, fmt, path):
+    from flask import Flask
+    from tbot_web.py import universe_web as uw
+
+    uw.FINAL_PATH = path
+    uw.screener_creds_exist = lambda: True
+    base = rss_mb()
+    t0 = time.perf_counter()
+    ttfb, sent = None, 0
+    if mode == "legacy":
+        final_symbols, _status = uw.load_final_symbols_and_status()
+        if not final_symbols:  # NDJSON final cache: the old loader fell back to load_json_file-style parsing
+            final_symbols = uw.load_json_file(path)
+        if fmt == "csv":
+            output = io.StringIO()
+            writer = csv.DictWriter(output, fieldnames=list(final_symbols[0].keys()))
+            writer.writeheader()
+            writer.writerows(final_symbols)
+            body = output.getvalue()
+        else:
+            body = json.dumps(final_symbols, indent=2)
+        data = body.encode("utf-8")
+        ttfb = time.perf_counter() - t0
+        sent = len(data)
+    else:
+        app = Flask(__name__)
+        app.secret_key = "bench"
+        app.register_blueprint(uw.universe_bp, url_prefix="/universe")
+        headers = {"Accept-Encoding": "gzip"} if mode == "stream+gz" else {}
+        resp = app.test_client().get(f"/universe/export/{fmt}", headers=headers, buffered=False)
+        assert resp.status_code == 200, resp.status_code
+        for chunk in resp.response:
+            if ttfb is None:
+                ttfb = time.perf_counter() - t0
+            sent += len(chunk)
+        resp.close()
+    total = time.perf_counter() - t0
+    print(json.dumps({"ttfb": ttfb, "total": total, "rss": rss_mb() - base, "bytes": sent}))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Universe export benchmark (legacy vs streaming)")
+    ap.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    ap.add_argument("--formats", nargs="+", default=["csv", "json", "ndjson"])
+    ap.add_argument("--child", nargs=3, metavar=("MODE", "FMT", "PATH"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    tmp = tempfile.TemporaryDirectory()
+    print(f"{'rows':>8} {'fmt':6} {'mode':10} {'ttfb ms':>9} {'total s':>8} {'peak RSS +MB':>13} {'MB sent':>8}")
+    for n in args.rows:
+        path = os.path.join(tmp.name, f"symbol_universe_{n}.json")
+        write_universe(path, n)
+        for fmt in args.formats:
+            modes = ["legacy", "stream", "stream+gz"] if fmt != "ndjson" else ["stream", "stream+gz"]
+            for mode in modes:
+                out = subprocess.run([sys.executable, __file__, "--child", mode, fmt, path],
+                                     capture_output=True, text=True, check=True).stdout.strip().splitlines()[-1]
+                r = json.loads(out)
+                print(f"{n:8d} {fmt:6} {mode:10} {r['ttfb'] * 1000:9.1f} {r['total']:8.2f} {r['rss']:13.1f} "
+                      f"{r['bytes'] / 1e6:8.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# tools/bench_universe_index.py
+# Benchmarks the universe table/counts endpoints on --rows (default 100k) record files (unfiltered + partial NDJSON,
+# final {"status", "symbols"} object), p50/p95 over --requests requests each:
+#   legacy   previous handlers: load_json_file/json.load of the whole file per request, filter + slice in Python
+#   index    per-file SQLite index (universe_index): offset page, keyset page, prefix and substring search, counts
+# Also reports the one-off index build per file. Runs the Flask blueprint through a test client.
+# Usage: python tools/bench_universe_index.py [--rows 100000] [--requests 50]
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from flask import Flask
+
+from tbot_bot.screeners import universe_index as ui
+from tbot_web.py import universe_web as uw
+
+
+def make_records(rng, n):
+    out = []
+    for i in range(n):
+        sym = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(rng.randint(1, 5))) + f"{i % 10}"
+        out.append({"symbol": sym, "exchange": rng.choice(["NYSE", "NASDAQ"]), "lastClose": round(rng.uniform(1, 500), 2),
+                    "marketCap": rng.randint(10 ** 6, 10 ** 12), "name": f"Company {i}", "sector": "Tech"})
+    return out
+
+
+def pct(samples):
+    s = sorted(samples)
+    return statistics.median(s) * 1000, s[min(len(s) - 1, int(0.95 * len(s)))] * 1000
+
+
+def timed(fn, n):
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return pct(samples)
+
+
+def legacy_table(path, search, offset, limit, final=False):
+    if final:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)["symbols"]
+    else:
+        data = uw.load_json_file(path)
+    if search:
+        data = [s for s in data if search in (s if isinstance(s, str) else s.get("symbol", "")).upper()]
+    return json.dumps(data[offset:offset + limit])
+
+
+def legacy_counts(paths):
+    unf, part, final = paths
+    with open(final, "r", encoding="utf-8") as f:
+        n_final = len(json.load(f)["symbols"])
+    return {"unfiltered": len(uw.load_json_file(unf)), "partial": len(uw.load_json_file(part)), "filtered": n_final}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Universe table/counts endpoint benchmark")
+    ap.add_argument("--rows", type=int, default=100000)
+    ap.add_argument("--requests", type=int, default=50)
+    args = ap.parse_args()
+
+    rng = random.Random(5)
+    tmp = tempfile.TemporaryDirectory()
+    d = Path(tmp.name)
+    records = make_records(rng, args.rows)
+    unf, part, final = d / "symbol_universe.unfiltered.json", d / "symbol_universe.partial.json", d / "symbol_universe.json"
+    for p in (unf, part):
+        with open(p, "w", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r) + "\n")
+    final.write_text(json.dumps({"status": "complete", "symbols": records}, indent=2), encoding="utf-8")
+    uw.UNFILTERED_PATH, uw.PARTIAL_PATH, uw.FINAL_PATH = str(unf), str(part), str(final)
+    uw.get_blocklist_count = lambda: 0
+    print(f"{args.rows} rows per file, {unf.stat().st_size / 1e6:.1f} MB NDJSON, {final.stat().st_size / 1e6:.1f} MB final")
+
+    n = args.requests
+    mid = args.rows // 2
+    print("\nlegacy (full load per request)        p50 ms    p95 ms")
+    for label, fn in [
+        ("table unfiltered offset=mid", lambda: legacy_table(str(unf), "", mid, 100)),
+        ("table unfiltered search=AB", lambda: legacy_table(str(unf), "AB", 0, 100)),
+        ("table final offset=mid", lambda: legacy_table(str(final), "", mid, 100, final=True)),
+        ("counts", lambda: legacy_counts((str(unf), str(part), str(final)))),
+    ]:
+        p50, p95 = timed(fn, n)
+        print(f"  {label:34s} {p50:8.1f}  {p95:8.1f}")
+
+    print("\nindex build (first request per file)")
+    for p in (unf, part, final):
+        t0 = time.perf_counter()
+        ui.get_universe_index(p).count()
+        print(f"  {p.name:34s} {(time.perf_counter() - t0) * 1000:8.0f} ms")
+
+    app = Flask(__name__)
+    app.register_blueprint(uw.universe_bp, url_prefix="/universe")
+    client = app.test_client()
+    cursor = client.get(f"/universe/table/unfiltered?offset={mid}&limit=100").headers["X-Next-After"]
+    print("\nindex (endpoint via test client)      p50 ms    p95 ms")
+    for label, url in [
+        ("table unfiltered offset=mid", f"/universe/table/unfiltered?offset={mid}&limit=100"),
+        ("table unfiltered after=cursor", f"/universe/table/unfiltered?after={cursor}&limit=100"),
+        ("table unfiltered search=AB", "/universe/table/unfiltered?search=AB&limit=100"),
+        ("table unfiltered prefix=AB", "/universe/table/unfiltered?search=AB&match=prefix&limit=100"),
+        ("table final offset=mid", f"/universe/table/final?offset={mid}&limit=100"),
+        ("counts", "/universe/counts"),
+    ]:
+        p50, p95 = timed(lambda: client.get(url).get_data(), n)
+        print(f"  {label:34s} {p50:8.2f}  {p95:8.2f}")
+
+    got = client.get("/universe/table/unfiltered?search=AB&limit=100").get_json()
+    assert got == json.loads(legacy_table(str(unf), "AB", 0, 100))
+    assert client.get("/universe/counts").get_json()["filtered"] == args.rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# tools/bench_universe_pipeline.py
+# Benchmarks universe_orchestrator.main() with local stub providers (--symbols raw symbols, --quote-us emulated
+# latency per enrichment quote call) in a scratch output dir:
+#   subprocess   each stage via `python -m`-style child interpreter (imports + checkpoint re-parse per stage)
+#   in-process   full rebuild (--force): records handed between stages in memory, checkpoints still written
+#   no-change    in-process rebuild with unchanged inputs (stage cache: every stage skipped)
+#   blocklist    in-process rebuild after a blocklist edit (raw reused from its checkpoint, enrich+publish re-run)
+# Usage: python tools/bench_universe_pipeline.py [--symbols 20000] [--quote-us 200] [--repeat 3]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def install(out_dir, n_symbols, quote_us):
+    """Point every stage at out_dir and replace providers/credentials with local stubs."""
+    from tbot_bot.screeners import universe_orchestrator as orch
+    from tbot_bot.screeners import symbol_universe_raw_builder as rb
+    from tbot_bot.screeners import symbol_enrichment as enr
+
+    class StubProvider:
+        def __init__(self, config):
+            self.config = config
+
+        def fetch_symbols(self):
+            return [{"symbol": f"S{i:06d}", "exchange": "NYSE", "companyName": f"COMPANY {i}"} for i in range(n_symbols)]
+
+        def fetch_quotes(self, symbols):
+            if quote_us:
+                time.sleep(quote_us / 1e6)
+            return [{"symbol": s, "c": 10.0 + int(s[1:]) % 90, "marketCap": 500.0 + int(s[1:]) % 9000,
+                     "volume": 1000} for s in symbols]
+
+    p = lambda name: os.path.join(out_dir, name)
+    orch.FINAL_PATH, orch.PARTIAL_PATH = p("symbol_universe.json"), p("symbol_universe.partial.json")
+    orch.MANIFEST_PATH, orch.UNIVERSE_LOG_PATH = p(".pipeline/universe_stages.json"), os.devnull
+    orch.set_state = lambda *a, **k: None
+    orch.log = lambda msg: None
+    rb.RAW_PATH, rb.LOG_PATH = p("symbol_universe.symbols_raw.json"), os.devnull
+    rb.get_raw_provider_configs = lambda: [("STUB", {"SCREENER_NAME": "STUB"})]
+    rb.get_provider_class = lambda name: StubProvider
+    enr.RAW_PATH, enr.LOG_PATH = rb.RAW_PATH, os.devnull
+    enr.UNFILTERED_PATH, enr.PARTIAL_PATH = p("symbol_universe.unfiltered.json"), orch.PARTIAL_PATH
+    enr.BLOCKLIST_PATH = p("screener_blocklist.txt")
+    enr.load_env_bot_config = lambda: {"SCREENER_UNIVERSE_MAX_SIZE": str(n_symbols)}
+    enr.get_enrichment_provider_creds = lambda: {"SCREENER_NAME": "STUB"}
+    enr.get_provider_class = lambda name: StubProvider
+    return orch, rb, enr
+
+
+def quiet(fn, *a, **k):
+    devnull = open(os.devnull, "w")
+    saved, sys.stdout = sys.stdout, devnull
+    try:
+        return fn(*a, **k)
+    finally:
+        sys.stdout = saved
+        devnull.close()
+
+
+def child_stage(module, out_dir, n_symbols, quote_us):
+    _orch, rb, enr = install(out_dir, n_symbols, quote_us)
+    quiet({"tbot_bot.screeners.symbol_universe_raw_builder": rb.main,
+           "tbot_bot.screeners.symbol_enrichment": enr.main}[module])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Universe orchestration benchmark (subprocess vs in-process + stage cache)")
+    ap.add_argument("--symbols", type=int, default=20000)
+    ap.add_argument("--quote-us", type=float, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--child-stage", nargs=2, metavar=("MODULE", "DIR"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child_stage:
+        child_stage(args.child_stage[0], args.child_stage[1], args.symbols, args.quote_us)
+        return
+
+    tmp = tempfile.TemporaryDirectory()
+    orch, _rb, enr = install(tmp.name, args.symbols, args.quote_us)
+
+    def run_module(module, tolerate_rcs=()):
+        return subprocess.run([sys.executable, __file__, "--symbols", str(args.symbols), "--quote-us",
+                               str(args.quote_us), "--child-stage", module, tmp.name]).returncode
+
+    orch.run_module = run_module
+
+    def timed(label, fn):
+        samples = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            quiet(fn)
+            samples.append(time.perf_counter() - t0)
+        median = sorted(samples)[len(samples) // 2]
+        print(f"  {label:34s} best {min(samples) * 1000:9.1f} ms   median {median * 1000:9.1f} ms", flush=True)
+
+    print(f"{args.symbols} raw symbols, {args.quote_us:.0f} us per quote call, best/median of {args.repeat}")
+    timed("subprocess stages (full)", lambda: orch.main(isolation="subprocess"))
+    timed("in-process full rebuild (--force)", lambda: orch.main(isolation="inprocess", force=True))
+    timed("in-process no-change rebuild", lambda: orch.main(isolation="inprocess"))
+    n = [0]
+
+    def blocklist_edit():
+        n[0] += 1
+        with open(enr.BLOCKLIST_PATH, "a", encoding="utf-8") as f:
+            f.write(f"S{n[0]:06d}|bench||\n")
+        orch.main(isolation="inprocess")
+
+    timed("in-process after blocklist edit", blocklist_edit)
+    with open(orch.FINAL_PATH, encoding="utf-8") as f:
+        print(f"  final universe: {len(json.load(f)['symbols'])} symbols")
+
+
+if __name__ == "__main__":
+    main()